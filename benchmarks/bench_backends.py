@@ -0,0 +1,86 @@
+"""Selenium(ChromeDriver) vs CDP 직접 연결 백엔드 비교
+
+백엔드별로 브라우저 시작 시간과 명령 1회당 지연(스크립트 실행, 요소 탐색, 클릭, 입력)을 측정합니다.
+페이지는 data: URL의 간단한 폼이라 네트워크 영향이 없습니다.
+
+사용법:
+    python benchmarks/bench_backends.py                  # 헤드리스, 각 명령 50회
+    python benchmarks/bench_backends.py -n 200 --backends cdp
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from selenium.webdriver.common.by import By
+
+from src.utils.browser import BrowserManager
+
+PAGE = (
+    "data:text/html;charset=utf-8,"
+    "<input id='title'><div id='editor' contenteditable='true'></div>"
+    "<button id='btn' onclick='this.dataset.clicks=(+this.dataset.clicks||0)+1'>발행</button>"
+    + "".join(f"<p class='item'>문단 {i}</p>" for i in range(200))
+)
+
+
+def timed(func, n: int) -> float:
+    """func를 n회 실행한 1회당 중앙값 (밀리초)"""
+    samples = []
+    for _ in range(n):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def run(backend: str, n: int, headless: bool) -> dict:
+    manager = BrowserManager(headless=headless, lean=False, backend=backend)
+    start = time.perf_counter()
+    driver = manager.create_driver()
+    results = {"startup_ms": (time.perf_counter() - start) * 1000}
+
+    try:
+        start = time.perf_counter()
+        driver.get(PAGE)
+        results["navigate_ms"] = (time.perf_counter() - start) * 1000
+
+        title = driver.find_element(By.ID, "title")
+        button = driver.find_element(By.ID, "btn")
+
+        results["execute_script_ms"] = timed(lambda: driver.execute_script("return 1;"), n)
+        results["find_element_ms"] = timed(lambda: driver.find_element(By.CSS_SELECTOR, "#editor"), n)
+        results["find_elements_ms"] = timed(lambda: driver.find_elements(By.CSS_SELECTOR, "p.item"), max(1, n // 5))
+        results["click_ms"] = timed(button.click, n)
+        results["send_keys_ms"] = timed(lambda: title.send_keys("가나다abc"), n)
+        results["commands"] = sum(stage["commands"] for stage in manager.stats.summary().values())
+    finally:
+        manager.quit()
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="브라우저 백엔드 시작/명령 지연 비교")
+    parser.add_argument("-n", type=int, default=50, help="명령별 반복 횟수")
+    parser.add_argument("--backends", default="selenium,cdp", help="비교할 백엔드 (쉼표 구분)")
+    parser.add_argument("--headed", action="store_true", help="창 표시 (기본은 헤드리스)")
+    args = parser.parse_args()
+
+    rows = {}
+    for backend in [b.strip() for b in args.backends.split(",") if b.strip()]:
+        run(backend, 1, not args.headed)  # 워밍업 (드라이버 캐시, 디스크 캐시)
+        rows[backend] = run(backend, args.n, not args.headed)
+
+    metrics = ["startup_ms", "navigate_ms", "execute_script_ms", "find_element_ms",
+               "find_elements_ms", "click_ms", "send_keys_ms", "commands"]
+    print(f"{'':20s}" + "".join(f"{b:>12s}" for b in rows))
+    for metric in metrics:
+        print(f"{metric:20s}" + "".join(f"{rows[b][metric]:12.2f}" for b in rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""소스코드 블록 삽입 시간 측정 (스크립트 삽입 vs 단계별 삽입)
+
+네이버 글쓰기 페이지에서 코드 블록을 n개씩 두 방식으로 삽입하고 블록당 시간을 비교합니다.
+글은 발행하지 않으며, 측정이 끝나면 페이지를 떠납니다 (임시저장 글이 남을 수 있음).
+.env의 계정 정보가 필요합니다.
+
+사용법:
+    python benchmarks/bench_code_blocks.py -n 10
+    python benchmarks/bench_code_blocks.py -n 5 --headless
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from src.publishers.naver import NaverPublisher
+
+SAMPLE_CODE = "def hello(name):\n    return f'hello {name}'\n\nprint(hello('blog'))"
+
+
+def open_editor(publisher):
+    """글쓰기 페이지를 열고 본문 영역에 커서 두기"""
+    driver = publisher.driver
+    driver.get(publisher.BLOG_WRITE_URL.format(blog_id=publisher.naver_id))
+    WebDriverWait(driver, 30).until(EC.presence_of_element_located((By.CSS_SELECTOR, ".se-documentTitle")))
+    driver.execute_script(publisher.HIDE_POPUPS_SCRIPT)
+    content_area = publisher._find_content_area()
+    if content_area:
+        content_area.click()
+
+
+def measure(publisher, fast: bool, runs: int) -> list:
+    """코드 블록 runs개 삽입 시간 목록 (초)"""
+    open_editor(publisher)
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        if not publisher._insert_code_block(SAMPLE_CODE, "python", fast=fast):
+            raise RuntimeError("코드 블록 삽입 실패")
+        times.append(time.perf_counter() - start)
+    publisher.driver.get("about:blank")
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="소스코드 블록 삽입 시간 측정")
+    parser.add_argument("-n", type=int, default=5, help="방식별 블록 수")
+    parser.add_argument("--headless", action="store_true", help="헤드리스 모드")
+    args = parser.parse_args()
+
+    publisher = NaverPublisher(headless=args.headless)
+    if not publisher.login():
+        raise RuntimeError("네이버 로그인 실패")
+
+    try:
+        for label, fast in (("stepwise", False), ("script", True)):
+            times = measure(publisher, fast, args.n)
+            print(
+                f"{label:8s} 블록당 중앙값 {statistics.median(times) * 1000:.0f}ms "
+                f"(min {min(times) * 1000:.0f}ms, max {max(times) * 1000:.0f}ms, n={len(times)})"
+            )
+    finally:
+        publisher.logout()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""ChromeDriver 시작 시간 측정
+
+캐시 미사용(매번 webdriver-manager 확인)과 캐시 사용 시의 드라이버 준비/시작 시간을 비교합니다.
+
+사용법:
+    python benchmarks/bench_driver_startup.py            # 각 3회
+    python benchmarks/bench_driver_startup.py -n 5 --headless
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+from src.utils.browser import BrowserManager
+
+
+def measure(use_cache: bool, headless: bool) -> tuple:
+    """드라이버 경로 확인 + Chrome 시작 시간 측정 (초)"""
+    start = time.perf_counter()
+    driver_path = BrowserManager.resolve_driver_path(use_cache=use_cache)
+    resolve_time = time.perf_counter() - start
+
+    options = Options()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+
+    start = time.perf_counter()
+    driver = webdriver.Chrome(service=Service(driver_path) if driver_path else Service(), options=options)
+    start_time = time.perf_counter() - start
+    driver.quit()
+
+    return resolve_time, start_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ChromeDriver 시작 시간 측정")
+    parser.add_argument("-n", type=int, default=3, help="반복 횟수")
+    parser.add_argument("--headless", action="store_true", help="헤드리스 모드")
+    args = parser.parse_args()
+
+    # 캐시 워밍업 (첫 실행 다운로드는 측정에서 제외)
+    BrowserManager.resolve_driver_path()
+
+    for label, use_cache in (("before (webdriver-manager)", False), ("after (cache)", True)):
+        results = [measure(use_cache, args.headless) for _ in range(args.n)]
+        resolve_times = [r[0] for r in results]
+        total_times = [r[0] + r[1] for r in results]
+        print(
+            f"{label:28s} 드라이버 확인 {statistics.median(resolve_times):.3f}s | "
+            f"시작 포함 {statistics.median(total_times):.3f}s (중앙값, n={args.n})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""에디터 준비 시간 측정 (일반 모드 vs 경량 모드)
+
+로그인 후 글쓰기 페이지 이동부터 에디터가 입력 가능한 상태가 될 때까지의 시간을 측정합니다.
+.env의 계정 정보가 필요합니다.
+
+사용법:
+    python benchmarks/bench_editor_ready.py -p tistory -n 3
+    python benchmarks/bench_editor_ready.py -p naver -p tistory --headless
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from src.publishers.naver import NaverPublisher
+from src.publishers.tistory import TistoryPublisher
+
+
+def tistory_ready(publisher) -> tuple:
+    """티스토리 글쓰기 URL과 준비 조건"""
+    url = publisher.BLOG_WRITE_URL.format(blog_name=publisher.blog_name)
+
+    def ready(driver):
+        try:
+            driver.switch_to.alert.dismiss()
+        except Exception:
+            pass
+        return driver.execute_script(
+            "return typeof tinymce !== 'undefined' && !!tinymce.activeEditor"
+            " && !!document.querySelector('#post-title-inp');"
+        )
+
+    return url, ready
+
+
+def naver_ready(publisher) -> tuple:
+    """네이버 글쓰기 URL과 준비 조건"""
+    url = publisher.BLOG_WRITE_URL.format(blog_id=publisher.naver_id)
+    return url, EC.presence_of_element_located((By.CSS_SELECTOR, ".se-documentTitle"))
+
+
+PLATFORMS = {
+    "naver": (NaverPublisher, naver_ready),
+    "tistory": (TistoryPublisher, tistory_ready),
+}
+
+
+def measure(platform: str, lean: bool, runs: int, headless: bool) -> list:
+    """로그인 1회 후 글쓰기 페이지 로딩을 runs회 측정 (초)"""
+    publisher_cls, ready_factory = PLATFORMS[platform]
+    publisher = publisher_cls(headless=headless, lean=lean)
+    if not publisher.login():
+        raise RuntimeError(f"{platform} 로그인 실패")
+
+    times = []
+    try:
+        url, ready = ready_factory(publisher)
+        for _ in range(runs):
+            start = time.perf_counter()
+            publisher.driver.get(url)
+            WebDriverWait(publisher.driver, 30, poll_frequency=0.1).until(ready)
+            times.append(time.perf_counter() - start)
+            publisher.driver.get("about:blank")
+    finally:
+        publisher.logout()
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="에디터 준비 시간 측정")
+    parser.add_argument("-p", "--platform", action="append", choices=list(PLATFORMS), help="측정 플랫폼")
+    parser.add_argument("-n", type=int, default=3, help="반복 횟수")
+    parser.add_argument("--headless", action="store_true", help="헤드리스 모드")
+    args = parser.parse_args()
+
+    for platform in args.platform or list(PLATFORMS):
+        for label, lean in (("normal", False), ("lean", True)):
+            times = measure(platform, lean, args.n, args.headless)
+            print(
+                f"{platform:8s} {label:6s} 에디터 준비 중앙값 {statistics.median(times):.2f}s "
+                f"(min {min(times):.2f}s, max {max(times):.2f}s, n={len(times)})"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""발행 단계별 시간 측정 (로컬 대체 페이지)
+
+tests/standin의 대체 서버를 띄우고 실제 Chrome으로 publish()를 처음부터 끝까지 실행해
+단계별(title, images, body, category, tags, publish ...) 경과 시간을 비교합니다.
+실제 사이트나 계정 없이 발행자 코드 변경 전후의 성능 회귀를 확인할 때 사용합니다.
+
+사용법:
+    python benchmarks/bench_standin.py -p tistory -p naver -n 3
+    python benchmarks/bench_standin.py -p naver --images 10 --latency 0.5 --headless
+"""
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import src.utils.cache as cache
+from src.publishers.naver import NaverPublisher
+from src.publishers.tistory import TistoryPublisher
+from tests.standin.naver_server import NaverStandin
+from tests.standin.tistory_server import TistoryStandin
+
+PLATFORMS = {
+    "naver": (NaverStandin, NaverPublisher, {"id": "bench", "password": "pw"}, "개발"),
+    "tistory": (TistoryStandin, TistoryPublisher, {"id": "bench@kakao", "password": "pw", "blogs": ["bench"]}, "맛집"),
+}
+
+
+def sample_post(workdir: Path, image_count: int, code_blocks: int) -> tuple:
+    """이미지 image_count장, 코드 블록 code_blocks개가 들어간 본문과 이미지 경로"""
+    from PIL import Image
+
+    images, parts = [], []
+    for i in range(image_count):
+        path = workdir / f"{i + 1}.photo.jpg"
+        Image.new("RGB", (1200, 900), (i * 20 % 255, 120, 200)).save(path, quality=90)
+        images.append(str(path))
+    for i in range(max(image_count, code_blocks)):
+        parts.append(f"## 소제목 {i + 1}\n\n문단 {i + 1}입니다. **강조**가 들어간 문장도 있습니다.")
+        if i < image_count:
+            parts.append(f"[IMAGE: {i + 1}.photo.jpg]")
+        if i < code_blocks:
+            parts.append(f"```python\nprint({i})\n```")
+    return "\n\n".join(parts), images
+
+
+def measure(platform: str, runs: int, args, content: str, images: list) -> list:
+    """publish() runs회의 단계별 경과 시간 목록 [{단계: 초, "total": 초}]"""
+    server_cls, publisher_cls, account, category = PLATFORMS[platform]
+    results = []
+    with server_cls(upload_latency=args.latency) as server:
+        publisher = publisher_cls(headless=args.headless, account=account, urls=server.publisher_urls())
+        try:
+            for i in range(runs):
+                start = time.perf_counter()
+                result = publisher.publish(
+                    title=f"벤치마크 {i + 1}", content=content, category=category, tags=["a", "b"], images=images
+                )
+                if not result:
+                    raise RuntimeError(f"{platform} 발행 실패: {result.error}")
+                stages = {stage: entry["wall_time"] for stage, entry in result.metrics.get("stages", {}).items()}
+                stages["total"] = time.perf_counter() - start
+                results.append(stages)
+        finally:
+            publisher.logout()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="발행 단계별 시간 측정 (로컬 대체 페이지)")
+    parser.add_argument("-p", "--platform", action="append", choices=list(PLATFORMS), help="측정 플랫폼")
+    parser.add_argument("-n", type=int, default=3, help="반복 횟수 (로그인은 첫 회에만 포함)")
+    parser.add_argument("--images", type=int, default=5, help="글당 이미지 수")
+    parser.add_argument("--code", type=int, default=3, help="글당 코드 블록 수 (네이버)")
+    parser.add_argument("--latency", type=float, default=0.3, help="업로드 한 건당 서버 지연 (초)")
+    parser.add_argument("--headless", action="store_true", help="헤드리스 모드")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # 캐시/세션은 임시 디렉터리에 (실제 .cache를 건드리지 않음)
+        cache.CACHE_DIR = Path(workdir) / "cache"
+        content, images = sample_post(Path(workdir), args.images, args.code)
+
+        for platform in args.platform or list(PLATFORMS):
+            runs = measure(platform, args.n, args, content, images)
+            stages = sorted({stage for run in runs for stage in run}, key=lambda s: (s == "total", s))
+            print(f"\n{platform} (n={len(runs)}, 이미지 {args.images}장, 업로드 지연 {args.latency}s)")
+            for stage in stages:
+                values = [run.get(stage, 0.0) for run in runs]
+                print(f"  {stage:10s} 중앙값 {statistics.median(values):6.2f}s (min {min(values):.2f}s, max {max(values):.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
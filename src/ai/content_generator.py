@@ -337,12 +337,14 @@ class ContentGenerator:
         return {"naver": None, "tistory": None}
     
     @staticmethod
-    def mark_as_published(post_dir: Path, platform: str):
+    def mark_as_published(post_dir: Path, platform: str, url: str = None, metrics: dict = None):
         """발행 완료 표시
         
         Args:
             post_dir: 포스트 디렉터리
             platform: 발행된 플랫폼 (naver, tistory)
+            url: 발행된 글 주소 (있으면 data["urls"][platform]에 기록)
+            metrics: 발행 성능 지표 (PublishResult.metrics, 있으면 data["metrics"][platform]에 기록)
         """
         import json
         
@@ -359,6 +361,10 @@ class ContentGenerator:
         
         # 발행 시간 기록
         data[platform] = datetime.now().strftime("%Y-%m-%d %H:%M")
+        if url:
+            data.setdefault("urls", {})[platform] = url
+        if metrics:
+            data.setdefault("metrics", {})[platform] = metrics
         
         # 저장
         with open(published_file, 'w', encoding='utf-8') as f:
@@ -167,20 +167,87 @@ publish_app = typer.Typer(help="🚀 블로그 발행 명령어")
 app.add_typer(publish_app, name="publish")
 
 
+def _use_playwright() -> bool:
+    """BROWSER_BACKEND=playwright 여부"""
+    import os
+    return os.getenv("BROWSER_BACKEND", "selenium").lower() == "playwright"
+
+
+def _publish_with_playwright(jobs: list, headless: bool) -> list:
+    """Playwright 백엔드로 여러 글을 동시에 발행 (PublishResult 목록)"""
+    import asyncio
+    from ..publishers.playwright_base import publish_concurrently
+    
+    return asyncio.run(publish_concurrently(jobs, headless=headless))
+
+
+def _print_validation(report, label: str = "발행 전 검증") -> bool:
+    """검증 결과 출력 (오류가 없으면 True)"""
+    from rich.markup import escape
+    
+    for issue in report.issues:
+        prefix = f"[{issue.platform}] " if issue.platform else ""
+        if issue.level == "error":
+            console.print(f"  ❌ {escape(prefix + issue.message)}", style="red")
+        else:
+            console.print(f"  ⚠️ {escape(prefix + issue.message)}", style="yellow")
+    
+    if report.ok:
+        warnings = f" (경고 {len(report.warnings)}개)" if report.warnings else ""
+        console.print(f"✅ {label} 통과{warnings}", style="green")
+    else:
+        console.print(f"❌ {label} 실패: 오류 {len(report.errors)}개", style="red")
+    return report.ok
+
+
+def _validate_rewrite(validator, platform: str, title: str, content: str, tags, category, media_dir) -> bool:
+    """리라이팅 결과를 해당 플랫폼 기준으로 검증 (오류만 출력, 오류가 없으면 True)"""
+    from rich.markup import escape
+    
+    report = validator.validate(
+        title, content, tags=tags, category=category, media_dir=media_dir, platforms=[platform]
+    )
+    for issue in report.errors:
+        console.print(f"    ❌ {platform} 검증 실패: {escape(issue.message)}", style="red")
+    return report.ok
+
+
+def _preprocess_media(media_dirs, platforms: list):
+    """발행할 글의 이미지를 플랫폼별 기준으로 미리 전처리 (프로세스 풀 한 번, 결과는 발행자가 재사용)"""
+    from ..media.image_handler import ImagePreprocessor
+    
+    images = [
+        str(f) for media_dir in media_dirs if Path(media_dir).is_dir()
+        for f in sorted(Path(media_dir).iterdir()) if f.is_file() and not f.name.startswith(".")
+    ]
+    if images:
+        ImagePreprocessor().prepare_many(images, platforms)
+
+
 @publish_app.command("naver")
 def publish_naver(
     draft_path: str = typer.Argument(..., help="발행할 초안 파일 경로"),
-    headless: bool = typer.Option(False, "--headless", help="헤드리스 모드")
+    headless: bool = typer.Option(False, "--headless", help="헤드리스 모드"),
+    http: bool = typer.Option(False, "--http", help="저장된 로그인 세션으로 브라우저 없이 발행 (거부 시 브라우저 사용)"),
+    validate_only: bool = typer.Option(False, "--validate-only", help="발행하지 않고 검증만 실행")
 ):
     """네이버 블로그에 발행"""
     import frontmatter
+    from ..editor.validator import PostValidator
     from ..publishers.naver import NaverPublisher
+    from ..publishers.naver_http import NaverHttpPublisher
     
     # 초안 로드
     post = frontmatter.load(draft_path)
     
     console.print(f"📝 발행할 글: {post.get('title')}", style="cyan")
     
+    # 브라우저를 띄우기 전에 초안/이미지 검증
+    if not _print_validation(PostValidator(["naver"]).validate_file(draft_path)):
+        raise typer.Exit(code=1)
+    if validate_only:
+        return
+    
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -188,8 +255,9 @@ def publish_naver(
     ) as progress:
         task = progress.add_task("네이버 블로그 발행 중...", total=None)
         
-        publisher = NaverPublisher(headless=headless)
-        if publisher.login():
+        publisher = NaverHttpPublisher(headless=headless) if http else NaverPublisher(headless=headless)
+        # HTTP 발행자는 세션이 없어도 publish()에서 브라우저 발행으로 대체
+        if http or publisher.login():
             result = publisher.publish(
                 title=post.get('title', '제목 없음'),
                 content=post.content,
@@ -200,8 +268,10 @@ def publish_naver(
             
             if result:
                 console.print("✅ 네이버 발행 완료!", style="green")
+                if result.url:
+                    console.print(f"🔗 {result.url}", style="cyan")
             else:
-                console.print("❌ 네이버 발행 실패", style="red")
+                console.print(f"❌ 네이버 발행 실패: {result.error or '원인 불명'}", style="red")
         else:
             console.print("❌ 네이버 로그인 실패", style="red")
 
@@ -209,17 +279,27 @@ def publish_naver(
 @publish_app.command("tistory")
 def publish_tistory(
     draft_path: str = typer.Argument(..., help="발행할 초안 파일 경로"),
-    headless: bool = typer.Option(False, "--headless", help="헤드리스 모드")
+    headless: bool = typer.Option(False, "--headless", help="헤드리스 모드"),
+    http: bool = typer.Option(False, "--http", help="저장된 로그인 세션으로 브라우저 없이 발행 (거부 시 브라우저 사용)"),
+    validate_only: bool = typer.Option(False, "--validate-only", help="발행하지 않고 검증만 실행")
 ):
     """티스토리 블로그에 발행"""
     import frontmatter
+    from ..editor.validator import PostValidator
     from ..publishers.tistory import TistoryPublisher
+    from ..publishers.tistory_http import TistoryHttpPublisher
     
     # 초안 로드
     post = frontmatter.load(draft_path)
     
     console.print(f"📝 발행할 글: {post.get('title')}", style="cyan")
     
+    # 브라우저를 띄우기 전에 초안/이미지 검증
+    if not _print_validation(PostValidator(["tistory"]).validate_file(draft_path)):
+        raise typer.Exit(code=1)
+    if validate_only:
+        return
+    
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -227,8 +307,9 @@ def publish_tistory(
     ) as progress:
         task = progress.add_task("티스토리 블로그 발행 중...", total=None)
         
-        publisher = TistoryPublisher(headless=headless)
-        if publisher.login():
+        publisher = TistoryHttpPublisher(headless=headless) if http else TistoryPublisher(headless=headless)
+        # HTTP 발행자는 세션이 없어도 publish()에서 브라우저 발행으로 대체
+        if http or publisher.login():
             result = publisher.publish(
                 title=post.get('title', '제목 없음'),
                 content=post.content,
@@ -239,19 +320,134 @@ def publish_tistory(
             
             if result:
                 console.print("✅ 티스토리 발행 완료!", style="green")
+                if result.url:
+                    console.print(f"🔗 {result.url}", style="cyan")
             else:
-                console.print("❌ 티스토리 발행 실패", style="red")
+                console.print(f"❌ 티스토리 발행 실패: {result.error or '원인 불명'}", style="red")
         else:
             console.print("❌ 티스토리 로그인 실패", style="red")
 
 
+@publish_app.command("wordpress")
+def publish_wordpress(
+    draft_path: str = typer.Argument(..., help="발행할 초안 파일 경로"),
+    status: Optional[str] = typer.Option(None, "-s", "--status", help="글 상태 (publish, draft, private, pending). 생략 시 WORDPRESS_STATUS"),
+    validate_only: bool = typer.Option(False, "--validate-only", help="발행하지 않고 검증만 실행")
+):
+    """워드프레스에 발행 (REST API, 브라우저 사용 안 함)"""
+    import frontmatter
+    from ..editor.validator import PostValidator
+    from ..publishers.wordpress import WordPressPublisher
+    
+    # 초안 로드
+    post = frontmatter.load(draft_path)
+    media_dir = PostValidator.media_dir_for(draft_path, post.get('input_dir'))
+    images = [str(f) for f in media_dir.iterdir() if f.is_file()] if media_dir.exists() else None
+    
+    console.print(f"📝 발행할 글: {post.get('title')}", style="cyan")
+    
+    if not _print_validation(PostValidator(["wordpress"]).validate_file(draft_path)):
+        raise typer.Exit(code=1)
+    if validate_only:
+        return
+    
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console
+    ) as progress:
+        task = progress.add_task("워드프레스 발행 중...", total=None)
+        
+        publisher = WordPressPublisher(status=status)
+        if publisher.login():
+            result = publisher.publish(
+                title=post.get('title', '제목 없음'),
+                content=post.content,
+                category=post.get('category'),
+                tags=post.get('keywords', []),
+                images=images
+            )
+            publisher.logout()
+            progress.update(task, completed=True)
+            
+            if result:
+                console.print("✅ 워드프레스 발행 완료!", style="green")
+                if result.url:
+                    console.print(f"🔗 {result.url}", style="cyan")
+            else:
+                console.print(f"❌ 워드프레스 발행 실패: {result.error or '원인 불명'}", style="red")
+        else:
+            console.print("❌ 워드프레스 인증 실패", style="red")
+
+
+@publish_app.command("fanout")
+def publish_fanout(
+    draft_path: str = typer.Argument(..., help="발행할 초안 파일 경로"),
+    platform: str = typer.Option("tistory", "-p", "--platform", help="플랫폼 (tistory, naver)"),
+    blogs: str = typer.Option(None, "-b", "--blogs", help="대상 블로그 (쉼표 구분, 생략 시 설정된 전체)"),
+    headless: bool = typer.Option(False, "--headless", help="헤드리스 모드"),
+    validate_only: bool = typer.Option(False, "--validate-only", help="발행하지 않고 검증만 실행")
+):
+    """같은 글을 한 플랫폼의 여러 블로그에 동시에 발행 (config/accounts.json)"""
+    import frontmatter
+    from ..editor.validator import PostValidator
+    from ..publishers.fanout import fan_out
+    
+    post = frontmatter.load(draft_path)
+    media_dir = Path(draft_path).parent / "media"
+    images = [str(f) for f in media_dir.iterdir() if f.is_file()] if media_dir.exists() else None
+    target_blogs = [b.strip() for b in blogs.split(",") if b.strip()] if blogs else None
+    
+    console.print(f"📝 발행할 글: {post.get('title')}", style="cyan")
+    
+    if not _print_validation(PostValidator([platform]).validate_file(draft_path)):
+        raise typer.Exit(code=1)
+    if validate_only:
+        return
+    
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console
+    ) as progress:
+        task = progress.add_task(f"{platform} 여러 블로그 발행 중...", total=None)
+        results = fan_out(
+            platform,
+            title=post.get('title', '제목 없음'),
+            content=post.content,
+            category=post.get('category'),
+            tags=post.get('keywords', []),
+            images=images,
+            blogs=target_blogs,
+            headless=headless,
+        )
+        progress.update(task, completed=True)
+    
+    if not results:
+        console.print("❌ 발행할 블로그가 없습니다. config/accounts.json을 확인하세요.", style="red")
+        return
+    
+    table = Table(title=f"📊 {platform} 블로그별 결과", box=box.SIMPLE_HEAVY)
+    table.add_column("블로그", style="cyan")
+    table.add_column("결과", justify="center")
+    table.add_column("주소 / 오류")
+    for blog, result in results.items():
+        table.add_row(blog, "✅" if result else "❌", (result.url if result else result.error) or "-")
+    console.print(table)
+    
+    success_count = sum(1 for r in results.values() if r)
+    console.print(f"\n🎉 {success_count}/{len(results)} 블로그 발행 완료!", style="green bold")
+
+
 @publish_app.command("all")
 def publish_all(
     draft_path: str = typer.Argument(..., help="발행할 초안 파일 경로"),
-    headless: bool = typer.Option(False, "--headless", help="헤드리스 모드")
+    headless: bool = typer.Option(False, "--headless", help="헤드리스 모드"),
+    validate_only: bool = typer.Option(False, "--validate-only", help="발행하지 않고 검증만 실행")
 ):
     """모든 블로그에 발행 (네이버 + 티스토리)"""
     import frontmatter
+    from ..editor.validator import PostValidator
     from ..publishers.naver import NaverPublisher
     from ..publishers.tistory import TistoryPublisher
     from ..ai.rewriter import PlatformRewriter
@@ -264,63 +460,126 @@ def publish_all(
     
     console.print(Panel(f"📝 {title}", title="발행할 글"))
     
+    # 브라우저를 띄우기 전에 초안/이미지 검증 (리라이팅 결과는 플랫폼별로 다시 검증)
+    validator = PostValidator(["naver", "tistory"])
+    if not _print_validation(validator.validate_file(draft_path)):
+        raise typer.Exit(code=1)
+    if validate_only:
+        return
+    media_dir = PostValidator.media_dir_for(draft_path, post.get('input_dir'))
+    _preprocess_media([media_dir], ["naver", "tistory"])
+    
     # 플랫폼별 리라이팅
     rewriter = PlatformRewriter()
     
     results = {}
     
-    # 네이버 발행
-    console.print("\n🟢 네이버 블로그 발행 중...", style="cyan")
-    try:
-        naver_content = rewriter.rewrite_content(content, "naver", title)
-        publisher = NaverPublisher(headless=headless)
-        if publisher.login():
-            results['naver'] = publisher.publish(title=title, content=naver_content, tags=tags)
-            publisher.logout()
-        else:
+    # Playwright 백엔드: 리라이팅 후 두 플랫폼을 한 브라우저에서 동시에 발행
+    if _use_playwright():
+        jobs = []
+        for platform in ("naver", "tistory"):
+            platform_title, platform_content = rewriter.rewrite_content(content, platform, title)
+            if not _validate_rewrite(validator, platform, platform_title, platform_content, tags, post.get('category'), media_dir):
+                results[platform] = False
+                continue
+            jobs.append({"platform": platform, "title": platform_title, "content": platform_content, "tags": tags})
+        console.print("\n🚀 네이버 + 티스토리 동시 발행 중 (Playwright)...", style="cyan")
+        for job, result in zip(jobs, _publish_with_playwright(jobs, headless)):
+            results[job["platform"]] = result
+    else:
+        # 네이버 발행
+        console.print("\n🟢 네이버 블로그 발행 중...", style="cyan")
+        try:
+            naver_title, naver_content = rewriter.rewrite_content(content, "naver", title)
+            if not _validate_rewrite(validator, "naver", naver_title, naver_content, tags, post.get('category'), media_dir):
+                results['naver'] = False
+            else:
+                publisher = NaverPublisher(headless=headless)
+                if publisher.login():
+                    results['naver'] = publisher.publish(title=naver_title, content=naver_content, tags=tags)
+                    publisher.logout()
+                else:
+                    results['naver'] = False
+        except Exception as e:
+            console.print(f"❌ 네이버 발행 오류: {e}", style="red")
             results['naver'] = False
-    except Exception as e:
-        console.print(f"❌ 네이버 발행 오류: {e}", style="red")
-        results['naver'] = False
     
-    # 티스토리 발행
-    console.print("\n🟠 티스토리 블로그 발행 중...", style="cyan")
-    try:
-        tistory_content = rewriter.rewrite_content(content, "tistory", title)
-        publisher = TistoryPublisher(headless=headless)
-        if publisher.login():
-            results['tistory'] = publisher.publish(title=title, content=tistory_content, tags=tags)
-            publisher.logout()
-        else:
+        # 티스토리 발행
+        console.print("\n🟠 티스토리 블로그 발행 중...", style="cyan")
+        try:
+            tistory_title, tistory_content = rewriter.rewrite_content(content, "tistory", title)
+            if not _validate_rewrite(validator, "tistory", tistory_title, tistory_content, tags, post.get('category'), media_dir):
+                results['tistory'] = False
+            else:
+                publisher = TistoryPublisher(headless=headless)
+                if publisher.login():
+                    results['tistory'] = publisher.publish(title=tistory_title, content=tistory_content, tags=tags)
+                    publisher.logout()
+                else:
+                    results['tistory'] = False
+        except Exception as e:
+            console.print(f"❌ 티스토리 발행 오류: {e}", style="red")
             results['tistory'] = False
-    except Exception as e:
-        console.print(f"❌ 티스토리 발행 오류: {e}", style="red")
-        results['tistory'] = False
     
     # 결과 출력
     console.print("\n" + "="*50)
     console.print("📊 발행 결과:", style="bold")
     for platform, success in results.items():
         status = "✅ 성공" if success else "❌ 실패"
-        console.print(f"  {platform}: {status}")
+        url = getattr(success, "url", None)
+        console.print(f"  {platform}: {status}" + (f" - {url}" if url else ""))
 
 
 # ============ 전체 워크플로우 ============
 @app.command("run")
 def run_workflow(
     input_path: str = typer.Argument(..., help="입력 post.md 경로"),
-    platforms: str = typer.Option("all", "-p", "--platforms", help="발행 플랫폼 (naver,tistory,all)"),
+    platforms: str = typer.Option("all", "-p", "--platforms", help="발행 플랫폼 (naver,tistory,wordpress,all)"),
     skip_confirm: bool = typer.Option(False, "-y", "--yes", help="확인 없이 바로 발행"),
-    headless: bool = typer.Option(False, "--headless", help="헤드리스 모드")
+    headless: bool = typer.Option(False, "--headless", help="헤드리스 모드"),
+    validate_only: bool = typer.Option(False, "--validate-only", help="AI 초안 생성/발행 없이 입력 글과 이미지만 검증")
 ):
     """전체 워크플로우 실행 (생성 → 확인 → 발행)"""
+    from ..editor.validator import PostValidator
+    from ..publishers import PUBLISHERS, PublisherWarmer
+    
+    console.print(Panel("🚀 블로그 자동 발행 시스템", style="bold blue"))
+    
+    target_platforms = []
+    if platforms == "all":
+        target_platforms = ["naver", "tistory"]
+    else:
+        target_platforms = [p.strip() for p in platforms.split(",")]
+    
+    # 브라우저를 띄우기 전에 입력 글과 이미지 검증 (이미지 마커는 초안 생성 후 플랫폼별로 검증)
+    if not _print_validation(PostValidator(target_platforms).validate_file(input_path, check_markers=False)):
+        raise typer.Exit(code=1)
+    if validate_only:
+        return
+    
+    # 초안 생성/리라이팅 동안 브라우저 실행과 로그인을 미리 진행
+    warmer = None
+    if not _use_playwright():
+        warmer = PublisherWarmer(
+            [p for p in target_platforms if p in PUBLISHERS], headless=headless
+        ).start()
+    
+    try:
+        # 브라우저가 뜨는 동안 이미지 전처리
+        _preprocess_media([PostValidator.media_dir_for(input_path)], target_platforms)
+        _run_workflow(input_path, target_platforms, skip_confirm, headless, warmer)
+    finally:
+        if warmer is not None:
+            warmer.close()
+
+
+def _run_workflow(input_path: str, target_platforms: list, skip_confirm: bool, headless: bool, warmer):
+    """run 명령 본문 (warmer: 미리 로그인 중인 발행자, Playwright 백엔드면 None)"""
     import frontmatter
     from ..ai.content_generator import ContentGenerator
     from ..ai.rewriter import PlatformRewriter
-    from ..publishers.naver import NaverPublisher
-    from ..publishers.tistory import TistoryPublisher
-    
-    console.print(Panel("🚀 블로그 자동 발행 시스템", style="bold blue"))
+    from ..editor.validator import PostValidator
+    from ..publishers import PUBLISHERS
     
     # 1. 초안 생성
     console.print("\n[1/3] 📝 AI 초안 생성 중...", style="cyan bold")
@@ -365,56 +624,165 @@ def run_workflow(
     input_dir = post.get('input_dir', None)  # 이미지 경로용
     rewriter = PlatformRewriter()
     
-    target_platforms = []
-    if platforms == "all":
-        target_platforms = ["naver", "tistory"]
-    else:
-        target_platforms = [p.strip() for p in platforms.split(",")]
-    
     results = {}
+    images = [str(f) for f in (Path(input_dir) / "media").iterdir()] if input_dir and (Path(input_dir) / "media").exists() else None
+    validator = PostValidator(target_platforms)
+    media_dir = PostValidator.media_dir_for(latest_draft['path'], input_dir)
     
-    for platform in target_platforms:
-        console.print(f"\n  📤 {platform} 발행 중...", style="dim")
-        
-        try:
-            # 플랫폼별로 다른 제목과 내용 생성 (리라이팅)
+    if warmer is None:
+        # Playwright 백엔드: 리라이팅을 먼저 끝내고 한 브라우저에서 동시에 발행
+        jobs = []
+        for platform in target_platforms:
+            if platform not in ("naver", "tistory"):
+                console.print(f"  ⚠️ 지원하지 않는 플랫폼: {platform}", style="yellow")
+                continue
             platform_title, platform_content = rewriter.rewrite_content(post.content, platform, original_title)
             console.print(f"    📝 {platform} 제목: {platform_title}", style="dim")
-            
-            if platform == "naver":
-                publisher = NaverPublisher(headless=headless)
-            elif platform == "tistory":
-                publisher = TistoryPublisher(headless=headless)
-            else:
-                console.print(f"  ⚠️ 지원하지 않는 플랫폼: {platform}", style="yellow")
+            if not _validate_rewrite(validator, platform, platform_title, platform_content, tags, category, media_dir):
+                results[platform] = False
                 continue
+            jobs.append({
+                "platform": platform, "title": platform_title, "content": platform_content,
+                "category": category, "tags": tags, "images": images,
+            })
+        for job, result in zip(jobs, _publish_with_playwright(jobs, headless)):
+            results[job["platform"]] = result
+    else:
+        for platform in target_platforms:
+            console.print(f"\n  📤 {platform} 발행 중...", style="dim")
+        
+            try:
+                # 플랫폼별로 다른 제목과 내용 생성 (리라이팅)
+                platform_title, platform_content = rewriter.rewrite_content(post.content, platform, original_title)
+                console.print(f"    📝 {platform} 제목: {platform_title}", style="dim")
             
-            if publisher.login():
-                # 플랫폼별 다른 제목 사용, 이미지 경로 전달
-                results[platform] = publisher.publish(
-                    title=platform_title, 
-                    content=platform_content, 
-                    category=category,
-                    tags=tags,
-                    images=[str(f) for f in (Path(input_dir) / "media").iterdir()] if input_dir and (Path(input_dir) / "media").exists() else None
-                )
-                publisher.logout()
-            else:
-                results[platform] = False
+                if platform not in PUBLISHERS:
+                    console.print(f"  ⚠️ 지원하지 않는 플랫폼: {platform}", style="yellow")
+                    continue
+            
+                if not _validate_rewrite(validator, platform, platform_title, platform_content, tags, category, media_dir):
+                    results[platform] = False
+                    continue
+            
+                # 초안 생성 중 미리 로그인해 둔 발행자 (끝나지 않았으면 여기서 대기)
+                publisher = warmer.get(platform)
+                if publisher:
+                    # 플랫폼별 다른 제목 사용, 이미지 경로 전달
+                    results[platform] = publisher.publish(
+                        title=platform_title, 
+                        content=platform_content, 
+                        category=category,
+                        tags=tags,
+                        images=images
+                    )
+                else:
+                    results[platform] = False
                 
-        except Exception as e:
-            console.print(f"  ❌ {platform} 오류: {e}", style="red")
-            results[platform] = False
+            except Exception as e:
+                console.print(f"  ❌ {platform} 오류: {e}", style="red")
+                results[platform] = False
     
     # 결과 출력
     console.print("\n" + "="*50)
     console.print("📊 최종 결과:", style="bold")
     for platform, success in results.items():
         status = "✅ 성공" if success else "❌ 실패"
-        console.print(f"  {platform}: {status}")
+        url = getattr(success, "url", None)
+        console.print(f"  {platform}: {status}" + (f" - {url}" if url else ""))
     
     success_count = sum(1 for v in results.values() if v)
     console.print(f"\n🎉 {success_count}/{len(results)} 블로그 발행 완료!", style="green bold")
+    
+    if warmer is not None:
+        warmer.log_report()
+
+
+@app.command("selectors")
+def selector_report(
+    platform: str = typer.Option("naver", "-p", "--platform", help="플랫폼"),
+    reset: bool = typer.Option(False, "--reset", help="통계 초기화")
+):
+    """대체 셀렉터 성공/실패 통계 및 죽은 셀렉터 확인"""
+    from ..utils.selector_registry import SelectorRegistry
+    
+    registry = SelectorRegistry(platform)
+    if reset:
+        registry.reset()
+        console.print(f"🧹 {platform} 셀렉터 통계를 초기화했습니다.", style="green")
+        return
+    
+    report = registry.report()
+    if not report:
+        console.print(f"📭 {platform} 셀렉터 통계가 없습니다.", style="yellow")
+        return
+    
+    table = Table(title=f"🎯 {platform} 셀렉터 통계", box=box.SIMPLE_HEAVY)
+    table.add_column("체인", style="cyan", no_wrap=True)
+    table.add_column("셀렉터", overflow="fold")
+    table.add_column("성공", justify="right")
+    table.add_column("실패", justify="right")
+    table.add_column("상태", justify="center")
+    for chain, entries in report.items():
+        for selector in registry.order(chain, list(entries)):
+            entry = entries[selector]
+            dead = entry.get("streak", 0) >= registry.DEAD_AFTER
+            table.add_row(
+                chain, selector, str(entry.get("hits", 0)), str(entry.get("misses", 0)),
+                "[red]죽음[/red]" if dead else "[green]정상[/green]",
+            )
+    console.print(table)
+    
+    dead = registry.dead_selectors()
+    if dead:
+        count = sum(len(v) for v in dead.values())
+        console.print(f"⚠️ 연속 {registry.DEAD_AFTER}회 이상 실패한 셀렉터 {count}개 - 코드에서 정리하세요.", style="yellow")
+
+
+@app.command("metrics")
+def metrics_report(
+    platform: str = typer.Option(None, "-p", "--platform", help="플랫폼 (생략 시 전체)"),
+    recent: int = typer.Option(5, "-n", "--recent", help="최근 구간 발행 수"),
+    threshold: float = typer.Option(0.2, "--threshold", help="이 비율 이상 증가한 지표 강조 (0.2 = 20%)")
+):
+    """발행별 브라우저 성능 지표 요약 (최근 발행 vs 이전 발행 중앙값)"""
+    from ..utils.perf_metrics import load_history, summarize_history
+    
+    for name in [platform] if platform else ["naver", "tistory"]:
+        history = load_history(name)
+        if not history:
+            console.print(f"📭 {name} 성능 기록이 없습니다.", style="yellow")
+            continue
+        
+        summary = summarize_history(history, recent=recent)
+        table = Table(
+            title=f"📈 {name} 브라우저 성능 (최근 {min(recent, len(history))}회 / 전체 {len(history)}회)",
+            box=box.SIMPLE_HEAVY,
+        )
+        table.add_column("지표", style="cyan", no_wrap=True)
+        table.add_column("최근", justify="right")
+        table.add_column("이전", justify="right")
+        table.add_column("변화", justify="right")
+        
+        regressions = 0
+        for key, entry in summary.items():
+            change = entry["change"]
+            if change is None:
+                change_text = "-"
+            elif change >= threshold:
+                change_text = f"[red]+{change:.0%}[/red]"
+                regressions += 1
+            else:
+                change_text = f"{change:+.0%}"
+            baseline = entry["baseline"]
+            table.add_row(
+                key,
+                f"{entry['recent']:g}",
+                f"{baseline:g}" if baseline is not None else "-",
+                change_text,
+            )
+        console.print(table)
+        if regressions:
+            console.print(f"⚠️ {name}: {regressions}개 지표가 {threshold:.0%} 이상 증가했습니다.", style="yellow")
 
 
 @app.command("version")
@@ -423,7 +791,7 @@ def version():
     console.print(Panel(
         "[bold]블로그 자동 발행 시스템[/bold]\n"
         "버전: 1.0.0\n"
-        "지원 플랫폼: 네이버, 티스토리",
+        "지원 플랫폼: 네이버, 티스토리, 워드프레스",
         title="ℹ️ 정보"
     ))
 
@@ -557,8 +925,8 @@ def publish_mode():
     import frontmatter
     from ..ai.content_generator import ContentGenerator
     from ..ai.rewriter import PlatformRewriter
-    from ..publishers.naver import NaverPublisher
-    from ..publishers.tistory import TistoryPublisher
+    from ..editor.validator import PostValidator
+    from ..publishers import PublisherWarmer
     
     console.print(Panel("🚀 블로그 발행", style="bold blue"))
     
@@ -700,6 +1068,20 @@ def publish_mode():
             
             console.print(f"  ✅ {len(selected_posts)}개 미발행 글만 진행", style="green")
     
+    # 브라우저를 띄우기 전에 입력 글과 이미지 검증 (오류가 있는 글은 제외)
+    validator = PostValidator(target_platforms)
+    valid_posts = []
+    for post_info in selected_posts:
+        console.print(f"\n  🔍 {post_info['folder_name']}", style="dim")
+        if _print_validation(validator.validate_file(post_info['path'], check_markers=False), label="검증"):
+            valid_posts.append(post_info)
+    if len(valid_posts) < len(selected_posts):
+        console.print(f"  ⚠️ 검증에 실패한 {len(selected_posts) - len(valid_posts)}개 글은 제외합니다.", style="yellow")
+    selected_posts = valid_posts
+    if not selected_posts:
+        console.print("  발행할 글이 없습니다.", style="yellow")
+        return
+    
     # 최종 확인
     if not Confirm.ask(f"\n  {len(selected_posts)}개 글을 {platform_choice}에 발행하시겠습니까?"):
         console.print("  발행이 취소되었습니다.", style="yellow")
@@ -713,77 +1095,88 @@ def publish_mode():
     
     total_results = {}
     
-    for idx, post_info in enumerate(selected_posts, 1):
-        console.print(f"\n  📝 [{idx}/{len(selected_posts)}] {post_info['folder_name']}", style="bold")
+    # 첫 글의 AI 초안 생성 동안 브라우저 실행과 로그인을 미리 진행
+    warmer = PublisherWarmer(target_platforms, headless=False).start()
+    
+    try:
+        # 브라우저가 뜨는 동안 선택한 글들의 이미지 전처리
+        _preprocess_media([PostValidator.media_dir_for(post_info['path']) for post_info in selected_posts], target_platforms)
+        for idx, post_info in enumerate(selected_posts, 1):
+            console.print(f"\n  📝 [{idx}/{len(selected_posts)}] {post_info['folder_name']}", style="bold")
         
-        # AI 초안 생성
-        console.print("    🤖 AI 초안 생성 중...", style="dim")
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("    Claude API 호출 중...", total=None)
-            gen.generate_draft(post_info['path'])
-            progress.update(task, completed=True)
+            # AI 초안 생성
+            console.print("    🤖 AI 초안 생성 중...", style="dim")
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console
+            ) as progress:
+                task = progress.add_task("    Claude API 호출 중...", total=None)
+                gen.generate_draft(post_info['path'])
+                progress.update(task, completed=True)
         
-        # 최신 초안 가져오기
-        drafts = gen.list_drafts()
-        if not drafts:
-            console.print("    ❌ 초안 생성 실패", style="red")
-            continue
+            # 최신 초안 가져오기
+            drafts = gen.list_drafts()
+            if not drafts:
+                console.print("    ❌ 초안 생성 실패", style="red")
+                continue
         
-        latest_draft = drafts[0]
-        post = frontmatter.load(latest_draft['path'])
+            latest_draft = drafts[0]
+            post = frontmatter.load(latest_draft['path'])
         
-        original_title = post.get('title', '제목 없음')
-        tags = post.get('keywords', [])
-        category = post.get('category', None)
-        input_dir = post.get('input_dir', None)
+            original_title = post.get('title', '제목 없음')
+            tags = post.get('keywords', [])
+            category = post.get('category', None)
+            input_dir = post.get('input_dir', None)
         
-        # 플랫폼별 발행
-        for platform in target_platforms:
-            console.print(f"    📤 {platform} 발행 중...", style="dim")
+            # 플랫폼별 발행
+            for platform in target_platforms:
+                console.print(f"    📤 {platform} 발행 중...", style="dim")
             
-            try:
-                platform_title, platform_content = rewriter.rewrite_content(
-                    post.content, platform, original_title
-                )
-                
-                if platform == "naver":
-                    publisher = NaverPublisher(headless=False)
-                elif platform == "tistory":
-                    publisher = TistoryPublisher(headless=False)
-                else:
-                    continue
-                
-                if publisher.login():
-                    success = publisher.publish(
-                        title=platform_title,
-                        content=platform_content,
-                        category=category,
-                        tags=tags,
-                        images=[str(f) for f in (Path(input_dir) / "media").iterdir()] 
-                            if input_dir and (Path(input_dir) / "media").exists() else None
+                try:
+                    platform_title, platform_content = rewriter.rewrite_content(
+                        post.content, platform, original_title
                     )
-                    publisher.logout()
+                    if not _validate_rewrite(
+                        validator, platform, platform_title, platform_content, tags, category,
+                        PostValidator.media_dir_for(latest_draft['path'], input_dir),
+                    ):
+                        total_results[f"{post_info['folder_name']}_{platform}"] = False
+                        continue
+                
+                    # 첫 글의 초안 생성 중 로그인해 둔 발행자를 모든 글에 재사용
+                    publisher = warmer.get(platform)
+                    if publisher:
+                        success = publisher.publish(
+                            title=platform_title,
+                            content=platform_content,
+                            category=category,
+                            tags=tags,
+                            images=[str(f) for f in (Path(input_dir) / "media").iterdir()] 
+                                if input_dir and (Path(input_dir) / "media").exists() else None
+                        )
                     
-                    key = f"{post_info['folder_name']}_{platform}"
-                    total_results[key] = success
+                        key = f"{post_info['folder_name']}_{platform}"
+                        total_results[key] = success
                     
-                    if success:
-                        console.print(f"    ✅ {platform} 발행 성공", style="green")
-                        # 발행 성공 시 기록
-                        ContentGenerator.mark_as_published(post_info['dir'], platform)
+                        if success:
+                            console.print(f"    ✅ {platform} 발행 성공" + (f" - {success.url}" if success.url else ""), style="green")
+                            # 발행 성공 시 기록 (글 주소 포함)
+                            ContentGenerator.mark_as_published(
+                                post_info['dir'], platform, url=success.url, metrics=success.metrics
+                            )
+                        else:
+                            console.print(f"    ❌ {platform} 발행 실패", style="red")
                     else:
-                        console.print(f"    ❌ {platform} 발행 실패", style="red")
-                else:
-                    total_results[f"{post_info['folder_name']}_{platform}"] = False
-                    console.print(f"    ❌ {platform} 로그인 실패", style="red")
+                        total_results[f"{post_info['folder_name']}_{platform}"] = False
+                        console.print(f"    ❌ {platform} 로그인 실패", style="red")
                     
-            except Exception as e:
-                console.print(f"    ❌ {platform} 오류: {e}", style="red")
-                total_results[f"{post_info['folder_name']}_{platform}"] = False
+                except Exception as e:
+                    console.print(f"    ❌ {platform} 오류: {e}", style="red")
+                    total_results[f"{post_info['folder_name']}_{platform}"] = False
+    finally:
+        warmer.close()
+    warmer.log_report()
     
     # 최종 결과
     console.print("\n" + "="*50)
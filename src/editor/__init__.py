@@ -1 +1,4 @@
 # 편집기 모듈
+from .validator import PostValidator, ValidationReport, ValidationIssue, resolve_image_marker
+
+__all__ = ["PostValidator", "ValidationReport", "ValidationIssue", "resolve_image_marker"]
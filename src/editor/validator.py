@@ -0,0 +1,303 @@
+"""
+발행 전 검증
+브라우저를 띄우기 전에 초안(리라이팅 결과)과 media 폴더를 정적으로 검사해
+발행 도중에야 드러나던 문제(찾을 수 없는 이미지 마커, 입력할 수 없는 제목, 태그 수 초과,
+너무 크거나 지원하지 않는 이미지)를 미리 알려줌
+"""
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional, Union
+import frontmatter
+
+from ..media.image_handler import ImagePreprocessor
+from ..utils.cache import JsonCache
+
+
+@dataclass
+class ValidationIssue:
+    """검증 문제 하나"""
+    level: str                      # "error" (발행 중단) 또는 "warning" (발행은 진행)
+    message: str
+    platform: Optional[str] = None  # 특정 플랫폼에만 해당하면 플랫폼 이름
+
+
+@dataclass
+class ValidationReport:
+    """검증 결과
+
+    bool로 평가하면 오류가 없는지 여부가 됩니다.
+    """
+    issues: list = field(default_factory=list)
+
+    def add(self, level: str, message: str, platform: str = None):
+        self.issues.append(ValidationIssue(level, message, platform))
+
+    @property
+    def errors(self) -> list:
+        return [issue for issue in self.issues if issue.level == "error"]
+
+    @property
+    def warnings(self) -> list:
+        return [issue for issue in self.issues if issue.level == "warning"]
+
+    def errors_for(self, platform: str) -> list:
+        """해당 플랫폼 발행을 막는 오류 (플랫폼 공통 오류 포함)"""
+        return [issue for issue in self.errors if issue.platform in (None, platform)]
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+
+def resolve_image_marker(name: str, files: dict) -> Optional[str]:
+    """[IMAGE: ...] 마커 이름과 일치하는 media 파일 찾기
+
+    발행자들의 매칭 규칙(정확한 파일명 → 앞 번호 → 부분 문자열)을 모두 따릅니다.
+
+    Args:
+        name: 마커 안의 파일명 또는 설명
+        files: {파일명: 경로} 딕셔너리
+
+    Returns:
+        일치한 파일명. 없으면 None
+    """
+    key = name.strip().lower().replace(" ", "")
+    names = {file_name: file_name.lower().replace(" ", "") for file_name in files}
+
+    for file_name, clean in names.items():
+        if key == clean:
+            return file_name
+
+    number = re.match(r"^(\d+)\.", key)
+    if number:
+        for file_name, clean in names.items():
+            if clean.startswith(number.group(1) + "."):
+                return file_name
+
+    for file_name, clean in names.items():
+        if key in clean or clean in key:
+            return file_name
+    return None
+
+
+class PostValidator:
+    """초안과 media 폴더 정적 검증 (브라우저/네트워크 사용 안 함)
+
+    - [IMAGE: ...] 마커가 media 폴더 파일과 연결되는지
+    - 제목이 비어 있지 않은지, ChromeDriver로 입력할 수 없는 BMP 밖 문자(이모지)가 있는지
+    - 플랫폼별 태그 수 제한
+    - 카테고리 지정 여부와 저장된 카테고리 목록에 있는지
+    - 이미지 형식(Pillow로 헤더 확인)과 크기
+    """
+
+    MARKER_PATTERN = re.compile(r"\[IMAGE:\s*([^\]]+)\]", re.IGNORECASE)
+
+    IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp"}
+    VIDEO_EXTENSIONS = {".mp4", ".mov", ".avi", ".mkv", ".webm"}
+
+    # 플랫폼별 제한
+    # - max_tags: 발행자가 입력하는 태그 수 (초과분은 버려짐, None이면 제한 없음)
+    # - max_image_mb: 원본 그대로 올리는 이미지 크기 한도 (None이면 사이트 설정)
+    #   이미지 전처리(IMAGE_PREPROCESS)가 켜져 있으면 재압축된 사본을 올리므로 전처리하지 않는 이미지(움직이는 GIF)에만 적용
+    # - non_bmp_title: 제목의 BMP 밖 문자(이모지) 처리 ("error": 키 입력 불가, "strip": 제거 후 발행, None: 그대로 발행)
+    PLATFORM_RULES = {
+        "naver": {"max_tags": 30, "max_image_mb": 20, "non_bmp_title": "error"},
+        "tistory": {"max_tags": 10, "max_image_mb": None, "non_bmp_title": "strip"},
+        "wordpress": {"max_tags": None, "max_image_mb": None, "non_bmp_title": None},
+    }
+
+    def __init__(self, platforms: Iterable[str] = ("naver", "tistory"), categories: dict = None, preprocess: bool = None):
+        """
+        Args:
+            platforms: 검증할 발행 플랫폼
+            categories: {플랫폼: [카테고리명]}. None이면 발행자가 저장한 카테고리 맵(.cache/categories.json)에서 수집
+            preprocess: 발행 전 이미지 전처리 여부. None이면 IMAGE_PREPROCESS 환경변수
+        """
+        self.platforms = [p for p in platforms if p in self.PLATFORM_RULES]
+        self.categories = categories if categories is not None else self._cached_categories()
+        self.preprocess = ImagePreprocessor(enabled=preprocess).enabled
+
+    @staticmethod
+    def _cached_categories() -> dict:
+        """저장된 카테고리 맵을 플랫폼별 이름 목록으로 ({"tistory:블로그": {...}} → {"tistory": [...]})"""
+        categories = {}
+        for key, entries in JsonCache("categories").load().items():
+            platform = key.split(":")[0]
+            categories.setdefault(platform, []).extend(entries or {})
+        return categories
+
+    def validate_file(self, path: Union[str, Path], check_markers: bool = True) -> ValidationReport:
+        """post.md 또는 초안 파일 검증
+
+        media 폴더는 초안의 input_dir/media, 없으면 파일과 같은 폴더의 media
+
+        Args:
+            path: 마크다운 파일 경로
+            check_markers: 이미지 마커 검증 여부 (AI 초안 생성 전 post.md는 마커가 없음)
+        """
+        path = Path(path)
+        report = ValidationReport()
+        try:
+            post = frontmatter.load(path)
+        except Exception as e:
+            report.add("error", f"파일을 읽을 수 없음: {path} ({e})")
+            return report
+
+        keywords = post.get("keywords", [])
+        if isinstance(keywords, str):
+            keywords = [k.strip() for k in keywords.split(",") if k.strip()]
+
+        return self.validate(
+            title=post.get("title", ""),
+            content=post.content if check_markers else "",
+            tags=keywords,
+            category=post.get("category"),
+            media_dir=self.media_dir_for(path, post.get("input_dir")),
+        )
+
+    @staticmethod
+    def media_dir_for(path: Union[str, Path], input_dir: str = None) -> Path:
+        """초안/입력 파일에 해당하는 media 폴더"""
+        return (Path(input_dir) if input_dir else Path(path).parent) / "media"
+
+    def validate(
+        self,
+        title: str,
+        content: str,
+        tags: Optional[list] = None,
+        category: Optional[str] = None,
+        media_dir: Union[str, Path, None] = None,
+        platforms: Optional[Iterable[str]] = None,
+    ) -> ValidationReport:
+        """제목/본문/태그/카테고리/media 폴더 검증
+
+        Args:
+            title: 글 제목
+            content: 본문 (마크다운, 이미지 마커 포함)
+            tags: 태그 목록
+            category: 카테고리
+            media_dir: 이미지 폴더
+            platforms: 검증할 플랫폼 (None이면 생성 시 지정한 플랫폼) - 리라이팅 결과는 플랫폼별로 검증
+
+        Returns:
+            ValidationReport
+        """
+        platforms = [p for p in (platforms or self.platforms) if p in self.PLATFORM_RULES]
+        report = ValidationReport()
+        media = self._media_files(media_dir)
+
+        self._check_title(report, title or "", platforms)
+        self._check_tags(report, tags or [], platforms)
+        self._check_category(report, category, platforms)
+        if content is not None:
+            self._check_markers(report, content, media, media_dir)
+        self._check_images(report, media, platforms)
+        return report
+
+    def _media_files(self, media_dir) -> dict:
+        """{파일명: 경로} (숨김 파일 제외)"""
+        if not media_dir or not Path(media_dir).is_dir():
+            return {}
+        return {
+            f.name: f for f in sorted(Path(media_dir).iterdir())
+            if f.is_file() and not f.name.startswith(".")
+        }
+
+    def _check_title(self, report: ValidationReport, title: str, platforms: list):
+        if not title.strip():
+            report.add("error", "제목이 비어 있음")
+            return
+
+        outside_bmp = "".join(sorted({c for c in title if ord(c) > 0xFFFF}))
+        if not outside_bmp:
+            return
+        if not "".join(c for c in title if ord(c) <= 0xFFFF).strip() and any(
+            self.PLATFORM_RULES[p]["non_bmp_title"] for p in platforms
+        ):
+            report.add("error", f"BMP 밖 문자를 빼면 제목이 비어 있음: {title}")
+            return
+        for platform in platforms:
+            rule = self.PLATFORM_RULES[platform]["non_bmp_title"]
+            if rule == "error":
+                report.add("error", f"제목에 입력할 수 없는 문자(이모지 등) 포함: {outside_bmp}", platform)
+            elif rule == "strip":
+                report.add("warning", f"제목의 이모지 등은 제거되고 발행됨: {outside_bmp}", platform)
+
+    def _check_tags(self, report: ValidationReport, tags: list, platforms: list):
+        for platform in platforms:
+            limit = self.PLATFORM_RULES[platform]["max_tags"]
+            if limit and len(tags) > limit:
+                report.add("warning", f"태그 {len(tags)}개 중 앞의 {limit}개만 입력됨", platform)
+        blank = [tag for tag in tags if not str(tag).strip()]
+        if blank:
+            report.add("warning", f"빈 태그 {len(blank)}개")
+
+    def _check_category(self, report: ValidationReport, category: Optional[str], platforms: list):
+        if not category:
+            report.add("warning", "카테고리 없음 (기본 카테고리로 발행)")
+            return
+        for platform in platforms:
+            known = {name.lstrip("- ").strip() for name in self.categories.get(platform, [])}
+            if known and category.lstrip("- ").strip() not in known:
+                report.add("warning", f"저장된 카테고리 목록에 없음: {category} (발행 시 목록을 다시 읽음)", platform)
+
+    def _check_markers(self, report: ValidationReport, content: str, media: dict, media_dir):
+        markers = [m.strip() for m in self.MARKER_PATTERN.findall(content)]
+        images = {name: path for name, path in media.items() if path.suffix.lower() in self.IMAGE_EXTENSIONS}
+
+        if markers and not images:
+            report.add("error", f"이미지 마커 {len(markers)}개가 있지만 media 폴더에 이미지 없음: {media_dir}")
+            return
+
+        used = set()
+        for marker in markers:
+            name = resolve_image_marker(marker, images)
+            if name is None:
+                report.add("error", f"media 폴더에서 찾을 수 없는 이미지 마커: [IMAGE: {marker}]")
+            else:
+                used.add(name)
+
+        unused = [name for name in images if name not in used]
+        if markers and unused:
+            report.add("warning", f"본문에 쓰이지 않는 이미지 {len(unused)}개: {', '.join(unused[:5])}")
+
+    def _check_images(self, report: ValidationReport, media: dict, platforms: list):
+        try:
+            from PIL import Image
+        except ImportError:
+            Image = None
+
+        for name, path in media.items():
+            suffix = path.suffix.lower()
+            if suffix in self.VIDEO_EXTENSIONS:
+                continue
+            if suffix not in self.IMAGE_EXTENSIONS:
+                report.add("error", f"지원하지 않는 파일 형식: {name}")
+                continue
+
+            size_mb = path.stat().st_size / (1024 * 1024)
+            if size_mb == 0:
+                report.add("error", f"빈 이미지 파일: {name}")
+                continue
+
+            animated = False
+            if Image is not None:
+                try:
+                    with Image.open(path) as img:
+                        animated = getattr(img, "n_frames", 1) > 1
+                        img.verify()
+                except Exception as e:
+                    report.add("error", f"이미지를 열 수 없음: {name} ({e})")
+                    continue
+
+            # 전처리된 사본은 플랫폼 기준 크기 이하로 재압축되므로 원본 그대로 올라가는 경우만 확인
+            if self.preprocess and not animated:
+                continue
+            for platform in platforms:
+                limit = self.PLATFORM_RULES[platform]["max_image_mb"]
+                if limit and size_mb > limit:
+                    report.add("error", f"이미지가 {limit}MB 초과 ({size_mb:.1f}MB): {name}", platform)
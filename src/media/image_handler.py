@@ -1,2 +1,243 @@
-# 이미지 핸들러
-# TODO: 이미지 리사이즈, 최적화, 워터마크 등
+"""
+이미지 핸들러
+브라우저 작업 전에 글의 이미지를 프로세스 풀에서 한꺼번에 전처리
+(EXIF 방향 보정, 최대 변 길이 리사이즈, 플랫폼별 목표 크기로 재압축)
+결과는 글 폴더의 .cache/images/<플랫폼>/에 원본과 같은 파일명으로 저장해 모든 발행자가 재사용
+"""
+import io
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import List, Optional
+from loguru import logger
+
+from ..utils.cache import JsonCache
+
+
+# 플랫폼별 전처리 기준
+# - max_side: 가로/세로 중 긴 변 최대 길이 (px)
+# - target_kb: 이 크기를 넘으면 품질을 낮춰(필요하면 크기도 줄여) 재압축
+PROFILES = {
+    "naver": {"max_side": 2000, "target_kb": 1500},
+    "tistory": {"max_side": 1800, "target_kb": 3000},
+    "wordpress": {"max_side": 2048, "target_kb": 1500},
+}
+DEFAULT_PROFILE = {"max_side": 2000, "target_kb": 1500}
+
+# 전처리 방식이 바뀌면 올려서 이전 결과를 다시 만들게 함
+PIPELINE_VERSION = 1
+
+JPEG_QUALITIES = (85, 78, 70, 62)
+SHRINK_STEPS = 3        # 최저 품질로도 목표 크기를 넘으면 0.8배씩 줄이는 최대 횟수
+MANIFEST_NAME = "manifest"
+
+
+def cache_dir_for(path, platform: str) -> Path:
+    """이미지가 속한 글의 전처리 결과 폴더 (글 폴더/.cache/images/<플랫폼>)"""
+    parent = Path(path).parent
+    post_dir = parent.parent if parent.name == "media" else parent
+    return post_dir / ".cache" / "images" / platform
+
+
+def _is_processed(path) -> bool:
+    """이미 전처리 결과 폴더에 있는 이미지인지"""
+    parts = Path(path).parts
+    return len(parts) >= 4 and parts[-4:-2] == (".cache", "images")
+
+
+def process_image(source: str, dest: str, max_side: int, target_kb: int) -> dict:
+    """이미지 하나 전처리 (프로세스 풀 작업 함수)
+
+    방향 정보가 없고 긴 변과 파일 크기가 기준 이하면 원본을 그대로 씁니다 (재압축 손실 방지).
+    움직이는 GIF는 변환하지 않습니다. 형식은 원본과 같게 유지합니다 (파일명 매칭 유지).
+
+    Args:
+        source: 원본 경로
+        dest: 결과 저장 경로
+        max_side: 긴 변 최대 길이 (px)
+        target_kb: 목표 파일 크기 (KB)
+
+    Returns:
+        {"output": 결과 경로 또는 None(원본 사용), "before_kb", "after_kb"}
+    """
+    from PIL import Image, ImageOps
+
+    before_kb = os.path.getsize(source) / 1024
+    with Image.open(source) as img:
+        image_format = img.format or "JPEG"
+        if getattr(img, "n_frames", 1) > 1:
+            return {"output": None, "before_kb": before_kb, "after_kb": before_kb}
+
+        orientation = img.getexif().get(274, 1)
+        too_large = max(img.size) > max_side
+        if orientation in (None, 1) and not too_large and before_kb <= target_kb:
+            return {"output": None, "before_kb": before_kb, "after_kb": before_kb}
+
+        img = ImageOps.exif_transpose(img)
+        if too_large:
+            img.thumbnail((max_side, max_side), Image.LANCZOS)
+        data = _encode(img, image_format, target_kb)
+
+    # 같은 이미지를 동시에 처리해도 결과 파일이 깨지지 않도록 임시 파일 → rename
+    fd, temp = tempfile.mkstemp(dir=os.path.dirname(dest), suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(temp, dest)
+    return {"output": dest, "before_kb": before_kb, "after_kb": len(data) / 1024}
+
+
+def _encode(img, image_format: str, target_kb: int) -> bytes:
+    """원본 형식으로 저장 (JPEG/WEBP는 목표 크기 이하가 될 때까지 품질 → 크기 순으로 낮춤)"""
+    from PIL import Image
+
+    if image_format in ("JPEG", "MPO", "WEBP"):
+        image_format = "WEBP" if image_format == "WEBP" else "JPEG"
+        if image_format == "JPEG" and img.mode != "RGB":
+            img = img.convert("RGB")
+        for _ in range(SHRINK_STEPS + 1):
+            for quality in JPEG_QUALITIES:
+                buffer = io.BytesIO()
+                img.save(buffer, image_format, quality=quality, optimize=True)
+                if buffer.tell() / 1024 <= target_kb:
+                    return buffer.getvalue()
+            img = img.resize((max(1, int(img.width * 0.8)), max(1, int(img.height * 0.8))), Image.LANCZOS)
+        return buffer.getvalue()
+
+    buffer = io.BytesIO()
+    img.save(buffer, image_format, **({"optimize": True} if image_format == "PNG" else {}))
+    return buffer.getvalue()
+
+
+class ImagePreprocessor:
+    """글 이미지 일괄 전처리
+
+    - 전처리가 필요한 이미지만 프로세스 풀에서 동시에 처리 (한 장이면 현재 프로세스에서)
+    - 결과 폴더의 manifest.json에 원본 크기/수정 시각/기준을 기록해 바뀌지 않은 이미지는 다시 처리하지 않음
+    - IMAGE_PREPROCESS=false로 끌 수 있고, IMAGE_PREPROCESS_WORKERS로 프로세스 수 지정 (0이면 CPU 수)
+    """
+
+    def __init__(self, enabled: bool = None, workers: int = None):
+        """
+        Args:
+            enabled: 전처리 여부. None이면 IMAGE_PREPROCESS 환경변수 (기본 true)
+            workers: 프로세스 수. None이면 IMAGE_PREPROCESS_WORKERS (0이면 CPU 수)
+        """
+        if enabled is None:
+            enabled = os.getenv("IMAGE_PREPROCESS", "true").lower() == "true"
+        if workers is None:
+            workers = int(os.getenv("IMAGE_PREPROCESS_WORKERS", "0"))
+        self.enabled = enabled
+        self.workers = workers or os.cpu_count() or 1
+
+    def prepare(self, images: Optional[list], platform: str) -> Optional[list]:
+        """업로드할 이미지 경로 목록 (전처리 결과가 있으면 결과 경로, 아니면 원본 경로)
+
+        Args:
+            images: 원본 이미지 경로 목록
+            platform: 발행 플랫폼 (PROFILES 기준 선택)
+
+        Returns:
+            images와 같은 순서의 경로 목록
+        """
+        if not images or not self.enabled:
+            return images
+        return self.prepare_many(images, [platform])[platform]
+
+    def prepare_many(self, images: list, platforms: list) -> dict:
+        """여러 플랫폼 기준의 전처리를 프로세스 풀 하나로 처리
+
+        Returns:
+            {플랫폼: images와 같은 순서의 경로 목록}
+        """
+        images = [str(p) for p in images or []]
+        if not self.enabled:
+            return {platform: images for platform in platforms}
+
+        start = time.time()
+        results = {platform: list(images) for platform in platforms}
+        jobs = []  # (플랫폼, 순서, 원본, 결과 경로, 기준, manifest 항목)
+        manifests = {}  # {결과 폴더: manifest}
+        reused = 0
+
+        for platform in platforms:
+            profile = PROFILES.get(platform, DEFAULT_PROFILE)
+            params = f"{profile['max_side']}:{profile['target_kb']}:{PIPELINE_VERSION}"
+            for index, source in enumerate(images):
+                path = Path(source)
+                if _is_processed(path) or not path.is_file():
+                    continue
+                cache_dir = cache_dir_for(path, platform)
+                stat = path.stat()
+                entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "params": params}
+                if cache_dir not in manifests:
+                    manifests[cache_dir] = JsonCache(MANIFEST_NAME, cache_dir=cache_dir).load()
+                cached = manifests[cache_dir].get(path.name)
+                if cached and {k: cached.get(k) for k in entry} == entry:
+                    output = cached.get("output")
+                    if output is None or (cache_dir / output).exists():
+                        results[platform][index] = str(cache_dir / output) if output else source
+                        reused += 1
+                        continue
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                jobs.append((platform, index, source, str(cache_dir / path.name), profile, entry))
+
+        outcomes = self._run(jobs)
+
+        before_kb = after_kb = 0
+        changed = 0
+        updates = {}  # {결과 폴더: {파일명: manifest 항목}}
+        for (platform, index, source, dest, _, entry), outcome in zip(jobs, outcomes):
+            if outcome is None:
+                continue  # 실패 시 원본 사용
+            output = outcome["output"]
+            before_kb += outcome["before_kb"]
+            after_kb += outcome["after_kb"]
+            if output:
+                results[platform][index] = output
+                changed += 1
+            updates.setdefault(Path(dest).parent, {})[Path(source).name] = dict(
+                entry, output=Path(output).name if output else None
+            )
+        for cache_dir, values in updates.items():
+            JsonCache(MANIFEST_NAME, cache_dir=cache_dir).update(values)
+
+        if jobs or reused:
+            logger.info(
+                f"🖼️ 이미지 전처리 ({', '.join(platforms)}): {len(jobs)}건 처리, {changed}건 변환 "
+                f"({before_kb / 1024:.1f}MB → {after_kb / 1024:.1f}MB), 재사용 {reused}건, {time.time() - start:.1f}초"
+            )
+        return results
+
+    def _run(self, jobs: list) -> List[Optional[dict]]:
+        """작업 실행 (2건 이상이고 프로세스가 2개 이상이면 프로세스 풀, 풀을 쓸 수 없으면 순서대로)"""
+        if not jobs:
+            return []
+
+        args = [(source, dest, profile["max_side"], profile["target_kb"]) for _, _, source, dest, profile, _ in jobs]
+        workers = min(self.workers, len(jobs))
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    futures = [executor.submit(process_image, *arg) for arg in args]
+                    return [self._outcome(future.result, arg[0]) for future, arg in zip(futures, args)]
+            except (OSError, BrokenProcessPool, NotImplementedError) as e:
+                logger.warning(f"⚠️ 프로세스 풀 사용 불가 - 순서대로 처리: {e}")
+
+        return self._run_sequential(args)
+
+    def _run_sequential(self, args: list) -> List[Optional[dict]]:
+        """현재 프로세스에서 순서대로 처리"""
+        return [self._outcome(lambda arg=arg: process_image(*arg), arg[0]) for arg in args]
+
+    @staticmethod
+    def _outcome(call, source: str) -> Optional[dict]:
+        try:
+            return call()
+        except BrokenProcessPool:
+            raise  # 풀 전체 실패는 _run에서 순서대로 다시 처리
+        except Exception as e:
+            logger.warning(f"⚠️ 이미지 전처리 실패 (원본 사용): {Path(source).name} - {e}")
+            return None
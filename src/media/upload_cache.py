@@ -0,0 +1,131 @@
+"""
+업로드 이미지 URL 캐시
+이미지 내용(sha256)으로 플랫폼/블로그별 업로드 결과(CDN URL)를 저장해
+재발행, 실패 후 재시도, fan-out에서 같은 사진을 다시 올리지 않음
+"""
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from loguru import logger
+
+from ..utils.cache import JsonCache
+
+
+CACHE_NAME = "upload_urls"
+
+
+def content_hash(path) -> str:
+    """파일 내용 sha256
+
+    전처리 결과 파일을 해시하므로 전처리 기준이 바뀌어 결과가 달라지면 키도 달라집니다.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class UploadCache:
+    """플랫폼/블로그별 업로드 결과 캐시 (.cache/upload_urls.json)
+
+    - 키: 업로드한 파일 내용의 sha256, 값: 업로드 결과 (티스토리는 URL, 네이버는 사진 정보 딕셔너리)
+    - UPLOAD_URL_CACHE_TTL_DAYS(기본 30일)가 지난 항목은 다시 업로드 (0이면 캐시 사용 안 함)
+    - UPLOAD_URL_CACHE_VERIFY=true면 재사용 전에 HEAD 요청으로 URL이 살아 있는지 확인
+    """
+
+    VERIFY_TIMEOUT = 5
+
+    def __init__(self, platform: str, scope: str, ttl_days: float = None, verify: bool = None):
+        """
+        Args:
+            platform: 플랫폼 이름
+            scope: 블로그 이름 또는 아이디 (업로드 결과를 공유할 수 있는 범위)
+            ttl_days: 재사용 기간 (일). None이면 UPLOAD_URL_CACHE_TTL_DAYS
+            verify: 재사용 전 URL 확인 여부. None이면 UPLOAD_URL_CACHE_VERIFY
+        """
+        if ttl_days is None:
+            ttl_days = float(os.getenv("UPLOAD_URL_CACHE_TTL_DAYS", "30"))
+        if verify is None:
+            verify = os.getenv("UPLOAD_URL_CACHE_VERIFY", "false").lower() == "true"
+        self.key = f"{platform}:{scope}"
+        self.ttl = ttl_days * 86400
+        self.verify = verify
+        self._cache = JsonCache(CACHE_NAME)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def lookup(self, image_map: dict) -> tuple:
+        """저장된 업로드 결과 조회
+
+        Args:
+            image_map: {이름: 경로} 딕셔너리
+
+        Returns:
+            ({이름: 업로드 결과}, {이름: 내용 해시}) - 해시는 store()에 넘김
+        """
+        hashes = {}
+        for name, path in image_map.items():
+            try:
+                hashes[name] = content_hash(path)
+            except OSError:
+                continue
+        if not self.enabled or not hashes:
+            return {}, hashes
+
+        entries = self._cache.get(self.key) or {}
+        now = time.time()
+        hits = {}
+        for name, digest in hashes.items():
+            entry = entries.get(digest)
+            if entry and now - entry.get("uploaded_at", 0) < self.ttl:
+                hits[name] = entry.get("value")
+
+        if self.verify and hits:
+            dead = self._dead_urls(hits)
+            if dead:
+                logger.info(f"♻️ 만료된 이미지 URL {len(dead)}개는 다시 업로드")
+                self.invalidate(hashes[name] for name in dead)
+                hits = {name: value for name, value in hits.items() if name not in dead}
+        return hits, hashes
+
+    def store(self, uploaded: dict, hashes: dict):
+        """업로드 결과 저장
+
+        Args:
+            uploaded: {이름: 업로드 결과}
+            hashes: lookup()이 돌려준 {이름: 내용 해시}
+        """
+        values = {hashes[name]: value for name, value in uploaded.items() if name in hashes and value}
+        if not self.enabled or not values:
+            return
+        now = time.time()
+        entries = self._cache.get(self.key) or {}
+        entries.update({digest: {"value": value, "uploaded_at": now} for digest, value in values.items()})
+        # 만료된 항목은 저장하면서 정리
+        self._cache.set(self.key, {k: v for k, v in entries.items() if now - v.get("uploaded_at", 0) < self.ttl})
+
+    def invalidate(self, digests):
+        """항목 삭제 (URL이 더 이상 유효하지 않을 때)"""
+        digests = set(digests)
+        entries = self._cache.get(self.key) or {}
+        self._cache.set(self.key, {k: v for k, v in entries.items() if k not in digests})
+
+    def _dead_urls(self, hits: dict) -> set:
+        """HEAD 요청으로 응답하지 않는 URL의 이름"""
+        def check(item):
+            name, value = item
+            url = value.get("url") if isinstance(value, dict) else value
+            try:
+                response = requests.head(url, timeout=self.VERIFY_TIMEOUT, allow_redirects=True)
+                return name, response.ok
+            except Exception as e:
+                logger.debug(f"이미지 URL 확인 실패 ({name}): {e}")
+                return name, False
+
+        with ThreadPoolExecutor(max_workers=min(8, len(hits))) as executor:
+            return {name for name, alive in executor.map(check, hits.items()) if not alive}
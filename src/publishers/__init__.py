@@ -1,6 +1,32 @@
 # 블로그 발행 모듈
-from .base import BasePublisher
+from .base import BasePublisher, PublishResult
 from .naver import NaverPublisher
 from .tistory import TistoryPublisher
+from .wordpress import WordPressPublisher
+from .warmup import PublisherWarmer
+from .fanout import fan_out
 
-__all__ = ["BasePublisher", "NaverPublisher", "TistoryPublisher"]
+# 플랫폼 이름 → 발행자 클래스
+PUBLISHERS = {
+    NaverPublisher.PLATFORM_NAME: NaverPublisher,
+    TistoryPublisher.PLATFORM_NAME: TistoryPublisher,
+    WordPressPublisher.PLATFORM_NAME: WordPressPublisher,
+}
+
+
+def create_publisher(platform: str, **kwargs) -> BasePublisher:
+    """플랫폼 이름으로 발행자 생성
+
+    Args:
+        platform: 플랫폼 이름 ("naver", "tistory", "wordpress")
+        **kwargs: 발행자 생성 인자 (headless, lean 등)
+    """
+    if platform not in PUBLISHERS:
+        raise ValueError(f"지원하지 않는 플랫폼: {platform}")
+    return PUBLISHERS[platform](**kwargs)
+
+
+__all__ = [
+    "BasePublisher", "PublishResult", "NaverPublisher", "TistoryPublisher", "WordPressPublisher",
+    "PUBLISHERS", "create_publisher", "PublisherWarmer", "fan_out",
+]
@@ -2,22 +2,59 @@
 발행자 베이스 클래스
 모든 블로그 발행자의 공통 인터페이스 정의
 """
+import os
+import time
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, Union
 import frontmatter
 from loguru import logger
 
+from ..media.image_handler import ImagePreprocessor
+from ..utils.cache import JsonCache
+from ..utils.perf_metrics import PerfRecorder
+
+
+@dataclass
+class PublishResult:
+    """발행 결과
+    
+    bool로 평가하면 성공 여부가 되므로 기존의 `if publisher.publish(...)` 코드는 그대로 동작합니다.
+    """
+    success: bool
+    platform: str = ""
+    url: Optional[str] = None       # 발행된 글 주소
+    post_id: Optional[str] = None   # 플랫폼 글 번호
+    error: Optional[str] = None     # 실패 사유
+    metrics: dict = field(default_factory=dict)  # 단계별 통계 등 부가 정보
+    
+    def __bool__(self) -> bool:
+        return self.success
+
 
 class BasePublisher(ABC):
     """블로그 발행자 베이스 클래스"""
     
     PLATFORM_NAME = "base"
     
+    # 블로그별 카테고리 맵 캐시 파일 이름 ({플랫폼:블로그: {카테고리명: 위치 정보}})
+    CATEGORY_CACHE_NAME = "categories"
+    
+    # 로그인 세션(쿠키) 캐시 파일 이름 ({플랫폼:계정: {"cookies", "saved_at"}}) - HTTP 발행자가 사용
+    SESSION_CACHE_NAME = "sessions"
+    
     def __init__(self):
         """발행자 초기화"""
         self.driver = None
         self.is_logged_in = False
+        self.last_stats = {}  # 마지막 발행의 단계별 WebDriver 명령 통계
+        self.last_result = None  # 마지막 발행 결과 (PublishResult)
+        self.perf = PerfRecorder()  # 페이지/요청별 브라우저 성능 지표 (브라우저 기반 발행자만 해당)
+        # 로그인 쿠키 저장 여부 (평문 저장이라 기본 끔 - HTTP 발행(--http) 또는 SAVE_BROWSER_SESSION=true일 때만)
+        self.save_sessions = os.getenv("SAVE_BROWSER_SESSION", "false").lower() == "true"
+        # 캡차/2차 인증을 터미널 입력으로 기다릴지 여부 (백그라운드 사전 로그인에서는 끔)
+        self.interactive = True
     
     @abstractmethod
     def login(self) -> bool:
@@ -36,7 +73,7 @@ class BasePublisher(ABC):
         category: Optional[str] = None,
         tags: Optional[list] = None,
         images: Optional[list] = None
-    ) -> bool:
+    ) -> PublishResult:
         """글 발행
         
         Args:
@@ -47,24 +84,24 @@ class BasePublisher(ABC):
             images: 이미지 파일 경로 목록
         
         Returns:
-            발행 성공 여부
+            발행 결과 (성공 여부, 글 주소)
         """
         pass
     
-    def publish_from_file(self, file_path: Union[str, Path]) -> bool:
+    def publish_from_file(self, file_path: Union[str, Path]) -> PublishResult:
         """파일에서 글 정보를 읽어 발행
         
         Args:
             file_path: 마크다운 파일 경로
         
         Returns:
-            발행 성공 여부
+            발행 결과
         """
         file_path = Path(file_path)
         
         if not file_path.exists():
             logger.error(f"파일을 찾을 수 없습니다: {file_path}")
-            return False
+            return self._result(False, error=f"파일 없음: {file_path}")
         
         # 파일 로드
         post = frontmatter.load(file_path)
@@ -91,6 +128,193 @@ class BasePublisher(ABC):
             images=images
         )
     
+    def _result(self, success: bool, url: str = None, post_id: str = None, error: str = None) -> PublishResult:
+        """발행 결과 생성 (단계별 통계는 _report_stats에서 채워짐)"""
+        self.last_result = PublishResult(
+            success=success,
+            platform=self.PLATFORM_NAME,
+            url=url,
+            post_id=post_id,
+            error=error,
+        )
+        return self.last_result
+    
+    def _mark_stage(self, stage: str):
+        """WebDriver 명령 통계의 현재 단계 변경 (브라우저 기반 발행자만 해당)"""
+        stats = getattr(getattr(self, "browser_manager", None), "stats", None)
+        if stats is not None:
+            stats.mark(stage)
+    
+    def _report_stats(self):
+        """발행 단계별 WebDriver 명령 통계와 브라우저 성능 지표를 로그로 출력하고 초기화"""
+        stats = getattr(getattr(self, "browser_manager", None), "stats", None)
+        if stats is not None:
+            try:
+                stats.log_report(f"{self.PLATFORM_NAME} WebDriver 명령 통계")
+                self.last_stats = stats.summary()
+                if self.last_result is not None:
+                    self.last_result.metrics["stages"] = self.last_stats
+            finally:
+                stats.reset()
+        self._report_perf()
+        
+        # 발행 중 모은 셀렉터 통계는 발행이 끝날 때 한 번에 저장
+        selectors = getattr(self, "selectors", None)
+        if selectors is not None:
+            selectors.flush()
+    
+    def _capture_page(self, label: str):
+        """현재 페이지의 브라우저 성능 지표 기록 (페이지가 준비된 직후 호출)"""
+        self.perf.capture_page(self.driver, label)
+    
+    def _capture_requests(self, label: str, url_pattern: str):
+        """마지막 페이지 기록 이후 URL 패턴과 일치한 요청(업로드, 발행 API) 시간 기록"""
+        self.perf.capture_requests(self.driver, label, url_pattern)
+    
+    def _report_perf(self):
+        """브라우저 성능 지표를 결과의 metrics["browser"]와 .cache/perf_history.json에 저장하고 초기화
+        
+        로그인 때 기록한 페이지 지표는 로그인 후 첫 발행 결과에 함께 들어갑니다.
+        """
+        if not self.perf.has_data() or self.last_result is None:
+            return
+        try:
+            self.perf.log_report(f"{self.PLATFORM_NAME} 브라우저 성능")
+            browser = self.perf.summary()
+            self.last_result.metrics["browser"] = browser
+            self.perf.save_history(self.PLATFORM_NAME, {
+                "success": self.last_result.success,
+                "pages": browser["pages"],
+                "requests": browser["requests"],
+                "stages": {stage: {"wall_time": e["wall_time"]} for stage, e in self.last_stats.items()},
+            })
+        except Exception as e:
+            logger.debug(f"브라우저 성능 기록 실패: {e}")
+        finally:
+            self.perf.reset()
+    
+    def _execute_async_script(self, timeout: float, script: str, *args):
+        """비동기 스크립트를 지정한 대기 시간으로 실행 (끝나면 드라이버의 원래 대기 시간으로 복원)
+
+        set_script_timeout은 드라이버 전체 설정이라 되돌리지 않으면 이후 모든 비동기 스크립트가 같은 대기 시간을 물려받습니다.
+        """
+        try:
+            previous = self.driver.timeouts.script
+        except Exception:
+            previous = getattr(self.driver, "script_timeout", None)  # CdpDriver
+
+        self.driver.set_script_timeout(timeout)
+        try:
+            return self.driver.execute_async_script(script, *args)
+        finally:
+            if previous is not None:
+                try:
+                    self.driver.set_script_timeout(previous)
+                except Exception as e:
+                    logger.debug(f"스크립트 대기 시간 복원 실패: {e}")
+
+    def _prepare_images(self, images: Optional[list]) -> Optional[list]:
+        """업로드 전 이미지 전처리 (방향 보정, 리사이즈, 플랫폼별 재압축)
+        
+        결과는 글 폴더의 .cache/images/<플랫폼>/에 저장되어 다음 발행/다른 발행자가 재사용하며,
+        CLI에서 미리 처리했으면 캐시만 확인합니다.
+        
+        Returns:
+            images와 같은 순서의 업로드할 경로 목록
+        """
+        return ImagePreprocessor().prepare(images, self.PLATFORM_NAME)
+    
+    def _prepare_browser(self) -> bool:
+        """발행 전 브라우저 점검 (브라우저 기반 발행자만 해당)
+        
+        BROWSER_RECYCLE_AFTER/BROWSER_MAX_RSS_MB 기준을 넘으면 브라우저를 다시 시작해 로그인하고,
+        아니면 탭 하나만 남기고 빈 페이지로 이동해 같은 탭을 재사용합니다.
+        
+        Returns:
+            발행을 계속할 수 있는지 여부 (재로그인 실패 시 False)
+        """
+        manager = getattr(self, "browser_manager", None)
+        if manager is None or self.driver is None:
+            return True
+        
+        reason = manager.recycle_reason()
+        if reason is None:
+            manager.reset_tabs()
+            return True
+        
+        logger.info(f"♻️ {self.PLATFORM_NAME} 브라우저 재시작 ({reason})")
+        self.logout()
+        return self.login()
+    
+    def _track_browser(self):
+        """발행 횟수/메모리 기록 (마지막 결과의 metrics["memory"]에도 저장)"""
+        manager = getattr(self, "browser_manager", None)
+        if manager is None or self.driver is None:
+            return
+        try:
+            self._mark_stage("memory")
+            usage = manager.record_use()
+            if self.last_result is not None:
+                self.last_result.metrics["memory"] = dict(usage, uses=manager.uses)
+        except Exception as e:
+            logger.debug(f"브라우저 메모리 기록 실패: {e}")
+    
+    def _override_urls(self, urls: Optional[dict]):
+        """URL 상수를 이 인스턴스에서만 바꾸기 (로컬 대체 서버로 발행할 때)
+        
+        Args:
+            urls: {"LOGIN_URL": ..., "BLOG_WRITE_URL": ...} - 클래스에 정의된 *_URL 상수만 가능
+        """
+        for name, url in (urls or {}).items():
+            if not name.endswith("_URL") or not hasattr(type(self), name):
+                raise ValueError(f"알 수 없는 URL 설정: {name}")
+            setattr(self, name, url)
+    
+    def _category_cache_key(self) -> str:
+        """카테고리 캐시 키 (블로그를 구분할 수 있도록 하위 클래스에서 재정의)"""
+        return self.PLATFORM_NAME
+    
+    def _session_key(self) -> str:
+        """세션 캐시 키 (계정을 구분할 수 있도록 하위 클래스에서 재정의)"""
+        return self.PLATFORM_NAME
+    
+    def save_session(self):
+        """브라우저 로그인 쿠키 저장 (save_sessions가 꺼져 있으면 저장 안 함)
+        
+        쿠키는 평문이므로 파일은 소유자만 읽을 수 있게(0600) 저장합니다.
+        """
+        if self.driver is None or not self.save_sessions:
+            return
+        try:
+            cookies = self.driver.get_cookies()
+            cache = JsonCache(self.SESSION_CACHE_NAME)
+            cache.set(self._session_key(), {"cookies": cookies, "saved_at": time.time()})
+            try:
+                os.chmod(cache.path, 0o600)
+            except OSError:
+                pass  # 권한 모델이 다른 파일 시스템 (Windows 등)
+            logger.debug(f"로그인 세션 저장: 쿠키 {len(cookies)}개")
+        except Exception as e:
+            logger.debug(f"로그인 세션 저장 실패: {e}")
+    
+    def load_session(self) -> list:
+        """저장된 로그인 쿠키 목록 (Selenium get_cookies 형식, 없으면 빈 목록)"""
+        return (JsonCache(self.SESSION_CACHE_NAME).get(self._session_key()) or {}).get("cookies", [])
+    
+    def get_cached_categories(self) -> dict:
+        """저장된 카테고리 맵 조회
+        
+        Returns:
+            {카테고리명: {"index": 순서, "id": 요소 id, "value": 값}} 딕셔너리
+        """
+        return JsonCache(self.CATEGORY_CACHE_NAME).get(self._category_cache_key(), {})
+    
+    def save_categories(self, categories: dict):
+        """카테고리 맵 저장 (캐시 조회 실패로 전체 목록을 다시 읽었을 때만 호출)"""
+        if categories:
+            JsonCache(self.CATEGORY_CACHE_NAME).set(self._category_cache_key(), categories)
+            logger.debug(f"카테고리 맵 갱신: {len(categories)}개")
+    
     @abstractmethod
     def logout(self):
         """로그아웃 및 브라우저 종료"""
@@ -0,0 +1,151 @@
+"""
+여러 블로그 동시 발행 (fan-out)
+같은 글을 한 플랫폼의 여러 블로그/계정에 동시에 발행
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+from loguru import logger
+
+from .base import PublishResult
+from ..utils.accounts import load_accounts
+
+
+def _default_factory(platform: str, account: dict, blog: str, headless: bool, lean: bool, image_url_cache: dict):
+    """플랫폼별 발행자 생성 (계정 지정)"""
+    if platform == "tistory":
+        from .tistory import TistoryPublisher
+        return TistoryPublisher(
+            headless=headless, lean=lean, account=account, blog_name=blog, image_url_cache=image_url_cache
+        )
+    if platform == "naver":
+        from .naver import NaverPublisher
+        return NaverPublisher(headless=headless, lean=lean, account=account)
+    raise ValueError(f"fan-out을 지원하지 않는 플랫폼: {platform}")
+
+
+def resolve_targets(platform: str, blogs: Optional[List[str]] = None) -> tuple:
+    """발행 대상 블로그를 계정별로 묶기
+
+    Args:
+        platform: 플랫폼 이름
+        blogs: 블로그 이름(네이버는 아이디) 목록. None이면 설정된 모든 블로그
+
+    Returns:
+        ([(계정, [블로그, ...]), ...], [계정을 찾지 못한 블로그, ...])
+    """
+    accounts = load_accounts(platform)
+    groups, seen = [], set()
+    for account in accounts:
+        targets = [b for b in account["blogs"] if (blogs is None or b in blogs) and b not in seen]
+        seen.update(targets)
+        if targets:
+            groups.append((account, targets))
+    missing = [b for b in (blogs or []) if b not in seen]
+    return groups, missing
+
+
+def fan_out(
+    platform: str,
+    title: str,
+    content: str,
+    category: Optional[str] = None,
+    tags: Optional[list] = None,
+    images: Optional[list] = None,
+    blogs: Optional[List[str]] = None,
+    headless: bool = None,
+    lean: bool = None,
+    max_workers: int = None,
+    publisher_factory: Callable = None,
+) -> Dict[str, PublishResult]:
+    """한 글을 같은 플랫폼의 여러 블로그에 발행
+
+    - 계정마다 브라우저 하나, 로그인 한 번 (같은 카카오 계정의 블로그는 순서대로 발행)
+    - 서로 다른 계정은 동시에 진행 (FANOUT_CONCURRENCY, 기본: 계정 수)
+    - 티스토리는 처음 업로드한 이미지 URL을 다른 블로그에서 재사용
+
+    Args:
+        platform: 플랫폼 이름 ("tistory", "naver")
+        title, content, category, tags, images: 발행할 글
+        blogs: 대상 블로그 목록. None이면 설정된 모든 블로그
+        headless: 헤드리스 모드 여부
+        lean: 경량 모드 여부
+        max_workers: 동시에 진행할 계정 수
+        publisher_factory: (플랫폼, 계정, 블로그, headless, lean, 이미지 캐시) → 발행자 (테스트용)
+
+    Returns:
+        {블로그: PublishResult} (대상 순서)
+    """
+    factory = publisher_factory or _default_factory
+    groups, missing = resolve_targets(platform, blogs)
+
+    results: Dict[str, PublishResult] = {}
+    for blog in missing:
+        logger.warning(f"⚠️ 계정 설정에 없는 블로그: {blog}")
+        results[blog] = PublishResult(False, platform=platform, error="계정 설정 없음")
+    if not groups:
+        return results
+
+    image_url_cache = {}
+    # 첫 발행이 이미지를 올릴 때까지 다른 계정은 로그인만 해 두고 대기 (같은 이미지 중복 업로드 방지)
+    seeded = threading.Event()
+    if not images or platform != "tistory":
+        seeded.set()
+
+    def publish_group(index: int, account: dict, targets: List[str]) -> Dict[str, PublishResult]:
+        group_results = {}
+        publisher = None
+        try:
+            publisher = factory(platform, account, targets[0], headless, lean, image_url_cache)
+            if not publisher.login():
+                return {blog: PublishResult(False, platform=platform, error="로그인 실패") for blog in targets}
+
+            for blog in targets:
+                if index != 0:
+                    seeded.wait(timeout=float(os.getenv("FANOUT_SEED_TIMEOUT", "300")))
+                if hasattr(publisher, "blog_name"):
+                    publisher.blog_name = blog
+                try:
+                    logger.info(f"📤 [{account['name']}] {blog} 발행 중...")
+                    group_results[blog] = publisher.publish(
+                        title=title, content=content, category=category, tags=tags, images=images
+                    )
+                except Exception as e:
+                    group_results[blog] = PublishResult(False, platform=platform, error=str(e))
+                finally:
+                    if index == 0:
+                        seeded.set()
+            return group_results
+        except Exception as e:
+            logger.error(f"❌ [{account['name']}] 발행 오류: {e}")
+            for blog in targets:
+                group_results.setdefault(blog, PublishResult(False, platform=platform, error=str(e)))
+            return group_results
+        finally:
+            if index == 0:
+                seeded.set()
+            if publisher is not None:
+                try:
+                    publisher.logout()
+                except Exception:
+                    pass
+
+    workers = max_workers or int(os.getenv("FANOUT_CONCURRENCY", "0")) or len(groups)
+    logger.info(
+        f"🚀 {platform} {sum(len(t) for _, t in groups)}개 블로그 발행 "
+        f"(계정 {len(groups)}개, 동시 {min(workers, len(groups))}개)"
+    )
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fanout") as executor:
+        futures = [executor.submit(publish_group, i, account, targets) for i, (account, targets) in enumerate(groups)]
+        group_results = [future.result() for future in futures]
+
+    # 대상 순서대로 정리
+    for (_, targets), group in zip(groups, group_results):
+        for blog in targets:
+            results[blog] = group.get(blog) or PublishResult(False, platform=platform, error="결과 없음")
+    if image_url_cache:
+        logger.info(f"♻️ 공유 이미지 URL {len(image_url_cache)}개")
+    if blogs:
+        results = {blog: results[blog] for blog in blogs if blog in results}
+    return results
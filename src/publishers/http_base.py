@@ -0,0 +1,73 @@
+"""
+HTTP 발행자 공통 기능
+브라우저 로그인에서 저장한 쿠키로 requests 세션을 구성
+"""
+from typing import Union
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class SessionRejected(Exception):
+    """세션 쿠키가 만료/거부됨 (브라우저 로그인 필요)"""
+
+
+class HttpSessionMixin:
+    """HTTP 발행자 믹스인
+
+    Selenium 발행자 클래스와 함께 상속해 변환 함수/응답 해석은 그대로 쓰고,
+    로그인 확인과 업로드/저장만 연결 풀을 공유하는 requests 세션으로 처리합니다.
+    """
+
+    REQUEST_TIMEOUT = 30  # 요청별 최대 대기 (초)
+
+    USER_AGENT = (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+
+    def _init_http(self, cookies: Union[list, dict, None], pool_size: int = 4):
+        """
+        Args:
+            cookies: 세션 쿠키 (Selenium get_cookies() 목록 또는 {이름: 값}). None이면 저장된 세션
+            pool_size: 호스트별 연결 풀 크기 (동시 업로드 수)
+        """
+        self._cookies = cookies
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(pool_size, 2))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"User-Agent": self.USER_AGENT})
+
+    def _load_cookies(self, url: str, domain_suffix: str) -> int:
+        """세션 쿠키를 HTTP 세션에 설정
+
+        Args:
+            url: 요청할 주소 (대체 서버 여부 판단용)
+            domain_suffix: 실제 플랫폼 도메인 (예: "tistory.com")
+
+        Returns:
+            설정한 쿠키 수
+        """
+        cookies = self._cookies if self._cookies is not None else self.load_session()
+        if isinstance(cookies, dict):
+            cookies = [{"name": name, "value": value} for name, value in cookies.items()]
+
+        host = urlparse(url).hostname or ""
+        real_host = host.endswith(domain_suffix)
+        count = 0
+        self.session.cookies.clear()
+        for cookie in cookies or []:
+            domain = (cookie.get("domain") or "").lstrip(".")
+            if real_host and domain and not domain.endswith(domain_suffix):
+                continue  # 다른 서비스 도메인 쿠키 (예: 카카오 로그인)
+            # 대체 서버(base_url)에는 도메인 없이 설정
+            self.session.cookies.set(cookie["name"], cookie["value"], domain=domain if real_host and domain else "")
+            count += 1
+        return count
+
+    @staticmethod
+    def _check_session(response: requests.Response, login_marker: str):
+        """응답이 인증 오류이거나 로그인 페이지로 이동했으면 SessionRejected"""
+        if response.status_code in (401, 403) or login_marker in response.url:
+            raise SessionRejected(f"HTTP {response.status_code}")
@@ -15,8 +15,10 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from dotenv import load_dotenv
 from loguru import logger
 
-from .base import BasePublisher
+from .base import BasePublisher, PublishResult
 from ..utils.browser import BrowserManager
+from ..utils.network import NetworkCapture
+from ..utils.selector_registry import SelectorRegistry
 
 load_dotenv()
 
@@ -30,16 +32,271 @@ class NaverPublisher(BasePublisher):
     LOGIN_URL = "https://nid.naver.com/nidlogin.login"
     BLOG_HOME_URL = "https://blog.naver.com/{blog_id}"
     BLOG_WRITE_URL = "https://blog.naver.com/{blog_id}/postwrite"
+    POST_URL = "https://blog.naver.com/{blog_id}/{log_no}"
+    PUBLISH_API_PATTERN = r"/RabbitWrite\.naver"  # SmartEditor ONE 발행(저장) API
+    UPLOAD_PATTERN = r"/simpleUpload/"  # 사진 업로드 API (성능 지표용)
     
-    def __init__(self, headless: bool = None):
+    PUBLISH_TIMEOUT = 30  # 발행 API 응답 최대 대기 (초)
+    
+    # 도움말/모달/오버레이 숨기기
+    HIDE_POPUPS_SCRIPT = """
+        // 도움말 패널 숨기기
+        var helpPanel = document.querySelector('[class*="help-panel"], [class*="helpPanel"], .se-help-panel');
+        if (helpPanel) helpPanel.style.display = 'none';
+
+        // 도움말 닫기 버튼 클릭
+        var closeButtons = document.querySelectorAll('[class*="close"], [class*="Close"]');
+        closeButtons.forEach(function(btn) {
+            if (btn.offsetParent !== null) {  // visible check
+                try { btn.click(); } catch(e) {}
+            }
+        });
+
+        // 모달/오버레이 숨기기
+        var modals = document.querySelectorAll('[class*="modal"], [class*="overlay"], [class*="popup"]');
+        modals.forEach(function(m) {
+            if (m.style) m.style.display = 'none';
+        });
+    """
+    
+    # 본문 입력 영역 (제목 영역 제외)
+    FIND_CONTENT_AREA_SCRIPT = """
+        var selectors = [
+            '.se-component.se-text.se-l-default',
+            '.se-text-paragraph',
+            '[data-placeholder]',
+            '.se-section-text',
+            '.se-component-content'
+        ];
+        function isTitle(el) {
+            var cls = ((el && el.className) || '').toString();
+            return cls.toLowerCase().indexOf('title') >= 0 || cls.indexOf('documentTitle') >= 0;
+        }
+        for (var i = 0; i < selectors.length; i++) {
+            var elements = document.querySelectorAll(selectors[i]);
+            for (var j = 0; j < elements.length; j++) {
+                if (!isTitle(elements[j]) && !isTitle(elements[j].parentElement)) return elements[j];
+            }
+        }
+        return null;
+    """
+    
+    # 본문 글자 수 (공백 제외, 에디터가 없으면 -1)
+    TEXT_LENGTH_SCRIPT = """
+        var root = document.querySelector('.se-main-container, .se-content');
+        return root ? root.innerText.replace(/\\s/g, '').length : -1;
+    """
+    
+    # 이미지 컴포넌트 선택 (arguments: 이미지 src, true면 그 컴포넌트 바로 앞 문단 끝으로 커서 이동)
+    # 선택한 위치 뒤에 다음 업로드 이미지가 들어감
+    SELECT_IMAGE_COMPONENT_SCRIPT = """
+        var src = arguments[0], before = arguments[1];
+        var imgs = document.querySelectorAll('.se-component.se-image img');
+        var comp = null;
+        for (var i = 0; i < imgs.length; i++) {
+            if (imgs[i].getAttribute('src') === src) { comp = imgs[i].closest('.se-component'); break; }
+        }
+        if (!comp) return false;
+        if (before) {
+            comp = comp.previousElementSibling;
+            if (!comp) return false;
+            var paragraphs = comp.querySelectorAll('.se-text-paragraph');
+            if (paragraphs.length) {
+                var paragraph = paragraphs[paragraphs.length - 1];
+                paragraph.scrollIntoView({block: 'center'});
+                paragraph.click();
+                var range = document.createRange();
+                range.selectNodeContents(paragraph);
+                range.collapse(false);
+                var selection = window.getSelection();
+                selection.removeAllRanges();
+                selection.addRange(range);
+                return true;
+            }
+        }
+        comp.scrollIntoView({block: 'center'});
+        (comp.querySelector('.se-module-image') || comp).click();
+        return true;
+    """
+    
+    # 포커스된 에디터에 합성 paste 이벤트 전송 (arguments: HTML, 일반 텍스트)
+    PASTE_HTML_SCRIPT = """
+        var target = document.activeElement;
+        if (!target || target === document.body) {
+            target = document.querySelector('.se-main-container [contenteditable], .se-content');
+        }
+        if (!target) return;
+        var data = new DataTransfer();
+        data.setData('text/html', arguments[0]);
+        data.setData('text/plain', arguments[1]);
+        target.dispatchEvent(new ClipboardEvent('paste', {
+            clipboardData: data, bubbles: true, cancelable: true
+        }));
+    """
+    
+    # 카테고리 드롭다운 열기/검색/클릭 (비동기, arguments: 카테고리명, 캐시된 위치)
+    SELECT_CATEGORY_SCRIPT = """
+        var target = arguments[0], cached = arguments[1];
+        var done = arguments[arguments.length - 1];
+        var btn = document.querySelector("button[class*='selectbox_button']");
+        if (!btn) return done({error: 'no button'});
+
+        var current = btn.querySelector("span[class*='text']");
+        if (current && current.textContent.indexOf(target) >= 0) return done({already: true});
+        btn.click();
+
+        function visible(el) { return el.offsetParent !== null; }
+        function textOf(el) { return (el.innerText || '').trim(); }
+        function pick(item) {
+            var clickable = item.querySelector('label, button') || item;
+            clickable.scrollIntoView({block: 'center'});
+            clickable.click();
+            return textOf(item);
+        }
+
+        var started = Date.now();
+        (function poll() {
+            var items = Array.prototype.filter.call(document.querySelectorAll(
+                "[class*='option_list'] li, [class*='selectbox_list'] li, [role='option'], [role='menuitem']"
+            ), visible);
+            if (!items.length) {
+                if (Date.now() - started < 3000) return setTimeout(poll, 50);
+                return done({error: 'no items'});
+            }
+
+            // 1. 캐시된 위치 확인
+            if (cached) {
+                var input = cached.value && document.querySelector('input[value="' + CSS.escape(cached.value) + '"]');
+                var item = input ? input.closest('li') || input.parentElement : items[cached.index];
+                if (item && textOf(item).indexOf(target) >= 0) {
+                    return done({clicked: pick(item), cached: true});
+                }
+            }
+
+            // 2. 전체 목록 스캔 (캐시 갱신용 맵 생성)
+            var map = {}, hit = null;
+            items.forEach(function(item, i) {
+                var text = textOf(item);
+                if (!text) return;
+                var input = item.querySelector('input');
+                map[text] = {index: i, id: item.id || null, value: input ? input.value || input.id : null};
+                if (!hit && (text === target || text.indexOf(target) >= 0)) hit = item;
+            });
+            done({clicked: hit ? pick(hit) : null, map: map});
+        })();
+    """
+    
+    # 툴바 '소스코드' 버튼 후보 (CSS 또는 XPath)
+    CODE_BUTTON_SELECTORS = [
+        "button[data-name='code']",
+        ".se-code-toolbar-button",
+        "button.se-document-toolbar-basic-button[data-name='code']",
+        "[class*='toolbar'] button[class*='code']",
+        "button[data-log='dot.code']",
+        # '소스코드' 텍스트가 있는 툴바 버튼
+        "//button[contains(@class, 'toolbar') and .//span[contains(text(), '소스코드')]]",
+    ]
+    
+    # 소스코드 컴포넌트 입력 영역 후보
+    CODE_INPUT_SELECTORS = [
+        ".se-code-source-editor",
+        "textarea.se-code-source-editor",
+        ".se-module-code textarea",
+        ".se-section-code textarea",
+        "[class*='code'] textarea",
+    ]
+    
+    # 소스코드 블록 한 개를 스크립트 한 번으로 삽입 (비동기)
+    # arguments: 버튼 셀렉터 목록, 입력 영역 셀렉터 목록, 코드, 언어, 제한 시간(ms)
+    # 버튼 클릭 → 새 코드 컴포넌트가 생길 때까지 50ms 간격 확인 → 값 입력 → 언어 선택
+    INSERT_CODE_SCRIPT = """
+        var buttons = arguments[0], inputs = arguments[1], code = arguments[2];
+        var language = (arguments[3] || '').toLowerCase(), limit = arguments[4];
+        var done = arguments[arguments.length - 1];
+        var started = Date.now();
+
+        function lookup(selector, root) {
+            if (selector.indexOf('/') === 0 || selector.indexOf('(') === 0) {
+                return document.evaluate(selector, document, null,
+                    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            }
+            return (root || document).querySelector(selector);
+        }
+        function codeComponents() {
+            return document.querySelectorAll('.se-component.se-code, .se-module-code, .se-section-code');
+        }
+
+        var button = null, index = -1;
+        for (var i = 0; i < buttons.length && !button; i++) {
+            try {
+                var el = lookup(buttons[i]);
+                if (el && el.getClientRects().length && !el.disabled) { button = el; index = i; }
+            } catch (e) {}
+        }
+        if (!button) return done({error: 'no button'});
+
+        var before = codeComponents().length;
+        button.click();
+
+        (function poll() {
+            var components = codeComponents();
+            var input = null;
+            if (components.length > before) {
+                var component = components[components.length - 1];
+                for (var j = 0; j < inputs.length && !input; j++) {
+                    input = component.matches(inputs[j]) ? component : component.querySelector(inputs[j]);
+                }
+                input = input || component.querySelector('textarea, [contenteditable="true"]');
+            }
+            if (!input) {
+                if (Date.now() - started < limit) return setTimeout(poll, 50);
+                return done({button: index, error: 'no input'});
+            }
+
+            input.focus();
+            if ('value' in input) {
+                input.value = code;
+                input.dispatchEvent(new Event('input', {bubbles: true}));
+            } else {
+                var data = new DataTransfer();
+                data.setData('text/plain', code);
+                input.dispatchEvent(new ClipboardEvent('paste', {clipboardData: data, bubbles: true, cancelable: true}));
+                if (!input.innerText.trim()) input.innerText = code;
+            }
+            input.dispatchEvent(new Event('change', {bubbles: true}));
+
+            var select = language && component.querySelector('select');
+            if (select) {
+                Array.prototype.forEach.call(select.options, function(option) {
+                    if (option.value.toLowerCase() === language || option.text.toLowerCase() === language) {
+                        select.value = option.value;
+                        select.dispatchEvent(new Event('change', {bubbles: true}));
+                    }
+                });
+            }
+            done({button: index, ms: Date.now() - started});
+        })();
+    """
+    
+    def __init__(self, headless: bool = None, lean: bool = None, account: dict = None, urls: dict = None):
         """
         Args:
             headless: 헤드리스 모드 여부
+            lean: 경량 모드 여부 (광고/분석/폰트 차단, eager 로딩)
+            account: 네이버 계정 {"id", "password"} (utils.accounts). None이면 환경변수
+            urls: URL 상수 덮어쓰기 {"LOGIN_URL": ..., "BLOG_WRITE_URL": ...} (로컬 대체 서버 테스트용)
         """
         super().__init__()
-        self.browser_manager = BrowserManager(headless=headless)
-        self.naver_id = os.getenv("NAVER_ID")
-        self.naver_password = os.getenv("NAVER_PASSWORD")
+        self.browser_manager = BrowserManager(headless=headless, lean=lean, platform=self.PLATFORM_NAME)
+        self.selectors = SelectorRegistry(self.PLATFORM_NAME)
+        self._code_block_timings = []  # [(방식, 초)] - 발행마다 초기화
+        self._override_urls(urls)
+        if account:
+            self.naver_id = account.get("id")
+            self.naver_password = account.get("password")
+        else:
+            self.naver_id = os.getenv("NAVER_ID")
+            self.naver_password = os.getenv("NAVER_PASSWORD")
         
         if not self.naver_id or not self.naver_password:
             raise ValueError("NAVER_ID 또는 NAVER_PASSWORD가 설정되지 않았습니다.")
@@ -54,6 +311,7 @@ class NaverPublisher(BasePublisher):
             self.driver = self.browser_manager.create_driver()
             self.driver.get(self.LOGIN_URL)
             time.sleep(2)
+            self._capture_page("login")
             
             logger.info("🔐 네이버 로그인 시도 중...")
             
@@ -78,14 +336,20 @@ class NaverPublisher(BasePublisher):
             # 로그인 성공 확인
             if "nid.naver.com" not in self.driver.current_url:
                 self.is_logged_in = True
+                self.save_session()  # NaverHttpPublisher가 재사용
                 logger.success("✅ 네이버 로그인 성공")
                 return True
             else:
                 # 캡차나 2차 인증이 필요할 수 있음
+                if not self.interactive:
+                    # 백그라운드 사전 로그인: 다른 입력(발행 확인 등)과 겹치지 않도록 실패로 돌려줌
+                    logger.warning("⚠️ 추가 인증이 필요합니다. 발행 단계에서 다시 로그인합니다.")
+                    return False
                 logger.warning("⚠️ 추가 인증이 필요할 수 있습니다. 브라우저를 확인해주세요.")
                 # 수동 인증을 위해 대기
                 input("인증 완료 후 Enter를 눌러주세요...")
                 self.is_logged_in = True
+                self.save_session()
                 return True
                 
         except Exception as e:
@@ -99,7 +363,7 @@ class NaverPublisher(BasePublisher):
         category: Optional[str] = None,
         tags: Optional[list] = None,
         images: Optional[list] = None
-    ) -> bool:
+    ) -> PublishResult:
         """네이버 블로그에 글 발행
         
         Args:
@@ -110,14 +374,19 @@ class NaverPublisher(BasePublisher):
             images: 이미지 파일 경로 목록
         
         Returns:
-            발행 성공 여부
+            발행 결과 (성공 여부, 글 주소)
         """
+        self.last_result = None
+        self._code_block_timings = []
         if not self.is_logged_in:
             if not self.login():
-                return False
+                return self._result(False, error="로그인 실패")
+        elif not self._prepare_browser():
+            return self._result(False, error="브라우저 재시작 후 로그인 실패")
         
         try:
             # 글쓰기 페이지로 이동
+            self._mark_stage("navigate")
             write_url = self.BLOG_WRITE_URL.format(blog_id=self.naver_id)
             self.driver.get(write_url)
             time.sleep(2)  # 기본 로딩 대기 (4초 → 2초로 단축)
@@ -127,25 +396,7 @@ class NaverPublisher(BasePublisher):
             from selenium.webdriver.common.action_chains import ActionChains
             
             # JavaScript로 빠르게 팝업/도움말 닫기
-            self.driver.execute_script("""
-                // 도움말 패널 숨기기
-                var helpPanel = document.querySelector('[class*="help-panel"], [class*="helpPanel"], .se-help-panel');
-                if (helpPanel) helpPanel.style.display = 'none';
-                
-                // 도움말 닫기 버튼 클릭
-                var closeButtons = document.querySelectorAll('[class*="close"], [class*="Close"]');
-                closeButtons.forEach(function(btn) {
-                    if (btn.offsetParent !== null) {  // visible check
-                        try { btn.click(); } catch(e) {}
-                    }
-                });
-                
-                // 모달/오버레이 숨기기
-                var modals = document.querySelectorAll('[class*="modal"], [class*="overlay"], [class*="popup"]');
-                modals.forEach(function(m) {
-                    if (m.style) m.style.display = 'none';
-                });
-            """)
+            self.driver.execute_script(self.HIDE_POPUPS_SCRIPT)
             time.sleep(0.5)
             
             # "작성중인 글" 복구 팝업 처리 (있을 경우만)
@@ -166,10 +417,12 @@ class NaverPublisher(BasePublisher):
             time.sleep(0.3)
             
             # 제목 영역 클릭 - "제목" 텍스트가 있는 영역
+            self._mark_stage("title")
             # 네이버 에디터는 클릭으로 활성화 필요
             title_area = WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, ".se-documentTitle, .se-title-text, .se-component.se-documentTitle"))
             )
+            self._capture_page("postwrite")
             
             # ActionChains로 클릭
             actions = ActionChains(self.driver)
@@ -185,34 +438,8 @@ class NaverPublisher(BasePublisher):
             
             # 본문 영역 직접 클릭 (Tab 대신)
             # 본문 영역: "글감과 함께 나의 일상을 기록해보세요!" 플레이스홀더가 있는 영역
-            content_area = None
-            content_selectors = [
-                ".se-component.se-text.se-l-default",
-                ".se-text-paragraph",
-                "[data-placeholder]",
-                ".se-section-text",
-                ".se-component-content"
-            ]
-            
-            for selector in content_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for elem in elements:
-                        # 제목 영역이 아닌 본문 영역 찾기
-                        try:
-                            class_attr = elem.get_attribute('class') or ''
-                            parent_class = elem.find_element(By.XPATH, "..").get_attribute('class') or ''
-                            if 'title' not in class_attr.lower() and 'title' not in parent_class.lower():
-                                if 'documentTitle' not in class_attr and 'documentTitle' not in parent_class:
-                                    content_area = elem
-                                    break
-                        except:
-                            content_area = elem
-                            break
-                    if content_area:
-                        break
-                except:
-                    continue
+            self._mark_stage("body")
+            content_area = self._find_content_area()
             
             if content_area:
                 actions = ActionChains(self.driver)
@@ -225,7 +452,8 @@ class NaverPublisher(BasePublisher):
                 actions.send_keys(Keys.TAB).perform()
                 time.sleep(0.3)
             
-            # 이미지 파일 매핑 생성
+            # 이미지 파일 매핑 생성 (전처리 결과 경로, 파일명은 원본과 같음)
+            images = self._prepare_images(images)
             image_map = {}
             if images:
                 for img_path in images:
@@ -250,6 +478,8 @@ class NaverPublisher(BasePublisher):
             
             paragraphs = content_with_placeholders.split('\n\n')
             last_was_naver_map = False  # 이전 문단이 네이버 지도 링크였는지 추적
+            pending_text = []  # 한 번에 붙여넣을 일반 문단 묶음
+            pending_images = []  # 한 번에 업로드할 연속 이미지 마커 묶음
             
             for para in paragraphs:
                 if para.strip():
@@ -258,6 +488,11 @@ class NaverPublisher(BasePublisher):
                     # 코드 블록 플레이스홀더 확인
                     code_placeholder_match = re.match(r'__CODE_BLOCK_(\d+)__', text)
                     if code_placeholder_match:
+                        self._insert_text_chunk(pending_text)
+                        pending_text = []
+                        self._insert_images(pending_images, image_map)
+                        pending_images = []
+                        
                         idx = int(code_placeholder_match.group(1))
                         block = code_blocks[idx]
                         if self._insert_code_block(block['code'], block['lang']):
@@ -267,55 +502,51 @@ class NaverPublisher(BasePublisher):
                             actions = ActionChains(self.driver)
                             actions.send_keys(f"[코드]\n{block['code']}\n[/코드]").send_keys(Keys.ENTER).send_keys(Keys.ENTER).perform()
                             logger.warning("⚠️ 소스코드 블록 대신 일반 텍스트로 입력됨")
-                        time.sleep(0.5)
                         continue
                     
                     # [IMAGE: 파일명] 패턴 확인
                     image_match = re.match(r'\[IMAGE:\s*([^\]]+)\]', text, re.IGNORECASE)
                     if image_match:
+                        self._insert_text_chunk(pending_text)
+                        pending_text = []
+                        
                         # 네이버 지도 링크 직후 이미지 업로드 시 대기
                         if last_was_naver_map:
                             logger.info("⏳ 네이버 지도 로딩 대기 중...")
                             time.sleep(5)
                             last_was_naver_map = False
                         
-                        image_name = image_match.group(1).strip()
-                        # 이미지 업로드 시도
-                        if self._upload_image(image_name, image_map):
-                            logger.info(f"📷 이미지 업로드 완료: {image_name}")
-                        else:
-                            # 이미지 업로드 실패 시 설명 텍스트만 입력
-                            actions = ActionChains(self.driver)
-                            actions.send_keys(f"[사진: {image_name}]").send_keys(Keys.ENTER).send_keys(Keys.ENTER).perform()
-                        time.sleep(0.5)
+                        # 연속된 이미지 마커는 모아서 한 번에 업로드
+                        pending_images.append(image_match.group(1).strip())
                         continue
                     
-                    # 마크다운 헤딩 처리
-                    if text.startswith('### '):
-                        text = text[4:]
-                    elif text.startswith('## '):
-                        text = text[3:]
-                    elif text.startswith('# '):
-                        text = text[2:]
-                    
-                    # 볼드 마크다운 제거
-                    text = text.replace('**', '')
+                    self._insert_images(pending_images, image_map)
+                    pending_images = []
                     
                     # 네이버 지도 링크 감지 (naver.me 또는 map.naver.com)
+                    # 지도/링크 카드는 키 입력으로만 생성되므로 따로 입력
                     if 'naver.me' in text or 'map.naver.com' in text:
+                        self._insert_text_chunk(pending_text)
+                        pending_text = []
+                        
                         last_was_naver_map = True
                         logger.info("🗺️ 네이버 지도 링크 감지")
-                    else:
-                        last_was_naver_map = False
+                        self._type_paragraphs([text])
+                        continue
                     
-                    actions = ActionChains(self.driver)
-                    actions.send_keys(text).send_keys(Keys.ENTER).send_keys(Keys.ENTER).perform()
-                    time.sleep(0.1)  # 0.2초 + 0.1초 → 0.1초로 통합
+                    last_was_naver_map = False
+                    pending_text.append(text)
+            
+            self._insert_text_chunk(pending_text)
+            self._insert_images(pending_images, image_map)
             
             time.sleep(1)  # 2초 → 1초
             logger.info("✅ 본문 입력 완료")
+            if image_map:
+                self._capture_requests("upload", self.UPLOAD_PATTERN)
             
             # 발행 전 도움말 패널 닫기 (발행 버튼을 가릴 수 있음)
+            self._mark_stage("publish")
             try:
                 # JavaScript로 도움말 패널 숨기기
                 self.driver.execute_script("""
@@ -346,11 +577,13 @@ class NaverPublisher(BasePublisher):
             
             # 카테고리 선택 (발행 팝업이 열린 후)
             if category:
+                self._mark_stage("category")
                 self._select_category(category)
                 time.sleep(0.5)
             
             # 태그 입력 (발행 팝업이 열린 후)
             if tags:
+                self._mark_stage("tags")
                 self._add_tags(tags)
                 time.sleep(1)
             
@@ -368,19 +601,11 @@ class NaverPublisher(BasePublisher):
                 "//button[text()='발행']"
             ]
             
-            final_btn = None
-            for selector in final_publish_selectors:
-                try:
-                    if selector.startswith('//'):
-                        final_btn = self.driver.find_element(By.XPATH, selector)
-                    else:
-                        final_btn = WebDriverWait(self.driver, 2).until(
-                            EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                        )
-                    if final_btn:
-                        break
-                except:
-                    continue
+            final_btn = self.selectors.find(self.driver, "final_publish", final_publish_selectors, timeout=4)
+            
+            # 발행 API 응답 수집 시작 (이전 요청 이벤트는 버림)
+            network = NetworkCapture(self.driver)
+            network.clear()
             
             if final_btn:
                 self.driver.execute_script("arguments[0].click();", final_btn)
@@ -400,9 +625,20 @@ class NaverPublisher(BasePublisher):
                     except:
                         continue
             
-            time.sleep(3)
-            logger.success(f"✅ 네이버 블로그 발행 완료: {title}")
-            return True
+            response = network.wait_for_response(self.PUBLISH_API_PATTERN, timeout=self.PUBLISH_TIMEOUT)
+            self._capture_requests("publish", self.PUBLISH_API_PATTERN)
+            if response is None:
+                # 성능 로그를 못 읽는 환경 등 - 발행 여부를 알 수 없으므로 성공으로 기록하지 않음
+                logger.warning("⚠️ 발행 API 응답을 확인하지 못했습니다. 블로그에서 직접 확인하세요.")
+                return self._result(False, error="발행 응답 확인 불가")
+            
+            success, url, post_id, error = self._parse_publish_response(response, self.naver_id)
+            if not success:
+                logger.error(f"❌ 네이버 블로그 발행 실패: {error}")
+                return self._result(False, error=error)
+            
+            logger.success(f"✅ 네이버 블로그 발행 완료: {title}" + (f" ({url})" if url else ""))
+            return self._result(True, url=url, post_id=post_id)
             
         except Exception as e:
             logger.error(f"❌ 네이버 블로그 발행 실패: {e}")
@@ -412,10 +648,243 @@ class NaverPublisher(BasePublisher):
                 logger.info("📸 에러 스크린샷 저장: naver_error.png")
             except:
                 pass
+            return self._result(False, error=str(e))
+        finally:
+            self._report_code_blocks()
+            self._track_browser()
+            self._report_stats()
+    
+    @classmethod
+    def _parse_publish_response(cls, response: dict, blog_id: str) -> tuple:
+        """발행 API(RabbitWrite.naver) 응답 해석
+        
+        성공 응답 예: {"isSuccess": true, "result": {"redirectUrl": ".../PostView.naver?blogId=...&logNo=223..."}}
+        
+        Args:
+            response: NetworkCapture.wait_for_response 결과
+            blog_id: 블로그 아이디 (글 주소 생성용)
+        
+        Returns:
+            (성공 여부, 글 주소, 글 번호, 실패 사유)
+        """
+        status = response.get("status") or 0
+        data = NetworkCapture.parse_json(response.get("body")) or {}
+        result = data.get("result") if isinstance(data.get("result"), dict) else {}
+        
+        if not (200 <= status < 300) or data.get("isSuccess") is False or not data:
+            error = (
+                response.get("error")
+                or result.get("errorMessage")
+                or data.get("message")
+                or f"HTTP {status}"
+            )
+            return False, None, None, str(error)
+        
+        log_no = result.get("logNo")
+        redirect_url = result.get("redirectUrl") or ""
+        if not log_no:
+            match = re.search(r"logNo=(\d+)", redirect_url)
+            log_no = match.group(1) if match else None
+        
+        if log_no:
+            return True, cls.POST_URL.format(blog_id=blog_id, log_no=log_no), str(log_no), None
+        return True, redirect_url or None, None, None
+    
+    def _insert_text_chunk(self, paragraphs: List[str]):
+        """일반 문단 묶음 입력
+        
+        문단 전체를 HTML로 만들어 한 번의 붙여넣기 이벤트로 삽입하고,
+        에디터가 붙여넣기를 처리하지 않으면 키 입력 방식으로 대체합니다.
+        
+        Args:
+            paragraphs: 마크다운 문단 목록
+        """
+        if not paragraphs:
+            return
+        
+        html = self._paragraphs_to_html(paragraphs)
+        plain_text = '\n\n'.join(self._clean_paragraph(p) for p in paragraphs)
+        
+        before = self._text_length()
+        if self._paste_html(html, plain_text, before=before):
+            logger.debug(f"문단 {len(paragraphs)}개 붙여넣기 완료 ({len(plain_text)}자)")
+            return
+        
+        # 확인 시간이 지난 뒤 반영됐거나 일부만 들어갔으면 그만큼은 다시 입력하지 않음
+        applied = self._text_length() - before if before >= 0 else 0
+        remaining = self._untyped_paragraphs(paragraphs, applied)
+        if applied > 0:
+            logger.debug(f"붙여넣기 일부 반영 ({applied}자) - 나머지 문단 {len(remaining)}개만 키 입력")
+        else:
+            logger.debug("붙여넣기 미지원 - 키 입력 방식으로 대체")
+        self._type_paragraphs(remaining)
+    
+    def _type_paragraphs(self, paragraphs: List[str]):
+        """문단을 키 입력으로 입력 (붙여넣기 불가 시 대체 경로)"""
+        from selenium.webdriver.common.action_chains import ActionChains
+        
+        for para in paragraphs:
+            text = self._clean_paragraph(para)
+            actions = ActionChains(self.driver)
+            actions.send_keys(text).send_keys(Keys.ENTER).send_keys(Keys.ENTER).perform()
+            time.sleep(0.1)
+    
+    def _text_length(self) -> int:
+        """본문 글자 수 (공백 제외, 에디터가 없거나 읽지 못하면 -1)"""
+        try:
+            return self.driver.execute_script(self.TEXT_LENGTH_SCRIPT)
+        except Exception as e:
+            logger.debug(f"본문 글자 수 확인 실패: {e}")
+            return -1
+    
+    @classmethod
+    def _untyped_paragraphs(cls, paragraphs: List[str], applied: int) -> List[str]:
+        """붙여넣기로 이미 들어간 글자 수(공백 제외)만큼 앞에서 덜어낸 나머지 문단
+        
+        Args:
+            paragraphs: 마크다운 문단 목록
+            applied: 에디터에 늘어난 글자 수 (공백 제외)
+        
+        Returns:
+            키 입력할 문단 목록 (문단 중간까지 들어갔으면 그 문단은 남은 부분만)
+        """
+        if applied <= 0:
+            return list(paragraphs)
+        
+        remaining = []
+        for para in paragraphs:
+            if applied <= 0:
+                remaining.append(para)
+                continue
+            text = cls._clean_paragraph(para)
+            length = len(re.sub(r'\s', '', text))
+            if applied >= length:
+                applied -= length
+                continue
+            # 문단 중간까지 반영됨 - applied번째 글자(공백 제외) 뒤부터
+            positions = [i for i, ch in enumerate(text) if not ch.isspace()]
+            remaining.append(text[positions[applied - 1] + 1:])
+            applied = 0
+        return remaining
+    
+    @staticmethod
+    def _clean_paragraph(text: str) -> str:
+        """마크다운 헤딩/볼드 기호 제거"""
+        text = text.strip()
+        if text.startswith('### '):
+            text = text[4:]
+        elif text.startswith('## '):
+            text = text[3:]
+        elif text.startswith('# '):
+            text = text[2:]
+        return text.replace('**', '')
+    
+    @staticmethod
+    def _paragraphs_to_html(paragraphs: List[str]) -> str:
+        """문단 목록을 SmartEditor 붙여넣기용 HTML로 변환
+        
+        키 입력 방식과 같은 모양이 되도록 문단 사이에 빈 줄을 넣습니다.
+        헤딩은 굵게, **볼드**는 <b>로 변환합니다.
+        """
+        import html as html_lib
+        
+        blocks = []
+        for para in paragraphs:
+            text = para.strip()
+            is_heading = bool(re.match(r'^#{1,3} ', text))
+            if is_heading:
+                text = re.sub(r'^#{1,3} ', '', text)
+            
+            escaped = html_lib.escape(text, quote=False)
+            escaped = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', escaped).replace('**', '')
+            
+            lines = escaped.split('\n')
+            if is_heading:
+                lines = [f'<b>{line}</b>' if line else line for line in lines]
+            blocks.extend(f'<p>{line or "<br>"}</p>' for line in lines)
+            blocks.append('<p><br></p>')
+        
+        return ''.join(blocks)
+    
+    def _paste_html(self, html: str, plain_text: str, timeout: float = 3, before: int = None) -> bool:
+        """합성 붙여넣기 이벤트로 HTML 삽입 (OS 클립보드 사용 안 함)
+        
+        현재 포커스된 에디터 요소에 text/html 데이터가 담긴 paste 이벤트를 보내고,
+        본문 텍스트 길이가 늘어나는지로 처리 여부를 확인합니다.
+        
+        Args:
+            html: 삽입할 HTML
+            plain_text: 같은 내용의 일반 텍스트
+            timeout: 반영 확인 대기 시간 (초)
+            before: 붙여넣기 전 본문 글자 수 (None이면 여기서 확인)
+        
+        Returns:
+            삽입 성공 여부
+        """
+        try:
+            if before is None:
+                before = self.driver.execute_script(self.TEXT_LENGTH_SCRIPT)
+            if before < 0:
+                return False
+            
+            self.driver.execute_script(self.PASTE_HTML_SCRIPT, html, plain_text)
+            
+            # 공백 제외 글자 수의 절반 이상 늘어나면 반영된 것으로 판단
+            expected = len(re.sub(r'\s', '', plain_text)) // 2
+            WebDriverWait(self.driver, timeout, poll_frequency=0.2).until(
+                lambda d: d.execute_script(self.TEXT_LENGTH_SCRIPT) - before >= expected
+            )
+            return True
+        except TimeoutException:
+            return False
+        except Exception as e:
+            logger.debug(f"붙여넣기 실패: {e}")
             return False
     
+    def _category_cache_key(self) -> str:
+        """카테고리 캐시 키 (블로그 = 네이버 아이디)"""
+        return f"{self.PLATFORM_NAME}:{self.naver_id}"
+    
+    def _session_key(self) -> str:
+        """세션 캐시 키 (네이버 아이디별)"""
+        return f"{self.PLATFORM_NAME}:{self.naver_id}"
+    
     def _select_category(self, category: str):
-        """카테고리 선택"""
+        """카테고리 선택
+        
+        드롭다운 열기, 항목 검색, 클릭을 한 번의 비동기 스크립트로 처리합니다.
+        캐시된 위치가 맞으면 바로 클릭하고, 틀리면 전체 목록을 읽어 캐시를 갱신합니다.
+        스크립트가 실패하면 기존 방식으로 재시도합니다.
+        """
+        cached = self.get_cached_categories().get(category)
+        
+        try:
+            result = self._execute_async_script(10, self.SELECT_CATEGORY_SCRIPT, category, cached)
+        except Exception as e:
+            logger.debug(f"카테고리 스크립트 실패: {e}")
+            result = {"error": str(e)}
+        
+        if result.get("already"):
+            logger.info(f"📁 카테고리 이미 선택됨: {category}")
+            return True
+        if result.get("map"):
+            self.save_categories(result["map"])
+        if result.get("clicked"):
+            source = "캐시" if result.get("cached") else "검색"
+            logger.info(f"📁 카테고리 선택: {category} ('{result['clicked']}', {source})")
+            time.sleep(0.3)
+            return True
+        if "map" in result:
+            from selenium.webdriver.common.action_chains import ActionChains
+            
+            logger.warning(f"⚠️ 카테고리를 찾을 수 없음: {category}")
+            ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
+            return False
+        
+        return self._select_category_fallback(category)
+    
+    def _select_category_fallback(self, category: str):
+        """카테고리 선택 (요소별 탐색 방식)"""
         try:
             from selenium.webdriver.common.action_chains import ActionChains
             
@@ -488,8 +957,20 @@ class NaverPublisher(BasePublisher):
             logger.warning(f"⚠️ 카테고리 선택 실패: {e}")
             return False
     
+    def _find_content_area(self):
+        """본문 입력 영역 찾기 (제목 영역 제외, 한 번의 스크립트)
+        
+        Returns:
+            본문 영역 WebElement. 찾지 못하면 None
+        """
+        try:
+            return self.driver.execute_script(self.FIND_CONTENT_AREA_SCRIPT)
+        except Exception as e:
+            logger.debug(f"본문 영역 탐색 실패: {e}")
+            return None
+    
     def _add_tags(self, tags: list):
-        """태그 추가"""
+        """태그 추가 (입력 영역 탐색 1회 + 키 입력 1회)"""
         try:
             from selenium.webdriver.common.action_chains import ActionChains
             
@@ -504,29 +985,29 @@ class NaverPublisher(BasePublisher):
                 "div[class*='tag_area']"
             ]
             
-            tag_input = None
-            for selector in tag_selectors:
-                try:
-                    tag_input = WebDriverWait(self.driver, 3).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    if tag_input:
-                        break
-                except:
-                    continue
+            # 모든 셀렉터를 한 번에 확인 (팝업 렌더링 대기 포함)
+            try:
+                tag_input = WebDriverWait(self.driver, 3).until(
+                    lambda d: d.execute_script("""
+                        var selectors = arguments[0];
+                        for (var i = 0; i < selectors.length; i++) {
+                            var el = document.querySelector(selectors[i]);
+                            if (el) return el;
+                        }
+                        return null;
+                    """, tag_selectors)
+                )
+            except TimeoutException:
+                tag_input = None
             
             if tag_input:
-                # 태그 영역 클릭
+                # 태그 영역 클릭 후 모든 태그를 한 번의 액션으로 입력
                 tag_input.click()
-                time.sleep(0.3)
                 
+                actions = ActionChains(self.driver)
                 for tag in tags[:30]:  # 최대 30개
-                    actions = ActionChains(self.driver)
-                    actions.send_keys(tag).perform()
-                    time.sleep(0.1)
-                    actions = ActionChains(self.driver)
-                    actions.send_keys(Keys.ENTER).perform()
-                    time.sleep(0.2)
+                    actions.send_keys(tag).pause(0.1).send_keys(Keys.ENTER).pause(0.1)
+                actions.perform()
                 
                 logger.info(f"🏷️ 태그 추가: {', '.join(tags[:30])}")
             else:
@@ -558,6 +1039,252 @@ class NaverPublisher(BasePublisher):
         
         return html
     
+    @staticmethod
+    def _find_image_path(image_name: str, image_map: dict) -> Optional[str]:
+        """[IMAGE: ...] 마커 이름으로 이미지 파일 경로 찾기
+        
+        Args:
+            image_name: 이미지 파일명 또는 설명
+            image_map: {파일명: 경로} 딕셔너리
+        
+        Returns:
+            이미지 경로. 찾지 못하면 None
+        """
+        image_name_lower = image_name.lower().replace(' ', '')
+        
+        # 정확한 파일명 매칭 또는 부분 매칭
+        for name, path in image_map.items():
+            name_clean = name.lower().replace(' ', '')
+            # 정확한 매칭
+            if image_name_lower == name_clean:
+                return path
+            # 부분 매칭 (파일명에 검색어가 포함되거나 검색어에 파일명이 포함)
+            if image_name_lower in name_clean or name_clean in image_name_lower:
+                return path
+            # 숫자 매칭 (예: "2.내부인테리어.jpg" vs "2.내부인테리어.jpg")
+            if name_clean.startswith(image_name_lower.split('.')[0] + '.'):
+                return path
+        
+        return None
+    
+    def _insert_images(self, image_names: List[str], image_map: dict):
+        """연속된 이미지 마커 묶음을 현재 커서 위치에 삽입
+        
+        한 번의 다중 파일 선택으로 업로드하고, 빠진 이미지는 본문 순서 자리(앞 이미지 뒤)로
+        커서를 옮겨 한 장씩 다시 올립니다. 그래도 실패하면 기존 방식으로 재시도합니다.
+        
+        Args:
+            image_names: 이미지 마커 이름 목록 (본문 순서)
+            image_map: {파일명: 경로} 딕셔너리
+        """
+        from selenium.webdriver.common.action_chains import ActionChains
+        
+        if not image_names:
+            return
+        
+        missing, placed = self._upload_images_batch(image_names, image_map)
+        if not missing:
+            return
+        
+        for image_name in missing:
+            self._move_cursor_to_image_slot(image_name, image_names, placed)
+            retry_missing, retry_placed = self._upload_images_batch([image_name], image_map)
+            if not retry_missing:
+                placed.update(retry_placed)
+                logger.info(f"📷 이미지 업로드 완료: {image_name}")
+            elif self._upload_image(image_name, image_map):
+                logger.info(f"📷 이미지 업로드 완료: {image_name}")
+            else:
+                # 이미지 업로드 실패 시 설명 텍스트만 입력
+                actions = ActionChains(self.driver)
+                actions.send_keys(f"[사진: {image_name}]").send_keys(Keys.ENTER).send_keys(Keys.ENTER).perform()
+        
+        # 다음 문단은 묶음의 마지막 이미지 뒤에 이어서 입력
+        last = placed.get(image_names[-1])
+        if last and image_names[-1] not in missing:
+            self._select_image_component(last)
+    
+    def _move_cursor_to_image_slot(self, image_name: str, image_names: List[str], placed: dict):
+        """빠진 이미지가 본문 순서대로 들어가도록 커서 이동
+        
+        앞쪽에 올라간 이미지가 있으면 그 뒤, 없으면 뒤쪽 첫 이미지의 바로 앞으로 옮깁니다.
+        
+        Args:
+            image_name: 다시 올릴 이미지 마커 이름
+            image_names: 묶음의 이미지 마커 이름 목록 (본문 순서)
+            placed: {마커 이름: 에디터에 들어간 이미지 src}
+        """
+        index = image_names.index(image_name)
+        before = [placed[name] for name in image_names[:index] if name in placed]
+        after = [placed[name] for name in image_names[index + 1:] if name in placed]
+        if before:
+            moved = self._select_image_component(before[-1])
+        elif after:
+            moved = self._select_image_component(after[0], before=True)
+        else:
+            return  # 아직 올라간 이미지가 없음 - 커서는 원래 자리
+        if not moved:
+            logger.warning(f"⚠️ 이미지 자리로 커서를 옮기지 못함 (순서가 바뀔 수 있음): {image_name}")
+    
+    def _select_image_component(self, src: str, before: bool = False) -> bool:
+        """src가 같은 이미지 컴포넌트 선택 (before=True면 그 앞 문단 끝으로 커서 이동)"""
+        try:
+            return bool(self.driver.execute_script(self.SELECT_IMAGE_COMPONENT_SCRIPT, src, before))
+        except Exception as e:
+            logger.debug(f"이미지 컴포넌트 선택 실패: {e}")
+            return False
+    
+    def _upload_images_batch(self, image_names: List[str], image_map: dict) -> tuple:
+        """여러 이미지를 한 번의 다중 파일 선택으로 업로드
+        
+        파일 input에 모든 경로를 한 번에 전달한 뒤, 고정 대기 대신
+        새 이미지 컴포넌트가 모두 CDN 주소를 갖게 될 때까지 MutationObserver로 기다립니다.
+        
+        Args:
+            image_names: 이미지 마커 이름 목록 (본문 순서)
+            image_map: {파일명: 경로} 딕셔너리
+        
+        Returns:
+            (올라가지 않은 이미지 마커 이름 목록, {올라간 마커 이름: 에디터의 이미지 src})
+        """
+        found, missing = [], []
+        for image_name in image_names:
+            image_path = self._find_image_path(image_name, image_map)
+            if image_path and Path(image_path).exists():
+                found.append((image_name, str(Path(image_path).absolute())))
+            else:
+                logger.warning(f"⚠️ 이미지 파일을 찾을 수 없음: {image_name}")
+                missing.append(image_name)
+        
+        if not found:
+            return list(image_names), {}
+        paths = [path for _, path in found]
+        
+        logger.info(f"📷 이미지 {len(paths)}장 일괄 업로드 시도")
+        start = time.time()
+        
+        try:
+            # 현재 이미지 컴포넌트 표시 (이후 추가되는 것만 감시)
+            self.driver.execute_script("""
+                window.__naverImagesBefore = new Set(
+                    Array.prototype.slice.call(document.querySelectorAll('.se-component.se-image'))
+                );
+            """)
+            
+            file_input = self._find_image_file_input()
+            if file_input is None:
+                return list(image_names), {}
+            
+            self.driver.execute_script("arguments[0].multiple = true;", file_input)
+            file_input.send_keys("\n".join(paths))
+            
+            timeout = 15 + 5 * len(paths)
+            result = self._execute_async_script(timeout + 10, """
+                var expected = arguments[0], timeout = arguments[1];
+                var done = arguments[arguments.length - 1];
+                var before = window.__naverImagesBefore || new Set();
+                var observer, timer;
+                
+                function fresh() {
+                    var comps = document.querySelectorAll('.se-component.se-image');
+                    return Array.prototype.filter.call(comps, function(c) { return !before.has(c); });
+                }
+                function readySrcs() {
+                    var srcs = [];
+                    fresh().forEach(function(c) {
+                        var img = c.querySelector('img');
+                        var src = img && img.getAttribute('src') || '';
+                        if (/^https?:/.test(src)) srcs.push(src);
+                    });
+                    return srcs;
+                }
+                function finish(result) {
+                    observer.disconnect();
+                    clearTimeout(timer);
+                    done(result);
+                }
+                function check() {
+                    // 여러 장 첨부 시 뜨는 첨부 방식 선택 레이어 → 개별사진
+                    var buttons = document.querySelectorAll('button');
+                    for (var i = 0; i < buttons.length; i++) {
+                        var b = buttons[i];
+                        if (!b.__picked && b.innerText && b.innerText.trim() === '개별사진') {
+                            b.__picked = true;
+                            b.click();
+                        }
+                    }
+                    var srcs = readySrcs();
+                    if (srcs.length >= expected) finish({count: srcs.length, srcs: srcs});
+                }
+                
+                observer = new MutationObserver(check);
+                observer.observe(document.body, {childList: true, subtree: true, attributes: true, attributeFilter: ['src']});
+                timer = setTimeout(function() {
+                    observer.disconnect();
+                    var srcs = readySrcs();
+                    done({timeout: true, count: srcs.length, srcs: srcs});
+                }, timeout * 1000);
+                check();
+            """, len(paths), timeout)
+        except Exception as e:
+            logger.warning(f"⚠️ 일괄 업로드 실패 (한 장씩 재시도): {e}")
+            return list(image_names), {}
+        
+        count = (result or {}).get("count", 0)
+        if count == 0:
+            logger.warning("⚠️ 일괄 업로드 결과 없음 (한 장씩 재시도)")
+            return list(image_names), {}
+        placed = self._arrived_images(found, (result or {}).get("srcs") or [])
+        if count < len(paths):
+            not_arrived = [name for name, _ in found if name not in placed]
+            logger.warning(f"⚠️ 일괄 업로드 일부만 완료: {count}/{len(paths)} (한 장씩 재시도: {', '.join(not_arrived)})")
+            missing.extend(not_arrived)
+        else:
+            logger.info(f"✅ 이미지 {count}장 업로드 완료 ({time.time() - start:.1f}초)")
+        return [name for name in image_names if name in missing], placed
+    
+    @staticmethod
+    def _arrived_images(found: List[tuple], srcs: List[str]) -> dict:
+        """일괄 업로드 후 에디터에 나타난 이미지 마커 이름과 src
+        
+        CDN 주소의 파일명으로 맞춰 보고, 주소에 파일명이 없으면 선택 순서대로 들어갔다고 봅니다.
+        
+        Args:
+            found: [(마커 이름, 경로)] (선택 순서)
+            srcs: 업로드가 끝난 새 이미지의 src 목록 (본문 순서)
+        
+        Returns:
+            {마커 이름: src}
+        """
+        from urllib.parse import unquote, urlparse
+        
+        by_file = {unquote(urlparse(src).path).rsplit("/", 1)[-1].lower(): src for src in srcs}
+        arrived = {name: by_file[Path(path).name.lower()] for name, path in found if Path(path).name.lower() in by_file}
+        if len(arrived) < len(srcs):
+            return {name: src for (name, _), src in zip(found, srcs)}
+        return arrived
+    
+    def _find_image_file_input(self):
+        """사진 업로드용 파일 input 찾기 (없으면 사진 버튼을 눌러 생성)"""
+        inputs = self.driver.find_elements(By.CSS_SELECTOR, "input[type='file'][accept*='image'], input[type='file']")
+        if inputs:
+            return inputs[0]
+        
+        photo_btns = self.driver.find_elements(
+            By.CSS_SELECTOR, "button[data-name='image'], [class*='se-toolbar'] button[class*='image']"
+        )
+        if not photo_btns:
+            logger.debug("사진 버튼을 찾을 수 없음")
+            return None
+        
+        self.driver.execute_script("arguments[0].click();", photo_btns[0])
+        try:
+            return WebDriverWait(self.driver, 5).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='file']"))
+            )
+        except TimeoutException:
+            return None
+    
     def _upload_image(self, image_name: str, image_map: dict) -> bool:
         """이미지 업로드
         
@@ -577,24 +1304,7 @@ class NaverPublisher(BasePublisher):
         for attempt in range(3):
             try:
                 # 이미지 파일 찾기
-                image_path = None
-                image_name_lower = image_name.lower().replace(' ', '')
-                
-                # 정확한 파일명 매칭 또는 부분 매칭
-                for name, path in image_map.items():
-                    name_clean = name.lower().replace(' ', '')
-                    # 정확한 매칭
-                    if image_name_lower == name_clean:
-                        image_path = path
-                        break
-                    # 부분 매칭 (파일명에 검색어가 포함되거나 검색어에 파일명이 포함)
-                    if image_name_lower in name_clean or name_clean in image_name_lower:
-                        image_path = path
-                        break
-                    # 숫자 매칭 (예: "2.내부인테리어.jpg" vs "2.내부인테리어.jpg")
-                    if name_clean.startswith(image_name_lower.split('.')[0] + '.'):
-                        image_path = path
-                        break
+                image_path = self._find_image_path(image_name, image_map)
                 
                 if not image_path or not Path(image_path).exists():
                     logger.warning(f"⚠️ 이미지 파일을 찾을 수 없음: {image_name}")
@@ -627,16 +1337,7 @@ class NaverPublisher(BasePublisher):
                     "[data-tooltip*='사진']"
                 ]
                 
-                photo_btn = None
-                for selector in photo_btn_selectors:
-                    try:
-                        photo_btn = WebDriverWait(self.driver, 2).until(
-                            EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                        )
-                        if photo_btn:
-                            break
-                    except:
-                        continue
+                photo_btn = self.selectors.find(self.driver, "photo_button", photo_btn_selectors, timeout=4)
                 
                 if not photo_btn:
                     # 대체 방법: 파일 input 직접 사용
@@ -687,12 +1388,65 @@ class NaverPublisher(BasePublisher):
         
         return False
     
-    def _insert_code_block(self, code: str, language: str = "") -> bool:
+    def _insert_code_block(self, code: str, language: str = "", fast: bool = True) -> bool:
         """네이버 에디터에 소스코드 블록 삽입
         
+        스크립트 한 번으로 버튼 클릭~코드 입력까지 처리하고(고정 대기 없음),
+        실패하면 단계별로 요소를 찾아 입력하는 기존 방식으로 대체합니다.
+        블록별 소요 시간은 발행 결과의 metrics["code_blocks"]에 기록됩니다.
+        
         Args:
             code: 삽입할 코드 내용
             language: 프로그래밍 언어 (선택)
+            fast: False면 단계별 방식만 사용 (벤치마크 비교용)
+        
+        Returns:
+            삽입 성공 여부
+        """
+        start = time.perf_counter()
+        if fast and self._insert_code_block_fast(code, language):
+            self._code_block_timings.append(("fast", time.perf_counter() - start))
+            return True
+        
+        success = self._insert_code_block_stepwise(code, language)
+        if success:
+            self._code_block_timings.append(("stepwise", time.perf_counter() - start))
+        return success
+    
+    def _insert_code_block_fast(self, code: str, language: str = "") -> bool:
+        """소스코드 블록을 스크립트 한 번으로 삽입한 뒤 ESC/Enter 한 번으로 컴포넌트 밖으로 이동"""
+        from selenium.webdriver.common.action_chains import ActionChains
+        
+        buttons = self.selectors.order("code_button", self.CODE_BUTTON_SELECTORS)
+        try:
+            result = self._execute_async_script(
+                10, self.INSERT_CODE_SCRIPT, buttons, self.CODE_INPUT_SELECTORS, code, language or "", 5000
+            ) or {}
+        except Exception as e:
+            logger.debug(f"소스코드 스크립트 삽입 실패: {e}")
+            return False
+        
+        index = result.get("button", -1)
+        if index >= 0:
+            self.selectors.record("code_button", buttons[:index + 1], buttons[index])
+        if result.get("error"):
+            logger.debug(f"소스코드 스크립트 삽입 실패: {result['error']}")
+            if index >= 0:
+                # 빈 코드 컴포넌트가 생겼을 수 있으므로 빠져나옴
+                ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
+            return False
+        
+        # 코드 블록 다음에 새 텍스트 영역 생성 (키 입력 한 번에)
+        ActionChains(self.driver).send_keys(Keys.ESCAPE).send_keys(Keys.ENTER).perform()
+        logger.debug(f"소스코드 블록 스크립트 삽입 ({result.get('ms', 0)}ms)")
+        return True
+    
+    def _insert_code_block_stepwise(self, code: str, language: str = "") -> bool:
+        """소스코드 블록 단계별 삽입 (버튼 클릭 → 입력 영역 대기 → 입력 → ESC)
+        
+        Args:
+            code: 삽입할 코드 내용
+            language: 프로그래밍 언어 (선택, 사용하지 않음)
         
         Returns:
             삽입 성공 여부
@@ -700,37 +1454,8 @@ class NaverPublisher(BasePublisher):
         from selenium.webdriver.common.action_chains import ActionChains
         
         try:
-            logger.info(f"💻 소스코드 블록 삽입 시도 (언어: {language or 'plain'})")
-            
             # 1. 툴바에서 '소스코드' 버튼 찾기 및 클릭
-            code_btn_selectors = [
-                "button[data-name='code']",
-                ".se-code-toolbar-button",
-                "button.se-document-toolbar-basic-button[data-name='code']",
-                "[class*='toolbar'] button[class*='code']",
-                "button[data-log='dot.code']",
-            ]
-            
-            code_btn = None
-            for selector in code_btn_selectors:
-                try:
-                    code_btn = WebDriverWait(self.driver, 3).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                    if code_btn:
-                        break
-                except:
-                    continue
-            
-            if not code_btn:
-                # XPath로 '소스코드' 텍스트가 있는 버튼 찾기
-                try:
-                    code_btn = self.driver.find_element(
-                        By.XPATH, 
-                        "//button[contains(@class, 'toolbar') and .//span[contains(text(), '소스코드')]]"
-                    )
-                except:
-                    pass
+            code_btn = self.selectors.find(self.driver, "code_button", self.CODE_BUTTON_SELECTORS, timeout=5)
             
             if not code_btn:
                 logger.warning("⚠️ 소스코드 버튼을 찾을 수 없음 - 일반 텍스트로 삽입")
@@ -741,24 +1466,9 @@ class NaverPublisher(BasePublisher):
             time.sleep(1)
             
             # 2. 소스코드 입력 영역 찾기 (textarea 또는 contenteditable)
-            code_input_selectors = [
-                ".se-code-source-editor",
-                "textarea.se-code-source-editor",
-                ".se-module-code textarea",
-                ".se-section-code textarea",
-                "[class*='code'] textarea",
-            ]
-            
-            code_input = None
-            for selector in code_input_selectors:
-                try:
-                    code_input = WebDriverWait(self.driver, 3).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    if code_input:
-                        break
-                except:
-                    continue
+            code_input = self.selectors.find(
+                self.driver, "code_input", self.CODE_INPUT_SELECTORS, timeout=5, clickable=False
+            )
             
             if code_input:
                 # textarea에 직접 입력
@@ -811,8 +1521,28 @@ class NaverPublisher(BasePublisher):
             logger.warning(f"⚠️ 소스코드 블록 삽입 실패: {e}")
             return False
 
+    def _report_code_blocks(self):
+        """소스코드 블록 삽입 시간 요약 (로그 + 마지막 결과의 metrics["code_blocks"])"""
+        if not self._code_block_timings:
+            return
+        timings = self._code_block_timings
+        summary = {
+            "count": len(timings),
+            "fast": sum(1 for path, _ in timings if path == "fast"),
+            "total_seconds": round(sum(seconds for _, seconds in timings), 2),
+            "avg_ms": round(sum(seconds for _, seconds in timings) / len(timings) * 1000),
+        }
+        logger.info(
+            f"💻 소스코드 블록 {summary['count']}개 (스크립트 삽입 {summary['fast']}개), "
+            f"블록당 평균 {summary['avg_ms']}ms"
+        )
+        if self.last_result is not None:
+            self.last_result.metrics["code_blocks"] = summary
+        self._code_block_timings = []
+    
     def logout(self):
         """로그아웃 및 브라우저 종료"""
+        self.selectors.flush()
         self.browser_manager.quit()
         self.is_logged_in = False
         self.driver = None
@@ -0,0 +1,478 @@
+"""
+네이버 블로그 HTTP 발행자
+브라우저 로그인에서 넘겨받은 세션(쿠키)으로 사진 업로드와 SmartEditor ONE 문서 저장을 HTTP 요청만으로 처리
+"""
+import json
+import mimetypes
+import os
+import re
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Union
+from xml.etree import ElementTree
+import requests
+from loguru import logger
+
+from .base import PublishResult
+from .http_base import HttpSessionMixin, SessionRejected
+from .naver import NaverPublisher
+from ..media.upload_cache import UploadCache
+
+
+class NaverHttpPublisher(HttpSessionMixin, NaverPublisher):
+    """네이버 블로그 발행자 (브라우저 없이 HTTP)
+
+    NaverPublisher 로그인 시 저장된 쿠키(.cache/sessions.json) 또는 직접 넘겨준 쿠키로
+    에디터 토큰 → 사진 업로드 세션 키 → 사진 업로드 → RabbitWrite.naver 저장 순서로 요청합니다.
+    본문은 SmartEditor ONE 문서 JSON(documentModel)으로 직렬화하며,
+    세션이 거부되면 브라우저 발행(NaverPublisher)으로 대체합니다.
+    """
+
+    # 요청 호스트 (base_url을 지정하면 모두 대체 서버로)
+    BLOG_HOST = "https://blog.naver.com"
+    EDITOR_HOST = "https://platform.editor.naver.com"
+    UPLOAD_HOST = "https://blog.upphoto.naver.com"
+
+    TOKEN_PATH = "/PostWriteFormSeOptions.naver?blogId={blog_id}"
+    SESSION_KEY_PATH = "/api/blogpc001/v1/photo-uploader/session-key"
+    UPLOAD_PATH = (
+        "/{session_key}/simpleUpload/0?userId={blog_id}&extractExif=true&extractAnimatedCnt=true"
+        "&autorotate=true&extractDominantColor=false&denyAnimatedImage=false&skipXcamFiltering=false"
+    )
+    SAVE_PATH = "/RabbitWrite.naver"
+
+    EDITOR_VERSION = "2.8.0"
+
+    # 공개 설정 → populationParams openType 값
+    OPEN_TYPES = {"public": 2, "neighbor": 1, "private": 0}
+
+    def __init__(
+        self,
+        cookies: Union[list, dict, None] = None,
+        base_url: str = None,
+        visibility: str = None,
+        fallback: bool = True,
+        **kwargs,
+    ):
+        """
+        Args:
+            cookies: 세션 쿠키 (Selenium get_cookies() 목록 또는 {이름: 값}). None이면 저장된 세션
+            base_url: 대체 서버 주소 (테스트용). None이면 NAVER_BASE_URL 또는 실제 네이버 호스트
+            visibility: 공개 설정 ("public", "neighbor", "private"). None이면 NAVER_VISIBILITY (기본 public)
+            fallback: 세션이 거부되면 브라우저 발행으로 대체할지 여부
+            **kwargs: NaverPublisher 인자 (headless, lean, account)
+        """
+        super().__init__(**kwargs)
+        base_url = (base_url or os.getenv("NAVER_BASE_URL") or "").rstrip("/")
+        self.blog_host = base_url or self.BLOG_HOST
+        self.editor_host = base_url or self.EDITOR_HOST
+        self.upload_host = base_url or self.UPLOAD_HOST
+        self.visibility = (visibility or os.getenv("NAVER_VISIBILITY", "public")).lower()
+        self.fallback = fallback
+        self._token = None  # SmartEditor 인증 토큰 (SE-Authorization)
+        self._init_http(cookies, pool_size=int(os.getenv("NAVER_UPLOAD_CONCURRENCY", "4")))
+
+    def login(self) -> bool:
+        """저장된 세션으로 에디터 토큰 발급 (브라우저 사용 안 함)
+
+        Returns:
+            세션 유효 여부
+        """
+        token_url = self.blog_host + self.TOKEN_PATH.format(blog_id=self.naver_id)
+        if not self._load_cookies(token_url, "naver.com"):
+            logger.warning("⚠️ 저장된 네이버 세션 없음 (브라우저 로그인 필요)")
+            return False
+
+        try:
+            response = self.session.get(
+                token_url,
+                headers={"Referer": self.BLOG_WRITE_URL.format(blog_id=self.naver_id)},
+                timeout=self.REQUEST_TIMEOUT,
+            )
+            self._check_session(response, "nid.naver.com")
+            data = response.json()
+        except (SessionRejected, requests.RequestException, ValueError) as e:
+            logger.warning(f"⚠️ 네이버 세션 거부: {e}")
+            return False
+
+        self._token = (data.get("result") or {}).get("token")
+        if not data.get("isSuccess", True) or not self._token:
+            logger.warning("⚠️ 네이버 에디터 토큰 발급 실패 (세션 만료)")
+            return False
+
+        self.is_logged_in = True
+        logger.success("✅ 네이버 세션 확인 (HTTP)")
+        return True
+
+    def publish(
+        self,
+        title: str,
+        content: str,
+        category: Optional[str] = None,
+        tags: Optional[list] = None,
+        images: Optional[list] = None
+    ) -> PublishResult:
+        """네이버 블로그에 글 발행 (HTTP)
+
+        Returns:
+            발행 결과 (성공 여부, 글 주소)
+        """
+        self.last_result = None
+        try:
+            if not self.is_logged_in and not self.login():
+                raise SessionRejected("세션 없음 또는 만료")
+
+            start = time.time()
+            image_map = {Path(p).name.lower(): str(p) for p in (self._prepare_images(images) or [])}
+            blocks = self._split_blocks(content)
+
+            # 본문에 쓰인 이미지만 업로드
+            paths = []
+            for kind, value, _ in blocks:
+                path = self._find_image_path(value, image_map) if kind == "image" else None
+                if path and path not in paths:
+                    paths.append(path)
+                elif kind == "image" and not path:
+                    logger.warning(f"⚠️ 이미지 파일을 찾을 수 없음: {value}")
+            uploaded = self._upload_photos_reusing(paths) if paths else {}
+
+            document = self._build_document(title, blocks, image_map, uploaded)
+            response = self._save_post(document, category, tags)
+
+            success, url, post_id, error = self._parse_publish_response(response, self.naver_id)
+            if not success:
+                logger.error(f"❌ 네이버 블로그 발행 실패: {error}")
+                return self._result(False, error=error)
+
+            logger.success(f"✅ 네이버 블로그 발행 완료 (HTTP, {time.time() - start:.1f}초): {title} ({url})")
+            return self._result(True, url=url, post_id=post_id)
+
+        except SessionRejected as e:
+            self.is_logged_in = False
+            if not self.fallback:
+                return self._result(False, error=f"세션 거부: {e}")
+            logger.warning(f"⚠️ 네이버 세션 거부 ({e}) - 브라우저 발행으로 대체")
+            return self._publish_with_browser(title, content, category, tags, images)
+        except Exception as e:
+            logger.error(f"❌ 네이버 블로그 발행 실패: {e}")
+            return self._result(False, error=str(e))
+
+    # ---------- 본문 직렬화 ----------
+
+    @staticmethod
+    def _split_blocks(content: str) -> List[tuple]:
+        """본문을 (종류, 값, 언어) 블록 목록으로 분리
+
+        종류: "text" (문단), "image" ([IMAGE: 이름]), "code" (```언어 ... ```)
+        """
+        blocks = []
+        pattern = re.compile(r'```(\w*)\n(.*?)```', re.DOTALL)
+        position = 0
+        for match in list(pattern.finditer(content)) + [None]:
+            chunk = content[position:match.start()] if match else content[position:]
+            for para in chunk.split('\n\n'):
+                text = para.strip()
+                if not text:
+                    continue
+                image_match = re.match(r'\[IMAGE:\s*([^\]]+)\]', text, re.IGNORECASE)
+                if image_match:
+                    blocks.append(("image", image_match.group(1).strip(), None))
+                else:
+                    blocks.append(("text", text, None))
+            if match:
+                blocks.append(("code", match.group(2).strip(), match.group(1) or None))
+                position = match.end()
+        return blocks
+
+    @staticmethod
+    def _se_id() -> str:
+        return f"SE-{uuid.uuid4()}"
+
+    @classmethod
+    def _text_nodes(cls, line: str, bold: bool = False) -> list:
+        """한 줄 → textNode 목록 (**볼드** 구간은 굵게)"""
+        nodes = []
+        for i, piece in enumerate(re.split(r'\*\*(.+?)\*\*', line)):
+            if not piece:
+                continue
+            node = {"id": cls._se_id(), "value": piece.replace('**', ''), "@ctype": "textNode"}
+            if bold or i % 2 == 1:
+                node["style"] = {"bold": True, "@ctype": "nodeStyle"}
+            nodes.append(node)
+        return nodes or [{"id": cls._se_id(), "value": "", "@ctype": "textNode"}]
+
+    @classmethod
+    def _text_component(cls, text: str) -> dict:
+        """문단 → text 컴포넌트 (헤딩은 굵게, 줄마다 paragraph)"""
+        is_heading = bool(re.match(r'^#{1,3} ', text))
+        if is_heading:
+            text = re.sub(r'^#{1,3} ', '', text)
+        return {
+            "id": cls._se_id(),
+            "layout": "default",
+            "value": [
+                {"id": cls._se_id(), "nodes": cls._text_nodes(line, bold=is_heading), "@ctype": "paragraph"}
+                for line in text.split('\n')
+            ],
+            "@ctype": "text",
+        }
+
+    @classmethod
+    def _image_component(cls, photo: dict, represent: bool) -> dict:
+        """업로드 결과 → image 컴포넌트"""
+        return {
+            "id": cls._se_id(),
+            "layout": "default",
+            "src": f"{photo['url']}?type=w1",
+            "internalResource": True,
+            "represent": represent,
+            "path": photo.get("path"),
+            "domain": photo.get("domain"),
+            "fileSize": photo.get("fileSize"),
+            "width": photo.get("width"),
+            "widthPercentage": 0,
+            "height": photo.get("height"),
+            "originalWidth": photo.get("width"),
+            "originalHeight": photo.get("height"),
+            "fileName": photo.get("fileName"),
+            "caption": None,
+            "format": "normal",
+            "displayFormat": "normal",
+            "imageLoaded": True,
+            "contentMode": "normal",
+            "origin": {"srcFrom": "local", "@ctype": "imageOrigin"},
+            "@ctype": "image",
+        }
+
+    @classmethod
+    def _code_component(cls, code: str, language: Optional[str]) -> dict:
+        """코드 블록 → code 컴포넌트 (소스코드)"""
+        return {
+            "id": cls._se_id(),
+            "layout": "default",
+            "value": [
+                {"id": cls._se_id(), "nodes": [{"id": cls._se_id(), "value": line, "@ctype": "textNode"}],
+                 "@ctype": "paragraph"}
+                for line in code.split('\n')
+            ],
+            "language": language,
+            "theme": "default",
+            "@ctype": "code",
+        }
+
+    def _build_document(self, title: str, blocks: List[tuple], image_map: dict, uploaded: dict) -> dict:
+        """SmartEditor ONE 문서 JSON (documentModel)
+
+        Args:
+            title: 글 제목
+            blocks: _split_blocks 결과
+            image_map: {파일명: 경로}
+            uploaded: {경로: 업로드 결과}
+        """
+        components = [{
+            "id": self._se_id(),
+            "layout": "default",
+            "title": [{"id": self._se_id(), "nodes": self._text_nodes(title), "@ctype": "paragraph"}],
+            "subTitle": None,
+            "align": "left",
+            "@ctype": "documentTitle",
+        }]
+
+        represent = True
+        for kind, value, language in blocks:
+            if kind == "text":
+                components.append(self._text_component(self._clean_heading_marks(value)))
+            elif kind == "code":
+                components.append(self._code_component(value, language))
+            else:
+                photo = uploaded.get(self._find_image_path(value, image_map))
+                if photo:
+                    components.append(self._image_component(photo, represent))
+                    represent = False
+
+        return {
+            "documentId": "",
+            "document": {
+                "version": self.EDITOR_VERSION,
+                "theme": "default",
+                "language": "ko-KR",
+                "id": str(uuid.uuid4()),
+                "components": components,
+            },
+        }
+
+    @staticmethod
+    def _clean_heading_marks(text: str) -> str:
+        """'####' 이상 헤딩 기호 정리 (1~3단계는 _text_component에서 굵게 처리)"""
+        return re.sub(r'^#{4,} ', '', text)
+
+    # ---------- 요청 ----------
+
+    def _upload_photos_reusing(self, paths: List[str]) -> dict:
+        """업로드 URL 캐시(블로그별 이미지 내용 해시 → 사진 정보)에 있는 사진은 재사용하고 나머지만 업로드
+
+        Returns:
+            {경로: 사진 정보} (_upload_photos와 같은 형식)
+        """
+        url_cache = UploadCache(self.PLATFORM_NAME, self.naver_id)
+        reused, hashes = url_cache.lookup({path: path for path in paths})
+        remaining = [path for path in paths if path not in reused]
+
+        uploaded = self._upload_photos(remaining) if remaining else {}
+        url_cache.store(uploaded, hashes)
+
+        if reused:
+            logger.info(f"♻️ 이미 업로드된 사진 {len(reused)}개 재사용")
+        return {**reused, **uploaded}
+
+    def _upload_photos(self, paths: List[str]) -> dict:
+        """사진 업로드 세션 키 발급 후 여러 장을 동시에 업로드
+
+        Args:
+            paths: 이미지 경로 목록
+
+        Returns:
+            {경로: {"url", "path", "domain", "fileName", "width", "height", "fileSize"}}
+        """
+        response = self.session.get(
+            self.editor_host + self.SESSION_KEY_PATH,
+            headers={"SE-Authorization": self._token},
+            timeout=self.REQUEST_TIMEOUT,
+        )
+        self._check_session(response, "nid.naver.com")
+        session_key = response.json().get("sessionKey")
+        if not session_key:
+            raise RuntimeError("사진 업로드 세션 키 발급 실패")
+
+        upload_url = self.upload_host + self.UPLOAD_PATH.format(session_key=session_key, blog_id=self.naver_id)
+        start = time.time()
+
+        def upload(path: str):
+            with open(path, "rb") as f:
+                response = self.session.post(
+                    upload_url,
+                    files={"image": (Path(path).name, f, mimetypes.guess_type(path)[0] or "image/jpeg")},
+                    timeout=self.REQUEST_TIMEOUT * 2,
+                )
+            self._check_session(response, "nid.naver.com")
+            if not response.ok:
+                logger.debug(f"사진 업로드 실패 ({Path(path).name}): HTTP {response.status_code}")
+                return path, None
+            return path, self._parse_upload_response(response.text)
+
+        concurrency = int(os.getenv("NAVER_UPLOAD_CONCURRENCY", "4"))
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(paths)))) as executor:
+            results = list(executor.map(upload, paths))
+
+        uploaded = {path: photo for path, photo in results if photo}
+        logger.info(f"✅ 사진 {len(uploaded)}/{len(paths)}개 업로드 완료 ({time.time() - start:.1f}초)")
+        return uploaded
+
+    @staticmethod
+    def _parse_upload_response(body: str) -> Optional[dict]:
+        """사진 업로드 응답(XML) 해석
+
+        응답 예: <item><url>https://blogfiles.pstatic.net/...</url><path>/MjAy.../a.png</path>
+                 <fileName>a.png</fileName><width>800</width><height>600</height><fileSize>1234</fileSize></item>
+        """
+        try:
+            root = ElementTree.fromstring(body)
+        except ElementTree.ParseError:
+            return None
+
+        item = root if root.tag == "item" else root.find(".//item")
+        if item is None or not (item.findtext("url") or "").startswith("http"):
+            return None
+
+        def number(tag):
+            try:
+                return int(item.findtext(tag))
+            except (TypeError, ValueError):
+                return None
+
+        url = item.findtext("url")
+        return {
+            "url": url,
+            "path": item.findtext("path"),
+            "domain": re.match(r'https?://[^/]+', url).group(0),
+            "fileName": item.findtext("fileName"),
+            "width": number("width"),
+            "height": number("height"),
+            "fileSize": number("fileSize"),
+        }
+
+    def _category_id(self, category: Optional[str]) -> Optional[int]:
+        """카테고리 이름 → 번호 (브라우저 발행 때 저장된 카테고리 맵 사용, 없으면 None = 기본 카테고리)"""
+        if not category:
+            return None
+        value = (self.get_cached_categories().get(category) or {}).get("value")
+        return int(value) if str(value or "").isdigit() else None
+
+    def _save_post(self, document: dict, category: Optional[str], tags: Optional[list]) -> dict:
+        """RabbitWrite.naver에 문서 저장(발행) 요청
+
+        Returns:
+            {"status", "body"} (_parse_publish_response 입력 형식)
+        """
+        category_id = self._category_id(category)
+        if category and category_id is None:
+            logger.warning(f"⚠️ 카테고리 번호를 알 수 없음 (기본 카테고리로 발행): {category}")
+
+        population = {
+            "configuration": {
+                "openType": self.OPEN_TYPES.get(self.visibility, 2),
+                "commentYn": True,
+                "searchYn": True,
+                "sympathyYn": True,
+                "scrapType": 2,
+                "outSideAllowYn": True,
+                "cclYn": False,
+            },
+            "populationMeta": {
+                "categoryId": category_id,
+                "logNo": None,
+                "directorySeq": 0,
+                "postWriteTimeType": "now",
+                "tags": ",".join((tags or [])[:30]),
+                "noticePostYn": False,
+                "autoByCategoryYn": False,
+            },
+        }
+        response = self.session.post(
+            self.blog_host + self.SAVE_PATH,
+            data={
+                "blogId": self.naver_id,
+                "documentModel": json.dumps(document, ensure_ascii=False),
+                "mediaResources": json.dumps({"image": [], "video": [], "file": []}),
+                "populationParams": json.dumps(population, ensure_ascii=False),
+                "productApiVersion": "v1",
+            },
+            headers={"Referer": self.BLOG_WRITE_URL.format(blog_id=self.naver_id)},
+            timeout=self.REQUEST_TIMEOUT,
+        )
+        self._check_session(response, "nid.naver.com")
+        return {"status": response.status_code, "body": response.text}
+
+    def _publish_with_browser(self, title, content, category, tags, images) -> PublishResult:
+        """브라우저 발행으로 대체 (로그인 성공 시 새 세션이 저장되어 다음 HTTP 발행에 사용)"""
+        publisher = NaverPublisher(
+            headless=self.browser_manager.headless,
+            lean=self.browser_manager.lean,
+            account={"id": self.naver_id, "password": self.naver_password},
+        )
+        publisher.save_sessions = True  # HTTP 발행을 쓰므로 새 세션 저장
+        try:
+            result = publisher.publish(title=title, content=content, category=category, tags=tags, images=images)
+        finally:
+            publisher.logout()
+        self.last_result = result
+        self._cookies = None  # 다음 발행은 새로 저장된 세션 사용
+        return result
+
+    def logout(self):
+        """HTTP 세션 정리 (브라우저 없음)"""
+        self.session.close()
+        self.is_logged_in = False
+        logger.info("👋 네이버 HTTP 세션 종료")
@@ -0,0 +1,261 @@
+"""
+네이버 블로그 자동화 (Playwright)
+asyncio + Playwright로 네이버 블로그에 글 발행 (BROWSER_BACKEND=playwright)
+"""
+import asyncio
+import re
+from pathlib import Path
+from typing import List, Optional
+from loguru import logger
+
+from .base import PublishResult
+from .naver import NaverPublisher
+from .playwright_base import PlaywrightPublisherMixin
+from ..utils.playwright_browser import PlaywrightBrowser
+
+
+class NaverPlaywrightPublisher(PlaywrightPublisherMixin, NaverPublisher):
+    """네이버 블로그 발행자 (Playwright async)
+
+    계정 설정, 문단 → HTML 변환, 페이지 스크립트, 응답 해석은 NaverPublisher와 공유합니다.
+    코드 블록은 소스코드 컴포넌트 대신 일반 문단으로 붙여넣습니다.
+    """
+
+    LOGIN_TIMEOUT = 90  # 캡차/2차 인증 포함 로그인 완료 대기 (초)
+    IMAGE_TIMEOUT = 60  # 이미지 업로드 완료 대기 (초)
+
+    def __init__(self, browser: PlaywrightBrowser):
+        """
+        Args:
+            browser: 공유 PlaywrightBrowser
+        """
+        NaverPublisher.__init__(self, headless=browser.headless, lean=browser.lean)
+        self._init_playwright(browser)
+
+    async def login(self) -> bool:
+        """네이버 로그인
+
+        Returns:
+            로그인 성공 여부
+        """
+        page = await self._new_page()
+        try:
+            logger.info("🔐 네이버 로그인 시도 중... (Playwright)")
+            await page.goto(self.LOGIN_URL)
+
+            # 아이디/비밀번호 직접 입력 (보안 키패드 우회)
+            await self.run_script(
+                page,
+                "document.getElementById('id').value = arguments[0];"
+                "document.getElementById('pw').value = arguments[1];",
+                self.naver_id, self.naver_password,
+            )
+            await page.click("[id='log.login']")
+
+            # 캡차/2차 인증은 브라우저에서 직접 처리 (헤드리스가 아닐 때)
+            await page.wait_for_url(lambda url: "nid.naver.com" not in url, timeout=self.LOGIN_TIMEOUT * 1000)
+
+            self.is_logged_in = True
+            logger.success("✅ 네이버 로그인 성공")
+            return True
+        except Exception as e:
+            logger.error(f"❌ 네이버 로그인 실패: {e}")
+            await self._save_error_screenshot(page)
+            return False
+        finally:
+            await page.close()
+
+    async def publish(
+        self,
+        title: str,
+        content: str,
+        category: Optional[str] = None,
+        tags: Optional[list] = None,
+        images: Optional[list] = None
+    ) -> PublishResult:
+        """네이버 블로그에 글 발행
+
+        Returns:
+            발행 결과 (성공 여부, 글 주소)
+        """
+        if not self.is_logged_in and not await self.login():
+            return self._result(False, error="로그인 실패")
+
+        async with self._page_slots:
+            page = await self._new_page()
+            try:
+                await page.goto(self.BLOG_WRITE_URL.format(blog_id=self.naver_id))
+                logger.info(f"📝 네이버 블로그 글 작성 중: {title}")
+
+                # 제목 영역이 나타나면 팝업 정리
+                title_area = page.locator(".se-documentTitle, .se-title-text").first
+                await title_area.wait_for()
+                await self.run_script(page, self.HIDE_POPUPS_SCRIPT)
+                new_post_btn = page.locator("button:has-text('새로 작성'), button:has-text('아니오')")
+                if await new_post_btn.count():
+                    await new_post_btn.first.click()
+                    logger.info("✅ '작성중인 글' 팝업 - 새로 작성 선택")
+                await page.keyboard.press("Escape")
+
+                # 제목 입력
+                await title_area.click()
+                await page.keyboard.type(title)
+
+                # 본문 영역 클릭
+                content_area = await page.evaluate_handle(
+                    f"() => (function() {{ {self.FIND_CONTENT_AREA_SCRIPT} }})()"
+                )
+                element = content_area.as_element()
+                if element:
+                    await element.click()
+                else:
+                    await page.keyboard.press("Tab")
+
+                images = await asyncio.to_thread(self._prepare_images, images)
+                image_map = {Path(p).name.lower(): str(p) for p in (images or [])}
+                await self._write_body(page, content, image_map)
+                logger.info("✅ 본문 입력 완료")
+
+                # 발행 설정 팝업 열기
+                await self.run_script(page, self.HIDE_POPUPS_SCRIPT)
+                await page.keyboard.press("Escape")
+                await page.locator("button[class*='publish_btn']").first.click()
+
+                if category:
+                    result = await self.run_async_script(
+                        page, self.SELECT_CATEGORY_SCRIPT, category, self.get_cached_categories().get(category)
+                    )
+                    if result.get("map"):
+                        self.save_categories(result["map"])
+                    if result.get("clicked") or result.get("already"):
+                        logger.info(f"📁 카테고리 선택: {category}")
+                    else:
+                        logger.warning(f"⚠️ 카테고리를 찾을 수 없음: {category}")
+
+                if tags:
+                    await page.locator("div[class*='tag_textarea'], div[class*='tag_area']").first.click()
+                    for tag in tags[:30]:
+                        await page.keyboard.type(tag)
+                        await page.keyboard.press("Enter")
+                    logger.info(f"🏷️ 태그 추가: {', '.join(tags[:30])}")
+
+                # 최종 발행 - 발행 API 응답으로 결과 확인
+                final_btn = page.locator(
+                    "div[class*='layer_btn_area'] button, button[class*='confirm_btn']"
+                ).first
+                async with page.expect_response(
+                    lambda r: re.search(self.PUBLISH_API_PATTERN, r.url) is not None,
+                    timeout=self.PUBLISH_TIMEOUT * 1000,
+                ) as response_info:
+                    await final_btn.click()
+                response = await response_info.value
+
+                success, url, post_id, error = self._parse_publish_response(
+                    {"status": response.status, "body": await response.text()}, self.naver_id
+                )
+                if not success:
+                    logger.error(f"❌ 네이버 블로그 발행 실패: {error}")
+                    return self._result(False, error=error)
+
+                logger.success(f"✅ 네이버 블로그 발행 완료: {title}" + (f" ({url})" if url else ""))
+                return self._result(True, url=url, post_id=post_id)
+
+            except Exception as e:
+                logger.error(f"❌ 네이버 블로그 발행 실패: {e}")
+                await self._save_error_screenshot(page)
+                return self._result(False, error=str(e))
+            finally:
+                await page.close()
+
+    async def _write_body(self, page, content: str, image_map: dict):
+        """본문 입력 (문단 묶음 붙여넣기 + 연속 이미지 한 번에 업로드)"""
+        # 코드 블록은 일반 문단으로 (``` 기호만 제거)
+        content = re.sub(r'```\w*\n(.*?)```', lambda m: m.group(1).strip(), content, flags=re.DOTALL)
+
+        pending_text, pending_images = [], []
+        for para in content.split('\n\n'):
+            text = para.strip()
+            if not text:
+                continue
+
+            image_match = re.match(r'\[IMAGE:\s*([^\]]+)\]', text, re.IGNORECASE)
+            if image_match:
+                await self._paste_paragraphs(page, pending_text)
+                pending_text = []
+                pending_images.append(image_match.group(1).strip())
+                continue
+
+            await self._insert_images_async(page, pending_images, image_map)
+            pending_images = []
+
+            # 지도/링크 카드는 키 입력으로만 생성됨
+            if 'naver.me' in text or 'map.naver.com' in text:
+                await self._paste_paragraphs(page, pending_text)
+                pending_text = []
+                await page.keyboard.type(self._clean_paragraph(text))
+                await page.keyboard.press("Enter")
+                await page.keyboard.press("Enter")
+                continue
+
+            pending_text.append(text)
+
+        await self._paste_paragraphs(page, pending_text)
+        await self._insert_images_async(page, pending_images, image_map)
+
+    async def _paste_paragraphs(self, page, paragraphs: List[str]):
+        """문단 묶음을 합성 붙여넣기로 삽입 (반영되지 않으면 키 입력)"""
+        if not paragraphs:
+            return
+
+        html = self._paragraphs_to_html(paragraphs)
+        plain_text = '\n\n'.join(self._clean_paragraph(p) for p in paragraphs)
+        expected = len(re.sub(r'\s', '', plain_text)) // 2
+
+        before = await self.run_script(page, self.TEXT_LENGTH_SCRIPT)
+        await self.run_script(page, self.PASTE_HTML_SCRIPT, html, plain_text)
+        try:
+            await page.wait_for_function(
+                f"([before, expected]) => (function() {{ {self.TEXT_LENGTH_SCRIPT} }})() - before >= expected",
+                arg=[before, expected],
+                timeout=3000,
+            )
+            return
+        except Exception:
+            logger.debug("붙여넣기 미지원 - 키 입력 방식으로 대체")
+
+        # 확인 시간이 지난 뒤 반영됐거나 일부만 들어갔으면 그만큼은 다시 입력하지 않음
+        applied = 0
+        if before is not None and before >= 0:
+            applied = await self.run_script(page, self.TEXT_LENGTH_SCRIPT) - before
+        for para in self._untyped_paragraphs(paragraphs, applied):
+            await page.keyboard.type(self._clean_paragraph(para))
+            await page.keyboard.press("Enter")
+            await page.keyboard.press("Enter")
+
+    async def _insert_images_async(self, page, image_names: List[str], image_map: dict):
+        """연속 이미지를 파일 선택 한 번으로 업로드하고 이미지 컴포넌트가 생길 때까지 대기"""
+        paths = [p for p in (self._find_image_path(name, image_map) for name in image_names) if p]
+        if not paths:
+            if image_names:
+                logger.warning(f"⚠️ 이미지 파일을 찾을 수 없음: {image_names}")
+            return
+
+        count_script = "() => document.querySelectorAll('.se-component.se-image img[src^=\"http\"]').length"
+        before = await page.evaluate(count_script)
+
+        async with page.expect_file_chooser() as chooser_info:
+            await page.locator("button[data-name='image']").first.click()
+        chooser = await chooser_info.value
+        await chooser.set_files(paths)
+
+        # 여러 장이면 '개별사진' 선택
+        single_btn = page.locator("button:has-text('개별사진')")
+        if len(paths) > 1 and await single_btn.count():
+            await single_btn.first.click()
+
+        await page.wait_for_function(
+            f"(before) => ({count_script})() >= before + {len(paths)}",
+            arg=before,
+            timeout=self.IMAGE_TIMEOUT * 1000,
+        )
+        logger.info(f"✅ 이미지 {len(paths)}개 업로드 완료")
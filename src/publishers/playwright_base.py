@@ -0,0 +1,145 @@
+"""
+Playwright 발행자 공통 기능
+asyncio 기반으로 한 Chromium 안의 플랫폼/계정별 컨텍스트에서 발행
+"""
+import asyncio
+import os
+from loguru import logger
+
+from .base import PublishResult
+from ..utils.playwright_browser import PlaywrightBrowser
+
+
+class PlaywrightPublisherMixin:
+    """Playwright(async) 발행자 믹스인
+
+    Selenium 발행자 클래스와 함께 상속해 설정/변환 함수/스크립트 상수는 그대로 쓰고,
+    login/publish/logout만 async로 다시 구현합니다.
+    페이지 스크립트는 Selenium과 같은 형식(arguments, 마지막 인자 콜백)으로 실행할 수 있습니다.
+    """
+
+    def _init_playwright(self, browser: PlaywrightBrowser):
+        self.browser = browser
+        # 같은 계정으로 동시에 여는 글쓰기 페이지 수 (기본 1 - 임시저장 충돌 방지)
+        self._page_slots = asyncio.Semaphore(int(os.getenv("PLAYWRIGHT_PAGES_PER_ACCOUNT", "1")))
+
+    async def _context(self):
+        """이 발행자(플랫폼/계정)의 브라우저 컨텍스트"""
+        return await self.browser.context(self._category_cache_key(), platform=self.PLATFORM_NAME)
+
+    async def _new_page(self):
+        """새 탭 열기 (알림창은 자동으로 '취소' 처리 - 임시저장 글 복구 안 함)"""
+        context = await self._context()
+        page = await context.new_page()
+
+        async def dismiss(dialog):
+            logger.info(f"📋 알림창 감지: {dialog.message[:50]}...")
+            await dialog.dismiss()
+
+        page.on("dialog", dismiss)
+        return page
+
+    @staticmethod
+    async def run_script(page, script: str, *args):
+        """Selenium execute_script 형식의 스크립트 실행"""
+        return await page.evaluate(
+            f"(args) => (function() {{ {script} }}).apply(null, args)", list(args)
+        )
+
+    @staticmethod
+    async def run_async_script(page, script: str, *args):
+        """Selenium execute_async_script 형식의 스크립트 실행 (마지막 인자가 완료 콜백)"""
+        return await page.evaluate(
+            "(args) => new Promise((done) => { "
+            f"(function() {{ {script} }}).apply(null, args.concat([done])); }})",
+            list(args),
+        )
+
+    async def _save_error_screenshot(self, page):
+        path = f"{self.PLATFORM_NAME}_error.png"
+        try:
+            await page.screenshot(path=path)
+            logger.info(f"📸 에러 스크린샷 저장: {path}")
+        except Exception:
+            pass
+
+    async def logout(self):
+        """로그아웃 (컨텍스트/브라우저는 PlaywrightBrowser.close에서 정리)"""
+        self.is_logged_in = False
+        logger.info(f"👋 {self.PLATFORM_NAME} 로그아웃 완료")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.logout()
+
+
+def create_playwright_publisher(platform: str, browser: PlaywrightBrowser):
+    """플랫폼 이름으로 Playwright 발행자 생성"""
+    if platform == "naver":
+        from .naver_playwright import NaverPlaywrightPublisher
+        return NaverPlaywrightPublisher(browser)
+    if platform == "tistory":
+        from .tistory_playwright import TistoryPlaywrightPublisher
+        return TistoryPlaywrightPublisher(browser)
+    raise ValueError(f"지원하지 않는 플랫폼: {platform}")
+
+
+async def publish_concurrently(
+    jobs: list,
+    headless: bool = None,
+    lean: bool = None,
+    publisher_factory=create_playwright_publisher,
+) -> list:
+    """여러 글을 한 이벤트 루프에서 동시에 발행
+
+    Chromium 하나를 띄우고 플랫폼(계정)마다 컨텍스트 하나를 사용합니다.
+    서로 다른 플랫폼/계정은 동시에, 같은 계정의 글은 PLAYWRIGHT_PAGES_PER_ACCOUNT 개씩 진행합니다.
+
+    Args:
+        jobs: [{"platform", "title", "content", "category", "tags", "images"}] 목록
+        headless: 헤드리스 모드 여부
+        lean: 경량 모드 여부
+        publisher_factory: (플랫폼, 브라우저) → 발행자 (테스트용)
+
+    Returns:
+        jobs 순서대로의 PublishResult 목록
+    """
+    browser = PlaywrightBrowser(headless=headless, lean=lean)
+    publishers = {}
+    login_tasks = {}
+
+    async def run(job: dict) -> PublishResult:
+        platform = job["platform"]
+        try:
+            if platform not in publishers:
+                publishers[platform] = publisher_factory(platform, browser)
+                login_tasks[platform] = asyncio.ensure_future(publishers[platform].login())
+            publisher = publishers[platform]
+
+            # 같은 계정의 로그인은 한 번만
+            if not await login_tasks[platform]:
+                return PublishResult(False, platform=platform, error="로그인 실패")
+
+            return await publisher.publish(
+                title=job["title"],
+                content=job["content"],
+                category=job.get("category"),
+                tags=job.get("tags"),
+                images=job.get("images"),
+            )
+        except Exception as e:
+            logger.error(f"❌ {platform} 발행 오류: {e}")
+            return PublishResult(False, platform=platform, error=str(e))
+
+    try:
+        return list(await asyncio.gather(*(run(job) for job in jobs)))
+    finally:
+        for publisher in publishers.values():
+            try:
+                await publisher.logout()
+            except Exception:
+                pass
+        await browser.close()
+
@@ -17,8 +17,10 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from dotenv import load_dotenv
 from loguru import logger
 
-from .base import BasePublisher
+from .base import BasePublisher, PublishResult
+from ..media.upload_cache import UploadCache
 from ..utils.browser import BrowserManager
+from ..utils.network import NetworkCapture
 
 load_dotenv()
 
@@ -30,18 +32,117 @@ class TistoryPublisher(BasePublisher):
     
     # 티스토리 URL
     LOGIN_URL = "https://www.tistory.com/auth/login"
+    HOME_URL = "https://www.tistory.com"
+    MANAGE_URL = "https://{blog_name}.tistory.com/manage"  # 블로그 관리 (로그인 세션 확립)
     BLOG_WRITE_URL = "https://{blog_name}.tistory.com/manage/newpost"  # 블로그별 글쓰기 URL
+    ATTACH_URL = "https://{blog_name}.tistory.com/manage/post/attach.json"  # 에디터 첨부 업로드
     
-    def __init__(self, headless: bool = None):
+    PUBLISH_API_PATTERN = r"/manage/post(/\d+)?\.json"  # 발행(저장) API
+    ATTACH_PATTERN = r"/manage/post/attach\.json"  # 첨부 업로드 API (성능 지표용)
+    
+    UPLOAD_TIMEOUT = 120  # 페이지 내 동시 업로드 최대 대기 (초)
+    PUBLISH_TIMEOUT = 30  # 발행 API 응답 최대 대기 (초)
+    
+    # TinyMCE 본문 설정 (arguments[0]: HTML)
+    SET_CONTENT_SCRIPT = """
+        // TinyMCE 에디터 인스턴스 가져오기
+        if (typeof tinymce !== 'undefined' && tinymce.activeEditor) {
+            var editor = tinymce.activeEditor;
+            // 내용 설정
+            editor.setContent(arguments[0]);
+            // 변경사항 저장 (폼 데이터에 반영)
+            editor.save();
+            console.log('TinyMCE API로 내용 설정 완료');
+        } else if (typeof tinyMCE !== 'undefined' && tinyMCE.activeEditor) {
+            var editor = tinyMCE.activeEditor;
+            editor.setContent(arguments[0]);
+            editor.save();
+            console.log('tinyMCE API로 내용 설정 완료');
+        } else {
+            // API 사용 불가시 hidden textarea에 직접 입력
+            var textarea = document.querySelector('#editor-tistory');
+            if (textarea) {
+                textarea.value = arguments[0];
+                console.log('textarea에 직접 입력');
+            }
+        }
+    """
+    
+    # 카테고리 검색/클릭 (arguments: 카테고리명, 캐시된 위치) - 드롭다운이 열린 상태에서 실행
+    SELECT_CATEGORY_SCRIPT = """
+        var target = arguments[0], cached = arguments[1];
+        var list = document.querySelector('#category-list');
+        var items = list.querySelectorAll('div.mce-menu-item');
+
+        function textOf(item) {
+            var span = item.querySelector('span.mce-text');
+            return span ? span.textContent.trim() : '';
+        }
+        function matches(text) {
+            // 정확히 일치하거나, "- 맛집" 형태에서 맛집만 비교
+            return text === target || text.replace(/^[-\\s]+/, '').trim() === target;
+        }
+        function pick(item) {
+            item.scrollIntoView({block: 'center'});
+            item.click();
+            return textOf(item);
+        }
+
+        // 1. 캐시된 위치 확인
+        if (cached) {
+            var item = (cached.id && document.getElementById(cached.id)) || items[cached.index];
+            if (item && list.contains(item) && matches(textOf(item))) {
+                return {clicked: pick(item), cached: true};
+            }
+        }
+
+        // 2. 전체 목록 스캔 (캐시 갱신용 맵 생성)
+        var map = {}, hit = null;
+        for (var i = 0; i < items.length; i++) {
+            var text = textOf(items[i]);
+            if (!text) continue;
+            var name = text.replace(/^[-\\s]+/, '').trim();
+            var id = items[i].id && items[i].id.indexOf('mceu_') !== 0 ? items[i].id : null;
+            map[name] = {
+                index: i,
+                id: id,
+                value: items[i].getAttribute('data-value') || items[i].getAttribute('data-id')
+            };
+            if (!hit && matches(text)) hit = items[i];
+        }
+        return {clicked: hit ? pick(hit) : null, map: map, total: items.length};
+    """
+    
+    def __init__(
+        self,
+        headless: bool = None,
+        lean: bool = None,
+        account: dict = None,
+        blog_name: str = None,
+        image_url_cache: dict = None,
+        urls: dict = None,
+    ):
         """
         Args:
             headless: 헤드리스 모드 여부
+            lean: 경량 모드 여부 (광고/분석/폰트 차단, eager 로딩)
+            account: 카카오 계정 {"id", "password", "blogs"} (utils.accounts). None이면 환경변수
+            blog_name: 발행할 블로그 이름. None이면 계정의 첫 블로그 또는 TISTORY_BLOG_NAME
+            image_url_cache: 업로드한 이미지 URL 공유 캐시 {파일 키: URL} (여러 블로그에 같은 글 발행 시)
+            urls: URL 상수 덮어쓰기 {"LOGIN_URL": ..., "BLOG_WRITE_URL": ...} (로컬 대체 서버 테스트용)
         """
         super().__init__()
-        self.browser_manager = BrowserManager(headless=headless)
-        self.tistory_id = os.getenv("TISTORY_ID")
-        self.tistory_password = os.getenv("TISTORY_PASSWORD")
-        self.blog_name = os.getenv("TISTORY_BLOG_NAME")
+        self.browser_manager = BrowserManager(headless=headless, lean=lean, platform=self.PLATFORM_NAME)
+        if account:
+            self.tistory_id = account.get("id")
+            self.tistory_password = account.get("password")
+            self.blog_name = blog_name or next(iter(account.get("blogs") or []), None)
+        else:
+            self.tistory_id = os.getenv("TISTORY_ID")
+            self.tistory_password = os.getenv("TISTORY_PASSWORD")
+            self.blog_name = blog_name or os.getenv("TISTORY_BLOG_NAME")
+        self.image_url_cache = image_url_cache
+        self._override_urls(urls)
         
         if not self.tistory_id or not self.tistory_password:
             raise ValueError("TISTORY_ID 또는 TISTORY_PASSWORD가 설정되지 않았습니다.")
@@ -58,6 +159,7 @@ class TistoryPublisher(BasePublisher):
             self.driver = self.browser_manager.create_driver()
             self.driver.get(self.LOGIN_URL)
             time.sleep(2)
+            self._capture_page("login")
             
             logger.info("🔐 티스토리 로그인 시도 중...")
             
@@ -136,12 +238,13 @@ class TistoryPublisher(BasePublisher):
             
             # 로그인 성공 확인 - 티스토리 메인으로 이동 시도
             time.sleep(2)
-            self.driver.get("https://www.tistory.com")
+            self.driver.get(self.HOME_URL)
             time.sleep(2)
             
             # 블로그 관리 페이지로 이동하여 세션 확립
-            self.driver.get(f"https://{self.blog_name}.tistory.com/manage")
+            self.driver.get(self.MANAGE_URL.format(blog_name=self.blog_name))
             time.sleep(2)
+            self._capture_page("manage")
             
             # 다시 로그인 페이지로 리다이렉트되면 쿠키 문제
             if "auth/login" in self.driver.current_url:
@@ -154,9 +257,10 @@ class TistoryPublisher(BasePublisher):
                         logger.info("✅ 블로그 관리 페이지 접근 성공!")
                         break
             
-            # 로그인 상태 확인
-            if self.blog_name in self.driver.current_url or "tistory.com" in self.driver.current_url:
+            # 로그인 상태 확인 (관리 페이지에서 로그인 페이지로 돌아가지 않았으면 성공)
+            if "auth/login" not in self.driver.current_url:
                 self.is_logged_in = True
+                self.save_session()  # TistoryHttpPublisher가 재사용
                 logger.success("✅ 티스토리 로그인 성공")
                 return True
             else:
@@ -174,7 +278,7 @@ class TistoryPublisher(BasePublisher):
         category: Optional[str] = None,
         tags: Optional[list] = None,
         images: Optional[list] = None
-    ) -> bool:
+    ) -> PublishResult:
         """티스토리에 글 발행
         
         Args:
@@ -185,14 +289,18 @@ class TistoryPublisher(BasePublisher):
             images: 이미지 파일 경로 목록
         
         Returns:
-            발행 성공 여부
+            발행 결과 (성공 여부, 글 주소)
         """
+        self.last_result = None
         if not self.is_logged_in:
             if not self.login():
-                return False
+                return self._result(False, error="로그인 실패")
+        elif not self._prepare_browser():
+            return self._result(False, error="브라우저 재시작 후 로그인 실패")
         
         try:
             # 글쓰기 페이지로 이동 (블로그 이름 포함)
+            self._mark_stage("navigate")
             write_url = self.BLOG_WRITE_URL.format(blog_name=self.blog_name)
             logger.info(f"📝 글쓰기 페이지로 이동: {write_url}")
             self.driver.get(write_url)
@@ -210,7 +318,8 @@ class TistoryPublisher(BasePublisher):
             
             logger.info(f"📝 티스토리 글 작성 중: {title}")
             
-            # 이미지 파일 매핑 생성
+            # 이미지 파일 매핑 생성 (전처리 결과 경로, 파일명은 원본과 같음)
+            images = self._prepare_images(images)
             image_map = {}
             if images:
                 for img_path in images:
@@ -222,9 +331,11 @@ class TistoryPublisher(BasePublisher):
             clean_title = ''.join(c for c in title if ord(c) <= 0xFFFF)
             
             # 제목 입력
+            self._mark_stage("title")
             title_input = WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "#post-title-inp"))
             )
+            self._capture_page("newpost")
             title_input.clear()
             title_input.send_keys(clean_title)
             time.sleep(1)
@@ -232,9 +343,12 @@ class TistoryPublisher(BasePublisher):
             # 이미지 먼저 업로드 (본문 입력 전에)
             uploaded_images = {}  # {파일명: 업로드된 이미지 URL}
             if image_map:
-                uploaded_images = self._upload_images(image_map)
+                self._mark_stage("images")
+                uploaded_images = self._upload_images_reusing(image_map)
+                self._capture_requests("upload", self.ATTACH_PATTERN)
             
             # 본문 입력 - 티스토리 TinyMCE 에디터 처리
+            self._mark_stage("body")
             editor_found = False
             
             # 티스토리는 TinyMCE iframe 에디터 사용 (id: editor-tistory_ifr)
@@ -249,37 +363,14 @@ class TistoryPublisher(BasePublisher):
                 
                 # 방법 1: TinyMCE API 사용 (가장 확실한 방법)
                 # 메인 프레임에서 TinyMCE API 호출
-                self.driver.execute_script("""
-                    // TinyMCE 에디터 인스턴스 가져오기
-                    if (typeof tinymce !== 'undefined' && tinymce.activeEditor) {
-                        var editor = tinymce.activeEditor;
-                        // 내용 설정
-                        editor.setContent(arguments[0]);
-                        // 변경사항 저장 (폼 데이터에 반영)
-                        editor.save();
-                        console.log('TinyMCE API로 내용 설정 완료');
-                    } else if (typeof tinyMCE !== 'undefined' && tinyMCE.activeEditor) {
-                        var editor = tinyMCE.activeEditor;
-                        editor.setContent(arguments[0]);
-                        editor.save();
-                        console.log('tinyMCE API로 내용 설정 완료');
-                    } else {
-                        // API 사용 불가시 hidden textarea에 직접 입력
-                        var textarea = document.querySelector('#editor-tistory');
-                        if (textarea) {
-                            textarea.value = arguments[0];
-                            console.log('textarea에 직접 입력');
-                        }
-                    }
-                """, tinymce_html)
+                self.driver.execute_script(self.SET_CONTENT_SCRIPT, tinymce_html)
                 
                 time.sleep(1)
                 
-                # 에디터 내용이 제대로 들어갔는지 확인
-                # iframe으로 전환해서 확인
-                self.driver.switch_to.frame(iframe)
-                body_content = self.driver.execute_script("return document.body.innerHTML;")
-                self.driver.switch_to.default_content()
+                # 에디터 내용이 제대로 들어갔는지 확인 (프레임 전환 없이 iframe 문서 조회)
+                body_content = self.driver.execute_script(
+                    "return arguments[0].contentDocument.body.innerHTML;", iframe
+                )
                 
                 if len(body_content) > 50:  # 내용이 있으면 성공
                     editor_found = True
@@ -378,45 +469,36 @@ class TistoryPublisher(BasePublisher):
             
             # 카테고리 선택
             if category:
+                self._mark_stage("category")
                 self._select_category(category)
             
             # 태그 입력
             if tags:
+                self._mark_stage("tags")
                 self._add_tags(tags)
             
-            # 발행 버튼 클릭
+            # 발행 버튼 클릭 후 발행 API 응답으로 결과 확인
+            self._mark_stage("publish")
+            network = NetworkCapture(self.driver)
+            network.clear()
             self._click_publish_button()
             
-            # 발행 결과 확인 (에러 팝업 감지)
-            time.sleep(3)
+            response = network.wait_for_response(self.PUBLISH_API_PATTERN, timeout=self.PUBLISH_TIMEOUT)
+            self._capture_requests("publish", self.PUBLISH_API_PATTERN)
+            if response is None:
+                # 성능 로그를 못 읽는 환경 등 - 페이지 상태로 판단
+                logger.debug("발행 API 응답을 확인하지 못함 - 페이지 상태로 확인")
+                success, error = self._check_publish_result_from_page()
+                url, post_id = None, None
+            else:
+                success, url, post_id, error = self._parse_publish_response(response)
             
-            # 에러 팝업 확인
-            try:
-                # 티스토리 에러 팝업: "게시글을 작성하는데 실패했습니다"
-                error_elements = self.driver.find_elements(By.XPATH, "//*[contains(text(), '실패')]")
-                if error_elements:
-                    logger.error("❌ 티스토리 발행 실패: 에러 팝업 감지됨")
-                    # 확인 버튼 클릭
-                    try:
-                        confirm_btn = self.driver.find_element(By.XPATH, "//button[contains(text(), '확인')]")
-                        confirm_btn.click()
-                    except:
-                        pass
-                    return False
-            except:
-                pass
+            if not success:
+                logger.error(f"❌ 티스토리 발행 실패: {error}")
+                return self._result(False, error=error)
             
-            # URL 변경 확인 (발행 성공 시 글 페이지로 이동)
-            current_url = self.driver.current_url
-            if "newpost" in current_url or "manage" in current_url:
-                # 아직 작성 페이지에 있으면 실패 가능성
-                time.sleep(2)
-                current_url = self.driver.current_url
-                if "newpost" in current_url:
-                    logger.warning("⚠️ 발행 후에도 작성 페이지에 머물러 있음 - 실패 가능성")
-            
-            logger.success(f"✅ 티스토리 발행 완료: {title}")
-            return True
+            logger.success(f"✅ 티스토리 발행 완료: {title}" + (f" ({url})" if url else ""))
+            return self._result(True, url=url, post_id=post_id)
             
         except Exception as e:
             logger.error(f"❌ 티스토리 발행 실패: {e}")
@@ -426,7 +508,65 @@ class TistoryPublisher(BasePublisher):
                 logger.info("📸 에러 스크린샷 저장: tistory_error.png")
             except:
                 pass
-            return False
+            return self._result(False, error=str(e))
+        finally:
+            self._track_browser()
+            self._report_stats()
+    
+    @staticmethod
+    def _parse_publish_response(response: dict) -> tuple:
+        """발행 API(/manage/post.json) 응답 해석
+        
+        성공 응답 예: {"entryUrl": "https://blog.tistory.com/123"}
+        
+        Args:
+            response: NetworkCapture.wait_for_response 결과
+        
+        Returns:
+            (성공 여부, 글 주소, 글 번호, 실패 사유)
+        """
+        status = response.get("status") or 0
+        data = NetworkCapture.parse_json(response.get("body")) or {}
+        
+        url = data.get("entryUrl") or data.get("url")
+        if 200 <= status < 300 and url:
+            post_id = url.rstrip("/").rsplit("/", 1)[-1]
+            return True, url, post_id, None
+        
+        error = (
+            response.get("error")
+            or data.get("message")
+            or data.get("error")
+            or f"HTTP {status}"
+        )
+        return False, None, None, str(error)
+    
+    def _check_publish_result_from_page(self) -> tuple:
+        """발행 API 응답을 못 받았을 때 페이지 상태로 결과 판단
+        
+        Returns:
+            (성공 여부, 실패 사유)
+        """
+        time.sleep(3)
+        
+        # 티스토리 에러 팝업: "게시글을 작성하는데 실패했습니다"
+        try:
+            error_elements = self.driver.find_elements(By.XPATH, "//*[contains(text(), '실패')]")
+            if error_elements:
+                try:
+                    self.driver.find_element(By.XPATH, "//button[contains(text(), '확인')]").click()
+                except:
+                    pass
+                return False, "에러 팝업 감지됨"
+        except:
+            pass
+        
+        # 발행 성공 시 글 관리/글 페이지로 이동
+        if "newpost" in self.driver.current_url:
+            time.sleep(2)
+            if "newpost" in self.driver.current_url:
+                return False, "발행 후 작성 페이지에 머무름"
+        return True, None
     
     def _input_content_to_editor(self, editor, content: str):
         """에디터에 콘텐츠 입력"""
@@ -719,47 +859,41 @@ class TistoryPublisher(BasePublisher):
             return Keys.CONTROL
     
     def _close_modal_if_exists(self):
-        """TinyMCE 모달 오버레이가 있으면 닫기"""
+        """TinyMCE 모달 오버레이가 있으면 닫기 (한 번의 스크립트 + ESC)"""
         from selenium.webdriver.common.action_chains import ActionChains
         from selenium.webdriver.common.keys import Keys
         
         try:
             self.driver.switch_to.default_content()
             
-            # mce-modal-block 오버레이 확인 및 제거
-            modal_blocks = self.driver.find_elements(By.CSS_SELECTOR, "#mce-modal-block, .mce-modal-block")
-            if modal_blocks:
-                for modal in modal_blocks:
-                    try:
-                        self.driver.execute_script("arguments[0].remove();", modal)
-                    except:
-                        pass
-                logger.debug("모달 오버레이 제거됨")
-            
-            # mce-dragh (에디터 리사이즈 핸들러) 제거
-            dragh_elements = self.driver.find_elements(By.CSS_SELECTOR, ".mce-dragh, #mceu_29-dragh")
-            for elem in dragh_elements:
-                try:
-                    self.driver.execute_script("arguments[0].style.display = 'none';", elem)
-                except:
-                    pass
-            
-            # mce-window (팝업 창) 닫기
-            mce_windows = self.driver.find_elements(By.CSS_SELECTOR, ".mce-window")
-            for win in mce_windows:
-                try:
-                    close_btn = win.find_elements(By.CSS_SELECTOR, ".mce-close, button[aria-label='Close']")
-                    if close_btn:
-                        close_btn[0].click()
-                    else:
-                        self.driver.execute_script("arguments[0].remove();", win)
-                except:
-                    pass
+            removed = self.driver.execute_script("""
+                var count = 0;
+                
+                // mce-modal-block 오버레이 제거
+                document.querySelectorAll('#mce-modal-block, .mce-modal-block').forEach(function(el) {
+                    el.remove();
+                    count++;
+                });
+                
+                // mce-dragh (에디터 리사이즈 핸들러) 숨기기
+                document.querySelectorAll('.mce-dragh, #mceu_29-dragh').forEach(function(el) {
+                    el.style.display = 'none';
+                });
+                
+                // mce-window (팝업 창) 닫기 - 닫기 버튼이 없으면 제거
+                document.querySelectorAll('.mce-window').forEach(function(win) {
+                    var close = win.querySelector(".mce-close, button[aria-label='Close']");
+                    if (close) { close.click(); } else { win.remove(); }
+                    count++;
+                });
+                return count;
+            """)
+            if removed:
+                logger.debug(f"모달 오버레이 {removed}개 제거됨")
             
             # ESC 키로 모달 닫기 시도
             try:
-                actions = ActionChains(self.driver)
-                actions.send_keys(Keys.ESCAPE).perform()
+                ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
                 time.sleep(0.3)
             except:
                 pass
@@ -767,10 +901,52 @@ class TistoryPublisher(BasePublisher):
         except Exception as e:
             logger.debug(f"모달 닫기 중 오류 (무시): {e}")
     
+    @staticmethod
+    def _image_cache_key(path: str) -> str:
+        """업로드 URL 캐시 키 (절대 경로 + 수정 시각)"""
+        resolved = Path(path).resolve()
+        try:
+            return f"{resolved}:{resolved.stat().st_mtime_ns}"
+        except OSError:
+            return str(resolved)
+    
+    def _upload_images_reusing(self, image_map: dict) -> dict:
+        """이미 업로드한 이미지는 URL을 재사용하고 나머지만 업로드
+        
+        1. image_url_cache (fan-out 중 공유하는 메모리 캐시)
+        2. 업로드 URL 캐시 (.cache/upload_urls.json, 블로그별 이미지 내용 해시 → URL)
+        
+        Args:
+            image_map: {파일명: 경로} 딕셔너리
+        
+        Returns:
+            {파일명: 업로드된 URL} 딕셔너리
+        """
+        shared = self.image_url_cache if self.image_url_cache is not None else {}
+        keys = {name: self._image_cache_key(path) for name, path in image_map.items()}
+        reused = {name: shared[key] for name, key in keys.items() if key in shared}
+        
+        url_cache = UploadCache(self.PLATFORM_NAME, self.blog_name)
+        cached, hashes = url_cache.lookup({n: p for n, p in image_map.items() if n not in reused})
+        reused.update(cached)
+        remaining = {name: path for name, path in image_map.items() if name not in reused}
+        
+        uploaded = self._upload_images(remaining) if remaining else {}
+        url_cache.store(uploaded, hashes)
+        for name, url in {**cached, **uploaded}.items():
+            shared[keys[name]] = url
+        
+        if reused:
+            logger.info(f"♻️ 이미 업로드된 이미지 {len(reused)}개 URL 재사용")
+        return {**reused, **uploaded}
+    
     def _upload_images(self, image_map: dict) -> dict:
-        """이미지 업로드 - 클립보드 붙여넣기 방식 (macOS)
+        """이미지 업로드
+        
+        1. 페이지 내부 fetch로 첨부 엔드포인트에 여러 장을 동시에 업로드
+        2. 실패한 이미지는 합성 붙여넣기 이벤트(OS 클립보드 미사용)로 재시도
+        3. 그래도 실패하면 OS 클립보드 붙여넣기 (헤드리스 모드 제외)
         
-        이미지를 클립보드에 복사한 후 에디터에 Cmd+V로 붙여넣기하여 업로드합니다.
         업로드 후 이미지 URL만 수집하고, 에디터 내용은 비웁니다.
         (본문 입력 시 HTML에 이미지 URL을 포함하여 설정)
         
@@ -780,7 +956,258 @@ class TistoryPublisher(BasePublisher):
         Returns:
             {파일명: 업로드된 URL} 딕셔너리
         """
-        import subprocess
+        # 방향 보정/리사이즈는 publish()에서 _prepare_images로 끝난 상태 (글 폴더 .cache/images/tistory/)
+        prepared = {}
+        for name, path in image_map.items():
+            if not Path(path).exists():
+                logger.warning(f"⚠️ 이미지 파일 없음: {path}")
+                continue
+            prepared[name] = path
+        
+        uploaded = self._upload_images_via_fetch(prepared)
+        
+        remaining = {name: path for name, path in prepared.items() if name not in uploaded}
+        if remaining:
+            if uploaded:
+                logger.info(f"📷 {len(remaining)}개 이미지는 붙여넣기 방식으로 재시도")
+            uploaded.update(self._upload_images_via_synthetic_paste(remaining))
+        
+        # OS 클립보드는 화면이 있는 환경에서만 마지막 수단으로 사용
+        remaining = {name: path for name, path in prepared.items() if name not in uploaded}
+        if remaining:
+            if self.browser_manager.headless:
+                logger.warning(f"⚠️ 헤드리스 모드에서는 클립보드 붙여넣기를 건너뜁니다: {list(remaining)}")
+            else:
+                uploaded.update(self._upload_images_via_clipboard(remaining))
+        
+        # 모든 이미지 업로드 완료 후 에디터 내용 비우기
+        # (본문 입력 시 HTML로 다시 설정할 것이므로)
+        if uploaded:
+            try:
+                self.driver.execute_script("""
+                    if (typeof tinymce !== 'undefined' && tinymce.activeEditor) {
+                        tinymce.activeEditor.setContent('');
+                    }
+                """)
+                logger.debug("에디터 내용 초기화 완료")
+            except:
+                pass
+        
+        return uploaded
+    
+    def _upload_images_via_fetch(self, image_map: dict) -> dict:
+        """페이지 내부 fetch로 첨부 엔드포인트에 이미지 동시 업로드
+        
+        로그인된 글쓰기 페이지의 세션(쿠키)을 그대로 사용해
+        attach.json에 multipart 요청을 보냅니다. 동시 요청 수는
+        TISTORY_UPLOAD_CONCURRENCY 환경변수로 조절합니다 (기본 4).
+        
+        Args:
+            image_map: {파일명: 업로드할 경로} 딕셔너리
+        
+        Returns:
+            {파일명: 업로드된 URL} 딕셔너리 (실패한 이미지는 제외)
+        """
+        import base64
+        import mimetypes
+        
+        uploaded = {}
+        if not image_map:
+            return uploaded
+        
+        files = []
+        for name, path in image_map.items():
+            try:
+                data = Path(path).read_bytes()
+            except OSError as e:
+                logger.warning(f"⚠️ 이미지 읽기 실패 ({name}): {e}")
+                continue
+            files.append({
+                "name": name,
+                "filename": Path(name).name,
+                "type": mimetypes.guess_type(str(path))[0] or "image/jpeg",
+                "data": base64.b64encode(data).decode("ascii"),
+            })
+        
+        attach_url = self.ATTACH_URL.format(blog_name=self.blog_name)
+        concurrency = int(os.getenv("TISTORY_UPLOAD_CONCURRENCY", "4"))
+        
+        logger.info(f"📷 이미지 {len(files)}개 동시 업로드 시도 (동시 {concurrency}개)")
+        start = time.time()
+        
+        try:
+            self.driver.switch_to.default_content()
+            results = self._execute_async_script(self.UPLOAD_TIMEOUT, """
+                var files = arguments[0], url = arguments[1], concurrency = arguments[2];
+                var done = arguments[arguments.length - 1];
+                var results = {}, next = 0;
+                
+                function toBlob(b64, type) {
+                    var bin = atob(b64), bytes = new Uint8Array(bin.length);
+                    for (var i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+                    return new Blob([bytes], {type: type});
+                }
+                
+                function worker() {
+                    if (next >= files.length) return Promise.resolve();
+                    var f = files[next++];
+                    var form = new FormData();
+                    form.append('file', toBlob(f.data, f.type), f.filename);
+                    return fetch(url, {method: 'POST', body: form, credentials: 'include'})
+                        .then(function(r) {
+                            return r.text().then(function(t) { results[f.name] = {status: r.status, body: t}; });
+                        })
+                        .catch(function(e) { results[f.name] = {status: 0, body: String(e)}; })
+                        .then(worker);
+                }
+                
+                var workers = [];
+                for (var i = 0; i < Math.min(concurrency, files.length); i++) workers.push(worker());
+                Promise.all(workers).then(function() { done(results); });
+            """, files, attach_url, concurrency)
+        except Exception as e:
+            logger.warning(f"⚠️ 페이지 내 업로드 실패 (붙여넣기 방식으로 대체): {e}")
+            return uploaded
+        
+        for name, result in (results or {}).items():
+            url = None
+            if 200 <= result.get("status", 0) < 300:
+                url = self._parse_attach_response(result.get("body", ""))
+            if url:
+                uploaded[name] = url
+            else:
+                logger.debug(f"첨부 업로드 실패 ({name}): HTTP {result.get('status')} {result.get('body', '')[:100]}")
+        
+        logger.info(f"✅ 이미지 {len(uploaded)}/{len(files)}개 업로드 완료 ({time.time() - start:.1f}초)")
+        return uploaded
+    
+    @staticmethod
+    def _parse_attach_response(body: str) -> Optional[str]:
+        """첨부 엔드포인트 응답에서 이미지 URL 추출
+        
+        Args:
+            body: 응답 본문 (JSON)
+        
+        Returns:
+            이미지 URL. 찾지 못하면 None
+        """
+        import json
+        import re
+        
+        try:
+            data = json.loads(body)
+        except (TypeError, ValueError):
+            match = re.search(r'https?://[^"\'\s<>]+(?:kakaocdn|daumcdn)[^"\'\s<>]*', body or "")
+            return match.group(0) if match else None
+        
+        # url 계열 키 우선, 없으면 중첩 구조에서 첫 번째 http URL
+        def find_url(value):
+            if isinstance(value, dict):
+                for key in ("url", "fileUrl", "originalUrl", "imageUrl"):
+                    if isinstance(value.get(key), str) and value[key].startswith("http"):
+                        return value[key]
+                for child in value.values():
+                    found = find_url(child)
+                    if found:
+                        return found
+            elif isinstance(value, list):
+                for child in value:
+                    found = find_url(child)
+                    if found:
+                        return found
+            return None
+        
+        return find_url(data)
+    
+    def _upload_images_via_synthetic_paste(self, image_map: dict) -> dict:
+        """이미지 업로드 - 합성 붙여넣기 이벤트 방식 (OS 클립보드 미사용)
+        
+        페이지 안에서 이미지 바이트로 DataTransfer를 만들어 에디터 body에
+        paste 이벤트(처리되지 않으면 drop 이벤트)를 보냅니다.
+        OS 클립보드를 쓰지 않으므로 X 없는 헤드리스 서버나 여러 작업자가 동시에 실행해도 안전합니다.
+        
+        Args:
+            image_map: {파일명: 업로드할 경로} 딕셔너리
+        
+        Returns:
+            {파일명: 업로드된 URL} 딕셔너리
+        """
+        import base64
+        import mimetypes
+        
+        uploaded = {}
+        
+        for name, path in image_map.items():
+            try:
+                logger.info(f"📷 이미지 붙여넣기 시도: {name}")
+                self._close_modal_if_exists()
+                
+                data = base64.b64encode(Path(path).read_bytes()).decode("ascii")
+                mime_type = mimetypes.guess_type(str(path))[0] or "image/jpeg"
+                
+                self._watch_new_image()
+                handled = self.driver.execute_script("""
+                    var b64 = arguments[0], type = arguments[1], filename = arguments[2];
+                    var iframe = document.querySelector('#editor-tistory_ifr, iframe[id*="ifr"]');
+                    var body = iframe.contentDocument.body;
+                    if (typeof tinymce !== 'undefined' && tinymce.activeEditor) {
+                        tinymce.activeEditor.focus();
+                    }
+                    
+                    var bin = atob(b64), bytes = new Uint8Array(bin.length);
+                    for (var i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+                    var file = new File([bytes], filename, {type: type});
+                    
+                    function makeData() {
+                        var data = new DataTransfer();
+                        data.items.add(file);
+                        return data;
+                    }
+                    
+                    var paste = new ClipboardEvent('paste', {clipboardData: makeData(), bubbles: true, cancelable: true});
+                    body.dispatchEvent(paste);
+                    if (paste.defaultPrevented) return 'paste';
+                    
+                    var drop = new DragEvent('drop', {dataTransfer: makeData(), bubbles: true, cancelable: true});
+                    body.dispatchEvent(drop);
+                    if (drop.defaultPrevented) return 'drop';
+                    return null;
+                """, data, mime_type, Path(name).name)
+                
+                if not handled:
+                    logger.debug(f"에디터가 합성 붙여넣기를 처리하지 않음: {name}")
+                    continue
+                
+                start = time.time()
+                result = self._wait_for_new_image(timeout=60)
+                if result.get("url"):
+                    uploaded[name] = result["url"]
+                    logger.info(f"✅ 이미지 업로드 완료 ({handled}, {time.time() - start:.1f}초): {name}")
+                else:
+                    logger.warning(f"⚠️ 이미지 붙여넣기 업로드 실패: {name} - {result}")
+                
+                self._close_modal_if_exists()
+                
+            except Exception as e:
+                try:
+                    self.driver.switch_to.default_content()
+                except:
+                    pass
+                logger.warning(f"⚠️ 합성 붙여넣기 실패 ({name}): {e}")
+        
+        return uploaded
+    
+    def _upload_images_via_clipboard(self, image_map: dict) -> dict:
+        """이미지 업로드 - 클립보드 붙여넣기 방식
+        
+        이미지를 클립보드에 복사한 후 에디터에 Cmd/Ctrl+V로 붙여넣기하여 업로드합니다.
+        
+        Args:
+            image_map: {파일명: 업로드할 경로} 딕셔너리
+        
+        Returns:
+            {파일명: 업로드된 URL} 딕셔너리
+        """
         from selenium.webdriver.common.action_chains import ActionChains
         
         uploaded = {}
@@ -818,78 +1245,18 @@ class TistoryPublisher(BasePublisher):
         
         for name, path in image_map.items():
             try:
-                if not Path(path).exists():
-                    logger.warning(f"⚠️ 이미지 파일 없음: {path}")
-                    continue
-                
                 logger.info(f"📷 이미지 업로드 시도: {name}")
                 
                 # 모달이 있으면 닫기 (이전 업로드에서 남아있을 수 있음)
                 self._close_modal_if_exists()
                 
-                # 0. 이미지 크기 확인 + EXIF 방향 보정 + 필요시 리사이즈
-                image_path = Path(path)
-                temp_image_path = None
-                file_size_mb = image_path.stat().st_size / (1024 * 1024)
-                needs_resize = file_size_mb > 4  # 4MB 이상이면 리사이즈
-                needs_orientation_fix = False
-                
-                try:
-                    from PIL import Image, ImageOps
-                    import tempfile
-
-                    with Image.open(path) as img:
-                        orientation = None
-                        exif = img.getexif()
-                        if exif:
-                            orientation = exif.get(274)
-                            if orientation and orientation != 1:
-                                needs_orientation_fix = True
-                        
-                        img = ImageOps.exif_transpose(img)
-                        
-                        # 최대 크기 제한 (가로 1800px) - 리사이즈 조건일 때만 적용
-                        max_width = 1800
-                        if needs_resize and img.width > max_width:
-                            ratio = max_width / img.width
-                            new_size = (max_width, int(img.height * ratio))
-                            img = img.resize(new_size, Image.LANCZOS)
-                        
-                        if needs_resize or needs_orientation_fix:
-                            temp_fd, temp_path = tempfile.mkstemp(suffix='.jpg')
-                            os.close(temp_fd)
-                            img.convert('RGB').save(temp_path, 'JPEG', quality=85)
-                            temp_image_path = temp_path
-                            path = temp_path
-                            
-                            new_size_mb = Path(temp_path).stat().st_size / (1024 * 1024)
-                            if needs_resize:
-                                logger.debug(f"이미지 리사이즈: {file_size_mb:.1f}MB → {new_size_mb:.1f}MB")
-                            if needs_orientation_fix and not needs_resize:
-                                logger.debug("이미지 EXIF 방향 보정 후 임시 저장")
-                except Exception as e:
-                    logger.warning(f"이미지 전처리 실패(회전/리사이즈): {e}")
-                
                 # 1. 이미지를 클립보드에 복사 (OS별 분기)
                 if not self._copy_image_to_clipboard(path):
-                    # 임시 파일 정리
-                    if temp_image_path and Path(temp_image_path).exists():
-                        try:
-                            os.remove(temp_image_path)
-                        except:
-                            pass
                     continue
                 
-                # 임시 파일 정리
-                if temp_image_path and Path(temp_image_path).exists():
-                    try:
-                        os.remove(temp_image_path)
-                    except:
-                        pass
-                
                 logger.debug(f"클립보드에 이미지 복사 완료: {name}")
                 
-                # 2. 에디터 iframe으로 전환 및 붙여넣기
+                # 2. 새 이미지 감시 시작 후 에디터 iframe에 붙여넣기
                 try:
                     self.driver.switch_to.default_content()
                     
@@ -899,18 +1266,13 @@ class TistoryPublisher(BasePublisher):
                             tinymce.activeEditor.focus();
                         }
                     """)
-                    time.sleep(0.3)
+                    self._watch_new_image()
                     
                     iframe = self.driver.find_element(By.CSS_SELECTOR, "#editor-tistory_ifr, iframe[id*='ifr']")
                     self.driver.switch_to.frame(iframe)
                     
-                    # 3. 붙여넣기 전 이미지 개수 확인
-                    imgs_before = self.driver.find_elements(By.TAG_NAME, "img")
-                    count_before = len(imgs_before)
-                    
-                    # 4. JavaScript로 body에 포커스 및 붙여넣기
+                    # 3. JavaScript로 body에 포커스 및 붙여넣기
                     self.driver.execute_script("document.body.focus();")
-                    time.sleep(0.2)
                     
                     actions = ActionChains(self.driver)
                     paste_key = self._get_paste_key()
@@ -918,75 +1280,23 @@ class TistoryPublisher(BasePublisher):
                     
                     self.driver.switch_to.default_content()
                     
-                    # 5. 이미지 업로드 완료 대기 (iframe 내 이미지 개수 + CDN URL 확인)
-                    max_wait = 60
-                    poll_interval = 1
-                    elapsed = 0
-                    img_url = None
-                    
-                    while elapsed < max_wait:
-                        time.sleep(poll_interval)
-                        elapsed += poll_interval
-                        
-                        try:
-                            # iframe으로 전환하여 이미지 확인
-                            self.driver.switch_to.default_content()
-                            iframe = self.driver.find_element(By.CSS_SELECTOR, "#editor-tistory_ifr, iframe[id*='ifr']")
-                            self.driver.switch_to.frame(iframe)
-                            
-                            imgs_after = self.driver.find_elements(By.TAG_NAME, "img")
-                            
-                            if len(imgs_after) > count_before:
-                                new_img = imgs_after[-1]
-                                src = new_img.get_attribute("src")
-                                
-                                if src and src.startswith("http") and "kakaocdn" in src:
-                                    img_url = src
-                                    logger.info(f"✅ 이미지 업로드 완료 ({elapsed:.1f}초): {name}")
-                                    self.driver.switch_to.default_content()
-                                    break
-                                else:
-                                    logger.debug(f"이미지 처리 중... ({elapsed:.1f}초) - src: {src[:50] if src else 'None'}...")
-                            else:
-                                logger.debug(f"이미지 대기 중... ({elapsed:.1f}초)")
-                            
-                            self.driver.switch_to.default_content()
-                        except Exception as e:
-                            try:
-                                self.driver.switch_to.default_content()
-                            except:
-                                pass
-                            logger.debug(f"확인 중 오류: {e}")
+                    # 4. 이미지 업로드 완료 대기 (MutationObserver로 CDN URL 감지)
+                    start = time.time()
+                    result = self._wait_for_new_image(timeout=60)
+                    elapsed = time.time() - start
                     
-                    if img_url:
-                        uploaded[name] = img_url
+                    if result.get("url"):
+                        uploaded[name] = result["url"]
+                        logger.info(f"✅ 이미지 업로드 완료 ({elapsed:.1f}초): {name}")
+                    elif result.get("error"):
+                        logger.warning(f"⚠️ 이미지 업로드 실패: {name} - {result['error'][:50]}")
+                    elif (result.get("src") or "").startswith("http"):
+                        # 타임아웃이지만 http 주소는 있음
+                        uploaded[name] = result["src"]
+                        logger.info(f"✅ 이미지 업로드 완료 (타임아웃 직전): {name}")
                     else:
-                        # 타임아웃 - 마지막으로 한번 더 확인
-                        try:
-                            self.driver.switch_to.default_content()
-                            iframe = self.driver.find_element(By.CSS_SELECTOR, "#editor-tistory_ifr, iframe[id*='ifr']")
-                            self.driver.switch_to.frame(iframe)
-                            imgs_final = self.driver.find_elements(By.TAG_NAME, "img")
-                            
-                            # 새 이미지가 있는지 확인
-                            if len(imgs_final) > count_before:
-                                new_img = imgs_final[-1]
-                                src = new_img.get_attribute("src")
-                                if src and src.startswith("http"):
-                                    uploaded[name] = src
-                                    logger.info(f"✅ 이미지 업로드 완료 (타임아웃 직전): {name}")
-                                else:
-                                    logger.warning(f"⚠️ 이미지 업로드 타임아웃: {name} - src: {src[:30] if src else 'None'}")
-                            else:
-                                logger.warning(f"⚠️ 이미지 업로드 타임아웃: {name} (이미지 없음)")
-                            
-                            self.driver.switch_to.default_content()
-                        except Exception as e:
-                            try:
-                                self.driver.switch_to.default_content()
-                            except:
-                                pass
-                            logger.warning(f"⚠️ 이미지 업로드 타임아웃: {name}")
+                        src = result.get("src")
+                        logger.warning(f"⚠️ 이미지 업로드 타임아웃: {name} - src: {src[:30] if src else 'None'}")
                     
                     # 모달 닫기 (업로드 완료 후 모달이 있을 수 있음)
                     self._close_modal_if_exists()
@@ -1001,59 +1311,112 @@ class TistoryPublisher(BasePublisher):
             except Exception as e:
                 logger.warning(f"⚠️ 이미지 업로드 실패 ({name}): {e}")
         
-        # 모든 이미지 업로드 완료 후 에디터 내용 비우기
-        # (본문 입력 시 HTML로 다시 설정할 것이므로)
-        if uploaded:
-            try:
-                self.driver.execute_script("""
-                    if (typeof tinymce !== 'undefined' && tinymce.activeEditor) {
-                        tinymce.activeEditor.setContent('');
+        return uploaded
+    
+    def _watch_new_image(self):
+        """에디터 iframe에 새 이미지 감시자(MutationObserver) 설치
+        
+        설치 시점 이후 추가된 <img>의 src가 CDN URL이 되거나,
+        에디터 에러 알림이 뜨면 window.__tistoryImageWait 프로미스가 완료됩니다.
+        """
+        self.driver.execute_script("""
+            var iframe = document.querySelector('#editor-tistory_ifr, iframe[id*="ifr"]');
+            var doc = iframe.contentDocument;
+            var existing = new Set(Array.prototype.slice.call(doc.images));
+            var staleErrors = new Set(Array.prototype.slice.call(document.querySelectorAll('.mce-notification-error')));
+            var state = {src: null};
+            window.__tistoryImageState = state;
+            
+            window.__tistoryImageWait = new Promise(function(resolve) {
+                var observers = [];
+                function finish(result) {
+                    observers.forEach(function(o) { o.disconnect(); });
+                    resolve(result);
+                }
+                function check() {
+                    var imgs = doc.images;
+                    for (var i = 0; i < imgs.length; i++) {
+                        if (existing.has(imgs[i])) continue;
+                        var src = imgs[i].getAttribute('src') || '';
+                        state.src = src;
+                        if (/^https?:/.test(src) && src.indexOf('kakaocdn') >= 0) {
+                            return finish({url: src});
+                        }
                     }
-                """)
-                logger.debug("에디터 내용 초기화 완료")
-            except:
-                pass
+                    var errors = document.querySelectorAll('.mce-notification-error');
+                    for (var j = 0; j < errors.length; j++) {
+                        if (!staleErrors.has(errors[j])) return finish({error: errors[j].innerText || 'upload error'});
+                    }
+                }
+                
+                var inFrame = new MutationObserver(check);
+                inFrame.observe(doc.body, {childList: true, subtree: true, attributes: true, attributeFilter: ['src']});
+                var inPage = new MutationObserver(check);
+                inPage.observe(document.body, {childList: true, subtree: true});
+                observers.push(inFrame, inPage);
+            });
+        """)
+    
+    def _wait_for_new_image(self, timeout: float = 60) -> dict:
+        """_watch_new_image 설치 후 새 이미지 업로드 완료를 한 번의 호출로 대기
         
-        return uploaded
+        Args:
+            timeout: 최대 대기 시간 (초)
+        
+        Returns:
+            {"url": CDN URL} / {"error": 메시지} / {"timeout": True, "src": 마지막 src}
+        """
+        result = self._execute_async_script(timeout + 10, """
+            var timeout = arguments[0], done = arguments[arguments.length - 1];
+            if (!window.__tistoryImageWait) return done({error: 'watcher not installed'});
+            var timer = setTimeout(function() {
+                done({timeout: true, src: window.__tistoryImageState.src});
+            }, timeout * 1000);
+            window.__tistoryImageWait.then(function(result) {
+                clearTimeout(timer);
+                done(result);
+            });
+        """, timeout)
+        return result or {}
+    
+    def _category_cache_key(self) -> str:
+        """카테고리 캐시 키 (블로그별)"""
+        return f"{self.PLATFORM_NAME}:{self.blog_name}"
+    
+    def _session_key(self) -> str:
+        """세션 캐시 키 (카카오 계정별)"""
+        return f"{self.PLATFORM_NAME}:{self.tistory_id}"
     
     def _select_category(self, category: str):
-        """카테고리 선택"""
+        """카테고리 선택
+        
+        드롭다운을 연 뒤 항목 검색과 클릭을 한 번의 스크립트로 처리합니다.
+        캐시된 위치가 맞으면 바로 클릭하고, 틀리면 전체 목록을 읽어 캐시를 갱신합니다.
+        """
         try:
             # 카테고리 버튼 클릭하여 드롭다운 열기
             category_btn = WebDriverWait(self.driver, 10).until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, "#category-btn"))
             )
             category_btn.click()
-            time.sleep(0.5)
             
-            # 카테고리 목록에서 해당 카테고리 찾기
-            category_list = WebDriverWait(self.driver, 5).until(
+            # 카테고리 목록 표시 대기
+            WebDriverWait(self.driver, 5).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "#category-list"))
             )
             
-            # 카테고리 항목들 찾기 (div.mce-menu-item)
-            items = category_list.find_elements(By.CSS_SELECTOR, "div.mce-menu-item")
+            cached = self.get_cached_categories().get(category)
+            result = self.driver.execute_script(self.SELECT_CATEGORY_SCRIPT, category, cached)
             
-            logger.info(f"🔍 찾는 카테고리: '{category}', 총 {len(items)}개 항목")
+            if result.get("map"):
+                logger.debug(f"카테고리 목록 스캔: 총 {result.get('total')}개 항목")
+                self.save_categories(result["map"])
             
-            for item in items:
-                # 카테고리 이름 확인 (span.mce-text 안에 있음)
-                try:
-                    txt_span = item.find_element(By.CSS_SELECTOR, "span.mce-text")
-                    item_text = txt_span.text.strip()
-                    
-                    # 정확히 일치하거나, "- 맛집" 형태에서 맛집만 비교
-                    clean_text = item_text.lstrip('- ').strip()
-                    if item_text == category or clean_text == category:
-                        # 스크롤하여 해당 항목이 보이도록
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", item)
-                        time.sleep(0.2)
-                        item.click()
-                        logger.info(f"📁 카테고리 선택: {category} ('{item_text}')")
-                        time.sleep(0.5)
-                        return
-                except Exception as e:
-                    continue
+            if result.get("clicked"):
+                source = "캐시" if result.get("cached") else "검색"
+                logger.info(f"📁 카테고리 선택: {category} ('{result['clicked']}', {source})")
+                time.sleep(0.3)
+                return
             
             logger.warning(f"⚠️ 카테고리를 찾을 수 없음: {category}")
             # 드롭다운 닫기
@@ -1068,10 +1431,8 @@ class TistoryPublisher(BasePublisher):
             # 태그 입력 영역 찾기
             tag_input = self.driver.find_element(By.CSS_SELECTOR, "#tagText")
             
-            for tag in tags[:10]:  # 최대 10개
-                tag_input.send_keys(tag)
-                tag_input.send_keys(",")  # 쉼표로 구분
-                time.sleep(0.2)
+            # 쉼표로 구분해 한 번에 입력 (최대 10개)
+            tag_input.send_keys("".join(f"{tag}," for tag in tags[:10]))
             
             logger.info(f"🏷️ 태그 추가: {', '.join(tags[:10])}")
         except Exception as e:
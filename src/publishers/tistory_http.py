@@ -0,0 +1,232 @@
+"""
+티스토리 HTTP 발행자
+브라우저 로그인에서 넘겨받은 세션(쿠키)으로 첨부 업로드와 글 저장을 HTTP 요청만으로 처리
+"""
+import mimetypes
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Union
+import requests
+from loguru import logger
+
+from .base import PublishResult
+from .http_base import HttpSessionMixin, SessionRejected
+from .tistory import TistoryPublisher
+
+
+class TistoryHttpPublisher(HttpSessionMixin, TistoryPublisher):
+    """티스토리 발행자 (브라우저 없이 HTTP)
+
+    TistoryPublisher 로그인 시 저장된 쿠키(.cache/sessions.json) 또는 직접 넘겨준 쿠키로
+    attach.json 업로드와 post.json 저장을 요청합니다. 마크다운 변환/이미지 전처리/응답 해석은
+    TistoryPublisher와 공유하며, 세션이 거부되면 브라우저 발행(TistoryPublisher)으로 대체합니다.
+    """
+
+    BLOG_URL = "https://{blog_name}.tistory.com"  # 블로그 주소 (base_url로 변경 가능)
+    MANAGE_PATH = "/manage"
+    ATTACH_PATH = "/manage/post/attach.json"
+    SAVE_PATH = "/manage/post.json"
+
+    # 공개 설정 → post.json visibility 값
+    VISIBILITY = {"public": 20, "protected": 15, "private": 0}
+
+    def __init__(
+        self,
+        cookies: Union[list, dict, None] = None,
+        base_url: str = None,
+        visibility: str = None,
+        fallback: bool = True,
+        **kwargs,
+    ):
+        """
+        Args:
+            cookies: 세션 쿠키 (Selenium get_cookies() 목록 또는 {이름: 값}). None이면 저장된 세션
+            base_url: 블로그 주소 (테스트용 대체 서버). None이면 TISTORY_BASE_URL 또는 https://{블로그}.tistory.com
+            visibility: 공개 설정 ("public", "protected", "private"). None이면 TISTORY_VISIBILITY (기본 public)
+            fallback: 세션이 거부되면 브라우저 발행으로 대체할지 여부
+            **kwargs: TistoryPublisher 인자 (headless, lean, account, blog_name, image_url_cache)
+        """
+        super().__init__(**kwargs)
+        self.base_url = (base_url or os.getenv("TISTORY_BASE_URL") or self.BLOG_URL).rstrip("/")
+        self.visibility = (visibility or os.getenv("TISTORY_VISIBILITY", "public")).lower()
+        self.fallback = fallback
+        self._init_http(cookies, pool_size=int(os.getenv("TISTORY_UPLOAD_CONCURRENCY", "4")))
+
+    def _url(self, path: str) -> str:
+        return self.base_url.format(blog_name=self.blog_name) + path
+
+    def login(self) -> bool:
+        """저장된 세션으로 블로그 관리 페이지 접근 확인 (브라우저 사용 안 함)
+
+        Returns:
+            세션 유효 여부
+        """
+        if not self._load_cookies(self._url(""), "tistory.com"):
+            logger.warning("⚠️ 저장된 티스토리 세션 없음 (브라우저 로그인 필요)")
+            return False
+
+        try:
+            response = self.session.get(self._url(self.MANAGE_PATH), timeout=self.REQUEST_TIMEOUT)
+        except requests.RequestException as e:
+            logger.error(f"❌ 티스토리 세션 확인 실패: {e}")
+            return False
+
+        if response.status_code >= 400 or "auth/login" in response.url:
+            logger.warning(f"⚠️ 티스토리 세션 거부 (HTTP {response.status_code})")
+            return False
+
+        self.is_logged_in = True
+        logger.success("✅ 티스토리 세션 확인 (HTTP)")
+        return True
+
+    def publish(
+        self,
+        title: str,
+        content: str,
+        category: Optional[str] = None,
+        tags: Optional[list] = None,
+        images: Optional[list] = None
+    ) -> PublishResult:
+        """티스토리에 글 발행 (HTTP)
+
+        Returns:
+            발행 결과 (성공 여부, 글 주소)
+        """
+        self.last_result = None
+        try:
+            if not self.is_logged_in and not self.login():
+                raise SessionRejected("세션 없음 또는 만료")
+
+            start = time.time()
+            image_map = {Path(p).name.lower(): str(p) for p in (self._prepare_images(images) or [])}
+            uploaded_images = self._upload_images_reusing(image_map) if image_map else {}
+
+            html = self._markdown_to_tinymce_html(content, uploaded_images)
+            response = self._save_post(title, html, category, tags)
+
+            success, url, post_id, error = self._parse_publish_response(response)
+            if not success:
+                logger.error(f"❌ 티스토리 발행 실패: {error}")
+                return self._result(False, error=error)
+
+            logger.success(f"✅ 티스토리 발행 완료 (HTTP, {time.time() - start:.1f}초): {title} ({url})")
+            return self._result(True, url=url, post_id=post_id)
+
+        except SessionRejected as e:
+            self.is_logged_in = False
+            if not self.fallback:
+                return self._result(False, error=f"세션 거부: {e}")
+            logger.warning(f"⚠️ 티스토리 세션 거부 ({e}) - 브라우저 발행으로 대체")
+            return self._publish_with_browser(title, content, category, tags, images)
+        except Exception as e:
+            logger.error(f"❌ 티스토리 발행 실패: {e}")
+            return self._result(False, error=str(e))
+
+    def _upload_images(self, image_map: dict) -> dict:
+        """첨부 엔드포인트에 이미지 동시 업로드 (연결 풀 공유)
+
+        Args:
+            image_map: {파일명: 경로} 딕셔너리
+
+        Returns:
+            {파일명: 업로드된 URL} 딕셔너리
+        """
+        attach_url = self._url(self.ATTACH_PATH)
+        start = time.time()
+
+        def upload(name: str, path: str):
+            if not Path(path).exists():
+                logger.warning(f"⚠️ 이미지 파일 없음: {path}")
+                return name, None
+            with open(path, "rb") as f:
+                response = self.session.post(
+                    attach_url,
+                    files={"file": (Path(name).name, f, mimetypes.guess_type(path)[0] or "image/jpeg")},
+                    timeout=self.UPLOAD_TIMEOUT,
+                )
+            self._check_session(response, "auth/login")
+            if not response.ok:
+                logger.debug(f"첨부 업로드 실패 ({name}): HTTP {response.status_code}")
+                return name, None
+            return name, self._parse_attach_response(response.text)
+
+        concurrency = int(os.getenv("TISTORY_UPLOAD_CONCURRENCY", "4"))
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(image_map)))) as executor:
+            results = list(executor.map(lambda item: upload(*item), image_map.items()))
+
+        uploaded = {name: url for name, url in results if url}
+        logger.info(f"✅ 이미지 {len(uploaded)}/{len(image_map)}개 업로드 완료 ({time.time() - start:.1f}초)")
+        return uploaded
+
+    def _category_id(self, category: Optional[str]) -> int:
+        """카테고리 이름 → id (브라우저 발행 때 저장된 카테고리 맵 사용, 없으면 0 = 미분류)"""
+        if not category:
+            return 0
+        entry = self.get_cached_categories().get(category) or {}
+        try:
+            return int(entry.get("value") or 0)
+        except (TypeError, ValueError):
+            return 0
+
+    def _save_post(self, title: str, html: str, category: Optional[str], tags: Optional[list]) -> dict:
+        """post.json에 글 저장 요청
+
+        Returns:
+            {"status", "body"} (_parse_publish_response 입력 형식)
+        """
+        category_id = self._category_id(category)
+        if category and not category_id:
+            logger.warning(f"⚠️ 카테고리 id를 알 수 없음 (미분류로 발행): {category}")
+
+        payload = {
+            "id": "0",
+            "title": ''.join(c for c in title if ord(c) <= 0xFFFF),
+            "content": html,
+            "visibility": self.VISIBILITY.get(self.visibility, 20),
+            "category": category_id,
+            "tag": ",".join((tags or [])[:10]),
+            "published": 1,
+            "password": "",
+            "uselessMarginForEntry": 1,
+            "daumLike": "401",
+            "cclCommercial": 0,
+            "cclDerive": 0,
+            "type": "post",
+            "attachments": [],
+            "recaptchaValue": "",
+            "draftSequence": None,
+        }
+        response = self.session.post(
+            self._url(self.SAVE_PATH),
+            json=payload,
+            headers={"Referer": self._url("/manage/newpost")},
+            timeout=self.REQUEST_TIMEOUT,
+        )
+        self._check_session(response, "auth/login")
+        return {"status": response.status_code, "body": response.text}
+
+    def _publish_with_browser(self, title, content, category, tags, images) -> PublishResult:
+        """브라우저 발행으로 대체 (로그인 성공 시 새 세션이 저장되어 다음 HTTP 발행에 사용)"""
+        publisher = TistoryPublisher(
+            headless=self.browser_manager.headless,
+            lean=self.browser_manager.lean,
+            account={"id": self.tistory_id, "password": self.tistory_password},
+            blog_name=self.blog_name,
+            image_url_cache=self.image_url_cache,
+        )
+        publisher.save_sessions = True  # HTTP 발행을 쓰므로 새 세션 저장
+        try:
+            result = publisher.publish(title=title, content=content, category=category, tags=tags, images=images)
+        finally:
+            publisher.logout()
+        self.last_result = result
+        self._cookies = None  # 다음 발행은 새로 저장된 세션 사용
+        return result
+
+    def logout(self):
+        """HTTP 세션 정리 (브라우저 없음)"""
+        self.session.close()
+        self.is_logged_in = False
+        logger.info("👋 티스토리 HTTP 세션 종료")
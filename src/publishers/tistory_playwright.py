@@ -0,0 +1,216 @@
+"""
+티스토리 자동화 (Playwright)
+asyncio + Playwright로 티스토리에 글 발행 (BROWSER_BACKEND=playwright)
+"""
+import asyncio
+import mimetypes
+import os
+import re
+import time
+from pathlib import Path
+from typing import Optional
+from loguru import logger
+
+from .base import PublishResult
+from .playwright_base import PlaywrightPublisherMixin
+from .tistory import TistoryPublisher
+from ..media.upload_cache import UploadCache
+from ..utils.playwright_browser import PlaywrightBrowser
+
+
+class TistoryPlaywrightPublisher(PlaywrightPublisherMixin, TistoryPublisher):
+    """티스토리 발행자 (Playwright async)
+
+    계정 설정, 마크다운 → TinyMCE HTML 변환, 이미지 전처리, 응답 해석은 TistoryPublisher와 공유합니다.
+    고정 대기 대신 Playwright의 자동 대기(locator, wait_for_function, expect_response)를 사용합니다.
+    """
+
+    LOGIN_TIMEOUT = 90  # 2차 인증 포함 로그인 완료 대기 (초)
+
+    def __init__(self, browser: PlaywrightBrowser):
+        """
+        Args:
+            browser: 공유 PlaywrightBrowser
+        """
+        TistoryPublisher.__init__(self, headless=browser.headless, lean=browser.lean)
+        self._init_playwright(browser)
+
+    async def login(self) -> bool:
+        """티스토리 로그인 (카카오 계정)
+
+        Returns:
+            로그인 성공 여부
+        """
+        page = await self._new_page()
+        try:
+            logger.info("🔐 티스토리 로그인 시도 중... (Playwright)")
+            await page.goto(self.LOGIN_URL)
+            await page.click(".btn_login.link_kakao_id")
+
+            await page.fill("input[name='loginId']", self.tistory_id)
+            await page.fill("input[name='password']", self.tistory_password)
+            await page.click("button[type='submit']")
+
+            # 2차 인증/계정 선택("계속하기")을 거쳐 티스토리로 돌아올 때까지 대기
+            deadline = time.time() + self.LOGIN_TIMEOUT
+            while time.time() < deadline:
+                url = page.url
+                if "tistory.com" in url and "kakao" not in url:
+                    break
+                continue_btn = page.locator("button:has-text('계속하기'), button.btn_confirm")
+                if await continue_btn.count() and await continue_btn.first.is_visible():
+                    await continue_btn.first.click()
+                await page.wait_for_timeout(500)
+
+            # 블로그 관리 페이지로 세션 확인
+            await page.goto(f"https://{self.blog_name}.tistory.com/manage")
+            if "auth/login" in page.url:
+                logger.error("❌ 로그인 실패 (블로그 관리 페이지 접근 불가)")
+                return False
+
+            self.is_logged_in = True
+            logger.success("✅ 티스토리 로그인 성공")
+            return True
+        except Exception as e:
+            logger.error(f"❌ 티스토리 로그인 실패: {e}")
+            await self._save_error_screenshot(page)
+            return False
+        finally:
+            await page.close()
+
+    async def publish(
+        self,
+        title: str,
+        content: str,
+        category: Optional[str] = None,
+        tags: Optional[list] = None,
+        images: Optional[list] = None
+    ) -> PublishResult:
+        """티스토리에 글 발행
+
+        Returns:
+            발행 결과 (성공 여부, 글 주소)
+        """
+        if not self.is_logged_in and not await self.login():
+            return self._result(False, error="로그인 실패")
+
+        async with self._page_slots:
+            page = await self._new_page()
+            try:
+                write_url = self.BLOG_WRITE_URL.format(blog_name=self.blog_name)
+                logger.info(f"📝 글쓰기 페이지로 이동: {write_url}")
+                await page.goto(write_url)
+
+                # 제목 입력 (요소가 나타날 때까지 자동 대기)
+                clean_title = ''.join(c for c in title if ord(c) <= 0xFFFF)
+                await page.fill("#post-title-inp", clean_title)
+
+                # 이미지 업로드 (컨텍스트 쿠키를 공유하는 HTTP 요청으로 동시 업로드)
+                images = await asyncio.to_thread(self._prepare_images, images)
+                image_map = {Path(p).name.lower(): str(p) for p in (images or [])}
+                uploaded_images = await self._upload_images_async(page, image_map) if image_map else {}
+
+                # 본문 입력 - TinyMCE 준비 후 HTML 설정
+                await page.wait_for_function(
+                    "() => (window.tinymce && tinymce.activeEditor) || document.querySelector('#editor-tistory')"
+                )
+                html = self._markdown_to_tinymce_html(content, uploaded_images)
+                await self.run_script(page, self.SET_CONTENT_SCRIPT, html)
+                logger.info("✅ 본문 입력 완료")
+
+                if category:
+                    await self._select_category_async(page, category)
+
+                if tags:
+                    await page.locator("#tagText").press_sequentially("".join(f"{tag}," for tag in tags[:10]))
+                    logger.info(f"🏷️ 태그 추가: {', '.join(tags[:10])}")
+
+                # 발행 - 발행 API 응답으로 결과 확인
+                await page.click("#publish-layer-btn")
+                async with page.expect_response(
+                    lambda r: re.search(self.PUBLISH_API_PATTERN, r.url) and r.request.method != "GET",
+                    timeout=self.PUBLISH_TIMEOUT * 1000,
+                ) as response_info:
+                    await page.click("#publish-btn")
+                response = await response_info.value
+
+                success, url, post_id, error = self._parse_publish_response(
+                    {"status": response.status, "body": await response.text()}
+                )
+                if not success:
+                    logger.error(f"❌ 티스토리 발행 실패: {error}")
+                    return self._result(False, error=error)
+
+                logger.success(f"✅ 티스토리 발행 완료: {title}" + (f" ({url})" if url else ""))
+                return self._result(True, url=url, post_id=post_id)
+
+            except Exception as e:
+                logger.error(f"❌ 티스토리 발행 실패: {e}")
+                await self._save_error_screenshot(page)
+                return self._result(False, error=str(e))
+            finally:
+                await page.close()
+
+    async def _upload_images_async(self, page, image_map: dict) -> dict:
+        """첨부 엔드포인트에 이미지 동시 업로드 (업로드 URL 캐시에 있는 이미지는 재사용)
+
+        Args:
+            page: 글쓰기 페이지 (같은 컨텍스트의 쿠키 사용)
+            image_map: {파일명: 경로} 딕셔너리
+
+        Returns:
+            {파일명: 업로드된 URL} 딕셔너리
+        """
+        url_cache = UploadCache(self.PLATFORM_NAME, self.blog_name)
+        reused, hashes = await asyncio.to_thread(url_cache.lookup, image_map)
+        if reused:
+            logger.info(f"♻️ 이미 업로드된 이미지 {len(reused)}개 URL 재사용")
+        image_map = {name: path for name, path in image_map.items() if name not in reused}
+        if not image_map:
+            return reused
+
+        attach_url = self.ATTACH_URL.format(blog_name=self.blog_name)
+        limit = asyncio.Semaphore(int(os.getenv("TISTORY_UPLOAD_CONCURRENCY", "4")))
+        start = time.time()
+
+        async def upload(name: str, path: str):
+            if not Path(path).exists():
+                logger.warning(f"⚠️ 이미지 파일 없음: {path}")
+                return name, None
+            async with limit:
+                response = await page.request.post(attach_url, multipart={
+                    "file": {
+                        "name": Path(name).name,
+                        "mimeType": mimetypes.guess_type(path)[0] or "image/jpeg",
+                        "buffer": Path(path).read_bytes(),
+                    }
+                }, timeout=self.UPLOAD_TIMEOUT * 1000)
+            if not response.ok:
+                logger.debug(f"첨부 업로드 실패 ({name}): HTTP {response.status}")
+                return name, None
+            return name, self._parse_attach_response(await response.text())
+
+        results = await asyncio.gather(*(upload(n, p) for n, p in image_map.items()))
+        uploaded = {name: url for name, url in results if url}
+        logger.info(f"✅ 이미지 {len(uploaded)}/{len(image_map)}개 업로드 완료 ({time.time() - start:.1f}초)")
+        await asyncio.to_thread(url_cache.store, uploaded, hashes)
+        return {**reused, **uploaded}
+
+    async def _select_category_async(self, page, category: str):
+        """카테고리 선택 (TistoryPublisher와 같은 스크립트 + 캐시)"""
+        try:
+            await page.click("#category-btn")
+            await page.wait_for_selector("#category-list")
+
+            cached = self.get_cached_categories().get(category)
+            result = await self.run_script(page, self.SELECT_CATEGORY_SCRIPT, category, cached)
+
+            if result.get("map"):
+                self.save_categories(result["map"])
+            if result.get("clicked"):
+                logger.info(f"📁 카테고리 선택: {category} ('{result['clicked']}')")
+                return
+            logger.warning(f"⚠️ 카테고리를 찾을 수 없음: {category}")
+            await page.click("#category-btn")
+        except Exception as e:
+            logger.warning(f"⚠️ 카테고리 선택 실패: {e}")
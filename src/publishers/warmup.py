@@ -0,0 +1,202 @@
+"""
+발행자 미리 준비
+AI 초안 생성/리라이팅 중에 백그라운드에서 브라우저 실행과 로그인을 끝내 둠
+"""
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Callable, Dict, List, Optional
+from loguru import logger
+
+
+class PublisherWarmer:
+    """플랫폼별 발행자를 백그라운드 스레드에서 생성하고 로그인
+
+    사용 예:
+        warmer = PublisherWarmer(["naver", "tistory"], headless=True).start()
+        ...  # AI 초안 생성, 리라이팅
+        publisher = warmer.get("naver")  # 로그인이 끝날 때까지 대기 (실패 시 None)
+        publisher.publish(...)
+        warmer.close()  # 모든 발행자 로그아웃
+
+    같은 발행자를 여러 글 발행에 재사용하므로 로그인은 플랫폼마다 한 번입니다.
+    백그라운드 로그인은 터미널 입력(캡차/2차 인증)을 기다리지 않고, 실패하면
+    get()에서 메인 스레드로 다시 로그인합니다.
+    """
+
+    CLOSE_TIMEOUT = 10  # close()에서 아직 준비 중인 발행자를 기다리는 최대 시간 (초)
+
+    def __init__(
+        self,
+        platforms: List[str],
+        headless: bool = None,
+        lean: bool = None,
+        factory: Optional[Callable] = None,
+    ):
+        """
+        Args:
+            platforms: 준비할 플랫폼 목록
+            headless: 헤드리스 모드 여부
+            lean: 경량 모드 여부
+            factory: (플랫폼, headless, lean) → 발행자. 기본은 create_publisher
+        """
+        self.platforms = list(dict.fromkeys(platforms))
+        self.headless = headless
+        self.lean = lean
+        self.factory = factory or self._default_factory
+        self._executor = None
+        self._futures: Dict[str, Future] = {}
+        self._publishers = {}       # {플랫폼: 로그인된 발행자}
+        self._warm_seconds = {}     # {플랫폼: 생성+로그인 소요 시간}
+        self._wait_seconds = {}     # {플랫폼: get()에서 실제로 기다린 시간}
+        self._warming = {}          # {플랫폼: 로그인 중인 발행자} - close()가 시간 초과 시 종료
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @staticmethod
+    def _default_factory(platform: str, headless: bool, lean: bool):
+        from . import create_publisher
+        return create_publisher(platform, headless=headless, lean=lean)
+
+    def _warm(self, platform: str):
+        """발행자 생성 + 로그인 (워커 스레드)"""
+        start = time.perf_counter()
+        publisher = None
+        ok = False
+        try:
+            publisher = self.factory(platform, self.headless, self.lean)
+            # 메인 스레드의 입력(발행 확인 등)과 겹치지 않도록 터미널 입력을 기다리지 않음
+            publisher.interactive = False
+            with self._lock:
+                self._warming[platform] = publisher
+            ok = not self._closed and publisher.login()
+        except Exception as e:
+            logger.error(f"❌ {platform} 사전 로그인 오류: {e}")
+        finally:
+            self._warm_seconds[platform] = time.perf_counter() - start
+
+        with self._lock:
+            # close()가 기다리다 이미 종료한 발행자는 건드리지 않음
+            owned = self._warming.pop(platform, None) is publisher
+        if not owned:
+            return None
+        if not ok:
+            self._logout(platform, publisher)
+            return None
+        return publisher
+
+    def _login_interactively(self, platform: str):
+        """사전 로그인에 실패한 플랫폼을 메인 스레드에서 다시 로그인 (캡차/2차 인증 입력 가능)"""
+        logger.info(f"🔐 {platform} 사전 로그인 실패 - 다시 로그인합니다")
+        publisher = None
+        try:
+            publisher = self.factory(platform, self.headless, self.lean)
+            if publisher.login():
+                return publisher
+        except Exception as e:
+            logger.error(f"❌ {platform} 로그인 오류: {e}")
+        self._logout(platform, publisher)
+        return None
+
+    @staticmethod
+    def _logout(platform: str, publisher):
+        if publisher is None:
+            return
+        try:
+            publisher.logout()
+        except Exception as e:
+            logger.debug(f"{platform} 발행자 종료 실패: {e}")
+
+    def start(self) -> "PublisherWarmer":
+        """모든 플랫폼의 브라우저 실행/로그인을 백그라운드에서 시작"""
+        if self._executor is None and self.platforms:
+            self._executor = ThreadPoolExecutor(
+                max_workers=len(self.platforms), thread_name_prefix="publisher-warmup"
+            )
+            for platform in self.platforms:
+                self._futures[platform] = self._executor.submit(self._warm, platform)
+            logger.info(f"🔥 발행자 미리 준비 시작: {', '.join(self.platforms)}")
+        return self
+
+    def get(self, platform: str, timeout: float = None):
+        """로그인된 발행자 (준비가 끝날 때까지 대기)
+
+        Args:
+            platform: 플랫폼 이름
+            timeout: 최대 대기 시간 (초). None이면 무제한
+
+        Returns:
+            발행자. 다시 로그인해도 실패했거나 준비 대상이 아니면 None
+        """
+        if platform in self._publishers:
+            return self._publishers[platform]
+        if platform not in self._futures:
+            return None
+
+        start = time.perf_counter()
+        publisher = self._futures[platform].result(timeout=timeout)
+        self._wait_seconds.setdefault(platform, time.perf_counter() - start)
+
+        if publisher is None:
+            # 추가 인증이 필요했을 수 있으므로 여기서 한 번만 다시 로그인 (다음 get()은 재시도 안 함)
+            self._futures.pop(platform)
+            publisher = self._login_interactively(platform)
+            if publisher is None:
+                return None
+        self._publishers[platform] = publisher
+        return publisher
+
+    def hidden_seconds(self) -> dict:
+        """플랫폼별로 AI 처리 시간에 가려진 준비 시간 (초)"""
+        return {
+            platform: max(0.0, self._warm_seconds[platform] - waited)
+            for platform, waited in self._wait_seconds.items()
+            if platform in self._warm_seconds
+        }
+
+    def log_report(self):
+        """준비 시간 중 숨겨진 시간/기다린 시간 로그 출력"""
+        hidden = self.hidden_seconds()
+        for platform, seconds in hidden.items():
+            logger.info(
+                f"🔥 {platform} 준비 {self._warm_seconds[platform]:.1f}초 중 "
+                f"{seconds:.1f}초 숨김 (대기 {self._wait_seconds[platform]:.1f}초)"
+            )
+        if hidden:
+            logger.info(f"⏱️ 사전 준비로 절약한 시간: {sum(hidden.values()):.1f}초")
+
+    def close(self, timeout: float = None):
+        """모든 발행자 로그아웃
+
+        아직 준비 중인 발행자는 최대 timeout초(기본 CLOSE_TIMEOUT) 기다리고,
+        그래도 끝나지 않으면 로그인을 기다리지 않고 브라우저를 종료합니다.
+        """
+        timeout = self.CLOSE_TIMEOUT if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            self._closed = True
+        for platform, publisher in self._publishers.items():
+            self._logout(platform, publisher)
+        for platform, future in self._futures.items():
+            if platform in self._publishers or future.cancel():
+                continue
+            try:
+                publisher = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeout:
+                with self._lock:
+                    publisher = self._warming.pop(platform, None)
+                logger.warning(f"⏱️ {platform} 사전 로그인이 끝나지 않아 브라우저를 종료합니다")
+            except Exception:
+                publisher = None
+            self._logout(platform, publisher)
+        self._futures = {}
+        self._publishers = {}
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -1,2 +1,362 @@
-# 워드프레스 자동화
-# TODO: Selenium/Playwright로 워드프레스 조작 (또는 REST API 활용)
+"""
+워드프레스 발행자
+WordPress REST API(응용 프로그램 비밀번호 인증)로 미디어 업로드와 글 작성을 HTTP 요청만으로 처리
+"""
+import html
+import mimetypes
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+import requests
+from loguru import logger
+
+from .base import BasePublisher, PublishResult
+from .http_base import HttpSessionMixin, SessionRejected
+from ..editor.validator import resolve_image_marker
+from ..utils.cache import JsonCache
+
+
+class WordPressPublisher(HttpSessionMixin, BasePublisher):
+    """워드프레스 발행자 (브라우저 없이 REST API)
+
+    연결을 유지하는 requests 세션 하나로
+    사용자 확인(/users/me) → 미디어 동시 업로드(/media) + 카테고리/태그 조회 → 글 작성(/posts) 순서로 요청합니다.
+    카테고리/태그 id는 사이트별로 .cache/wordpress_terms.json에 저장해 다음 발행부터 조회 없이 사용합니다.
+    """
+
+    PLATFORM_NAME = "wordpress"
+
+    API_PATH = "/wp-json/wp/v2"
+    USER_PATH = "/users/me"
+    MEDIA_PATH = "/media"
+    POSTS_PATH = "/posts"
+    TERM_PATHS = {"categories": "/categories", "tags": "/tags"}
+
+    UPLOAD_TIMEOUT = 120  # 미디어 한 건 업로드 최대 대기 (초)
+
+    # 사이트별 카테고리/태그 id 캐시 파일 이름 ({사이트 주소: {"categories": {이름: id}, "tags": {이름: id}}})
+    TERM_CACHE_NAME = "wordpress_terms"
+
+    STATUSES = ("publish", "draft", "private", "pending")
+
+    def __init__(
+        self,
+        site_url: str = None,
+        account: dict = None,
+        status: str = None,
+        headless: bool = None,
+        lean: bool = None,
+    ):
+        """
+        Args:
+            site_url: 사이트 주소 (예: https://example.com). None이면 WORDPRESS_URL
+            account: {"id": 사용자명, "password": 응용 프로그램 비밀번호}. None이면 환경변수
+            status: 글 상태 ("publish", "draft", "private", "pending"). None이면 WORDPRESS_STATUS (기본 publish)
+            headless, lean: 다른 발행자와 같은 방식으로 생성할 수 있도록 받기만 함 (브라우저 사용 안 함)
+        """
+        super().__init__()
+        self.site_url = (site_url or os.getenv("WORDPRESS_URL") or "").rstrip("/")
+        if account:
+            self.username = account.get("id")
+            self.app_password = account.get("password")
+        else:
+            self.username = os.getenv("WORDPRESS_USERNAME")
+            # 응용 프로그램 비밀번호 (사용자 > 프로필에서 발급, 공백 포함 그대로 사용 가능)
+            self.app_password = os.getenv("WORDPRESS_APP_PASSWORD") or os.getenv("WORDPRESS_PASSWORD")
+
+        if not self.site_url or not self.username or not self.app_password:
+            raise ValueError("WORDPRESS_URL, WORDPRESS_USERNAME 또는 WORDPRESS_APP_PASSWORD가 설정되지 않았습니다.")
+
+        self.status = (status or os.getenv("WORDPRESS_STATUS", "publish")).lower()
+        if self.status not in self.STATUSES:
+            raise ValueError(f"지원하지 않는 글 상태: {self.status} (가능한 값: {', '.join(self.STATUSES)})")
+
+        self.concurrency = max(1, int(os.getenv("WORDPRESS_UPLOAD_CONCURRENCY", "4")))
+        self._init_http(None, pool_size=self.concurrency)
+        self.session.auth = (self.username, self.app_password)
+        self.session.headers.update({"Accept": "application/json"})
+
+    def _url(self, path: str) -> str:
+        return self.site_url + self.API_PATH + path
+
+    def login(self) -> bool:
+        """응용 프로그램 비밀번호로 사용자 확인
+
+        Returns:
+            인증 성공 여부
+        """
+        try:
+            response = self.session.get(
+                self._url(self.USER_PATH), params={"context": "edit"}, timeout=self.REQUEST_TIMEOUT
+            )
+            self._check_session(response, "wp-login.php")
+            response.raise_for_status()
+            user = response.json()
+        except SessionRejected as e:
+            logger.error(f"❌ 워드프레스 인증 실패 ({e}) - 사용자명/응용 프로그램 비밀번호를 확인하세요")
+            return False
+        except (requests.RequestException, ValueError) as e:
+            logger.error(f"❌ 워드프레스 연결 실패: {e}")
+            return False
+
+        self.is_logged_in = True
+        logger.success(f"✅ 워드프레스 인증 완료: {user.get('name') or self.username} ({self.site_url})")
+        return True
+
+    def publish(
+        self,
+        title: str,
+        content: str,
+        category: Optional[str] = None,
+        tags: Optional[list] = None,
+        images: Optional[list] = None
+    ) -> PublishResult:
+        """워드프레스에 글 발행
+
+        본문에 쓰인 이미지 업로드와 카테고리/태그 id 조회를 한 스레드 풀에서 동시에 진행한 뒤
+        글 작성 요청 한 번으로 발행합니다. 첫 이미지는 대표 이미지로 지정합니다.
+
+        Returns:
+            발행 결과 (성공 여부, 글 주소)
+        """
+        self.last_result = None
+        try:
+            if not self.is_logged_in and not self.login():
+                return self._result(False, error="인증 실패")
+
+            start = time.time()
+            image_map = {Path(p).name: str(p) for p in (self._prepare_images(images) or [])}
+            paths = self._used_images(content, image_map)
+
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                uploads = executor.map(self._upload_media, paths)
+                category_ids = executor.submit(self._term_ids, "categories", [category] if category else [])
+                tag_ids = executor.submit(self._term_ids, "tags", tags or [])
+                media = {path: item for path, item in zip(paths, uploads) if item}
+                category_ids, tag_ids = category_ids.result(), tag_ids.result()
+            if paths:
+                logger.info(f"✅ 미디어 {len(media)}/{len(paths)}개 업로드 완료 ({time.time() - start:.1f}초)")
+
+            payload = {
+                "title": title,
+                "content": self._markdown_to_html(content, image_map, media),
+                "status": self.status,
+                "categories": category_ids,
+                "tags": tag_ids,
+            }
+            if media:
+                payload["featured_media"] = next(iter(media.values()))["id"]
+
+            response = self._create_post(payload)
+            if self._rejected_terms(response):
+                # 캐시된 id가 사이트에서 삭제된 경우: 캐시를 비우고 다시 조회해 한 번 더 요청
+                logger.warning("⚠️ 저장된 카테고리/태그 id가 유효하지 않음 - 다시 조회")
+                JsonCache(self.TERM_CACHE_NAME).delete(self.site_url)
+                payload["categories"] = self._term_ids("categories", [category] if category else [])
+                payload["tags"] = self._term_ids("tags", tags or [])
+                response = self._create_post(payload)
+            if not response.ok:
+                raise RuntimeError(f"HTTP {response.status_code}: {response.text[:200]}")
+
+            post = response.json()
+            url, post_id = post.get("link"), str(post.get("id", ""))
+            logger.success(f"✅ 워드프레스 발행 완료 ({time.time() - start:.1f}초): {title} ({url})")
+            return self._result(True, url=url, post_id=post_id)
+
+        except SessionRejected as e:
+            self.is_logged_in = False
+            logger.error(f"❌ 워드프레스 인증 거부: {e}")
+            return self._result(False, error=f"인증 거부: {e}")
+        except Exception as e:
+            logger.error(f"❌ 워드프레스 발행 실패: {e}")
+            return self._result(False, error=str(e))
+
+    @staticmethod
+    def _used_images(content: str, image_map: dict) -> List[str]:
+        """본문의 [IMAGE: ...] 마커 순서대로 쓰인 이미지 경로 (중복 제외)"""
+        paths = []
+        for marker in re.findall(r'\[IMAGE:\s*([^\]]+)\]', content, re.IGNORECASE):
+            name = resolve_image_marker(marker, image_map)
+            if name is None:
+                logger.warning(f"⚠️ 이미지 파일을 찾을 수 없음: {marker.strip()}")
+            elif image_map[name] not in paths:
+                paths.append(image_map[name])
+        return paths
+
+    # ---------- 요청 ----------
+
+    def _upload_media(self, path: str) -> Optional[dict]:
+        """미디어 라이브러리에 파일 업로드
+
+        Returns:
+            {"id", "url"}. 실패 시 None
+        """
+        name = Path(path).name
+        try:
+            with open(path, "rb") as f:
+                response = self.session.post(
+                    self._url(self.MEDIA_PATH),
+                    files={"file": (name, f, mimetypes.guess_type(name)[0] or "image/jpeg")},
+                    timeout=self.UPLOAD_TIMEOUT,
+                )
+            self._check_session(response, "wp-login.php")
+            if not response.ok:
+                logger.warning(f"⚠️ 미디어 업로드 실패 ({name}): HTTP {response.status_code} {response.text[:100]}")
+                return None
+            data = response.json()
+            return {"id": data["id"], "url": data.get("source_url") or (data.get("guid") or {}).get("rendered")}
+        except SessionRejected:
+            raise
+        except Exception as e:
+            logger.warning(f"⚠️ 미디어 업로드 실패 ({name}): {e}")
+            return None
+
+    def _term_ids(self, taxonomy: str, names: list) -> List[int]:
+        """카테고리/태그 이름 → id 목록 (사이트별 캐시 → 검색 → 없으면 생성)
+
+        Args:
+            taxonomy: "categories" 또는 "tags"
+            names: 이름 목록
+        """
+        cache = JsonCache(self.TERM_CACHE_NAME)
+        cached = (cache.get(self.site_url) or {}).get(taxonomy, {})
+
+        ids, found = [], {}
+        for name in dict.fromkeys(str(n).strip() for n in names if str(n).strip()):
+            term_id = cached.get(name) or self._find_or_create_term(taxonomy, name)
+            if term_id:
+                ids.append(term_id)
+                if name not in cached:
+                    found[name] = term_id
+
+        if found:
+            cache.update_with(
+                lambda data: data.setdefault(self.site_url, {}).setdefault(taxonomy, {}).update(found)
+            )
+        return ids
+
+    def _find_or_create_term(self, taxonomy: str, name: str) -> Optional[int]:
+        """이름이 정확히 같은 카테고리/태그 id (없으면 생성, 권한이 없으면 None)"""
+        url = self._url(self.TERM_PATHS[taxonomy])
+        try:
+            response = self.session.get(
+                url, params={"search": name, "per_page": 100, "_fields": "id,name"}, timeout=self.REQUEST_TIMEOUT
+            )
+            self._check_session(response, "wp-login.php")
+            for term in response.json() if response.ok else []:
+                if html.unescape(term.get("name", "")) == name:
+                    return term["id"]
+
+            response = self.session.post(url, json={"name": name}, timeout=self.REQUEST_TIMEOUT)
+            data = response.json()
+            if response.ok:
+                logger.info(f"🏷️ 워드프레스 {taxonomy} 생성: {name}")
+                return data["id"]
+            # 동시에 같은 이름이 생성된 경우
+            if data.get("code") == "term_exists":
+                return (data.get("data") or {}).get("term_id")
+            logger.warning(f"⚠️ 워드프레스 {taxonomy} 생성 실패 ({name}): {data.get('message')}")
+        except SessionRejected:
+            raise
+        except Exception as e:
+            logger.warning(f"⚠️ 워드프레스 {taxonomy} 조회 실패 ({name}): {e}")
+        return None
+
+    def _create_post(self, payload: dict) -> requests.Response:
+        """글 작성 요청"""
+        response = self.session.post(self._url(self.POSTS_PATH), json=payload, timeout=self.REQUEST_TIMEOUT)
+        self._check_session(response, "wp-login.php")
+        return response
+
+    @staticmethod
+    def _rejected_terms(response: requests.Response) -> bool:
+        """카테고리/태그 id 때문에 글 작성이 거부되었는지"""
+        if response.status_code != 400:
+            return False
+        try:
+            data = response.json()
+        except ValueError:
+            return False
+        params = (data.get("data") or {}).get("params") or {}
+        return data.get("code") == "rest_invalid_param" and ("categories" in params or "tags" in params)
+
+    # ---------- 본문 변환 ----------
+
+    @staticmethod
+    def _inline(text: str) -> str:
+        """인라인 마크다운 (**볼드**, [링크](주소)) → HTML"""
+        text = html.escape(text, quote=False)
+        text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
+        return re.sub(r'\[([^\]]+)\]\((https?://[^)\s]+)\)', r'<a href="\2">\1</a>', text)
+
+    def _markdown_to_html(self, markdown_text: str, image_map: dict = None, media: dict = None) -> str:
+        """마크다운을 워드프레스 본문 HTML로 변환
+
+        Args:
+            markdown_text: 마크다운 본문
+            image_map: {파일명: 경로}
+            media: {경로: {"id", "url"}} 업로드 결과
+
+        Returns:
+            HTML (헤딩, 문단, 목록, 코드 블록, 이미지 figure)
+        """
+        image_map, media = image_map or {}, media or {}
+        parts, items = [], []
+
+        def flush_list():
+            if items:
+                parts.append("<ul>" + "".join(f"<li>{item}</li>" for item in items) + "</ul>")
+                items.clear()
+
+        lines = iter(markdown_text.split('\n'))
+        for line in lines:
+            stripped = line.strip()
+
+            if stripped.startswith('```'):
+                flush_list()
+                language, code = stripped[3:].strip(), []
+                for code_line in lines:
+                    if code_line.strip().startswith('```'):
+                        break
+                    code.append(code_line)
+                css = f' class="language-{html.escape(language)}"' if language else ''
+                parts.append(f'<pre class="wp-block-code"><code{css}>{html.escape(chr(10).join(code))}</code></pre>')
+                continue
+
+            if stripped.startswith('- ') or stripped.startswith('* '):
+                items.append(self._inline(stripped[2:]))
+                continue
+            flush_list()
+
+            if not stripped:
+                continue
+            heading = re.match(r'^(#{1,6}) (.+)$', stripped)
+            image = re.match(r'^\[IMAGE:\s*([^\]]+)\]$', stripped, re.IGNORECASE)
+            if heading:
+                level = max(2, len(heading.group(1)))  # h1은 글 제목이 사용
+                parts.append(f'<h{level}>{self._inline(heading.group(2))}</h{level}>')
+            elif image:
+                name = resolve_image_marker(image.group(1), image_map)
+                item = media.get(image_map.get(name)) if name else None
+                if item:
+                    alt = html.escape(Path(name).stem, quote=True)
+                    parts.append(
+                        f'<figure class="wp-block-image size-large">'
+                        f'<img src="{item["url"]}" alt="{alt}" class="wp-image-{item["id"]}"/></figure>'
+                    )
+                else:
+                    parts.append(f'<p>[사진: {html.escape(image.group(1).strip())}]</p>')
+            else:
+                parts.append(f'<p>{self._inline(stripped)}</p>')
+
+        flush_list()
+        return '\n'.join(parts)
+
+    def logout(self):
+        """HTTP 세션 정리 (브라우저 없음)"""
+        self.session.close()
+        self.is_logged_in = False
+        logger.info("👋 워드프레스 세션 종료")
@@ -0,0 +1,96 @@
+"""
+블로그 계정 설정
+config/accounts.json(또는 BLOG_ACCOUNTS_FILE)에서 플랫폼별 계정/블로그 목록을 로드
+파일이 없으면 기존 환경변수(NAVER_ID, TISTORY_ID ...) 계정 하나를 사용
+"""
+import json
+import os
+from pathlib import Path
+from typing import List, Optional
+from dotenv import load_dotenv
+from loguru import logger
+
+load_dotenv()
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+DEFAULT_ACCOUNTS_FILE = ROOT_DIR / "config" / "accounts.json"
+
+
+def _accounts_file() -> Path:
+    return Path(os.getenv("BLOG_ACCOUNTS_FILE", str(DEFAULT_ACCOUNTS_FILE)))
+
+
+def _env_accounts(platform: str) -> list:
+    """환경변수 계정 (기존 단일 계정 설정)"""
+    if platform == "naver" and os.getenv("NAVER_ID"):
+        return [{
+            "name": "default",
+            "id": os.getenv("NAVER_ID"),
+            "password": os.getenv("NAVER_PASSWORD"),
+            "blogs": [os.getenv("NAVER_ID")],
+        }]
+    if platform == "tistory" and os.getenv("TISTORY_ID"):
+        return [{
+            "name": "default",
+            "id": os.getenv("TISTORY_ID"),
+            "password": os.getenv("TISTORY_PASSWORD"),
+            "blogs": [os.getenv("TISTORY_BLOG_NAME")] if os.getenv("TISTORY_BLOG_NAME") else [],
+        }]
+    return []
+
+
+def load_accounts(platform: str) -> List[dict]:
+    """플랫폼 계정 목록
+
+    accounts.json 형식 (비밀번호는 password 또는 password_env로 환경변수 이름 지정):
+        {"tistory": [{"name": "main", "id": "kakao@example.com",
+                      "password_env": "TISTORY_PASSWORD", "blogs": ["blog-a", "blog-b"]}],
+         "naver": [{"name": "main", "id": "naver_id", "password_env": "NAVER_PASSWORD"}]}
+
+    Args:
+        platform: 플랫폼 이름
+
+    Returns:
+        [{"name", "id", "password", "blogs"}] 목록. 네이버는 항상 blogs = [아이디] (blogs 설정 무시)
+    """
+    path = _accounts_file()
+    if not path.exists():
+        return _env_accounts(platform)
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entries = json.load(f).get(platform, [])
+    except Exception as e:
+        logger.warning(f"⚠️ 계정 설정 파일 로드 실패 ({path}): {e} - 환경변수 계정 사용")
+        return _env_accounts(platform)
+
+    accounts = []
+    for i, entry in enumerate(entries):
+        password = entry.get("password") or os.getenv(entry.get("password_env", ""), "")
+        if not entry.get("id") or not password:
+            logger.warning(f"⚠️ {platform} 계정 설정 누락 (id/password): {entry.get('name', i)}")
+            continue
+        blogs = entry.get("blogs") or []
+        if platform == "naver":
+            # 네이버 계정의 블로그는 아이디 하나뿐 (여러 개를 적으면 같은 블로그에 중복 발행됨)
+            if blogs and list(blogs) != [entry["id"]]:
+                logger.warning(
+                    f"⚠️ 네이버 계정은 블로그가 아이디 하나뿐이라 blogs 설정을 무시합니다: "
+                    f"{entry.get('name', entry['id'])} ({', '.join(blogs)})"
+                )
+            blogs = [entry["id"]]
+        accounts.append({
+            "name": entry.get("name") or entry["id"],
+            "id": entry["id"],
+            "password": password,
+            "blogs": list(blogs),
+        })
+    return accounts
+
+
+def find_account(platform: str, blog: str) -> Optional[dict]:
+    """블로그 이름(네이버는 아이디) 또는 계정 이름으로 계정 조회"""
+    for account in load_accounts(platform):
+        if blog in account["blogs"] or blog == account["name"]:
+            return account
+    return None
@@ -3,6 +3,10 @@
 Selenium WebDriver 인스턴스 생성 및 관리
 """
 import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -10,28 +14,200 @@ from webdriver_manager.chrome import ChromeDriverManager
 from dotenv import load_dotenv
 from loguru import logger
 
+from .cache import JsonCache
+from .cdp_driver import CdpDriver
+from .driver_stats import DriverStats
+
+try:
+    import psutil
+except ImportError:  # 선택 의존성 (없으면 프로세스 메모리 측정/정리 생략)
+    psutil = None
+
 load_dotenv()
 
 
 class BrowserManager:
     """Selenium 브라우저 관리 클래스"""
     
-    def __init__(self, headless: bool = None):
+    # 이 모듈이 띄운 드라이버 프로세스 (Popen, 종료되면 cleanup_zombie_drivers에서 회수)
+    _driver_processes = []
+    _driver_processes_lock = threading.Lock()
+    
+    # ChromeDriver 경로 캐시 (Chrome 메이저 버전 → 드라이버 경로)
+    DRIVER_CACHE_NAME = "chromedriver"
+    
+    # 경량 모드에서 차단할 리소스 (CDP Network.setBlockedURLs 패턴, '*' 와일드카드)
+    LEAN_BLOCKED_URLS = [
+        # 광고
+        "*doubleclick.net*",
+        "*googlesyndication.com*",
+        "*googleadservices.com*",
+        "*adservice.google.*",
+        # 분석/트래킹
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*connect.facebook.net*",
+        # 웹폰트
+        "*fonts.googleapis.com*",
+        "*fonts.gstatic.com*",
+    ]
+    
+    # 플랫폼별 차단/허용 목록
+    # - block: 공통 목록에 추가로 차단할 패턴
+    # - allow: 공통 목록에서 제외할 패턴 (해당 플랫폼 에디터가 필요로 하는 리소스)
+    LEAN_PLATFORM_RULES = {
+        "naver": {
+            "block": [
+                "*veta.naver.com*",       # 광고
+                "*ad.naver.com*",
+                "*ssl.pstatic.net/tveta/*",
+                "*lcs.naver.com*",        # 로그 수집
+                "*nlog.naver.com*",
+                "*tivan.naver.com*",
+            ],
+            "allow": [],
+        },
+        "tistory": {
+            "block": [
+                "*display.ad.daum.net*",  # 카카오 광고
+                "*t1.daumcdn.net/kas/*",
+                "*adfit*",
+                "*tiara.kakao.com*",      # 로그 수집
+                "*tiara.tistory.com*",
+                "*tiara.daum.net*",
+            ],
+            # 에디터 본문 미리보기 폰트
+            "allow": ["*fonts.googleapis.com*", "*fonts.gstatic.com*"],
+        },
+    }
+    
+    # 경량 모드에서 eager 로딩(DOMContentLoaded까지만 대기)을 사용해도 되는 플랫폼
+    # (페이지 이동 후 명시적 대기/셀렉터 확인을 하는 발행자만 해당)
+    EAGER_SAFE_PLATFORMS = {"naver", "tistory"}
+    
+    # 드라이버 백엔드 (selenium: ChromeDriver, cdp: Chrome DevTools 직접 연결)
+    BACKENDS = ("selenium", "cdp")
+    
+    # 이 모듈이 띄운 드라이버 PID 기록 ({PID: {"started", "owner", "owner_started"}})
+    # 비정상 종료한 실행이 남긴 드라이버만 골라 정리 (다른 프로그램의 chromedriver는 건드리지 않음)
+    DRIVER_PID_CACHE_NAME = "driver_pids"
+    
+    def __init__(self, headless: bool = None, lean: bool = None, platform: str = None, backend: str = None):
         """
         Args:
             headless: 헤드리스 모드 여부. None이면 환경변수에서 로드
+            lean: 경량 모드 여부 (광고/분석/폰트 차단). None이면 환경변수에서 로드
+            platform: 플랫폼 이름 (경량 모드 차단 목록 선택용)
+            backend: 드라이버 백엔드 ("selenium" 또는 "cdp"). None이면 BROWSER_BACKEND 환경변수
         """
         if headless is None:
             headless = os.getenv("BROWSER_HEADLESS", "false").lower() == "true"
+        if lean is None:
+            lean = os.getenv("BROWSER_LEAN", "false").lower() == "true"
+        if backend is None:
+            backend = os.getenv("BROWSER_BACKEND", "selenium").lower()
+        if backend == "playwright":
+            # Playwright 백엔드는 발행자 단위로 선택됨 (동기 발행자는 Selenium 사용)
+            backend = "selenium"
+        elif backend not in self.BACKENDS:
+            logger.warning(f"⚠️ 알 수 없는 BROWSER_BACKEND: {backend} (selenium 사용)")
+            backend = "selenium"
         
         self.headless = headless
+        self.lean = lean
+        self.platform = platform
+        self.backend = backend
         self.driver = None
+        self.stats = None  # DriverStats (create_driver 이후)
+        self.startup_timings = {}  # {"driver_resolve": 초, "driver_start": 초}
+        
+        # 장시간 배치용 브라우저 재시작 기준 (0이면 사용 안 함)
+        self.recycle_after = int(os.getenv("BROWSER_RECYCLE_AFTER", "0"))
+        self.max_rss_mb = float(os.getenv("BROWSER_MAX_RSS_MB", "0"))
+        self.uses = 0  # 현재 브라우저로 발행한 횟수
+        self.last_memory = {}  # 마지막 memory_usage() 결과
+        self._root_pid = None  # chromedriver(또는 cdp 백엔드의 Chrome) 프로세스 ID
+    
+    @staticmethod
+    def get_chrome_major_version() -> Optional[str]:
+        """설치된 Chrome의 메이저 버전 조회 (네트워크 사용 안 함)
+        
+        Returns:
+            메이저 버전 문자열 (예: "120"). 확인 불가 시 None
+        """
+        try:
+            from webdriver_manager.core.os_manager import OperationSystemManager
+            
+            version = OperationSystemManager().get_browser_version_from_os("google-chrome")
+            if version:
+                return version.split(".")[0]
+        except Exception as e:
+            logger.debug(f"Chrome 버전 확인 실패: {e}")
+        return None
+    
+    @classmethod
+    def resolve_driver_path(cls, use_cache: bool = True) -> Optional[str]:
+        """ChromeDriver 경로 결정
+        
+        우선순위:
+            1. CHROMEDRIVER_PATH 환경변수 (고정 경로)
+            2. Chrome 메이저 버전별 캐시된 경로 (네트워크 확인 없음)
+            3. webdriver-manager 설치 (버전 조회/다운로드) → 캐시에 저장
+            4. 오프라인 등으로 실패 시 캐시에 남아있는 아무 드라이버
+        
+        Args:
+            use_cache: False면 캐시를 무시하고 webdriver-manager로 확인 (벤치마크용)
+        
+        Returns:
+            드라이버 경로. None이면 Selenium Manager에 맡김
+        """
+        pinned_path = os.getenv("CHROMEDRIVER_PATH")
+        if pinned_path:
+            if Path(pinned_path).exists():
+                logger.debug(f"고정 ChromeDriver 사용: {pinned_path}")
+                return pinned_path
+            logger.warning(f"⚠️ CHROMEDRIVER_PATH 파일이 없습니다: {pinned_path}")
+        
+        cache = JsonCache(cls.DRIVER_CACHE_NAME)
+        major_version = cls.get_chrome_major_version()
+        
+        if use_cache and major_version:
+            cached_path = cache.get(major_version)
+            if cached_path and Path(cached_path).exists():
+                logger.debug(f"캐시된 ChromeDriver 사용 (Chrome {major_version}): {cached_path}")
+                return cached_path
+        
+        try:
+            driver_path = ChromeDriverManager().install()
+            if major_version:
+                cache.set(major_version, driver_path)
+            return driver_path
+        except Exception as e:
+            logger.warning(f"⚠️ ChromeDriver 자동 설치 실패 (오프라인?): {e}")
+        
+        # 버전이 맞지 않더라도 캐시에 남은 드라이버로 시도 (최신 버전 우선)
+        cached = cache.load()
+        for version in sorted(cached, key=lambda v: int(v) if v.isdigit() else 0, reverse=True):
+            if Path(cached[version]).exists():
+                logger.warning(f"⚠️ 캐시된 ChromeDriver로 대체 (Chrome {version}용)")
+                return cached[version]
+        
+        return None
+    
+    def get_blocked_urls(self) -> list:
+        """경량 모드에서 차단할 URL 패턴 목록 (공통 + 플랫폼 - 플랫폼 허용)"""
+        rules = self.LEAN_PLATFORM_RULES.get(self.platform, {})
+        allowed = set(rules.get("allow", []))
+        
+        blocked = [p for p in self.LEAN_BLOCKED_URLS if p not in allowed]
+        blocked += [p for p in rules.get("block", []) if p not in blocked]
+        return blocked
     
     def create_driver(self) -> webdriver.Chrome:
         """Chrome WebDriver 생성
         
         Returns:
-            Chrome WebDriver 인스턴스
+            Chrome WebDriver 인스턴스 (cdp 백엔드는 같은 사용법의 CdpDriver)
         """
         options = Options()
         
@@ -55,9 +231,48 @@ class BrowserManager:
             "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         )
         
-        # ChromeDriver 자동 설치 및 생성
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=options)
+        # 네트워크 이벤트 수집 (발행 API 응답 확인용, 페이지/트레이싱 이벤트는 제외)
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+        
+        # 경량 모드: 확장/백그라운드 통신 비활성화 + eager 로딩
+        if self.lean:
+            options.add_argument("--disable-extensions")
+            options.add_argument("--disable-background-networking")
+            options.add_argument("--disable-component-update")
+            options.add_argument("--disable-default-apps")
+            options.add_argument("--disable-sync")
+            options.add_argument("--no-first-run")
+            if self.platform in self.EAGER_SAFE_PLATFORMS:
+                options.page_load_strategy = "eager"
+        
+        # 이전 실행이 비정상 종료되며 남긴 드라이버 정리
+        self.cleanup_zombie_drivers()
+        
+        if self.backend == "cdp":
+            # ChromeDriver 없이 Chrome 직접 실행 + DevTools 웹소켓 연결
+            self.startup_timings["driver_resolve"] = 0.0
+            start = time.perf_counter()
+            self.driver = CdpDriver(
+                arguments=options.arguments,
+                page_load_strategy=options.page_load_strategy,
+            )
+            self.startup_timings["driver_start"] = time.perf_counter() - start
+        else:
+            # ChromeDriver 경로 결정 (캐시 우선) 및 생성
+            start = time.perf_counter()
+            driver_path = self.resolve_driver_path()
+            self.startup_timings["driver_resolve"] = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            service = Service(driver_path) if driver_path else Service()
+            self.driver = webdriver.Chrome(service=service, options=options)
+            self.startup_timings["driver_start"] = time.perf_counter() - start
+        self.stats = DriverStats(self.driver)
+        self.uses = 0
+        self.last_memory = {}
+        self._root_pid = self._driver_pid()
+        self._register_driver_process()
         
         # 자동화 탐지 방지 스크립트
         self.driver.execute_cdp_cmd(
@@ -71,15 +286,247 @@ class BrowserManager:
             }
         )
         
-        logger.info(f"🌐 브라우저 생성 완료 (headless: {self.headless})")
+        # 경량 모드: 광고/분석/폰트 요청 차단
+        if self.lean:
+            blocked_urls = self.get_blocked_urls()
+            try:
+                self.driver.execute_cdp_cmd("Network.enable", {})
+                self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_urls})
+                logger.debug(f"경량 모드: {len(blocked_urls)}개 URL 패턴 차단")
+            except Exception as e:
+                logger.warning(f"⚠️ 리소스 차단 설정 실패 (계속 진행): {e}")
+        
+        logger.info(
+            f"🌐 브라우저 생성 완료 (backend: {self.backend}, headless: {self.headless}, lean: {self.lean}, "
+            f"드라이버 확인 {self.startup_timings['driver_resolve']:.2f}초, "
+            f"시작 {self.startup_timings['driver_start']:.2f}초)"
+        )
         return self.driver
     
+    def _register_driver_process(self):
+        """이 모듈이 띄운 드라이버 프로세스(Popen) 기록 (cleanup_zombie_drivers에서 회수)"""
+        try:
+            process = self.driver._process if self.backend == "cdp" else self.driver.service.process
+        except Exception:
+            return
+        if process is not None:
+            with self._driver_processes_lock:
+                self._driver_processes.append(process)
+            self._record_driver_pid(process.pid)
+    
+    @staticmethod
+    def _started_at(pid: Optional[int]) -> Optional[float]:
+        """프로세스 시작 시각 (없으면 None, psutil 필요)"""
+        if psutil is None or pid is None:
+            return None
+        try:
+            return psutil.Process(pid).create_time()
+        except psutil.Error:
+            return None
+    
+    @classmethod
+    def _is_same_process(cls, pid: Optional[int], started: Optional[float]) -> bool:
+        """PID가 기록한 그 프로세스인지 (PID 재사용 구분)"""
+        current = cls._started_at(pid)
+        return current is not None and started is not None and abs(current - started) < 1
+    
+    @classmethod
+    def _record_driver_pid(cls, pid: int):
+        """드라이버 PID를 .cache/driver_pids.json에 기록 (psutil이 없으면 정리할 수 없으므로 생략)"""
+        started = cls._started_at(pid)
+        if started is None:
+            return
+        owner = os.getpid()
+        entry = {"started": started, "owner": owner, "owner_started": cls._started_at(owner)}
+        try:
+            JsonCache(cls.DRIVER_PID_CACHE_NAME).update_with(lambda data: data.update({str(pid): entry}))
+        except Exception as e:
+            logger.debug(f"드라이버 PID 기록 실패: {e}")
+    
+    @classmethod
+    def _forget_driver_pid(cls, pid: Optional[int]):
+        """정상 종료한 드라이버의 PID 기록 삭제"""
+        if psutil is None or pid is None:
+            return
+        
+        def remove(data):
+            data.pop(str(pid), None)
+        
+        try:
+            JsonCache(cls.DRIVER_PID_CACHE_NAME).update_with(remove)
+        except Exception as e:
+            logger.debug(f"드라이버 PID 기록 삭제 실패: {e}")
+    
+    def _driver_pid(self) -> Optional[int]:
+        """드라이버 루트 프로세스 ID (selenium: chromedriver, cdp: Chrome)"""
+        try:
+            if self.backend == "cdp":
+                return self.driver._process.pid
+            return self.driver.service.process.pid
+        except Exception:
+            return None
+    
+    def _browser_processes(self) -> list:
+        """드라이버 루트와 하위 프로세스(Chrome 렌더러/GPU 등) 목록 (psutil 필요)"""
+        if psutil is None or self._root_pid is None:
+            return []
+        try:
+            root = psutil.Process(self._root_pid)
+            return [root] + root.children(recursive=True)
+        except psutil.Error:
+            return []
+    
+    def memory_usage(self) -> dict:
+        """현재 브라우저 메모리 사용량
+        
+        Returns:
+            {"rss_mb": 프로세스 트리 RSS 합계 (psutil 없으면 None),
+             "js_heap_mb": 현재 페이지 JS 힙 사용량 (CDP Performance.getMetrics),
+             "processes": 프로세스 수}
+        """
+        usage = {"rss_mb": None, "js_heap_mb": None, "processes": 0}
+        if not self.driver:
+            return usage
+        
+        processes = self._browser_processes()
+        if processes:
+            rss = 0
+            for process in processes:
+                try:
+                    rss += process.memory_info().rss
+                except psutil.Error:
+                    pass
+            usage["rss_mb"] = round(rss / 1024 / 1024, 1)
+            usage["processes"] = len(processes)
+        
+        try:
+            self.driver.execute_cdp_cmd("Performance.enable", {})
+            metrics = self.driver.execute_cdp_cmd("Performance.getMetrics", {}).get("metrics", [])
+            heap = next((m["value"] for m in metrics if m.get("name") == "JSHeapUsedSize"), None)
+            if heap is not None:
+                usage["js_heap_mb"] = round(heap / 1024 / 1024, 1)
+        except Exception as e:
+            logger.debug(f"JS 힙 측정 실패: {e}")
+        
+        self.last_memory = usage
+        return usage
+    
+    def record_use(self) -> dict:
+        """발행 1회 기록 + 메모리 측정 (발행 직후 호출)
+        
+        Returns:
+            memory_usage() 결과
+        """
+        self.uses += 1
+        usage = self.memory_usage()
+        logger.debug(
+            f"브라우저 사용 {self.uses}회 - RSS {usage['rss_mb']}MB, "
+            f"JS 힙 {usage['js_heap_mb']}MB, 프로세스 {usage['processes']}개"
+        )
+        return usage
+    
+    def recycle_reason(self) -> Optional[str]:
+        """브라우저를 다시 시작해야 하는 이유 (필요 없으면 None)"""
+        if not self.driver:
+            return None
+        if self.recycle_after and self.uses >= self.recycle_after:
+            return f"발행 {self.uses}회"
+        rss = self.last_memory.get("rss_mb")
+        if self.max_rss_mb and rss and rss >= self.max_rss_mb:
+            return f"RSS {rss:.0f}MB ≥ {self.max_rss_mb:.0f}MB"
+        return None
+    
+    def reset_tabs(self):
+        """탭 하나만 남기고 빈 페이지로 이동 (이전 에디터 페이지의 메모리 해제)
+        
+        발행마다 새 창을 열지 않고 같은 탭에서 페이지 이동만 하도록 유지합니다.
+        """
+        if not self.driver:
+            return
+        try:
+            # cdp 백엔드는 처음부터 탭 하나만 조작
+            if self.backend != "cdp":
+                handles = self.driver.window_handles
+                for handle in handles[1:]:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                self.driver.switch_to.window(handles[0])
+            self.driver.get("about:blank")
+        except Exception as e:
+            logger.debug(f"탭 정리 실패: {e}")
+    
+    @classmethod
+    def cleanup_zombie_drivers(cls) -> int:
+        """좀비/고아 chromedriver 프로세스 정리
+        
+        - 이 모듈이 띄운 드라이버 중 종료된 것(좀비)은 Popen.poll()로 회수
+          (다른 subprocess 자식은 건드리지 않아 종료 코드가 그대로 남음)
+        - .cache/driver_pids.json에 기록된 드라이버 중 띄운 실행이 이미 끝난 것
+          (비정상 종료로 남은 것)은 하위 Chrome과 함께 종료 (psutil 필요)
+        
+        Returns:
+            정리한 프로세스 수
+        """
+        cleaned = 0
+        
+        with cls._driver_processes_lock:
+            for process in list(cls._driver_processes):
+                already_reaped = process.returncode is not None  # Service.stop() 등에서 이미 회수
+                if process.poll() is None:
+                    continue
+                cls._driver_processes.remove(process)
+                if not already_reaped:
+                    cleaned += 1
+        
+        # 이전 실행이 남긴 드라이버 (기록한 PID만, 하위 Chrome 포함)
+        if psutil is not None:
+            def sweep(data):
+                nonlocal cleaned
+                for pid, entry in list(data.items()):
+                    if cls._is_same_process(entry.get("owner"), entry.get("owner_started")):
+                        continue  # 아직 실행 중인 (이 프로세스 포함) 실행의 드라이버
+                    del data[pid]
+                    if not cls._is_same_process(int(pid), entry.get("started")):
+                        continue  # 이미 종료됐거나 PID가 다른 프로세스에 재사용됨
+                    try:
+                        process = psutil.Process(int(pid))
+                        for child in process.children(recursive=True) + [process]:
+                            child.kill()
+                        cleaned += 1
+                    except psutil.Error:
+                        continue
+            
+            try:
+                JsonCache(cls.DRIVER_PID_CACHE_NAME).update_with(sweep)
+            except Exception as e:
+                logger.debug(f"드라이버 PID 기록 정리 실패: {e}")
+        
+        if cleaned:
+            logger.info(f"🧹 남은 드라이버 프로세스 {cleaned}개 정리")
+        return cleaned
+    
     def quit(self):
-        """브라우저 종료"""
+        """브라우저 종료 (드라이버가 남긴 하위 프로세스까지 정리)"""
         if self.driver:
-            self.driver.quit()
+            processes = self._browser_processes()
+            root_pid = self._root_pid
+            try:
+                self.driver.quit()
+            except Exception as e:
+                logger.warning(f"⚠️ 브라우저 종료 중 오류: {e}")
             self.driver = None
+            self._root_pid = None
+            
+            # quit()이 실패했거나 Chrome이 응답하지 않아 남은 프로세스 강제 종료
+            for process in processes:
+                try:
+                    if process.is_running():
+                        process.kill()
+                except psutil.Error:
+                    pass
+            self._forget_driver_pid(root_pid)
             logger.info("🌐 브라우저 종료")
+        self.cleanup_zombie_drivers()
     
     def __enter__(self):
         """Context manager 진입"""
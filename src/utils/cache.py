@@ -0,0 +1,109 @@
+"""
+로컬 캐시 저장소
+프로젝트 루트의 .cache/ 디렉터리에 JSON 파일로 값을 보관
+"""
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+from loguru import logger
+
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+CACHE_DIR = Path(os.getenv("BLOG_CACHE_DIR", str(ROOT_DIR / ".cache")))
+
+
+class JsonCache:
+    """JSON 파일 기반 키-값 캐시
+
+    파일 하나에 딕셔너리 하나를 저장합니다.
+    쓰기는 임시 파일 → rename 방식으로 처리해 중간에 종료되어도 파일이 깨지지 않습니다.
+    """
+
+    _locks = {}
+    _locks_guard = threading.Lock()
+
+    def __init__(self, name: str, cache_dir: Union[str, Path] = None):
+        """
+        Args:
+            name: 캐시 파일 이름 (확장자 제외)
+            cache_dir: 캐시 디렉터리. None이면 기본 .cache/ 사용
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else CACHE_DIR
+        self.path = self.cache_dir / f"{name}.json"
+
+        with self._locks_guard:
+            self._lock = self._locks.setdefault(str(self.path), threading.RLock())
+
+    def load(self) -> dict:
+        """캐시 전체 로드 (파일이 없거나 깨져 있으면 빈 딕셔너리)"""
+        with self._lock:
+            if not self.path.exists():
+                return {}
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                return data if isinstance(data, dict) else {}
+            except Exception as e:
+                logger.debug(f"캐시 로드 실패 (무시): {self.path} - {e}")
+                return {}
+
+    def save(self, data: dict):
+        """캐시 전체 저장"""
+        with self._lock:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                os.replace(temp_path, self.path)
+            except Exception:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+                raise
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """값 조회"""
+        return self.load().get(key, default)
+
+    def set(self, key: str, value: Any):
+        """값 저장"""
+        with self._lock:
+            data = self.load()
+            data[key] = value
+            self.save(data)
+
+    def update(self, values: dict):
+        """여러 값을 한 번에 저장"""
+        with self._lock:
+            data = self.load()
+            data.update(values)
+            self.save(data)
+
+    def update_with(self, fn: Callable[[dict], Optional[dict]]) -> dict:
+        """읽기-수정-쓰기를 한 번에 처리 (같은 파일을 쓰는 다른 스레드와 겹치지 않음)
+
+        Args:
+            fn: 캐시 전체 딕셔너리를 받아 수정하는 함수 (새 딕셔너리를 반환하면 그 값으로 저장)
+
+        Returns:
+            저장한 딕셔너리
+        """
+        with self._lock:
+            data = self.load()
+            result = fn(data)
+            data = data if result is None else result
+            self.save(data)
+            return data
+
+    def delete(self, key: str) -> Optional[Any]:
+        """값 삭제"""
+        with self._lock:
+            data = self.load()
+            value = data.pop(key, None)
+            self.save(data)
+            return value
@@ -0,0 +1,698 @@
+"""
+CDP 직접 연결 드라이버
+ChromeDriver 없이 Chrome을 직접 실행하고 DevTools 웹소켓으로 조작
+"""
+import base64
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+import urllib.request
+from collections import deque
+from pathlib import Path
+from typing import Optional
+from loguru import logger
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    JavascriptException,
+    NoAlertPresentException,
+    NoSuchElementException,
+    TimeoutException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+
+try:
+    import websocket  # websocket-client (selenium 의존성으로 함께 설치됨)
+except ImportError:  # pragma: no cover
+    websocket = None
+
+
+# Selenium Keys → CDP Input.dispatchKeyEvent 파라미터 (key, code, keyCode)
+SPECIAL_KEYS = {
+    Keys.ENTER: ("Enter", "Enter", 13),
+    Keys.RETURN: ("Enter", "Enter", 13),
+    Keys.TAB: ("Tab", "Tab", 9),
+    Keys.BACKSPACE: ("Backspace", "Backspace", 8),
+    Keys.DELETE: ("Delete", "Delete", 46),
+    Keys.ESCAPE: ("Escape", "Escape", 27),
+    Keys.SPACE: (" ", "Space", 32),
+    Keys.ARROW_LEFT: ("ArrowLeft", "ArrowLeft", 37),
+    Keys.ARROW_UP: ("ArrowUp", "ArrowUp", 38),
+    Keys.ARROW_RIGHT: ("ArrowRight", "ArrowRight", 39),
+    Keys.ARROW_DOWN: ("ArrowDown", "ArrowDown", 40),
+    Keys.HOME: ("Home", "Home", 36),
+    Keys.END: ("End", "End", 35),
+    Keys.PAGE_UP: ("PageUp", "PageUp", 33),
+    Keys.PAGE_DOWN: ("PageDown", "PageDown", 34),
+}
+
+# 수정 키 → CDP modifiers 비트 (Alt=1, Ctrl=2, Meta=4, Shift=8)
+MODIFIER_KEYS = {
+    Keys.ALT: ("Alt", "AltLeft", 18, 1),
+    Keys.CONTROL: ("Control", "ControlLeft", 17, 2),
+    Keys.COMMAND: ("Meta", "MetaLeft", 91, 4),
+    Keys.SHIFT: ("Shift", "ShiftLeft", 16, 8),
+}
+
+# 요소 탐색 전략 → querySelector/XPath 스크립트
+FIND_SCRIPTS = {
+    By.CSS_SELECTOR: "return Array.from(root.querySelectorAll(value));",
+    By.ID: "return Array.from(root.querySelectorAll('#' + CSS.escape(value)));",
+    By.NAME: "return Array.from(root.querySelectorAll('[name=\"' + CSS.escape(value) + '\"]'));",
+    By.CLASS_NAME: "return Array.from(root.querySelectorAll('.' + CSS.escape(value)));",
+    By.TAG_NAME: "return Array.from(root.querySelectorAll(value));",
+    By.XPATH: """
+        var doc = root.ownerDocument || root;
+        var snapshot = doc.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var result = [];
+        for (var i = 0; i < snapshot.snapshotLength; i++) result.push(snapshot.snapshotItem(i));
+        return result;
+    """,
+}
+
+# 요소 중앙 좌표 (iframe 안의 요소는 프레임 위치를 더해 페이지 좌표로 변환)
+CENTER_SCRIPT = """
+    this.scrollIntoView({block: 'center', inline: 'center'});
+    var rect = this.getBoundingClientRect();
+    var x = rect.left + rect.width / 2, y = rect.top + rect.height / 2;
+    var win = this.ownerDocument.defaultView;
+    while (win && win.frameElement) {
+        var frameRect = win.frameElement.getBoundingClientRect();
+        x += frameRect.left; y += frameRect.top;
+        win = win.parent;
+    }
+    return [x, y];
+"""
+
+
+def find_chrome_binary() -> Optional[str]:
+    """Chrome 실행 파일 경로 찾기 (CHROME_PATH 환경변수 우선)"""
+    pinned_path = os.getenv("CHROME_PATH")
+    if pinned_path and Path(pinned_path).exists():
+        return pinned_path
+
+    candidates = [
+        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+        r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+        r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+    ]
+    for path in candidates:
+        if Path(path).exists():
+            return path
+
+    for name in ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"):
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+class CdpElement(WebElement):
+    """CDP RemoteObject 기반 요소
+
+    WebElement를 상속해 isinstance 검사(ActionChains, expected_conditions)를 통과하며,
+    publishers에서 사용하는 메서드만 CDP로 구현합니다.
+    """
+
+    def __init__(self, driver: "CdpDriver", object_id: str):
+        super().__init__(driver, object_id)
+        self._driver = driver
+
+    def _call(self, body: str, *args):
+        return self._driver._call_function(self.id, f"function() {{ {body} }}", list(args))
+
+    @property
+    def tag_name(self) -> str:
+        return self._call("return this.tagName.toLowerCase();")
+
+    @property
+    def text(self) -> str:
+        return self._call("return this.innerText || this.textContent || '';")
+
+    @property
+    def location(self) -> dict:
+        x, y = self._call("var r = this.getBoundingClientRect(); return [r.left + window.scrollX, r.top + window.scrollY];")
+        return {"x": int(x), "y": int(y)}
+
+    @property
+    def size(self) -> dict:
+        width, height = self._call("var r = this.getBoundingClientRect(); return [r.width, r.height];")
+        return {"width": int(width), "height": int(height)}
+
+    def get_attribute(self, name: str):
+        return self._call(
+            "var name = arguments[0];"
+            "if (name in this && typeof this[name] !== 'function' && typeof this[name] !== 'object') return String(this[name]);"
+            "return this.getAttribute(name);",
+            name,
+        )
+
+    def get_property(self, name: str):
+        return self._call("return this[arguments[0]];", name)
+
+    def get_dom_attribute(self, name: str):
+        return self._call("return this.getAttribute(arguments[0]);", name)
+
+    def is_displayed(self) -> bool:
+        return bool(self._call(
+            "var style = window.getComputedStyle(this);"
+            "return style.display !== 'none' && style.visibility !== 'hidden' && this.getClientRects().length > 0;"
+        ))
+
+    def is_enabled(self) -> bool:
+        return not self._call("return !!this.disabled;")
+
+    def is_selected(self) -> bool:
+        return bool(self._call("return !!(this.checked || this.selected);"))
+
+    def click(self):
+        x, y = self._call(CENTER_SCRIPT)
+        self._driver._mouse_click(x, y)
+
+    def clear(self):
+        self._call(
+            "if ('value' in this) { this.value = ''; } else { this.textContent = ''; }"
+            "this.dispatchEvent(new Event('input', {bubbles: true}));"
+        )
+
+    def send_keys(self, *value):
+        text = "".join(str(v) for v in value)
+        is_file_input = self._call("return this.tagName === 'INPUT' && this.type === 'file';")
+        if is_file_input:
+            files = [str(Path(p).absolute()) for p in text.split("\n") if p]
+            self._driver.execute("DOM.setFileInputFiles", {"objectId": self.id, "files": files})
+            return
+        self._call("this.focus();")
+        self._driver._type(text)
+
+    def find_element(self, by=By.ID, value=None):
+        return self._driver.find_element(by, value, root=self)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self._driver.find_elements(by, value, root=self)
+
+
+class CdpAlert:
+    """JavaScript 대화상자 (Page.javascriptDialogOpening)"""
+
+    def __init__(self, driver: "CdpDriver", message: str):
+        self._driver = driver
+        self.text = message
+
+    def accept(self):
+        self._driver.execute("Page.handleJavaScriptDialog", {"accept": True})
+        self._driver._dialog = None
+
+    def dismiss(self):
+        self._driver.execute("Page.handleJavaScriptDialog", {"accept": False})
+        self._driver._dialog = None
+
+
+class CdpSwitchTo:
+    """driver.switch_to 대응 (같은 출처 iframe, 대화상자, 활성 요소)"""
+
+    def __init__(self, driver: "CdpDriver"):
+        self._driver = driver
+
+    @property
+    def alert(self) -> CdpAlert:
+        self._driver._drain_events()
+        if self._driver._dialog is None:
+            raise NoAlertPresentException()
+        return CdpAlert(self._driver, self._driver._dialog)
+
+    @property
+    def active_element(self) -> CdpElement:
+        return self._driver.execute_script("return document.activeElement;")
+
+    def frame(self, frame_reference):
+        if not isinstance(frame_reference, CdpElement):
+            frame_reference = self._driver.find_element(By.CSS_SELECTOR, f"iframe#{frame_reference}, iframe[name='{frame_reference}']")
+        self._driver._frames.append(frame_reference)
+
+    def default_content(self):
+        self._driver._frames = []
+
+    def parent_frame(self):
+        # 최상위 문서에서는 그대로 (Selenium과 같음)
+        if self._driver._frames:
+            self._driver._frames.pop()
+
+
+class CdpDriver:
+    """ChromeDriver 없이 CDP로 Chrome을 조작하는 드라이버
+
+    publishers가 사용하는 WebDriver 기능의 일부(이동, 스크립트 실행, 요소 탐색/클릭/입력,
+    ActionChains 키/마우스 동작, 같은 출처 iframe, 대화상자, 성능 로그, CDP 명령)만 제공합니다.
+    모든 CDP 호출은 execute()를 거치므로 DriverStats로 명령 수를 그대로 집계할 수 있습니다.
+    """
+
+    STARTUP_TIMEOUT = 20  # Chrome 실행 후 DevTools 포트 대기 (초)
+    COMMAND_TIMEOUT = 60  # CDP 명령 응답 대기 (초, 스크립트 실행은 script_timeout)
+    EVENT_BUFFER_SIZE = 5000  # get_log("performance")용 네트워크 이벤트 보관 개수
+
+    def __init__(
+        self,
+        headless: bool = False,
+        arguments: list = None,
+        page_load_strategy: str = "normal",
+        chrome_path: str = None,
+    ):
+        """
+        Args:
+            headless: 헤드리스 모드 여부
+            arguments: 추가 Chrome 실행 인자
+            page_load_strategy: "normal"(load 이벤트) 또는 "eager"(DOMContentLoaded)
+            chrome_path: Chrome 실행 파일 경로. None이면 자동 탐색
+        """
+        if websocket is None:
+            raise ImportError("CDP 백엔드에는 websocket-client 패키지가 필요합니다: pip install websocket-client")
+
+        self.chrome_path = chrome_path or find_chrome_binary()
+        if not self.chrome_path:
+            raise FileNotFoundError("Chrome 실행 파일을 찾을 수 없습니다. CHROME_PATH를 지정하세요.")
+
+        self.page_load_strategy = page_load_strategy
+        self.page_load_timeout = 300
+        self.script_timeout = 30
+        self.switch_to = CdpSwitchTo(self)
+
+        self._message_id = 0
+        self._events = deque()  # 아직 처리하지 않은 이벤트
+        self._network_log = deque(maxlen=self.EVENT_BUFFER_SIZE)
+        self._dialog = None  # 열린 대화상자 메시지
+        self._frames = []  # switch_to.frame으로 들어간 iframe 요소 (마지막이 현재 문서)
+        self._pressed_modifiers = 0
+        self._mouse_position = (0, 0)
+
+        self._user_data_dir = tempfile.mkdtemp(prefix="blog-cdp-")
+        args = [
+            self.chrome_path,
+            "--remote-debugging-port=0",
+            "--remote-allow-origins=*",
+            f"--user-data-dir={self._user_data_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+        ]
+        if headless:
+            args.append("--headless=new")
+        # chromedriver처럼 '--'가 없는 인자는 붙여서 전달 (예: "user-agent=...")
+        args += [a if a.startswith("-") else f"--{a}" for a in (arguments or [])]
+        args.append("about:blank")
+
+        self._process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            self._ws = websocket.create_connection(self._page_websocket_url(), suppress_origin=True, timeout=None)
+            self.execute("Page.enable", {})
+            self.execute("Runtime.enable", {})
+            self.execute("Network.enable", {})
+        except Exception:
+            self.quit()
+            raise
+
+    # ---------- 연결 ----------
+
+    def _page_websocket_url(self) -> str:
+        """DevToolsActivePort 파일에서 포트를 읽고 첫 페이지 탭의 웹소켓 주소 조회"""
+        port_file = Path(self._user_data_dir) / "DevToolsActivePort"
+        deadline = time.time() + self.STARTUP_TIMEOUT
+        while time.time() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"Chrome이 종료되었습니다 (exit {self._process.returncode})")
+            if port_file.exists():
+                lines = port_file.read_text().splitlines()
+                if lines and lines[0].isdigit():
+                    with urllib.request.urlopen(f"http://127.0.0.1:{lines[0]}/json/list", timeout=5) as response:
+                        targets = json.loads(response.read().decode("utf-8"))
+                    for target in targets:
+                        if target.get("type") == "page":
+                            return target["webSocketDebuggerUrl"]
+            time.sleep(0.05)
+        raise TimeoutException("Chrome DevTools 포트를 확인하지 못했습니다.")
+
+    def execute(self, driver_command: str, params: dict = None, timeout: float = None):
+        """CDP 명령 실행 (W3C actions 명령은 CDP 입력 이벤트로 변환)
+
+        Args:
+            driver_command: CDP 메서드 (예: "Runtime.evaluate") 또는 Command.W3C_ACTIONS
+            params: 파라미터
+            timeout: 응답 대기 시간 (초). None이면 COMMAND_TIMEOUT
+
+        Returns:
+            CDP 결과 딕셔너리
+        """
+        if driver_command == Command.W3C_ACTIONS:
+            self._perform_actions(params.get("actions", []))
+            return {}
+        if driver_command == Command.W3C_CLEAR_ACTIONS:
+            self._pressed_modifiers = 0
+            return {}
+
+        self._message_id += 1
+        message_id = self._message_id
+        self._ws.send(json.dumps({"id": message_id, "method": driver_command, "params": params or {}}))
+
+        timeout = self.COMMAND_TIMEOUT if timeout is None else timeout
+        while True:
+            try:
+                message = self._receive(timeout=timeout)
+            except websocket.WebSocketTimeoutException:
+                raise TimeoutException(f"{driver_command} 응답 대기 시간 초과")
+            if message.get("id") == message_id:
+                if "error" in message:
+                    raise JavascriptException(f"{driver_command}: {message['error'].get('message')}")
+                return message.get("result", {})
+
+    def _receive(self, timeout: float = None) -> dict:
+        """웹소켓 메시지 1개 수신 (이벤트는 버퍼에 보관)"""
+        self._ws.settimeout(timeout)
+        message = json.loads(self._ws.recv())
+        if "method" in message:
+            self._handle_event(message)
+        return message
+
+    def _handle_event(self, message: dict):
+        method = message["method"]
+        if method.startswith("Network."):
+            self._network_log.append({
+                "level": "INFO",
+                "timestamp": int(time.time() * 1000),
+                "message": json.dumps({"message": message}),
+            })
+        elif method == "Page.javascriptDialogOpening":
+            self._dialog = message["params"].get("message", "")
+        elif method == "Page.javascriptDialogClosed":
+            self._dialog = None
+        self._events.append(message)
+
+    def _drain_events(self):
+        """대기 중인 이벤트를 막힘 없이 모두 수신"""
+        while True:
+            try:
+                self._receive(timeout=0.001)
+            except websocket.WebSocketTimeoutException:
+                return
+
+    def _wait_event(self, method: str, timeout: float) -> dict:
+        """특정 이벤트 대기"""
+        deadline = time.time() + timeout
+        while True:
+            while self._events:
+                event = self._events.popleft()
+                if event["method"] == method:
+                    return event
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise TimeoutException(f"{method} 이벤트 대기 시간 초과")
+            try:
+                self._receive(timeout=remaining)
+            except websocket.WebSocketTimeoutException:
+                continue
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: dict):
+        """Selenium의 execute_cdp_cmd와 동일"""
+        return self.execute(cmd, cmd_args)
+
+    # ---------- 페이지 ----------
+
+    def get(self, url: str):
+        """페이지 이동 (page_load_strategy에 맞는 로딩 이벤트까지 대기)"""
+        self._frames = []
+        self._drain_events()
+        self._events.clear()
+        result = self.execute("Page.navigate", {"url": url}, timeout=self.page_load_timeout)
+        if result.get("errorText"):
+            raise TimeoutException(f"페이지 이동 실패: {result['errorText']}")
+        event = "Page.domContentEventFired" if self.page_load_strategy == "eager" else "Page.loadEventFired"
+        self._wait_event(event, self.page_load_timeout)
+
+    @property
+    def current_url(self) -> str:
+        return self.execute_script("return window.top.location.href;")
+
+    @property
+    def title(self) -> str:
+        return self.execute_script("return window.top.document.title;")
+
+    @property
+    def page_source(self) -> str:
+        return self.execute_script("return document.documentElement.outerHTML;")
+
+    def refresh(self):
+        self.get(self.current_url)
+
+    def set_script_timeout(self, time_to_wait: float):
+        self.script_timeout = time_to_wait
+
+    def set_page_load_timeout(self, time_to_wait: float):
+        self.page_load_timeout = time_to_wait
+
+    def implicitly_wait(self, time_to_wait: float):
+        """암시적 대기는 사용하지 않음 (WebDriverWait 사용)"""
+
+    def save_screenshot(self, filename: str) -> bool:
+        data = self.execute("Page.captureScreenshot", {"format": "png"}).get("data", "")
+        with open(filename, "wb") as f:
+            f.write(base64.b64decode(data))
+        return True
+
+    def get_log(self, log_type: str) -> list:
+        """성능 로그 (chromedriver의 goog:loggingPrefs performance 형식과 동일)"""
+        if log_type != "performance":
+            return []
+        self._drain_events()
+        entries = list(self._network_log)
+        self._network_log.clear()
+        self._events = deque(e for e in self._events if not e["method"].startswith("Network."))
+        return entries
+
+    # ---------- 스크립트 ----------
+
+    def _wrap(self, remote: dict):
+        """RemoteObject → 파이썬 값 / CdpElement / 목록"""
+        if remote.get("subtype") == "node":
+            return CdpElement(self, remote["objectId"])
+        if remote.get("subtype") == "null" or remote.get("type") == "undefined":
+            return None
+        if "objectId" not in remote:
+            return remote.get("value")
+        if remote.get("subtype") == "array":
+            properties = self.execute("Runtime.getProperties", {"objectId": remote["objectId"], "ownProperties": True})
+            items = [p for p in properties.get("result", []) if p.get("name", "").isdigit()]
+            items.sort(key=lambda p: int(p["name"]))
+            return [self._wrap(p["value"]) for p in items]
+        # 일반 객체는 JSON 값으로 변환
+        result = self.execute("Runtime.callFunctionOn", {
+            "objectId": remote["objectId"],
+            "functionDeclaration": "function() { return this; }",
+            "returnByValue": True,
+        })
+        return result.get("result", {}).get("value")
+
+    def _check(self, result: dict) -> dict:
+        if result.get("exceptionDetails"):
+            details = result["exceptionDetails"]
+            description = details.get("exception", {}).get("description") or details.get("text")
+            raise JavascriptException(description)
+        return result["result"]
+
+    def _call_function(self, object_id: str, declaration: str, args: list, await_promise: bool = False):
+        """object_id를 this로 함수 실행"""
+        arguments = [{"objectId": a.id} if isinstance(a, CdpElement) else {"value": a} for a in args]
+        result = self.execute("Runtime.callFunctionOn", {
+            "objectId": object_id,
+            "functionDeclaration": declaration,
+            "arguments": arguments,
+            "awaitPromise": await_promise,
+        }, timeout=self.script_timeout)
+        return self._wrap(self._check(result))
+
+    @property
+    def _frame(self) -> Optional[CdpElement]:
+        """스크립트를 실행할 iframe 요소 (최상위 문서면 None)"""
+        return self._frames[-1] if self._frames else None
+
+    def _run(self, script: str, args: tuple, is_async: bool):
+        if is_async:
+            body = (
+                "var args = Array.prototype.slice.call(arguments);"
+                "return new Promise(function(resolve) { args.push(resolve);"
+                f" (function() {{ {script} }}).apply(null, args); }});"
+            )
+        else:
+            body = f"return (function() {{ {script} }}).apply(null, arguments);"
+
+        elements = [a for a in args if isinstance(a, CdpElement)]
+        if self._frame is not None:
+            # iframe 문서 기준으로 실행 (같은 출처만 가능)
+            declaration = (
+                "function(src) { var args = Array.prototype.slice.call(arguments, 1);"
+                " return this.contentWindow.eval('(function() {' + src + '})').apply(null, args); }"
+            )
+            return self._call_function(self._frame.id, declaration, [body] + list(args), await_promise=is_async)
+        if elements:
+            return self._call_function(elements[0].id, f"function() {{ {body} }}", list(args), await_promise=is_async)
+
+        # 요소 인자가 없으면 Runtime.evaluate 1회로 처리
+        expression = f"(function() {{ {body} }}).apply(null, {json.dumps(list(args))})"
+        result = self.execute(
+            "Runtime.evaluate", {"expression": expression, "awaitPromise": is_async}, timeout=self.script_timeout
+        )
+        return self._wrap(self._check(result))
+
+    def execute_script(self, script: str, *args):
+        return self._run(script, args, is_async=False)
+
+    def execute_async_script(self, script: str, *args):
+        return self._run(script, args, is_async=True)
+
+    # ---------- 요소 ----------
+
+    def find_elements(self, by=By.ID, value=None, root: CdpElement = None) -> list:
+        script = FIND_SCRIPTS.get(by)
+        if script is None:
+            raise InvalidSelectorException(f"CDP 백엔드에서 지원하지 않는 탐색 방식: {by}")
+        declaration = f"var root = arguments[0] || document; var value = arguments[1]; {script}"
+        return self.execute_script(declaration, root, value) or []
+
+    def find_element(self, by=By.ID, value=None, root: CdpElement = None) -> CdpElement:
+        elements = self.find_elements(by, value, root=root)
+        if not elements:
+            raise NoSuchElementException(f"요소를 찾을 수 없습니다: {by}={value}")
+        return elements[0]
+
+    # ---------- 입력 ----------
+
+    def _key_event(self, event_type: str, key: str, code: str, key_code: int, text: str = None):
+        params = {
+            "type": event_type,
+            "key": key,
+            "code": code,
+            "windowsVirtualKeyCode": key_code,
+            "modifiers": self._pressed_modifiers,
+        }
+        if text:
+            params["text"] = text
+        self.execute("Input.dispatchKeyEvent", params)
+
+    def _key_down(self, key: str):
+        if key in MODIFIER_KEYS:
+            name, code, key_code, bit = MODIFIER_KEYS[key]
+            self._pressed_modifiers |= bit
+            self._key_event("rawKeyDown", name, code, key_code)
+        elif key in SPECIAL_KEYS:
+            name, code, key_code = SPECIAL_KEYS[key]
+            text = "\r" if name == "Enter" else (" " if name == " " else None)
+            self._key_event("keyDown" if text else "rawKeyDown", name, code, key_code, text)
+        elif self._pressed_modifiers & ~8:
+            # 단축키 (Ctrl/Cmd/Alt + 문자): 텍스트 없이 키 이벤트만
+            self._key_event("rawKeyDown", key, f"Key{key.upper()}", ord(key.upper()))
+        else:
+            self.execute("Input.insertText", {"text": key})
+
+    def _key_up(self, key: str):
+        if key in MODIFIER_KEYS:
+            name, code, key_code, bit = MODIFIER_KEYS[key]
+            self._pressed_modifiers &= ~bit
+            self._key_event("keyUp", name, code, key_code)
+        elif key in SPECIAL_KEYS:
+            name, code, key_code = SPECIAL_KEYS[key]
+            self._key_event("keyUp", name, code, key_code)
+        elif self._pressed_modifiers & ~8:
+            self._key_event("keyUp", key, f"Key{key.upper()}", ord(key.upper()))
+
+    def _type(self, text: str):
+        """element.send_keys와 같은 규칙으로 입력 (일반 문자는 insertText로 묶어서)"""
+        buffer = ""
+        for char in text:
+            if char in SPECIAL_KEYS or char in MODIFIER_KEYS or char == Keys.NULL or self._pressed_modifiers & ~8:
+                if buffer:
+                    self.execute("Input.insertText", {"text": buffer})
+                    buffer = ""
+                if char == Keys.NULL:
+                    for modifier in [k for k, v in MODIFIER_KEYS.items() if self._pressed_modifiers & v[3]]:
+                        self._key_up(modifier)
+                elif char in MODIFIER_KEYS:
+                    self._key_down(char)
+                else:
+                    self._key_down(char)
+                    self._key_up(char)
+            else:
+                buffer += char
+        if buffer:
+            self.execute("Input.insertText", {"text": buffer})
+        # send_keys가 끝나면 눌린 수정 키 해제 (WebDriver 동작과 동일)
+        for modifier in [k for k, v in MODIFIER_KEYS.items() if self._pressed_modifiers & v[3]]:
+            self._key_up(modifier)
+
+    def _mouse_click(self, x: float, y: float):
+        for event_type in ("mouseMoved", "mousePressed", "mouseReleased"):
+            self.execute("Input.dispatchMouseEvent", {
+                "type": event_type, "x": x, "y": y, "button": "left", "clickCount": 1,
+                "modifiers": self._pressed_modifiers,
+            })
+        self._mouse_position = (x, y)
+
+    def _perform_actions(self, sources: list):
+        """W3C actions(ActionChains.perform) 실행 - 같은 순번(tick)의 동작을 차례로 처리"""
+        ticks = max((len(s.get("actions", [])) for s in sources), default=0)
+        for tick in range(ticks):
+            for source in sources:
+                actions = source.get("actions", [])
+                if tick >= len(actions):
+                    continue
+                action = actions[tick]
+                kind = action.get("type")
+                if kind == "pause":
+                    if action.get("duration"):
+                        time.sleep(action["duration"] / 1000)
+                elif kind == "keyDown":
+                    self._key_down(action["value"])
+                elif kind == "keyUp":
+                    self._key_up(action["value"])
+                elif kind == "pointerMove":
+                    origin = action.get("origin", "viewport")
+                    x, y = action.get("x", 0), action.get("y", 0)
+                    if isinstance(origin, dict):
+                        element = CdpElement(self, next(iter(origin.values())))
+                        center_x, center_y = element._call(CENTER_SCRIPT)
+                        x, y = center_x + x, center_y + y
+                    elif origin == "pointer":
+                        x, y = self._mouse_position[0] + x, self._mouse_position[1] + y
+                    self._mouse_position = (x, y)
+                    self.execute("Input.dispatchMouseEvent", {"type": "mouseMoved", "x": x, "y": y})
+                elif kind in ("pointerDown", "pointerUp"):
+                    x, y = self._mouse_position
+                    self.execute("Input.dispatchMouseEvent", {
+                        "type": "mousePressed" if kind == "pointerDown" else "mouseReleased",
+                        "x": x, "y": y, "button": "left", "clickCount": 1,
+                        "modifiers": self._pressed_modifiers,
+                    })
+
+    # ---------- 종료 ----------
+
+    def quit(self):
+        """웹소켓/Chrome 프로세스 종료 및 임시 프로필 삭제"""
+        try:
+            if getattr(self, "_ws", None):
+                try:
+                    # 응답을 기다리지 않음 (브라우저가 먼저 연결을 끊을 수 있음)
+                    self._ws.send(json.dumps({"id": 0, "method": "Browser.close", "params": {}}))
+                except Exception:
+                    pass
+                self._ws.close()
+        finally:
+            self._ws = None
+            if self._process.poll() is None:
+                self._process.terminate()
+                try:
+                    self._process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self._process.kill()
+            shutil.rmtree(self._user_data_dir, ignore_errors=True)
+            logger.debug("CDP 드라이버 종료")
@@ -0,0 +1,96 @@
+"""
+WebDriver 명령 집계
+발행 단계별 WebDriver 명령 수와 소요 시간을 기록
+"""
+import time
+from contextlib import contextmanager
+from loguru import logger
+
+
+class DriverStats:
+    """WebDriver 명령 수/시간 집계 클래스
+
+    driver.execute를 감싸서 모든 WebDriver 명령(요소 탐색, 스크립트 실행,
+    프레임 전환, CDP 명령 등)을 현재 단계에 기록합니다.
+    """
+
+    def __init__(self, driver):
+        """
+        Args:
+            driver: Selenium WebDriver 인스턴스
+        """
+        self.driver = driver
+        self.stages = {}  # {단계: {"commands": 수, "command_time": 초, "wall_time": 초, "by_command": {명령: 수}}}
+        self.current_stage = "setup"
+        self._stage_started = time.perf_counter()
+        self._original_execute = driver.execute
+        driver.execute = self._execute
+
+    def _entry(self, stage: str) -> dict:
+        return self.stages.setdefault(
+            stage, {"commands": 0, "command_time": 0.0, "wall_time": 0.0, "by_command": {}}
+        )
+
+    def _execute(self, driver_command, params=None):
+        """명령 실행 + 기록"""
+        start = time.perf_counter()
+        try:
+            return self._original_execute(driver_command, params)
+        finally:
+            entry = self._entry(self.current_stage)
+            entry["commands"] += 1
+            entry["command_time"] += time.perf_counter() - start
+            entry["by_command"][driver_command] = entry["by_command"].get(driver_command, 0) + 1
+
+    def mark(self, stage: str):
+        """다음 단계 시작 (이전 단계의 경과 시간 기록)"""
+        now = time.perf_counter()
+        self._entry(self.current_stage)["wall_time"] += now - self._stage_started
+        self.current_stage = stage
+        self._stage_started = now
+
+    @contextmanager
+    def stage(self, name: str):
+        """with 블록 동안 name 단계로 기록"""
+        previous = self.current_stage
+        self.mark(name)
+        try:
+            yield
+        finally:
+            self.mark(previous)
+
+    def reset(self):
+        """기록 초기화"""
+        self.stages = {}
+        self.current_stage = "setup"
+        self._stage_started = time.perf_counter()
+
+    def summary(self) -> dict:
+        """단계별 집계 (현재 단계의 경과 시간 포함)"""
+        self.mark(self.current_stage)
+        return {
+            stage: {
+                "commands": entry["commands"],
+                "command_time": round(entry["command_time"], 3),
+                "wall_time": round(entry["wall_time"], 3),
+                "by_command": dict(entry["by_command"]),
+            }
+            for stage, entry in self.stages.items()
+        }
+
+    def log_report(self, title: str = "WebDriver 명령 통계"):
+        """단계별 통계 로그 출력"""
+        summary = self.summary()
+        total_commands = sum(e["commands"] for e in summary.values())
+        total_time = sum(e["wall_time"] for e in summary.values())
+
+        logger.info(f"📊 {title}: 명령 {total_commands}회 / {total_time:.1f}초")
+        for stage, entry in summary.items():
+            if not entry["commands"] and entry["wall_time"] < 0.01:
+                continue
+            top = sorted(entry["by_command"].items(), key=lambda x: -x[1])[:3]
+            top_text = ", ".join(f"{name} {count}" for name, count in top)
+            logger.info(
+                f"   - {stage}: 명령 {entry['commands']}회 ({entry['command_time']:.2f}초), "
+                f"경과 {entry['wall_time']:.2f}초 [{top_text}]"
+            )
@@ -0,0 +1,122 @@
+"""
+네트워크 응답 수집
+Chrome 성능 로그(CDP Network 이벤트)에서 특정 API 응답을 찾아 본문까지 읽기
+"""
+import base64
+import json
+import re
+import time
+from typing import Optional
+from loguru import logger
+
+
+class NetworkCapture:
+    """CDP 네트워크 이벤트 기반 응답 대기 클래스
+
+    BrowserManager가 goog:loggingPrefs로 성능 로그를 켜 두면
+    driver.get_log("performance")로 Network.* 이벤트를 읽을 수 있습니다.
+    발행 버튼 클릭 전에 clear()로 이전 이벤트를 비우고,
+    클릭 후 wait_for_response()로 발행 API 응답을 기다립니다.
+    """
+
+    def __init__(self, driver):
+        """
+        Args:
+            driver: Selenium WebDriver 인스턴스 (성능 로그 활성화 필요)
+        """
+        self.driver = driver
+
+    def _read_events(self) -> list:
+        """쌓인 성능 로그를 CDP 이벤트 목록으로 변환 (읽은 로그는 드라이버에서 비워짐)"""
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception as e:
+            logger.debug(f"성능 로그 읽기 실패: {e}")
+            return []
+
+        events = []
+        for entry in entries:
+            try:
+                events.append(json.loads(entry["message"])["message"])
+            except (KeyError, TypeError, ValueError):
+                continue
+        return events
+
+    def clear(self):
+        """지금까지 쌓인 이벤트 버리기"""
+        self._read_events()
+
+    def get_response_body(self, request_id: str) -> Optional[str]:
+        """요청 ID로 응답 본문 조회 (CDP Network.getResponseBody)"""
+        try:
+            result = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        except Exception as e:
+            logger.debug(f"응답 본문 조회 실패 ({request_id}): {e}")
+            return None
+
+        body = result.get("body", "")
+        if result.get("base64Encoded"):
+            try:
+                body = base64.b64decode(body).decode("utf-8", errors="replace")
+            except Exception:
+                return None
+        return body
+
+    def wait_for_response(self, url_pattern: str, timeout: float = 30, method: str = None) -> Optional[dict]:
+        """URL 패턴과 일치하는 요청의 응답 대기
+
+        Args:
+            url_pattern: 요청 URL에 대한 정규식
+            timeout: 최대 대기 시간 (초)
+            method: HTTP 메서드 제한 (예: "POST"). None이면 모두 허용
+
+        Returns:
+            {"url", "status", "body", "mime_type"} 딕셔너리. 시간 초과 시 None
+            (네트워크 오류로 요청이 실패하면 status 0, error 포함)
+        """
+        pattern = re.compile(url_pattern)
+        requests = {}  # requestId → {"url", "status", "mime_type"}
+        deadline = time.time() + timeout
+
+        while time.time() < deadline:
+            for event in self._read_events():
+                name = event.get("method")
+                params = event.get("params", {})
+                request_id = params.get("requestId")
+
+                if name == "Network.requestWillBeSent":
+                    request = params.get("request", {})
+                    if pattern.search(request.get("url", "")) and (
+                        method is None or request.get("method", "").upper() == method.upper()
+                    ):
+                        requests[request_id] = {"url": request.get("url"), "status": None, "mime_type": None}
+
+                elif name == "Network.responseReceived" and request_id in requests:
+                    response = params.get("response", {})
+                    requests[request_id]["status"] = response.get("status")
+                    requests[request_id]["mime_type"] = response.get("mimeType")
+
+                elif name == "Network.loadingFinished" and request_id in requests:
+                    info = requests[request_id]
+                    return {**info, "body": self.get_response_body(request_id)}
+
+                elif name == "Network.loadingFailed" and request_id in requests:
+                    info = requests[request_id]
+                    return {**info, "status": info["status"] or 0, "body": None,
+                            "error": params.get("errorText", "loadingFailed")}
+
+            time.sleep(0.2)
+
+        logger.debug(f"네트워크 응답 대기 시간 초과: {url_pattern}")
+        return None
+
+    @staticmethod
+    def parse_json(body: Optional[str]) -> Optional[dict]:
+        """응답 본문을 JSON으로 파싱 (실패 시 None)"""
+        if not body:
+            return None
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return None
+        return data if isinstance(data, dict) else None
@@ -0,0 +1,268 @@
+"""
+브라우저 성능 지표 수집
+발행 중 불러온 페이지별 CDP Performance.getMetrics, 내비게이션/리소스 타이밍과
+업로드·발행 요청 시간을 기록해 발행 결과와 .cache/perf_history.json에 남김
+"""
+import os
+import statistics
+import time
+from typing import Optional
+from loguru import logger
+
+from .cache import JsonCache
+
+
+class PerfRecorder:
+    """페이지/요청 단위 브라우저 성능 기록
+
+    - capture_page: 페이지가 준비된 시점에 호출. 내비게이션 타이밍, 리소스 요약(유형별/가장 느린 요청),
+      CDP 지표(스크립트/레이아웃 시간, JS 힙, DOM 노드 수)를 기록하고 리소스 타이밍 버퍼를 비움
+    - capture_requests: 이후 발생한 요청 중 URL 패턴과 일치하는 것(이미지 업로드, 발행 API)의 시간 기록
+    - BROWSER_PERF_METRICS=false로 끌 수 있음
+    """
+
+    HISTORY_CACHE_NAME = "perf_history"
+    HISTORY_LIMIT = 50  # 플랫폼별 보관 발행 수
+
+    # CDP Performance.getMetrics 중 기록할 항목 (초 단위 항목은 ms로 변환)
+    CDP_METRICS = {
+        "TaskDuration": "task_ms",
+        "ScriptDuration": "script_ms",
+        "LayoutDuration": "layout_ms",
+        "RecalcStyleDuration": "style_ms",
+        "JSHeapUsedSize": "js_heap_mb",
+        "Nodes": "nodes",
+    }
+
+    SLOWEST_RESOURCES = 5
+
+    # 내비게이션 타이밍 + 리소스 요약 (arguments: 가장 느린 리소스 수)
+    PAGE_TIMING_SCRIPT = """
+        var limit = arguments[0];
+        function ms(value) { return value > 0 ? Math.round(value) : null; }
+        function kb(value) { return Math.round((value || 0) / 1024); }
+        function shortName(url) { return url.split('?')[0].slice(-80); }
+
+        var nav = performance.getEntriesByType('navigation')[0];
+        var navigation = nav ? {
+            ttfb_ms: ms(nav.responseStart),
+            dom_content_loaded_ms: ms(nav.domContentLoadedEventEnd),
+            load_ms: ms(nav.loadEventEnd),
+            transfer_kb: kb(nav.transferSize)
+        } : null;
+
+        var entries = performance.getEntriesByType('resource');
+        var byType = {}, transfer = 0;
+        entries.forEach(function(entry) {
+            var type = entry.initiatorType || 'other';
+            var bucket = byType[type] = byType[type] || {count: 0, transfer_kb: 0, max_ms: 0};
+            bucket.count += 1;
+            bucket.transfer_kb += kb(entry.transferSize);
+            bucket.max_ms = Math.max(bucket.max_ms, Math.round(entry.duration));
+            transfer += entry.transferSize || 0;
+        });
+        var slowest = entries.slice().sort(function(a, b) { return b.duration - a.duration; })
+            .slice(0, limit).map(function(entry) {
+                return {name: shortName(entry.name), type: entry.initiatorType, ms: Math.round(entry.duration)};
+            });
+
+        // 이후 요청(업로드/발행)이 버퍼 초과로 빠지지 않도록 비움
+        performance.setResourceTimingBufferSize(1000);
+        performance.clearResourceTimings();
+
+        return {
+            url: location.origin + location.pathname,
+            navigation: navigation,
+            resources: {count: entries.length, transfer_kb: kb(transfer), by_type: byType, slowest: slowest}
+        };
+    """
+
+    # URL 패턴과 일치하는 리소스 타이밍 (arguments: 정규식 문자열)
+    REQUEST_TIMING_SCRIPT = """
+        var pattern = new RegExp(arguments[0]);
+        return performance.getEntriesByType('resource').filter(function(entry) {
+            return pattern.test(entry.name);
+        }).map(function(entry) {
+            return {
+                start: entry.startTime,
+                end: entry.responseEnd,
+                ms: Math.round(entry.duration),
+                transfer_kb: Math.round((entry.transferSize || 0) / 1024)
+            };
+        });
+    """
+
+    def __init__(self, enabled: bool = None):
+        """
+        Args:
+            enabled: 수집 여부. None이면 BROWSER_PERF_METRICS 환경변수 (기본 true)
+        """
+        if enabled is None:
+            enabled = os.getenv("BROWSER_PERF_METRICS", "true").lower() == "true"
+        self.enabled = enabled
+        self.pages = {}     # {라벨: 페이지 지표}
+        self.requests = {}  # {라벨: 요청 지표}
+
+    def capture_page(self, driver, label: str) -> Optional[dict]:
+        """현재 페이지의 성능 지표 기록
+
+        Args:
+            driver: WebDriver
+            label: 페이지 이름 (예: "login", "manage", "newpost", "postwrite")
+
+        Returns:
+            {"url", "navigation", "resources", "cdp"}. 수집 실패/비활성화 시 None
+        """
+        if not self.enabled or driver is None:
+            return None
+        try:
+            page = driver.execute_script(self.PAGE_TIMING_SCRIPT, self.SLOWEST_RESOURCES) or {}
+        except Exception as e:
+            logger.debug(f"페이지 타이밍 수집 실패 ({label}): {e}")
+            return None
+
+        page["cdp"] = self._cdp_metrics(driver)
+        page["captured_at"] = time.time()
+        self.pages[label] = page
+        return page
+
+    def capture_requests(self, driver, label: str, url_pattern: str) -> Optional[dict]:
+        """마지막 capture_page 이후 URL 패턴과 일치한 요청들의 시간 기록
+
+        Args:
+            driver: WebDriver
+            label: 요청 묶음 이름 (예: "upload", "publish")
+            url_pattern: 요청 URL 정규식
+
+        Returns:
+            {"count", "total_ms" (첫 요청 시작~마지막 응답), "avg_ms", "max_ms", "transfer_kb"}. 없으면 None
+        """
+        if not self.enabled or driver is None:
+            return None
+        try:
+            entries = driver.execute_script(self.REQUEST_TIMING_SCRIPT, url_pattern) or []
+        except Exception as e:
+            logger.debug(f"요청 타이밍 수집 실패 ({label}): {e}")
+            return None
+        if not entries:
+            return None
+
+        summary = {
+            "count": len(entries),
+            "total_ms": round(max(e["end"] for e in entries) - min(e["start"] for e in entries)),
+            "avg_ms": round(sum(e["ms"] for e in entries) / len(entries)),
+            "max_ms": max(e["ms"] for e in entries),
+            "transfer_kb": sum(e["transfer_kb"] for e in entries),
+        }
+        self.requests[label] = summary
+        return summary
+
+    def _cdp_metrics(self, driver) -> dict:
+        """CDP Performance.getMetrics 중 CDP_METRICS 항목"""
+        try:
+            driver.execute_cdp_cmd("Performance.enable", {})
+            raw = driver.execute_cdp_cmd("Performance.getMetrics", {}).get("metrics", [])
+        except Exception as e:
+            logger.debug(f"CDP 성능 지표 수집 실패: {e}")
+            return {}
+
+        metrics = {}
+        for entry in raw:
+            key = self.CDP_METRICS.get(entry.get("name"))
+            if key is None:
+                continue
+            value = entry.get("value") or 0
+            if key.endswith("_ms"):
+                value = round(value * 1000)
+            elif key.endswith("_mb"):
+                value = round(value / 1024 / 1024, 1)
+            metrics[key] = value
+        return metrics
+
+    def summary(self) -> dict:
+        """지금까지 기록한 지표 {"pages": {...}, "requests": {...}}"""
+        return {"pages": dict(self.pages), "requests": dict(self.requests)}
+
+    def has_data(self) -> bool:
+        return bool(self.pages or self.requests)
+
+    def reset(self):
+        self.pages = {}
+        self.requests = {}
+
+    def log_report(self, title: str = "브라우저 성능"):
+        """페이지/요청별 한 줄 요약 로그"""
+        for label, page in self.pages.items():
+            navigation = page.get("navigation") or {}
+            resources = page.get("resources") or {}
+            cdp = page.get("cdp") or {}
+            logger.info(
+                f"📈 {title} [{label}] DOMContentLoaded {navigation.get('dom_content_loaded_ms')}ms, "
+                f"load {navigation.get('load_ms')}ms, 리소스 {resources.get('count', 0)}개 "
+                f"{resources.get('transfer_kb', 0)}KB, 스크립트 {cdp.get('script_ms')}ms"
+            )
+        for label, request in self.requests.items():
+            logger.info(
+                f"📈 {title} [{label}] 요청 {request['count']}개, 전체 {request['total_ms']}ms "
+                f"(평균 {request['avg_ms']}ms, 최대 {request['max_ms']}ms)"
+            )
+
+    def save_history(self, platform: str, metrics: dict):
+        """발행 한 번의 지표를 플랫폼별 기록에 추가 (최근 HISTORY_LIMIT개 유지)"""
+        record = dict(metrics, recorded_at=time.time())
+
+        def append(data: dict):
+            data[platform] = (data.get(platform, []) + [record])[-self.HISTORY_LIMIT:]
+
+        JsonCache(self.HISTORY_CACHE_NAME).update_with(append)
+
+
+def flatten_metrics(record: dict) -> dict:
+    """발행 기록 하나를 {지표 이름: 값}으로 평탄화 (요약/비교용)
+
+    예: {"postwrite.load_ms": 2310, "postwrite.script_ms": 840, "upload.total_ms": 5200, "stage.images": 6.1}
+    """
+    flat = {}
+    for label, page in (record.get("pages") or {}).items():
+        for key, value in (page.get("navigation") or {}).items():
+            flat[f"{label}.{key}"] = value
+        flat[f"{label}.resources"] = (page.get("resources") or {}).get("count")
+        for key, value in (page.get("cdp") or {}).items():
+            flat[f"{label}.{key}"] = value
+    for label, request in (record.get("requests") or {}).items():
+        flat[f"{label}.total_ms"] = request.get("total_ms")
+        flat[f"{label}.avg_ms"] = request.get("avg_ms")
+    for stage, entry in (record.get("stages") or {}).items():
+        flat[f"stage.{stage}"] = entry.get("wall_time")
+    return {key: value for key, value in flat.items() if isinstance(value, (int, float))}
+
+
+def summarize_history(history: list, recent: int = 5) -> dict:
+    """지표별 최근 recent회 중앙값과 그 이전 중앙값 비교
+
+    Args:
+        history: save_history로 쌓인 발행 기록 목록 (오래된 순)
+        recent: 최근 구간 크기
+
+    Returns:
+        {지표 이름: {"recent": 중앙값, "baseline": 이전 중앙값 또는 None, "change": 증감 비율 또는 None}}
+    """
+    flats = [flatten_metrics(record) for record in history]
+    recent_part, baseline_part = flats[-recent:], flats[:-recent]
+
+    summary = {}
+    for key in sorted({key for flat in recent_part for key in flat}):
+        recent_values = [flat[key] for flat in recent_part if key in flat]
+        baseline_values = [flat[key] for flat in baseline_part if key in flat]
+        recent_median = statistics.median(recent_values)
+        baseline_median = statistics.median(baseline_values) if baseline_values else None
+        change = None
+        if baseline_median:
+            change = round((recent_median - baseline_median) / baseline_median, 3)
+        summary[key] = {"recent": recent_median, "baseline": baseline_median, "change": change}
+    return summary
+
+
+def load_history(platform: str) -> list:
+    """저장된 플랫폼별 발행 지표 기록 (오래된 순)"""
+    return JsonCache(PerfRecorder.HISTORY_CACHE_NAME).get(platform, [])
@@ -0,0 +1,135 @@
+"""
+Playwright 브라우저 관리
+Chromium 하나를 띄우고 플랫폼/계정별로 격리된 브라우저 컨텍스트를 제공 (asyncio)
+"""
+import asyncio
+import os
+import re
+from typing import Optional
+from dotenv import load_dotenv
+from loguru import logger
+
+from .browser import BrowserManager
+
+try:
+    from playwright.async_api import async_playwright
+except ImportError:  # 선택 의존성
+    async_playwright = None
+
+load_dotenv()
+
+
+class PlaywrightBrowser:
+    """Playwright(async) 브라우저 관리 클래스
+
+    Chromium 프로세스는 하나만 실행하고, 플랫폼/계정마다 쿠키와 저장소가 분리된
+    BrowserContext를 만들어 재사용합니다. 여러 발행을 한 이벤트 루프에서 동시에 진행할 수 있습니다.
+    """
+
+    # Selenium 백엔드와 같은 창 크기/User-Agent
+    VIEWPORT = {"width": 1920, "height": 1080}
+    USER_AGENT = (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+
+    def __init__(self, headless: bool = None, lean: bool = None):
+        """
+        Args:
+            headless: 헤드리스 모드 여부. None이면 환경변수에서 로드
+            lean: 경량 모드 여부 (광고/분석/폰트 차단). None이면 환경변수에서 로드
+        """
+        if headless is None:
+            headless = os.getenv("BROWSER_HEADLESS", "false").lower() == "true"
+        if lean is None:
+            lean = os.getenv("BROWSER_LEAN", "false").lower() == "true"
+
+        self.headless = headless
+        self.lean = lean
+        self._playwright = None
+        self._browser = None
+        self._contexts = {}  # {컨텍스트 키: BrowserContext}
+        # 동시에 발행을 시작해도 Chromium/컨텍스트를 한 번만 만들도록 잠금
+        self._start_lock = asyncio.Lock()
+        self._context_locks = {}  # {컨텍스트 키: asyncio.Lock}
+
+    async def start(self):
+        """Chromium 실행 (이미 실행 중이면 무시)"""
+        if self._browser is not None:
+            return
+        if async_playwright is None:
+            raise ImportError(
+                "Playwright 백엔드에는 playwright 패키지가 필요합니다: "
+                "pip install playwright && playwright install chromium"
+            )
+
+        async with self._start_lock:
+            if self._browser is not None:  # 기다리는 동안 다른 작업이 실행함
+                return
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(
+                headless=self.headless,
+                args=["--disable-blink-features=AutomationControlled", "--no-sandbox", "--disable-dev-shm-usage"],
+            )
+        logger.info(f"🌐 Playwright Chromium 실행 (headless: {self.headless}, lean: {self.lean})")
+
+    @staticmethod
+    def _blocked_url_regex(platform: Optional[str]) -> re.Pattern:
+        """경량 모드 차단 목록('*' 와일드카드)을 정규식 하나로 변환"""
+        patterns = BrowserManager(lean=True, platform=platform).get_blocked_urls()
+        parts = [".*".join(re.escape(piece) for piece in pattern.split("*")) for pattern in patterns]
+        return re.compile("^(?:" + "|".join(parts) + ")$")
+
+    async def context(self, key: str, platform: str = None):
+        """플랫폼/계정별 컨텍스트 (없으면 생성)
+
+        Args:
+            key: 컨텍스트 키 (예: "tistory:myblog")
+            platform: 플랫폼 이름 (경량 모드 차단 목록 선택용)
+
+        Returns:
+            playwright BrowserContext
+        """
+        if key in self._contexts:
+            return self._contexts[key]
+
+        async with self._context_locks.setdefault(key, asyncio.Lock()):
+            if key in self._contexts:  # 기다리는 동안 같은 키의 컨텍스트가 만들어짐
+                return self._contexts[key]
+
+            await self.start()
+            context = await self._browser.new_context(viewport=self.VIEWPORT, user_agent=self.USER_AGENT)
+            await context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+
+            if self.lean:
+                await context.route(self._blocked_url_regex(platform), lambda route: route.abort())
+
+            self._contexts[key] = context
+        logger.debug(f"브라우저 컨텍스트 생성: {key}")
+        return context
+
+    async def close(self):
+        """모든 컨텍스트와 Chromium 종료"""
+        for context in self._contexts.values():
+            try:
+                await context.close()
+            except Exception:
+                pass
+        self._contexts = {}
+        self._context_locks = {}
+
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+        logger.info("🌐 Playwright Chromium 종료")
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -0,0 +1,191 @@
+"""
+셀렉터 레지스트리
+대체 셀렉터 목록 중 성공한 셀렉터를 플랫폼별로 기록해 다음 발행에서 먼저 시도
+"""
+import time
+from typing import List, Optional
+from loguru import logger
+
+from .cache import JsonCache
+
+
+class SelectorRegistry:
+    """대체 셀렉터 목록(체인)의 성공/실패 통계
+
+    - 마지막으로 성공한 셀렉터를 먼저, 그다음 성공 횟수 순으로 시도
+    - 모든 후보를 스크립트 한 번으로 확인하며 폴링 (셀렉터마다 대기하지 않음)
+    - 마지막 성공 셀렉터가 있으면 prefer_timeout 동안은 그 셀렉터만 인정 (로딩 중 다른 요소 오인 방지)
+    - 통계는 .cache/selectors.json에 {플랫폼: {체인: {셀렉터: 통계}}}로 저장
+      (처음 사용할 때 한 번 읽고, 기록은 메모리에 모았다가 flush()에서 한 번에 저장 - 발행 끝/로그아웃 시)
+    """
+
+    CACHE_NAME = "selectors"
+
+    # 연속으로 이 횟수 이상 찾지 못한 셀렉터는 죽은 셀렉터로 보고
+    DEAD_AFTER = 5
+
+    # CSS/XPath 후보를 순서대로 확인해 첫 번째로 조건을 만족하는 [순번, 요소] 반환
+    FIND_SCRIPT = """
+        var selectors = arguments[0], clickable = arguments[1], limit = arguments[2];
+        function lookup(selector) {
+            if (selector.indexOf('/') === 0 || selector.indexOf('(') === 0) {
+                return document.evaluate(selector, document, null,
+                    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            }
+            return document.querySelector(selector);
+        }
+        function usable(el) {
+            if (!el) return false;
+            if (!clickable) return true;
+            return el.getClientRects().length > 0 && !el.disabled;
+        }
+        for (var i = 0; i < Math.min(selectors.length, limit); i++) {
+            try {
+                var el = lookup(selectors[i]);
+                if (usable(el)) return [i, el];
+            } catch (e) {}
+        }
+        return null;
+    """
+
+    def __init__(self, platform: str, cache_dir=None):
+        """
+        Args:
+            platform: 플랫폼 이름 (통계 구분)
+            cache_dir: 캐시 디렉터리 (테스트용)
+        """
+        self.platform = platform
+        self.cache = JsonCache(self.CACHE_NAME, cache_dir=cache_dir)
+        self._data = None     # {체인: {셀렉터: 통계}} (처음 사용할 때 로드)
+        self._dirty = set()   # 저장하지 않은 (체인, 셀렉터)
+
+    def _stats(self) -> dict:
+        if self._data is None:
+            self._data = self.cache.get(self.platform, {})
+        return self._data
+
+    def stats(self, chain: str) -> dict:
+        """체인의 셀렉터별 통계 {셀렉터: {"hits", "misses", "streak", "last_hit"}}"""
+        return self._stats().get(chain, {})
+
+    def order(self, chain: str, selectors: List[str]) -> List[str]:
+        """시도 순서 (마지막 성공 → 성공 횟수 → 원래 순서, 죽은 셀렉터는 맨 뒤)"""
+        stats = self.stats(chain)
+
+        def rank(item):
+            index, selector = item
+            entry = stats.get(selector, {})
+            dead = entry.get("streak", 0) >= self.DEAD_AFTER
+            return (dead, -entry.get("last_hit", 0), -entry.get("hits", 0), index)
+
+        return [selector for _, selector in sorted(enumerate(selectors), key=rank)]
+
+    def record(self, chain: str, tried: List[str], found: Optional[str]):
+        """결과 기록
+
+        Args:
+            chain: 체인 이름
+            tried: 시도 순서대로의 셀렉터 목록
+            found: 찾은 셀렉터 (없으면 None - 시도한 셀렉터 모두 실패)
+        """
+        entries = self._stats().setdefault(chain, {})
+        for selector in tried:
+            entry = entries.setdefault(selector, {"hits": 0, "misses": 0, "streak": 0, "last_hit": 0})
+            self._dirty.add((chain, selector))
+            if selector == found:
+                entry["hits"] += 1
+                entry["streak"] = 0
+                entry["last_hit"] = time.time()
+                break
+            entry["misses"] += 1
+            entry["streak"] += 1
+
+    def flush(self):
+        """메모리에 모은 기록을 파일에 저장 (이 인스턴스가 바꾼 셀렉터 항목만 덮어씀)"""
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, set()
+
+        def merge(data: dict):
+            platform = data.setdefault(self.platform, {})
+            for chain, selector in dirty:
+                platform.setdefault(chain, {})[selector] = self._data[chain][selector]
+
+        try:
+            self.cache.update_with(merge)
+        except Exception as e:
+            logger.debug(f"셀렉터 통계 저장 실패: {e}")
+
+    def find(
+        self,
+        driver,
+        chain: str,
+        selectors: List[str],
+        timeout: float = 4.0,
+        clickable: bool = True,
+        prefer_timeout: float = 1.0,
+        poll: float = 0.2,
+    ):
+        """학습된 순서로 요소 찾기
+
+        Args:
+            driver: WebDriver
+            chain: 체인 이름 (예: "final_publish")
+            selectors: 대체 셀렉터 목록 (CSS 또는 '//'로 시작하는 XPath)
+            timeout: 전체 최대 대기 시간 (초)
+            clickable: True면 화면에 보이고 비활성화되지 않은 요소만
+            prefer_timeout: 마지막 성공 셀렉터만 기다리는 시간 (초)
+            poll: 폴링 간격 (초)
+
+        Returns:
+            찾은 요소. 없으면 None
+        """
+        ordered = self.order(chain, selectors)
+        has_preferred = bool(self.stats(chain).get(ordered[0], {}).get("hits"))
+        start = time.time()
+
+        while True:
+            elapsed = time.time() - start
+            limit = 1 if has_preferred and elapsed < prefer_timeout else len(ordered)
+            try:
+                result = driver.execute_script(self.FIND_SCRIPT, ordered, clickable, limit)
+            except Exception as e:
+                logger.debug(f"셀렉터 확인 실패 ({chain}): {e}")
+                result = None
+
+            if result:
+                index, element = result
+                if index > 0 or not has_preferred:
+                    logger.debug(f"셀렉터 '{chain}': {ordered[index]} ({index + 1}번째 후보)")
+                self.record(chain, ordered[:index + 1], ordered[index])
+                return element
+
+            if elapsed >= timeout:
+                break
+            time.sleep(poll)
+
+        logger.warning(f"⚠️ 셀렉터 '{chain}' 후보 {len(ordered)}개 모두 실패 ({timeout:.0f}초)")
+        self.record(chain, ordered, None)
+        return None
+
+    def dead_selectors(self) -> dict:
+        """죽은 셀렉터 목록 {체인: [셀렉터, ...]} (연속 DEAD_AFTER회 이상 실패)"""
+        dead = {}
+        for chain, entries in self._stats().items():
+            selectors = [s for s, e in entries.items() if e.get("streak", 0) >= self.DEAD_AFTER]
+            if selectors:
+                dead[chain] = selectors
+        return dead
+
+    def report(self) -> dict:
+        """플랫폼 전체 통계 {체인: {셀렉터: 통계}}"""
+        return self._stats()
+
+    def reset(self):
+        """플랫폼 통계 삭제"""
+        self._data, self._dirty = {}, set()
+
+        def remove(data: dict):
+            data.pop(self.platform, None)
+
+        self.cache.update_with(remove)
@@ -0,0 +1,110 @@
+"""
+네이버 블로그 대체 서버 (테스트용)
+NaverHttpPublisher가 사용하는 에디터 토큰, 사진 업로드, RabbitWrite.naver와
+NaverPublisher(브라우저)가 사용하는 로그인/SmartEditor 글쓰기 페이지를 흉내냄
+"""
+import html
+import re
+import time
+from urllib.parse import parse_qs
+
+from .server import StandinServer, page
+
+
+class NaverStandin(StandinServer):
+    """로컬 HTTP 서버로 띄우는 네이버 로그인/SmartEditor ONE 페이지와 저장 API
+
+    사용 예:
+        with NaverStandin(session="valid") as server:
+            publisher = NaverHttpPublisher(cookies={"NID_SES": "valid"}, base_url=server.url, ...)
+            publisher = NaverPublisher(urls=server.publisher_urls(), ...)
+    """
+
+    SESSION_COOKIE = "NID_SES"
+    TOKEN = "se-token"
+    SESSION_KEY = "upload-key"
+
+    def __init__(self, session: str = "valid", upload_latency: float = 0.0, categories: list = None):
+        """
+        Args:
+            session: 유효한 세션 쿠키 값 (로그인 폼 제출 시 이 값으로 발급)
+            upload_latency: 사진 업로드 한 건당 지연 (초)
+            categories: 카테고리 이름 목록 (발행 설정 드롭다운)
+        """
+        super().__init__()
+        self.session = session
+        self.upload_latency = upload_latency
+        self.categories = categories or ["게시판", "맛집", "개발"]
+        self.uploads = []   # 업로드된 파일 이름
+        self.posts = []     # 저장 요청 폼 {"blogId", "documentModel", "populationParams", ...}
+
+    def publisher_urls(self) -> dict:
+        """NaverPublisher(urls=...)에 넘길 URL 덮어쓰기"""
+        return {
+            "LOGIN_URL": f"{self.url}/nidlogin.login",
+            "BLOG_WRITE_URL": f"{self.url}/{{blog_id}}/postwrite",
+        }
+
+    def _editor_page(self, blog_id: str) -> str:
+        items = "".join(
+            f'<li><label>{html.escape(name)}</label><input type="radio" name="category" value="{i}"></li>'
+            for i, name in enumerate(self.categories)
+        )
+        return (
+            page("naver_editor.html")
+            .replace("__CATEGORY_ITEMS__", items)
+            .replace("__BLOG_ID__", blog_id)
+            .replace("__SESSION_KEY__", self.SESSION_KEY)
+        )
+
+    def handle(self, request, method, body):
+        path = request.path.split("?")[0]
+
+        # 로그인 (세션 없이 접근 가능)
+        if path.startswith("/nid.naver.com") or path == "/nidlogin.login":
+            return 200, page("naver_login.html")
+        if path == "/nid/session" and method == "POST":
+            return 302, None, {
+                "Location": "/home",
+                "Set-Cookie": f"{self.SESSION_COOKIE}={self.session}; Path=/",
+            }
+        if path == "/home":
+            return 200, "<html><body>네이버 홈 (대체)</body></html>"
+
+        # 사진 업로드 서버는 세션 키로 인증
+        if path == f"/{self.SESSION_KEY}/simpleUpload/0":
+            time.sleep(self.upload_latency)
+            match = re.search(rb'filename="([^"]+)"', body)
+            name = match.group(1).decode("utf-8") if match else "file"
+            self.uploads.append(name)
+            return 200, (
+                f"<item><url>https://blogfiles.pstatic.net/standin/{name}</url>"
+                f"<path>/standin/{name}</path><fileName>{name}</fileName>"
+                "<width>8</width><height>8</height><fileSize>100</fileSize></item>"
+            ), {"Content-Type": "text/xml"}
+
+        if not self.has_cookie(request, self.SESSION_COOKIE, self.session):
+            return 302, None, {"Location": "/nid.naver.com/nidlogin.login"}
+
+        match = re.match(r"^/([^/]+)/postwrite$", path)
+        if match:
+            return 200, self._editor_page(match.group(1))
+
+        if path == "/PostWriteFormSeOptions.naver":
+            return 200, {"isSuccess": True, "result": {"token": self.TOKEN}}
+
+        if path == "/api/blogpc001/v1/photo-uploader/session-key":
+            if request.headers.get("SE-Authorization") != self.TOKEN:
+                return 401, {"isSuccess": False}
+            return 200, {"isSuccess": True, "sessionKey": self.SESSION_KEY}
+
+        if path == "/RabbitWrite.naver":
+            form = {key: values[0] for key, values in parse_qs(body.decode("utf-8")).items()}
+            self.posts.append(form)
+            log_no = 223000000000 + len(self.posts)
+            return 200, {
+                "isSuccess": True,
+                "result": {"redirectUrl": f"https://blog.naver.com/PostView.naver?blogId={form['blogId']}&logNo={log_no}"},
+            }
+
+        return 404, None
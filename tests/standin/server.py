@@ -0,0 +1,90 @@
+"""
+대체 서버 공통 기능 (테스트용)
+ThreadingHTTPServer를 임의 포트로 띄우고 요청을 handle(handler, method)로 넘김
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+PAGES_DIR = Path(__file__).parent / "pages"
+
+
+def page(name: str) -> str:
+    """대체 페이지 HTML (tests/standin/pages/)"""
+    return (PAGES_DIR / name).read_text(encoding="utf-8")
+
+
+class StandinServer:
+    """로컬 HTTP 대체 서버 베이스
+
+    하위 클래스는 handle(request, method, body)를 구현해 (상태 코드, 본문, 헤더)를 반환합니다.
+    본문이 dict면 JSON, str이면 그대로 보냅니다.
+    """
+
+    def __init__(self):
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def handle(self, request: BaseHTTPRequestHandler, method: str, body: bytes) -> tuple:
+        raise NotImplementedError
+
+    def _handler(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _dispatch(self, method: str):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0) or 0))
+                status, payload, headers = (standin.handle(self, method, body) + ({},))[:3]
+                if isinstance(payload, (dict, list)) or payload is None:
+                    data, content_type = json.dumps(payload or {}).encode("utf-8"), "application/json"
+                else:
+                    data, content_type = str(payload).encode("utf-8"), "text/html; charset=utf-8"
+                self.send_response(status)
+                self.send_header("Content-Type", (headers or {}).pop("Content-Type", content_type))
+                self.send_header("Content-Length", str(len(data)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                if method != "HEAD":
+                    self.wfile.write(data)
+
+            def do_GET(self):
+                self._dispatch("GET")
+
+            def do_POST(self):
+                self._dispatch("POST")
+
+            def do_HEAD(self):
+                self._dispatch("HEAD")
+
+        return Handler
+
+    @staticmethod
+    def has_cookie(request: BaseHTTPRequestHandler, name: str, value: str) -> bool:
+        return f"{name}={value}" in request.headers.get("Cookie", "")
+
+    def start(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
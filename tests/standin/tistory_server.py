@@ -0,0 +1,101 @@
+"""
+티스토리 대체 서버 (테스트용)
+TistoryHttpPublisher가 사용하는 /manage, attach.json, post.json과
+TistoryPublisher(브라우저)가 사용하는 로그인/글쓰기 페이지를 흉내냄
+"""
+import html
+import json
+import re
+import time
+
+from .server import StandinServer, page
+
+
+class TistoryStandin(StandinServer):
+    """로컬 HTTP 서버로 띄우는 티스토리 로그인/관리 페이지와 API
+
+    사용 예:
+        with TistoryStandin(session="valid") as server:
+            publisher = TistoryHttpPublisher(cookies={"TSSESSION": "valid"}, base_url=server.url, ...)
+            publisher = TistoryPublisher(urls=server.publisher_urls(), ...)
+    """
+
+    SESSION_COOKIE = "TSSESSION"
+
+    def __init__(self, session: str = "valid", upload_latency: float = 0.0, categories: list = None):
+        """
+        Args:
+            session: 유효한 세션 쿠키 값 (로그인 폼 제출 시 이 값으로 발급)
+            upload_latency: 첨부 업로드 한 건당 지연 (초)
+            categories: 카테고리 이름 목록 (글쓰기 페이지 드롭다운)
+        """
+        super().__init__()
+        self.session = session
+        self.upload_latency = upload_latency
+        self.categories = categories or ["일상", "맛집", "- 카페"]
+        self.uploads = []   # 업로드된 파일 이름
+        self.posts = []     # 저장 요청 payload
+        self.deleted = set()  # 삭제된 첨부 번호 (URL 확인 시 404)
+
+    def publisher_urls(self) -> dict:
+        """TistoryPublisher(urls=...)에 넘길 URL 덮어쓰기"""
+        return {
+            "LOGIN_URL": f"{self.url}/auth/login",
+            "HOME_URL": f"{self.url}/home",
+            "MANAGE_URL": f"{self.url}/manage",
+            "BLOG_WRITE_URL": f"{self.url}/manage/newpost",
+            "ATTACH_URL": f"{self.url}/manage/post/attach.json",
+        }
+
+    def _editor_page(self) -> str:
+        items = "".join(
+            f'<div class="mce-menu-item" id="category-{i + 1}" data-value="{i + 1}">'
+            f'<span class="mce-text">{html.escape(name)}</span></div>'
+            for i, name in enumerate(self.categories)
+        )
+        return page("tistory_editor.html").replace("__CATEGORY_ITEMS__", items)
+
+    def handle(self, request, method, body):
+        path = request.path.split("?")[0]
+
+        # 로그인 (세션 없이 접근 가능)
+        if path.startswith("/auth/login"):
+            return 200, page("tistory_login.html")
+        if path == "/kakao/login":
+            return 200, page("kakao_login.html")
+        if path == "/kakao/session" and method == "POST":
+            return 302, None, {
+                "Location": "/home",
+                "Set-Cookie": f"{self.SESSION_COOKIE}={self.session}; Path=/",
+            }
+        if path == "/home":
+            return 200, "<html><body>티스토리 홈 (대체)</body></html>"
+
+        # 첨부 이미지 (CDN처럼 세션 없이 접근 가능)
+        attach = re.match(r"^/attach/(\d+)/", path)
+        if attach and method in ("GET", "HEAD"):
+            number = int(attach.group(1))
+            if number > len(self.uploads) or number in self.deleted:
+                return 404, None
+            return 200, "", {"Content-Type": "image/png"}
+
+        if not self.has_cookie(request, self.SESSION_COOKIE, self.session):
+            return 302, None, {"Location": "/auth/login"}
+
+        if method == "GET":
+            if path == "/manage/newpost":
+                return 200, self._editor_page()
+            return 200, "<html><body>블로그 관리 (대체)</body></html>"
+
+        if path == "/manage/post/attach.json":
+            time.sleep(self.upload_latency)
+            match = re.search(rb'filename="([^"]+)"', body)
+            name = match.group(1).decode("utf-8") if match else "file"
+            self.uploads.append(name)
+            return 200, {"url": f"{self.url}/attach/{len(self.uploads)}/{name}"}
+
+        if path == "/manage/post.json":
+            self.posts.append(json.loads(body))
+            return 200, {"entryUrl": f"{self.url}/{100 + len(self.posts)}"}
+
+        return 404, None
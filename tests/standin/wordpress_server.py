@@ -0,0 +1,103 @@
+"""
+워드프레스 대체 서버 (테스트용)
+WordPressPublisher가 사용하는 REST API(/wp-json/wp/v2의 users/me, media, categories, tags, posts)를 흉내냄
+"""
+import base64
+import json
+import re
+import time
+from urllib.parse import parse_qs, urlparse
+
+from .server import StandinServer
+
+
+class WordPressStandin(StandinServer):
+    """로컬 HTTP 서버로 띄우는 WordPress REST API
+
+    사용 예:
+        with WordPressStandin(username="editor", app_password="abcd efgh") as server:
+            publisher = WordPressPublisher(site_url=server.url, account={"id": "editor", "password": "abcd efgh"})
+    """
+
+    API_PATH = "/wp-json/wp/v2"
+
+    def __init__(self, username: str = "editor", app_password: str = "app pass", upload_latency: float = 0.0,
+                 categories: list = None, tags: list = None):
+        """
+        Args:
+            username, app_password: 허용할 Basic 인증 정보
+            upload_latency: 미디어 업로드 한 건당 지연 (초)
+            categories: 미리 있는 카테고리 이름 목록
+            tags: 미리 있는 태그 이름 목록
+        """
+        super().__init__()
+        self.credentials = f"{username}:{app_password}"
+        self.upload_latency = upload_latency
+        self._next_id = 100
+        self.terms = {
+            "categories": {name: self._new_id() for name in (categories or ["일상", "맛집"])},
+            "tags": {name: self._new_id() for name in (tags or [])},
+        }
+        self.uploads = []     # 업로드된 파일 이름
+        self.posts = []       # 글 작성 요청 payload
+        self.requests = []    # (메서드, 경로) 요청 기록
+
+    def _new_id(self) -> int:
+        self._next_id += 1
+        return self._next_id
+
+    def _authorized(self, request) -> bool:
+        header = request.headers.get("Authorization", "")
+        if not header.startswith("Basic "):
+            return False
+        return base64.b64decode(header[6:]).decode("utf-8") == self.credentials
+
+    def handle(self, request, method, body):
+        parsed = urlparse(request.path)
+        path = parsed.path
+        query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        self.requests.append((method, path))
+
+        if not path.startswith(self.API_PATH):
+            return 404, {"code": "rest_no_route"}
+        if not self._authorized(request):
+            return 401, {"code": "rest_not_logged_in", "message": "You are not currently logged in."}
+        path = path[len(self.API_PATH):]
+
+        if path == "/users/me":
+            return 200, {"id": 1, "name": self.credentials.split(":")[0]}
+
+        if path == "/media" and method == "POST":
+            time.sleep(self.upload_latency)
+            match = re.search(rb'filename="([^"]+)"', body)
+            name = match.group(1).decode("utf-8") if match else "file"
+            self.uploads.append(name)
+            media_id = self._new_id()
+            return 201, {"id": media_id, "source_url": f"{self.url}/wp-content/uploads/{media_id}/{name}"}
+
+        taxonomy = path.strip("/")
+        if taxonomy in self.terms:
+            terms = self.terms[taxonomy]
+            if method == "GET":
+                search = query.get("search", "")
+                return 200, [{"id": term_id, "name": name} for name, term_id in terms.items() if search in name]
+            name = json.loads(body)["name"]
+            if name in terms:
+                return 400, {"code": "term_exists", "data": {"status": 400, "term_id": terms[name]}}
+            terms[name] = self._new_id()
+            return 201, {"id": terms[name], "name": name}
+
+        if path == "/posts" and method == "POST":
+            payload = json.loads(body)
+            known = {term_id for terms in self.terms.values() for term_id in terms.values()}
+            invalid = [key for key in ("categories", "tags") if set(payload.get(key, [])) - known]
+            if invalid:
+                return 400, {
+                    "code": "rest_invalid_param",
+                    "data": {"status": 400, "params": {key: "Invalid term id." for key in invalid}},
+                }
+            self.posts.append(payload)
+            post_id = 500 + len(self.posts)
+            return 201, {"id": post_id, "link": f"{self.url}/?p={post_id}", "status": payload.get("status")}
+
+        return 404, {"code": "rest_no_route"}
@@ -0,0 +1,387 @@
+"""
+브라우저 관리 테스트
+pytest tests/test_browser.py -v
+"""
+import os
+import sys
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+class TestDriverResolution:
+    """ChromeDriver 경로 결정 테스트"""
+    
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch):
+        """캐시 디렉터리를 임시 경로로 교체"""
+        monkeypatch.setattr("src.utils.cache.CACHE_DIR", tmp_path)
+        monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
+        return tmp_path
+    
+    def test_pinned_path(self, cache_dir, tmp_path, monkeypatch):
+        """CHROMEDRIVER_PATH가 있으면 그대로 사용"""
+        from src.utils.browser import BrowserManager
+        
+        driver = tmp_path / "chromedriver"
+        driver.write_text("")
+        monkeypatch.setenv("CHROMEDRIVER_PATH", str(driver))
+        
+        with patch("src.utils.browser.ChromeDriverManager") as manager:
+            assert BrowserManager.resolve_driver_path() == str(driver)
+            manager.assert_not_called()
+    
+    def test_cached_path_skips_network(self, cache_dir, tmp_path):
+        """같은 Chrome 메이저 버전이면 캐시된 경로 재사용"""
+        from src.utils.browser import BrowserManager
+        
+        driver = tmp_path / "chromedriver-120"
+        driver.write_text("")
+        
+        with patch.object(BrowserManager, "get_chrome_major_version", return_value="120"), \
+             patch("src.utils.browser.ChromeDriverManager") as manager:
+            manager.return_value.install.return_value = str(driver)
+            assert BrowserManager.resolve_driver_path() == str(driver)
+            assert BrowserManager.resolve_driver_path() == str(driver)
+            assert manager.return_value.install.call_count == 1
+    
+    def test_offline_fallback(self, cache_dir, tmp_path):
+        """설치 실패 시 캐시에 남은 드라이버 사용"""
+        from src.utils.browser import BrowserManager
+        from src.utils.cache import JsonCache
+        
+        driver = tmp_path / "chromedriver-119"
+        driver.write_text("")
+        JsonCache(BrowserManager.DRIVER_CACHE_NAME).set("119", str(driver))
+        
+        with patch.object(BrowserManager, "get_chrome_major_version", return_value="120"), \
+             patch("src.utils.browser.ChromeDriverManager") as manager:
+            manager.return_value.install.side_effect = ConnectionError("offline")
+            assert BrowserManager.resolve_driver_path() == str(driver)
+
+
+class TestLeanMode:
+    """경량 모드 차단 목록 테스트"""
+    
+    def test_platform_rules_merge(self):
+        """공통 + 플랫폼 차단 목록에서 플랫폼 허용 패턴 제외"""
+        from src.utils.browser import BrowserManager
+        
+        manager = BrowserManager(headless=True, lean=True, platform="tistory")
+        blocked = manager.get_blocked_urls()
+        
+        assert "*doubleclick.net*" in blocked
+        assert "*tiara.kakao.com*" in blocked
+        assert "*fonts.googleapis.com*" not in blocked
+        assert len(blocked) == len(set(blocked))
+    
+    def test_lean_from_env(self, monkeypatch):
+        """BROWSER_LEAN 환경변수로 경량 모드 설정"""
+        from src.utils.browser import BrowserManager
+        
+        monkeypatch.setenv("BROWSER_LEAN", "true")
+        assert BrowserManager(headless=True).lean is True
+        monkeypatch.setenv("BROWSER_LEAN", "false")
+        assert BrowserManager(headless=True).lean is False
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
+
+
+class TestDriverStats:
+    """WebDriver 명령 집계 테스트"""
+    
+    class FakeDriver:
+        def __init__(self):
+            self.calls = []
+        
+        def execute(self, driver_command, params=None):
+            self.calls.append(driver_command)
+            return {"value": None}
+    
+    def test_counts_commands_per_stage(self):
+        """단계별로 명령 수를 나눠 기록"""
+        from src.utils.driver_stats import DriverStats
+        
+        driver = self.FakeDriver()
+        stats = DriverStats(driver)
+        
+        stats.mark("title")
+        driver.execute("findElement")
+        driver.execute("sendKeysToElement")
+        stats.mark("tags")
+        driver.execute("executeScript")
+        
+        summary = stats.summary()
+        assert summary["title"]["commands"] == 2
+        assert summary["title"]["by_command"] == {"findElement": 1, "sendKeysToElement": 1}
+        assert summary["tags"]["commands"] == 1
+        assert driver.calls == ["findElement", "sendKeysToElement", "executeScript"]
+    
+    def test_stage_context_restores_previous(self):
+        """stage() 블록이 끝나면 이전 단계로 복귀"""
+        from src.utils.driver_stats import DriverStats
+        
+        driver = self.FakeDriver()
+        stats = DriverStats(driver)
+        stats.mark("body")
+        with stats.stage("images"):
+            driver.execute("executeAsyncScript")
+        driver.execute("executeScript")
+        
+        summary = stats.summary()
+        assert summary["images"]["commands"] == 1
+        assert summary["body"]["commands"] == 1
+
+
+class TestNetworkCapture:
+    """성능 로그 기반 응답 대기 테스트"""
+    
+    @staticmethod
+    def _entry(method, **params):
+        import json
+        return {"message": json.dumps({"message": {"method": method, "params": params}})}
+    
+    def test_wait_for_matching_response(self):
+        """URL 패턴이 일치하는 요청의 상태와 본문 반환"""
+        from unittest.mock import Mock
+        from src.utils.network import NetworkCapture
+        
+        driver = Mock()
+        driver.get_log.side_effect = [[
+            self._entry("Network.requestWillBeSent", requestId="1", request={"url": "https://b.tistory.com/manage/post/attach.json", "method": "POST"}),
+            self._entry("Network.requestWillBeSent", requestId="2", request={"url": "https://b.tistory.com/manage/post.json", "method": "POST"}),
+            self._entry("Network.responseReceived", requestId="2", response={"status": 200, "mimeType": "application/json"}),
+            self._entry("Network.loadingFinished", requestId="1"),
+            self._entry("Network.loadingFinished", requestId="2"),
+        ]]
+        driver.execute_cdp_cmd.return_value = {"body": '{"entryUrl": "https://b.tistory.com/7"}', "base64Encoded": False}
+        
+        response = NetworkCapture(driver).wait_for_response(r"/manage/post\.json", timeout=1)
+        
+        assert response["status"] == 200
+        assert NetworkCapture.parse_json(response["body"]) == {"entryUrl": "https://b.tistory.com/7"}
+        driver.execute_cdp_cmd.assert_called_once_with("Network.getResponseBody", {"requestId": "2"})
+    
+    def test_timeout_returns_none(self):
+        """일치하는 요청이 없으면 None"""
+        from unittest.mock import Mock
+        from src.utils.network import NetworkCapture
+        
+        driver = Mock()
+        driver.get_log.return_value = []
+        assert NetworkCapture(driver).wait_for_response(r"/RabbitWrite\.naver", timeout=0.3) is None
+
+
+class TestCdpDriver:
+    """CDP 백엔드 입력 변환 테스트 (Chrome 실행 없이 execute 호출만 확인)"""
+    
+    @pytest.fixture
+    def driver(self):
+        from collections import deque
+        from src.utils.cdp_driver import CdpDriver
+        
+        driver = CdpDriver.__new__(CdpDriver)
+        driver._pressed_modifiers = 0
+        driver._mouse_position = (0, 0)
+        driver._network_log = deque()
+        driver._events = deque()
+        driver._frames = []
+        driver.script_timeout = 30
+        driver.page_load_timeout = 300
+        driver.calls = []
+        driver.execute = lambda command, params=None, timeout=None: driver.calls.append((command, params)) or {}
+        driver._drain_events = lambda: None
+        return driver
+    
+    def test_type_batches_plain_text(self, driver):
+        """일반 문자는 insertText 한 번, 특수 키는 키 이벤트로"""
+        from selenium.webdriver.common.keys import Keys
+        
+        driver._type("태그1" + Keys.ENTER)
+        
+        assert driver.calls[0] == ("Input.insertText", {"text": "태그1"})
+        assert [c[1]["type"] for c in driver.calls[1:]] == ["keyDown", "keyUp"]
+        assert driver.calls[1][1]["key"] == "Enter"
+    
+    def test_action_chains_shortcut(self, driver):
+        """ActionChains 단축키(Ctrl+V)는 수정 키 비트와 함께 전달"""
+        from selenium.webdriver.common.action_chains import ActionChains
+        from selenium.webdriver.common.keys import Keys
+        from src.utils.cdp_driver import CdpDriver
+        
+        driver.execute = lambda command, params=None, timeout=None: (
+            CdpDriver.execute(driver, command, params) if command == "actions"
+            else driver.calls.append((command, params)) or {}
+        )
+        ActionChains(driver, duration=0).key_down(Keys.CONTROL).send_keys("v").key_up(Keys.CONTROL).perform()
+        
+        key_events = [c[1] for c in driver.calls if c[0] == "Input.dispatchKeyEvent"]
+        paste = [e for e in key_events if e["key"] == "v"]
+        assert paste and all(e["modifiers"] == 2 for e in paste)
+        assert key_events[-1]["key"] == "Control" and driver._pressed_modifiers == 0
+    
+    def test_performance_log_format(self, driver):
+        """get_log('performance')는 chromedriver와 같은 형식이라 NetworkCapture에서 그대로 사용"""
+        from src.utils.network import NetworkCapture
+        
+        driver._handle_event({"method": "Network.requestWillBeSent", "params": {
+            "requestId": "9", "request": {"url": "https://blog.naver.com/RabbitWrite.naver", "method": "POST"}}})
+        driver._handle_event({"method": "Network.loadingFinished", "params": {"requestId": "9"}})
+        
+        events = NetworkCapture(driver)._read_events()
+        assert [e["method"] for e in events] == ["Network.requestWillBeSent", "Network.loadingFinished"]
+        assert driver.get_log("performance") == []
+    
+    def test_async_script_waits_script_timeout(self, driver):
+        """비동기 스크립트 응답은 페이지 로드 시간(300초)이 아닌 스크립트 시간만큼 대기"""
+        timeouts = []
+        driver.execute = lambda command, params=None, timeout=None: timeouts.append((command, timeout)) or {
+            "result": {"type": "undefined"}
+        }
+        driver.set_script_timeout(12)
+        driver.execute_async_script("arguments[0](1);")
+        assert timeouts == [("Runtime.evaluate", 12)]
+    
+    def test_parent_frame_returns_to_outer_iframe(self, driver):
+        """중첩 iframe에서 parent_frame()은 바깥 iframe으로 (최상위에서는 그대로)"""
+        from src.utils.cdp_driver import CdpElement, CdpSwitchTo
+        
+        outer, inner = CdpElement(driver, "outer"), CdpElement(driver, "inner")
+        switch_to = CdpSwitchTo(driver)
+        switch_to.frame(outer)
+        switch_to.frame(inner)
+        assert driver._frame is inner
+        switch_to.parent_frame()
+        assert driver._frame is outer
+        switch_to.parent_frame()
+        switch_to.parent_frame()
+        assert driver._frame is None
+    
+    def test_unsupported_locator_is_invalid_selector(self, driver):
+        from selenium.common.exceptions import InvalidSelectorException
+        
+        with pytest.raises(InvalidSelectorException):
+            driver.find_elements("shadow", "x")
+
+
+class TestBrowserRecycling:
+    """장시간 배치용 브라우저 메모리/재시작 기준 테스트"""
+    
+    class FakeDriver:
+        def __init__(self, heap_bytes=50 * 1024 * 1024):
+            self.heap_bytes = heap_bytes
+            self.visited = []
+        
+        def execute_cdp_cmd(self, cmd, args):
+            if cmd == "Performance.getMetrics":
+                return {"metrics": [{"name": "JSHeapUsedSize", "value": self.heap_bytes}]}
+            return {}
+        
+        def get(self, url):
+            self.visited.append(url)
+    
+    def _manager(self, monkeypatch, **env):
+        from src.utils.browser import BrowserManager
+        
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+        manager = BrowserManager(headless=True, backend="cdp")
+        manager.driver = self.FakeDriver()
+        return manager
+    
+    def test_recycle_after_n_uses(self, monkeypatch):
+        """BROWSER_RECYCLE_AFTER회 발행 후 재시작"""
+        manager = self._manager(monkeypatch, BROWSER_RECYCLE_AFTER="2", BROWSER_MAX_RSS_MB="0")
+        
+        usage = manager.record_use()
+        assert usage["js_heap_mb"] == 50.0
+        assert manager.recycle_reason() is None
+        manager.record_use()
+        assert manager.recycle_reason() == "발행 2회"
+    
+    def test_recycle_above_rss(self, monkeypatch):
+        """RSS가 BROWSER_MAX_RSS_MB 이상이면 재시작"""
+        manager = self._manager(monkeypatch, BROWSER_RECYCLE_AFTER="0", BROWSER_MAX_RSS_MB="1000")
+        
+        manager.last_memory = {"rss_mb": 999.0}
+        assert manager.recycle_reason() is None
+        manager.last_memory = {"rss_mb": 1500.0}
+        assert "RSS" in manager.recycle_reason()
+    
+    def test_reset_tabs_navigates_blank(self, monkeypatch):
+        """탭 재사용: 새 창 없이 빈 페이지로 이동"""
+        manager = self._manager(monkeypatch)
+        manager.reset_tabs()
+        assert manager.driver.visited == ["about:blank"]
+
+
+class TestZombieCleanup:
+    """드라이버 좀비 프로세스 회수 테스트"""
+    
+    @pytest.mark.skipif(not hasattr(os, "waitid"), reason="os.waitid 필요 (POSIX)")
+    def test_reaps_only_own_driver_processes(self, monkeypatch):
+        """이 모듈이 띄운 드라이버만 회수하고 다른 subprocess 자식의 종료 코드는 남김"""
+        import subprocess
+        from src.utils.browser import BrowserManager
+        
+        monkeypatch.setattr(BrowserManager, "_driver_processes", [])
+        monkeypatch.setattr("src.utils.browser.psutil", None)
+        
+        driver = subprocess.Popen([sys.executable, "-c", "pass"])
+        other = subprocess.Popen([sys.executable, "-c", "raise SystemExit(3)"])
+        BrowserManager._driver_processes.append(driver)
+        for process in (driver, other):
+            os.waitid(os.P_PID, process.pid, os.WEXITED | os.WNOWAIT)  # 회수하지 않고 종료만 대기
+        
+        assert BrowserManager.cleanup_zombie_drivers() == 1
+        assert driver.returncode == 0 and BrowserManager._driver_processes == []
+        assert other.wait() == 3
+    
+    def test_kills_only_recorded_drivers_of_finished_runs(self, monkeypatch, tmp_path):
+        """기록된 PID 중 띄운 실행이 끝난 드라이버만 종료 (다른 chromedriver, 재사용된 PID는 그대로)"""
+        from types import SimpleNamespace
+        from src.utils.browser import BrowserManager
+        
+        class FakeError(Exception):
+            pass
+        
+        started = {os.getpid(): 1.0, 100: 5.0, 200: 9.0, 300: 7.0, 400: 3.0}  # 실행 중인 프로세스
+        killed = []
+        
+        class FakeProcess:
+            def __init__(self, pid):
+                if pid not in started:
+                    raise FakeError(pid)
+                self.pid = pid
+            
+            def create_time(self):
+                return started[self.pid]
+            
+            def children(self, recursive=False):
+                return []
+            
+            def kill(self):
+                killed.append(self.pid)
+        
+        monkeypatch.setattr("src.utils.cache.CACHE_DIR", tmp_path)
+        monkeypatch.setattr("src.utils.browser.psutil", SimpleNamespace(Process=FakeProcess, Error=FakeError))
+        monkeypatch.setattr(BrowserManager, "_driver_processes", [])
+        
+        BrowserManager._record_driver_pid(300)  # 이 실행의 드라이버
+        from src.utils.cache import JsonCache
+        JsonCache(BrowserManager.DRIVER_PID_CACHE_NAME).update({
+            "100": {"started": 5.0, "owner": 99, "owner_started": 2.0},   # 끝난 실행이 남김
+            "200": {"started": 4.0, "owner": 99, "owner_started": 2.0},   # PID 재사용
+        })
+        
+        assert BrowserManager.cleanup_zombie_drivers() == 1
+        assert killed == [100]  # 400은 기록되지 않은 다른 chromedriver
+        assert list(JsonCache(BrowserManager.DRIVER_PID_CACHE_NAME).load()) == ["300"]
+        
+        BrowserManager._forget_driver_pid(300)
+        assert JsonCache(BrowserManager.DRIVER_PID_CACHE_NAME).load() == {}
@@ -0,0 +1,127 @@
+"""
+여러 블로그 동시 발행(fan-out) 테스트
+pytest tests/test_fanout.py -v
+"""
+import json
+import sys
+import threading
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.publishers.base import PublishResult
+
+
+ACCOUNTS = {
+    "tistory": [
+        {"name": "main", "id": "a@kakao", "password_env": "TEST_MAIN_PW", "blogs": ["blog-a", "blog-b"]},
+        {"name": "sub", "id": "b@kakao", "password": "pw", "blogs": ["blog-c"]},
+        {"name": "broken", "id": "c@kakao", "password_env": "TEST_MISSING_PW", "blogs": ["blog-d"]},
+    ]
+}
+
+
+class FakePublisher:
+    """업로드 URL 캐시를 흉내내는 발행자"""
+    
+    instances = []
+    lock = threading.Lock()
+    
+    def __init__(self, account, blog, image_url_cache):
+        self.account = account
+        self.blog_name = blog
+        self.image_url_cache = image_url_cache
+        self.logins = 0
+        self.uploads = 0
+        with self.lock:
+            self.instances.append(self)
+    
+    def login(self):
+        self.logins += 1
+        return True
+    
+    def publish(self, title, content, category=None, tags=None, images=None):
+        for image in images or []:
+            if image not in self.image_url_cache:
+                self.uploads += 1
+                self.image_url_cache[image] = f"https://cdn/{image}"
+        return PublishResult(True, platform="tistory", url=f"https://{self.blog_name}.tistory.com/1")
+    
+    def logout(self):
+        pass
+
+
+def fake_factory(platform, account, blog, headless, lean, image_url_cache):
+    return FakePublisher(account, blog, image_url_cache)
+
+
+def write_accounts(tmp_path, monkeypatch):
+    path = tmp_path / "accounts.json"
+    path.write_text(json.dumps(ACCOUNTS), encoding="utf-8")
+    monkeypatch.setenv("BLOG_ACCOUNTS_FILE", str(path))
+    monkeypatch.setenv("TEST_MAIN_PW", "secret")
+    monkeypatch.delenv("TEST_MISSING_PW", raising=False)
+
+
+def test_load_accounts(tmp_path, monkeypatch):
+    """password_env로 비밀번호를 읽고 비밀번호가 없는 계정은 제외"""
+    from src.utils.accounts import load_accounts, find_account
+    
+    write_accounts(tmp_path, monkeypatch)
+    accounts = load_accounts("tistory")
+    
+    assert [a["name"] for a in accounts] == ["main", "sub"]
+    assert accounts[0]["password"] == "secret"
+    assert find_account("tistory", "blog-b")["id"] == "a@kakao"
+
+
+def test_naver_account_has_only_its_own_blog(tmp_path, monkeypatch):
+    """네이버 계정에 blogs를 여러 개 적어도 아이디 블로그 하나에만 발행"""
+    from src.publishers.fanout import resolve_targets
+    
+    path = tmp_path / "accounts.json"
+    path.write_text(json.dumps({
+        "naver": [{"name": "main", "id": "naver_a", "password": "pw", "blogs": ["naver_a", "other"]}]
+    }), encoding="utf-8")
+    monkeypatch.setenv("BLOG_ACCOUNTS_FILE", str(path))
+    
+    groups, missing = resolve_targets("naver")
+    assert [(account["id"], targets) for account, targets in groups] == [("naver_a", ["naver_a"])]
+    assert missing == []
+
+
+def test_env_fallback(tmp_path, monkeypatch):
+    """설정 파일이 없으면 기존 환경변수 계정"""
+    from src.utils.accounts import load_accounts
+    
+    monkeypatch.setenv("BLOG_ACCOUNTS_FILE", str(tmp_path / "none.json"))
+    monkeypatch.setenv("TISTORY_ID", "env@kakao")
+    monkeypatch.setenv("TISTORY_PASSWORD", "pw")
+    monkeypatch.setenv("TISTORY_BLOG_NAME", "env-blog")
+    
+    assert load_accounts("tistory") == [
+        {"name": "default", "id": "env@kakao", "password": "pw", "blogs": ["env-blog"]}
+    ]
+
+
+def test_fan_out_one_login_per_account(tmp_path, monkeypatch):
+    """같은 계정의 블로그는 로그인 한 번, 이미지는 한 번만 업로드"""
+    from src.publishers.fanout import fan_out
+    
+    write_accounts(tmp_path, monkeypatch)
+    FakePublisher.instances = []
+    
+    results = fan_out(
+        "tistory", "제목", "본문", images=["a.png", "b.png"],
+        blogs=["blog-a", "blog-b", "blog-c", "blog-x"], publisher_factory=fake_factory,
+    )
+    
+    assert list(results) == ["blog-a", "blog-b", "blog-c", "blog-x"]
+    assert results["blog-b"].url == "https://blog-b.tistory.com/1"
+    assert results["blog-c"]
+    assert not results["blog-x"] and results["blog-x"].error == "계정 설정 없음"
+    
+    assert len(FakePublisher.instances) == 2
+    assert all(p.logins == 1 for p in FakePublisher.instances)
+    assert sum(p.uploads for p in FakePublisher.instances) == 2
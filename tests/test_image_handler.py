@@ -0,0 +1,100 @@
+"""
+이미지 전처리 테스트
+pytest tests/test_image_handler.py -v
+"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.media.image_handler import ImagePreprocessor, cache_dir_for
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def make_post(tmp_path) -> Path:
+    media = tmp_path / "post" / "media"
+    media.mkdir(parents=True)
+    return media
+
+
+def noisy_jpeg(path: Path, size, orientation: int = None) -> str:
+    """재압축 효과가 보이도록 잡음이 있는 JPEG"""
+    img = Image.frombytes("RGB", size, os.urandom(size[0] * size[1] * 3))
+    exif = Image.Exif()
+    if orientation:
+        exif[274] = orientation
+    img.save(path, "JPEG", quality=100, exif=exif.tobytes())
+    return str(path)
+
+
+def test_large_and_rotated_images_are_resized_with_same_name(tmp_path):
+    media = make_post(tmp_path)
+    large = noisy_jpeg(media / "1.큰사진.jpg", (2400, 1200))
+    rotated = noisy_jpeg(media / "2.세로.jpg", (300, 200), orientation=6)
+
+    result = ImagePreprocessor(enabled=True, workers=2).prepare([large, rotated], "naver")
+
+    cache_dir = cache_dir_for(large, "naver")
+    assert cache_dir == tmp_path / "post" / ".cache" / "images" / "naver"
+    assert result == [str(cache_dir / "1.큰사진.jpg"), str(cache_dir / "2.세로.jpg")]
+
+    with Image.open(result[0]) as img:
+        assert max(img.size) == 2000
+        assert img.format == "JPEG"
+    assert os.path.getsize(result[0]) <= 1500 * 1024
+    with Image.open(result[1]) as img:
+        assert img.size == (200, 300)
+        assert img.getexif().get(274, 1) == 1
+
+
+def test_process_pool_results_are_used_without_fallback(tmp_path, monkeypatch):
+    """프로세스 풀 결과를 그대로 쓰고 순서대로 다시 처리하지 않음"""
+    media = make_post(tmp_path)
+    images = [noisy_jpeg(media / f"{i}.jpg", (2200, 1000)) for i in range(3)]
+
+    def fail(self, args):
+        raise AssertionError("순서대로 처리로 대체됨")
+
+    monkeypatch.setattr(ImagePreprocessor, "_run_sequential", fail)
+    result = ImagePreprocessor(enabled=True, workers=2).prepare(images, "naver")
+
+    cache_dir = cache_dir_for(images[0], "naver")
+    assert result == [str(cache_dir / f"{i}.jpg") for i in range(3)]
+
+
+def test_small_image_keeps_original_and_results_are_reused(tmp_path):
+    media = make_post(tmp_path)
+    small = str(media / "작은.png")
+    Image.new("RGB", (50, 50), "blue").save(small)
+    large = noisy_jpeg(media / "큰.jpg", (2000, 1000))
+
+    preprocessor = ImagePreprocessor(enabled=True, workers=1)
+    first = preprocessor.prepare_many([small, large], ["naver", "tistory"])
+    assert first["naver"][0] == small and first["tistory"][0] == small
+    assert first["naver"][1] != first["tistory"][1]
+
+    # 바뀌지 않은 이미지는 manifest로 재사용 (결과 파일을 다시 쓰지 않음)
+    processed = Path(first["tistory"][1])
+    mtime = processed.stat().st_mtime_ns
+    assert preprocessor.prepare([small, large], "tistory") == first["tistory"]
+    assert processed.stat().st_mtime_ns == mtime
+
+    # 원본이 바뀌면 다시 처리
+    noisy_jpeg(media / "큰.jpg", (1000, 500), orientation=3)
+    result = preprocessor.prepare([large], "tistory")
+    with Image.open(result[0]) as img:
+        assert img.size == (1000, 500)
+
+
+def test_disabled_or_broken_images_fall_back_to_original(tmp_path):
+    media = make_post(tmp_path)
+    broken = media / "깨진.jpg"
+    broken.write_bytes(b"not an image")
+
+    assert ImagePreprocessor(enabled=False).prepare([str(broken)], "naver") == [str(broken)]
+    assert ImagePreprocessor(enabled=True, workers=1).prepare([str(broken)], "naver") == [str(broken)]
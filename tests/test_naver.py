@@ -0,0 +1,278 @@
+"""
+네이버 발행자 테스트
+pytest tests/test_naver.py -v
+"""
+import sys
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+class TestNaverPublisher:
+    """NaverPublisher 단위 테스트"""
+    
+    @pytest.fixture
+    def mock_env(self, monkeypatch):
+        """테스트용 환경변수 설정"""
+        monkeypatch.setenv("NAVER_ID", "testid")
+        monkeypatch.setenv("NAVER_PASSWORD", "testpassword")
+    
+    def test_missing_credentials(self, monkeypatch):
+        """환경변수 미설정 시 예외 발생"""
+        monkeypatch.delenv("NAVER_ID", raising=False)
+        monkeypatch.delenv("NAVER_PASSWORD", raising=False)
+        
+        with patch('src.publishers.naver.BrowserManager'):
+            from src.publishers.naver import NaverPublisher
+            with pytest.raises(ValueError):
+                NaverPublisher(headless=True)
+    
+    def test_find_image_path(self):
+        """이미지 마커 이름으로 파일 경로 찾기"""
+        from src.publishers.naver import NaverPublisher
+        
+        image_map = {"1.카페로고.jpg": "/m/1.jpg", "2.내부 인테리어.jpg": "/m/2.jpg"}
+        
+        assert NaverPublisher._find_image_path("1.카페로고.jpg", image_map) == "/m/1.jpg"
+        assert NaverPublisher._find_image_path("2.내부인테리어.jpg", image_map) == "/m/2.jpg"
+        assert NaverPublisher._find_image_path("3.메뉴판.jpg", image_map) is None
+
+    def test_parse_publish_response(self):
+        """발행 API 응답에서 성공 여부와 글 주소 추출"""
+        from src.publishers.naver import NaverPublisher
+        
+        body = '{"isSuccess": true, "result": {"redirectUrl": "https://blog.naver.com/PostView.naver?blogId=me&logNo=223456"}}'
+        assert NaverPublisher._parse_publish_response({"status": 200, "body": body}, "me") == (
+            True, "https://blog.naver.com/me/223456", "223456", None
+        )
+        
+        body = '{"isSuccess": false, "result": {"errorMessage": "금칙어가 포함되어 있습니다"}}'
+        success, url, post_id, error = NaverPublisher._parse_publish_response({"status": 200, "body": body}, "me")
+        assert not success and error == "금칙어가 포함되어 있습니다"
+
+
+class TestBodyHtml:
+    """본문 붙여넣기용 HTML 변환 테스트"""
+    
+    def test_paragraphs_to_html(self):
+        """헤딩은 굵게, 문단 사이 빈 줄, HTML 이스케이프"""
+        from src.publishers.naver import NaverPublisher
+        
+        html = NaverPublisher._paragraphs_to_html(["## 영업 정보", "가격 <1만원> **추천**"])
+        
+        assert html == (
+            "<p><b>영업 정보</b></p><p><br></p>"
+            "<p>가격 &lt;1만원&gt; <b>추천</b></p><p><br></p>"
+        )
+    
+    def test_line_breaks_in_paragraph(self):
+        """문단 내 줄바꿈은 별도 줄로 유지"""
+        from src.publishers.naver import NaverPublisher
+        
+        html = NaverPublisher._paragraphs_to_html(["- 주차 가능\n- 예약 불가"])
+        assert html == "<p>- 주차 가능</p><p>- 예약 불가</p><p><br></p>"
+    
+    def test_clean_paragraph(self):
+        """키 입력용 텍스트는 마크다운 기호 제거"""
+        from src.publishers.naver import NaverPublisher
+        
+        assert NaverPublisher._clean_paragraph("### **제목**") == "제목"
+
+    
+    def test_untyped_paragraphs_after_partial_paste(self):
+        """붙여넣기로 이미 들어간 글자 수만큼 키 입력에서 제외"""
+        from src.publishers.naver import NaverPublisher
+        
+        paragraphs = ["## 제목", "첫 문단 **강조**", "둘째 문단"]
+        assert NaverPublisher._untyped_paragraphs(paragraphs, 0) == paragraphs
+        assert NaverPublisher._untyped_paragraphs(paragraphs, 2) == ["첫 문단 **강조**", "둘째 문단"]
+        assert NaverPublisher._untyped_paragraphs(paragraphs, 5) == [" 강조", "둘째 문단"]
+        assert NaverPublisher._untyped_paragraphs(paragraphs, 100) == []
+    
+    def test_paste_timeout_does_not_retype_applied_text(self, monkeypatch):
+        """붙여넣기 확인 시간이 지난 뒤 반영됐으면 키 입력으로 다시 넣지 않음"""
+        monkeypatch.setenv("NAVER_ID", "testid")
+        monkeypatch.setenv("NAVER_PASSWORD", "testpassword")
+        from src.publishers.naver import NaverPublisher
+        
+        with patch('src.publishers.naver.BrowserManager'):
+            publisher = NaverPublisher(headless=True)
+        lengths = iter([10, 10 + len("첫문단둘째문단")])
+        publisher._text_length = lambda: next(lengths)
+        publisher._paste_html = lambda html, plain_text, before=None: False
+        typed = []
+        publisher._type_paragraphs = typed.extend
+        
+        publisher._insert_text_chunk(["첫 문단", "둘째 문단"])
+        assert typed == []
+
+
+class TestCodeBlocks:
+    """소스코드 블록 삽입 테스트"""
+    
+    @pytest.fixture
+    def publisher(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("NAVER_ID", "testid")
+        monkeypatch.setenv("NAVER_PASSWORD", "testpassword")
+        from src.publishers.naver import NaverPublisher
+        from src.utils.selector_registry import SelectorRegistry
+        
+        with patch('src.publishers.naver.BrowserManager'):
+            publisher = NaverPublisher(headless=True)
+        publisher.selectors = SelectorRegistry("naver", cache_dir=tmp_path)
+        publisher.driver = type("Driver", (), {"set_script_timeout": lambda self, t: None})()
+        # 두 번째 후보 버튼만 페이지에 있음
+        publisher.driver.execute_async_script = lambda script, buttons, *args: {
+            "button": buttons.index(".se-code-toolbar-button"), "ms": 40
+        }
+        return publisher
+    
+    def test_fast_path_records_timing_and_selector(self, publisher):
+        """스크립트 한 번으로 삽입하고 블록별 시간과 성공한 버튼 셀렉터 기록"""
+        with patch('selenium.webdriver.common.action_chains.ActionChains', FakeActions):
+            assert publisher._insert_code_block("print(1)", "python")
+            assert publisher._insert_code_block("print(2)", "python")
+        
+        buttons = publisher.CODE_BUTTON_SELECTORS
+        assert publisher.selectors.order("code_button", buttons)[0] == buttons[1]
+        
+        from src.publishers.base import PublishResult
+        publisher.last_result = PublishResult(True, platform="naver")
+        publisher._report_code_blocks()
+        summary = publisher.last_result.metrics["code_blocks"]
+        assert summary["count"] == 2 and summary["fast"] == 2
+    
+    def test_falls_back_to_stepwise(self, publisher):
+        """스크립트 삽입이 실패하면 단계별 방식으로 대체"""
+        publisher.driver.execute_async_script = lambda *args: {"button": -1, "error": "no button"}
+        calls = []
+        publisher._insert_code_block_stepwise = lambda code, language: calls.append(code) or True
+        
+        with patch('selenium.webdriver.common.action_chains.ActionChains', FakeActions):
+            assert publisher._insert_code_block("x = 1", "python")
+        
+        assert calls == ["x = 1"]
+        assert publisher._code_block_timings[0][0] == "stepwise"
+
+
+    def test_script_timeout_is_restored(self, publisher):
+        """비동기 스크립트용으로 늘린 대기 시간은 실패해도 원래 값으로 복원"""
+        timeouts = []
+        publisher.driver.script_timeout = 30
+        publisher.driver.set_script_timeout = timeouts.append
+        
+        publisher._execute_async_script(120, "script", [".se-code-toolbar-button"])
+        
+        def fail(*args):
+            raise TimeoutError("script timeout")
+        publisher.driver.execute_async_script = fail
+        with pytest.raises(TimeoutError):
+            publisher._execute_async_script(60, "script")
+        
+        assert timeouts == [120, 30, 60, 30]
+
+
+class TestImageBatch:
+    """이미지 일괄 업로드 테스트"""
+    
+    @pytest.fixture
+    def publisher(self, monkeypatch):
+        monkeypatch.setenv("NAVER_ID", "testid")
+        monkeypatch.setenv("NAVER_PASSWORD", "testpassword")
+        from src.publishers.naver import NaverPublisher
+        
+        with patch('src.publishers.naver.BrowserManager'):
+            publisher = NaverPublisher(headless=True)
+        publisher.driver = type("Driver", (), {
+            "set_script_timeout": lambda self, t: None,
+            "execute_script": lambda self, *args: None,
+        })()
+        file_input = type("Input", (), {"send_keys": lambda self, keys: None})()
+        publisher._find_image_file_input = lambda: file_input
+        return publisher
+    
+    @staticmethod
+    def _images(tmp_path, names):
+        image_map = {}
+        for name in names:
+            (tmp_path / name).write_bytes(b"x")
+            image_map[name] = str(tmp_path / name)
+        return image_map
+    
+    def _insert(self, publisher, names, image_map, results):
+        """일괄 업로드 결과를 차례로 돌려주고 (커서 이동, 업로드) 호출 순서를 기록"""
+        calls = []
+        results = iter(results)
+        file_name = lambda src: src.split("?")[0].rsplit("/", 1)[-1]
+        
+        def upload(*args):
+            result = next(results)
+            calls.append(("upload", [file_name(src) for src in result["srcs"]]))
+            return result
+        
+        publisher.driver.execute_async_script = upload
+        publisher._select_image_component = lambda src, before=False: calls.append(
+            ("before" if before else "after", file_name(src))
+        ) or True
+        publisher._upload_image = lambda name, image_map: calls.append(("single", name)) or True
+        
+        with patch('selenium.webdriver.common.action_chains.ActionChains', FakeActions), patch('time.sleep'):
+            publisher._insert_images(names, image_map)
+        return calls
+    
+    def test_partial_batch_retries_missing_image_in_its_slot(self, publisher, tmp_path):
+        """일괄 업로드에서 빠진 이미지는 앞 이미지 뒤에 다시 올리고 커서는 묶음 끝으로"""
+        names = ["a.png", "b.png", "c.png"]
+        calls = self._insert(publisher, names, self._images(tmp_path, names), [
+            {"timeout": True, "count": 2,
+             "srcs": ["https://blogfiles.pstatic.net/MjAy/a.png?type=w1", "https://blogfiles.pstatic.net/MjAy/c.png"]},
+            {"count": 1, "srcs": ["https://blogfiles.pstatic.net/MjAy/b.png"]},
+        ])
+        
+        assert calls == [
+            ("upload", ["a.png", "c.png"]),
+            ("after", "a.png"), ("upload", ["b.png"]),
+            ("after", "c.png"),
+        ]
+    
+    def test_missing_first_image_goes_before_next_image(self, publisher, tmp_path):
+        """첫 이미지가 빠지면 다음 이미지 앞에 올리고, 다시 실패하면 기존 방식으로 재시도"""
+        names = ["a.png", "b.png"]
+        calls = self._insert(publisher, names, self._images(tmp_path, names), [
+            {"timeout": True, "count": 1, "srcs": ["https://blogfiles.pstatic.net/MjAy/b.png"]},
+            {"timeout": True, "count": 0, "srcs": []},
+        ])
+        
+        assert calls == [
+            ("upload", ["b.png"]),
+            ("before", "b.png"), ("upload", []), ("single", "a.png"),
+            ("after", "b.png"),
+        ]
+    
+    def test_unnamed_cdn_urls_assume_selection_order(self):
+        from src.publishers.naver import NaverPublisher
+        
+        found = [("a", "/m/a.png"), ("b", "/m/b.png"), ("c", "/m/c.png")]
+        assert NaverPublisher._arrived_images(found, ["https://cdn/x1", "https://cdn/x2"]) == {
+            "a": "https://cdn/x1", "b": "https://cdn/x2"
+        }
+
+
+class FakeActions:
+    """키 입력 없이 호출만 받는 ActionChains"""
+    
+    def __init__(self, driver):
+        pass
+    
+    def send_keys(self, *keys):
+        return self
+    
+    def perform(self):
+        pass
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
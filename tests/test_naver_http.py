@@ -0,0 +1,110 @@
+"""
+네이버 HTTP 발행자 테스트 (로컬 대체 서버)
+pytest tests/test_naver_http.py -v
+"""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import src.utils.cache as cache_module
+from src.publishers.base import PublishResult
+from src.publishers.naver_http import NaverHttpPublisher
+from tests.standin.naver_server import NaverStandin
+
+ACCOUNT = {"id": "tester", "password": "pw"}
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_module, "CACHE_DIR", tmp_path / "cache")
+
+
+def make_image(path: Path):
+    from PIL import Image
+    Image.new("RGB", (8, 8), "red").save(path)
+    return str(path)
+
+
+def make_publisher(server, cookies, **kwargs):
+    return NaverHttpPublisher(cookies=cookies, base_url=server.url, account=ACCOUNT, headless=True, **kwargs)
+
+
+def test_publish_over_http(tmp_path):
+    """세션 쿠키로 토큰 발급 + 사진 업로드 + 문서 저장"""
+    images = [make_image(tmp_path / "a.png"), make_image(tmp_path / "b.png")]
+    content = "## 소제목\n\n**굵게** 본문\n\n[IMAGE: a.png]\n\n```python\nprint(1)\n```\n\n[IMAGE: b.png]"
+    
+    with NaverStandin(session="valid") as server:
+        publisher = make_publisher(server, {"NID_SES": "valid"}, visibility="private")
+        result = publisher.publish(title="제목", content=content, tags=["a", "b"], images=images)
+        publisher.logout()
+    
+    assert result and result.post_id == "223000000001"
+    assert result.url == "https://blog.naver.com/tester/223000000001"
+    assert sorted(server.uploads) == ["a.png", "b.png"]
+    
+    form = server.posts[0]
+    assert form["blogId"] == "tester"
+    components = json.loads(form["documentModel"])["document"]["components"]
+    assert [c["@ctype"] for c in components] == ["documentTitle", "text", "text", "image", "code", "image"]
+    assert components[0]["title"][0]["nodes"][0]["value"] == "제목"
+    assert components[1]["value"][0]["nodes"][0]["style"]["bold"] is True
+    assert components[3]["represent"] is True and components[5]["represent"] is False
+    assert components[4]["language"] == "python"
+    
+    population = json.loads(form["populationParams"])
+    assert population["configuration"]["openType"] == 0
+    assert population["populationMeta"]["tags"] == "a,b"
+
+
+def test_republish_reuses_uploaded_photos(tmp_path):
+    """이미 올린 사진은 업로드 URL 캐시에서 재사용"""
+    images = [make_image(tmp_path / "a.png")]
+    
+    with NaverStandin(session="valid") as server:
+        publisher = make_publisher(server, {"NID_SES": "valid"})
+        assert publisher.publish(title="첫 발행", content="[IMAGE: a.png]", images=images)
+        assert publisher.publish(title="재발행", content="[IMAGE: a.png]", images=images)
+    
+    assert server.uploads == ["a.png"]
+    first, second = (json.loads(form["documentModel"])["document"]["components"][1] for form in server.posts)
+    assert first["src"] == second["src"]
+
+
+def test_rejected_session_falls_back(monkeypatch):
+    """세션이 거부되면 브라우저 발행으로 대체"""
+    calls = []
+    
+    def fake_browser_publish(self, title, content, category, tags, images):
+        calls.append(title)
+        return PublishResult(True, platform="naver", url="https://blog.naver.com/tester/1")
+    
+    monkeypatch.setattr(NaverHttpPublisher, "_publish_with_browser", fake_browser_publish)
+    
+    with NaverStandin(session="valid") as server:
+        publisher = make_publisher(server, {"NID_SES": "expired"})
+        result = publisher.publish(title="제목", content="본문")
+        
+        assert result.url == "https://blog.naver.com/tester/1"
+        assert calls == ["제목"]
+        assert server.posts == []
+        
+        publisher = make_publisher(server, {"NID_SES": "expired"}, fallback=False)
+        result = publisher.publish(title="제목", content="본문")
+        assert not result and "세션" in result.error
+
+
+def test_split_blocks():
+    """문단/이미지/코드 블록 분리"""
+    blocks = NaverHttpPublisher._split_blocks("첫 문단\n\n[IMAGE: a.png]\n\n```js\nx()\n```\n끝")
+    assert blocks == [
+        ("text", "첫 문단", None),
+        ("image", "a.png", None),
+        ("code", "x()", "js"),
+        ("text", "끝", None),
+    ]
@@ -0,0 +1,108 @@
+"""
+브라우저 성능 지표 수집 테스트
+pytest tests/test_perf_metrics.py -v
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.perf_metrics import PerfRecorder, summarize_history
+
+
+class FakeDriver:
+    """타이밍 스크립트와 CDP 명령에 고정 값을 돌려주는 드라이버"""
+    
+    def execute_script(self, script, *args):
+        if script == PerfRecorder.PAGE_TIMING_SCRIPT:
+            return {
+                "url": "https://blog.example/manage/newpost",
+                "navigation": {"ttfb_ms": 120, "dom_content_loaded_ms": 900, "load_ms": 1500, "transfer_kb": 40},
+                "resources": {"count": 30, "transfer_kb": 800, "by_type": {}, "slowest": []},
+            }
+        return [
+            {"start": 1000, "end": 1800, "ms": 800, "transfer_kb": 1},
+            {"start": 1100, "end": 2200, "ms": 1100, "transfer_kb": 1},
+        ]
+    
+    def execute_cdp_cmd(self, cmd, args):
+        if cmd == "Performance.getMetrics":
+            return {"metrics": [
+                {"name": "ScriptDuration", "value": 0.45},
+                {"name": "JSHeapUsedSize", "value": 20 * 1024 * 1024},
+                {"name": "Documents", "value": 3},
+            ]}
+        return {}
+
+
+def test_capture_page_and_requests():
+    """페이지 타이밍 + CDP 지표, 요청 묶음 요약"""
+    recorder = PerfRecorder(enabled=True)
+    driver = FakeDriver()
+    
+    page = recorder.capture_page(driver, "newpost")
+    assert page["navigation"]["load_ms"] == 1500
+    assert page["cdp"] == {"script_ms": 450, "js_heap_mb": 20.0}
+    
+    upload = recorder.capture_requests(driver, "upload", r"/attach\.json")
+    assert upload == {"count": 2, "total_ms": 1200, "avg_ms": 950, "max_ms": 1100, "transfer_kb": 2}
+    
+    assert set(recorder.summary()["pages"]) == {"newpost"}
+    recorder.reset()
+    assert not recorder.has_data()
+
+
+def test_disabled_recorder_skips_driver():
+    """BROWSER_PERF_METRICS=false면 드라이버를 건드리지 않음"""
+    recorder = PerfRecorder(enabled=False)
+    assert recorder.capture_page(object(), "login") is None
+    assert not recorder.has_data()
+
+
+def test_summarize_history_flags_change():
+    """최근 구간 중앙값을 이전 구간과 비교"""
+    def record(load_ms, upload_ms):
+        return {
+            "pages": {"newpost": {"navigation": {"load_ms": load_ms}, "resources": {"count": 10}, "cdp": {}}},
+            "requests": {"upload": {"total_ms": upload_ms, "avg_ms": upload_ms}},
+            "stages": {"images": {"wall_time": upload_ms / 1000}},
+        }
+    
+    history = [record(1000, 2000)] * 3 + [record(1500, 2000)] * 2
+    summary = summarize_history(history, recent=2)
+    
+    assert summary["newpost.load_ms"] == {"recent": 1500, "baseline": 1000, "change": 0.5}
+    assert summary["upload.total_ms"]["change"] == 0
+    assert summary["stage.images"]["recent"] == 2.0
+
+
+def test_report_stores_metrics_and_history(tmp_path, monkeypatch):
+    """발행 결과 metrics["browser"]와 플랫폼별 기록에 저장"""
+    monkeypatch.setattr("src.utils.cache.CACHE_DIR", tmp_path)
+    from src.publishers.base import BasePublisher
+    from src.utils.perf_metrics import load_history
+    
+    class Publisher(BasePublisher):
+        PLATFORM_NAME = "tistory"
+        
+        def login(self):
+            return True
+        
+        def publish(self, *args, **kwargs):
+            return self._result(True)
+        
+        def logout(self):
+            pass
+    
+    publisher = Publisher()
+    publisher.driver = FakeDriver()
+    publisher.perf.enabled = True
+    publisher._capture_page("login")  # 로그인 페이지 지표는 다음 발행 결과에 포함
+    result = publisher.publish()
+    publisher._capture_page("newpost")
+    publisher._report_stats()
+    
+    assert set(result.metrics["browser"]["pages"]) == {"login", "newpost"}
+    assert len(load_history("tistory")) == 1
+    assert not publisher.perf.has_data()
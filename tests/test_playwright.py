@@ -0,0 +1,137 @@
+"""
+Playwright 백엔드 테스트 (브라우저 실행 없이)
+pytest tests/test_playwright.py -v
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+class FakePublisher:
+    """로그인/발행 호출만 기록하는 발행자"""
+    
+    def __init__(self, platform, calls):
+        self.platform = platform
+        self.calls = calls
+    
+    async def login(self):
+        self.calls.append(("login", self.platform))
+        await asyncio.sleep(0.05)
+        return self.platform != "broken"
+    
+    async def publish(self, title, content, category=None, tags=None, images=None):
+        from src.publishers.base import PublishResult
+        
+        self.calls.append(("publish", self.platform, title))
+        await asyncio.sleep(0.2)
+        return PublishResult(True, platform=self.platform, url=f"https://{self.platform}/{title}")
+    
+    async def logout(self):
+        self.calls.append(("logout", self.platform))
+
+
+class TestPublishConcurrently:
+    """여러 글 동시 발행 테스트"""
+    
+    def _run(self, jobs):
+        from src.publishers.playwright_base import publish_concurrently
+        
+        calls = []
+        start = time.perf_counter()
+        results = asyncio.run(publish_concurrently(
+            jobs, headless=True, publisher_factory=lambda platform, browser: FakePublisher(platform, calls)
+        ))
+        return results, calls, time.perf_counter() - start
+    
+    def test_platforms_run_concurrently(self):
+        """플랫폼끼리는 동시에 발행하고 결과는 jobs 순서대로 반환"""
+        jobs = [
+            {"platform": "naver", "title": "a", "content": ""},
+            {"platform": "tistory", "title": "b", "content": ""},
+        ]
+        results, calls, elapsed = self._run(jobs)
+        
+        assert [r.url for r in results] == ["https://naver/a", "https://tistory/b"]
+        assert elapsed < 0.4  # 순차 실행이면 0.5초 이상
+    
+    def test_login_once_per_platform(self):
+        """같은 플랫폼의 글이 여러 개여도 로그인은 한 번"""
+        jobs = [{"platform": "naver", "title": t, "content": ""} for t in ("a", "b", "c")]
+        results, calls, _ = self._run(jobs)
+        
+        assert all(results)
+        assert calls.count(("login", "naver")) == 1
+        assert calls[-1] == ("logout", "naver")
+    
+    def test_login_failure(self):
+        """로그인 실패는 해당 글만 실패로 기록"""
+        jobs = [
+            {"platform": "broken", "title": "a", "content": ""},
+            {"platform": "tistory", "title": "b", "content": ""},
+        ]
+        results, _, _ = self._run(jobs)
+        
+        assert not results[0] and results[0].error == "로그인 실패"
+        assert results[1]
+
+
+def test_blocked_url_regex():
+    """경량 모드 차단 목록을 Playwright route용 정규식으로 변환"""
+    from src.utils.playwright_browser import PlaywrightBrowser
+    
+    pattern = PlaywrightBrowser._blocked_url_regex("naver")
+    assert pattern.match("https://www.google-analytics.com/collect?v=1")
+    assert pattern.match("https://lcs.naver.com/m?u=1")
+    assert not pattern.match("https://blog.naver.com/PostWriteForm.naver")
+
+
+def test_concurrent_contexts_launch_one_browser(monkeypatch):
+    """동시에 컨텍스트를 요청해도 Chromium은 한 번만 실행"""
+    from src.utils import playwright_browser
+    
+    launches = []
+    
+    class FakeContext:
+        async def add_init_script(self, script):
+            pass
+    
+    class FakeBrowser:
+        def __init__(self):
+            self.contexts = 0
+        
+        async def new_context(self, **kwargs):
+            self.contexts += 1
+            await asyncio.sleep(0.05)
+            return FakeContext()
+    
+    class FakeChromium:
+        async def launch(self, **kwargs):
+            await asyncio.sleep(0.05)  # 실행 중에 다른 작업으로 전환
+            launches.append(FakeBrowser())
+            return launches[-1]
+    
+    class FakePlaywright:
+        chromium = FakeChromium()
+    
+    class FakeStarter:
+        async def start(self):
+            return FakePlaywright()
+    
+    monkeypatch.setattr(playwright_browser, "async_playwright", FakeStarter)
+    
+    async def main():
+        browser = playwright_browser.PlaywrightBrowser(headless=True, lean=False)
+        return await asyncio.gather(
+            browser.context("naver:a", "naver"),
+            browser.context("tistory:b", "tistory"),
+            browser.context("naver:a", "naver"),
+        )
+    
+    first, second, again = asyncio.run(main())
+    assert len(launches) == 1
+    assert launches[0].contexts == 2
+    assert first is again and first is not second
@@ -0,0 +1,74 @@
+"""
+셀렉터 레지스트리 테스트
+pytest tests/test_selector_registry.py -v
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.selector_registry import SelectorRegistry
+
+
+class FakeDriver:
+    """FIND_SCRIPT 대신 존재하는 셀렉터 목록으로 응답"""
+    
+    def __init__(self, present):
+        self.present = set(present)
+        self.calls = []
+    
+    def execute_script(self, script, selectors, clickable, limit):
+        self.calls.append(list(selectors[:limit]))
+        for i, selector in enumerate(selectors[:limit]):
+            if selector in self.present:
+                return [i, f"<element {selector}>"]
+        return None
+
+
+SELECTORS = ["button.old", "button.older", "button.new"]
+
+
+def test_learns_last_good_selector(tmp_path):
+    """성공한 셀렉터를 다음 번에 먼저 시도"""
+    registry = SelectorRegistry("naver", cache_dir=tmp_path)
+    driver = FakeDriver(["button.new"])
+    
+    assert registry.find(driver, "final", SELECTORS, timeout=0) == "<element button.new>"
+    assert registry.order("final", SELECTORS)[0] == "button.new"
+    
+    # 두 번째는 스크립트 한 번, 첫 후보에서 바로 성공
+    driver.calls = []
+    assert registry.find(driver, "final", SELECTORS, timeout=0) == "<element button.new>"
+    assert driver.calls == [["button.new"]]
+    
+    # 기록은 flush() 전까지 파일에 쓰지 않고, 저장 후 다른 인스턴스(다음 실행)에서도 유지
+    assert not (tmp_path / "selectors.json").exists()
+    registry.flush()
+    assert SelectorRegistry("naver", cache_dir=tmp_path).order("final", SELECTORS)[0] == "button.new"
+
+
+def test_falls_back_after_prefer_timeout(tmp_path):
+    """마지막 성공 셀렉터가 사라지면 prefer_timeout 후 다른 후보 사용"""
+    registry = SelectorRegistry("naver", cache_dir=tmp_path)
+    registry.record("final", ["button.new"], "button.new")
+    
+    driver = FakeDriver(["button.old"])
+    element = registry.find(driver, "final", SELECTORS, timeout=1, prefer_timeout=0.1, poll=0.05)
+    
+    assert element == "<element button.old>"
+    assert driver.calls[0] == ["button.new"]
+    assert registry.stats("final")["button.new"]["streak"] == 1
+
+
+def test_reports_dead_selectors(tmp_path):
+    """연속 실패한 셀렉터는 죽은 셀렉터로 보고하고 맨 뒤로"""
+    registry = SelectorRegistry("naver", cache_dir=tmp_path)
+    driver = FakeDriver(["button.new"])
+    for _ in range(SelectorRegistry.DEAD_AFTER):
+        registry.find(driver, "final", ["button.old", "button.new"], timeout=0)
+        registry.record("final", ["button.old"], None)
+    
+    assert registry.dead_selectors() == {"final": ["button.old"]}
+    assert registry.order("final", ["button.old", "button.new"]) == ["button.new", "button.old"]
+    assert registry.find(FakeDriver([]), "missing", ["a", "b"], timeout=0) is None
@@ -0,0 +1,97 @@
+"""
+발행자 end-to-end 테스트 (로컬 대체 페이지 + 실제 Chrome)
+Chrome이 없는 환경에서는 건너뜀
+pytest tests/test_standin_e2e.py -v
+"""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.cdp_driver import find_chrome_binary
+from tests.standin.naver_server import NaverStandin
+from tests.standin.tistory_server import TistoryStandin
+
+pytestmark = pytest.mark.skipif(find_chrome_binary() is None, reason="Chrome이 설치되어 있지 않음")
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """카테고리/셀렉터 캐시는 임시 디렉터리에, 로그인 세션은 저장하지 않음"""
+    monkeypatch.setattr("src.utils.cache.CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setenv("SAVE_BROWSER_SESSION", "false")
+
+
+def make_image(path: Path):
+    from PIL import Image
+    Image.new("RGB", (8, 8), "red").save(path)
+    return str(path)
+
+
+def test_tistory_publish(tmp_path):
+    """로그인 → 이미지 업로드 → 본문/카테고리/태그 → 발행 API 응답"""
+    from src.publishers.tistory import TistoryPublisher
+    
+    images = [make_image(tmp_path / "a.png"), make_image(tmp_path / "b.png")]
+    
+    with TistoryStandin(upload_latency=0.2) as server:
+        publisher = TistoryPublisher(
+            headless=True,
+            account={"id": "test@kakao", "password": "pw", "blogs": ["test-blog"]},
+            urls=server.publisher_urls(),
+        )
+        try:
+            result = publisher.publish(
+                title="제목", content="첫 문단\n\n[IMAGE: a.png]\n\n[IMAGE: b.png]",
+                category="맛집", tags=["a", "b"], images=images,
+            )
+        finally:
+            publisher.logout()
+    
+    assert result, result.error
+    assert result.url == f"{server.url}/101"
+    assert sorted(server.uploads) == ["a.png", "b.png"]
+    
+    post = server.posts[0]
+    assert post["title"] == "제목"
+    assert post["category"] == 2
+    assert post["tag"] == "a,b"
+    assert f"{server.url}/attach/" in post["content"]
+    assert {"title", "images", "body", "publish"} <= set(result.metrics["stages"])
+
+
+def test_naver_publish(tmp_path):
+    """로그인 → 문단 붙여넣기/사진/소스코드 → 카테고리/태그 → 발행 API 응답"""
+    from src.publishers.naver import NaverPublisher
+    
+    images = [make_image(tmp_path / "a.png")]
+    content = "첫 문단\n\n[IMAGE: a.png]\n\n```python\nprint(1)\n```\n\n마지막 문단"
+    
+    with NaverStandin(upload_latency=0.2) as server:
+        publisher = NaverPublisher(
+            headless=True, account={"id": "tester", "password": "pw"}, urls=server.publisher_urls()
+        )
+        try:
+            result = publisher.publish(
+                title="제목", content=content, category="개발", tags=["a", "b"], images=images
+            )
+        finally:
+            publisher.logout()
+    
+    assert result, result.error
+    assert result.url == "https://blog.naver.com/tester/223000000001"
+    assert server.uploads == ["a.png"]
+    
+    form = server.posts[0]
+    components = json.loads(form["documentModel"])["document"]["components"]
+    assert [c["@ctype"] for c in components] == ["documentTitle", "text", "image", "code", "text"]
+    assert components[2]["src"].startswith("https://")
+    assert components[3]["language"] == "python"
+    
+    population = json.loads(form["populationParams"])["populationMeta"]
+    assert population == {"categoryId": 2, "tags": "a,b"}
+    assert result.metrics["code_blocks"]["count"] == 1
@@ -65,6 +65,79 @@ class TestTistoryPublisher:
             from src.publishers.tistory import TistoryPublisher
             with pytest.raises(ValueError):
                 TistoryPublisher(headless=True)
+    
+    def test_parse_attach_response(self):
+        """첨부 업로드 응답에서 이미지 URL 추출"""
+        from src.publishers.tistory import TistoryPublisher
+        
+        url = "https://blog.kakaocdn.net/dn/abc/img.jpg"
+        assert TistoryPublisher._parse_attach_response(f'{{"url": "{url}", "width": 10}}') == url
+        assert TistoryPublisher._parse_attach_response(f'{{"data": {{"fileUrl": "{url}"}}}}') == url
+        assert TistoryPublisher._parse_attach_response(f'<html>{url}</html>') == url
+        assert TistoryPublisher._parse_attach_response('{"error": "denied"}') is None
+    
+    def test_parse_publish_response(self):
+        """발행 API 응답에서 성공 여부와 글 주소 추출"""
+        from src.publishers.tistory import TistoryPublisher
+        
+        ok = {"status": 200, "body": '{"entryUrl": "https://testblog.tistory.com/42"}'}
+        assert TistoryPublisher._parse_publish_response(ok) == (True, "https://testblog.tistory.com/42", "42", None)
+        
+        failed = TistoryPublisher._parse_publish_response({"status": 400, "body": '{"message": "제목을 입력하세요"}'})
+        assert failed == (False, None, None, "제목을 입력하세요")
+        
+        network_error = TistoryPublisher._parse_publish_response({"status": 0, "body": None, "error": "net::ERR_FAILED"})
+        assert network_error[0] is False and network_error[3] == "net::ERR_FAILED"
+    
+    def test_category_cache_per_blog(self, mock_env, tmp_path, monkeypatch):
+        """카테고리 맵은 블로그별로 저장"""
+        monkeypatch.setattr("src.utils.cache.CACHE_DIR", tmp_path)
+        
+        with patch('src.publishers.tistory.BrowserManager'):
+            from src.publishers.tistory import TistoryPublisher
+            publisher = TistoryPublisher(headless=True)
+            publisher.save_categories({"맛집": {"index": 3, "id": None, "value": "123"}})
+            
+            assert publisher.get_cached_categories()["맛집"]["index"] == 3
+            
+            monkeypatch.setenv("TISTORY_BLOG_NAME", "otherblog")
+            assert TistoryPublisher(headless=True).get_cached_categories() == {}
+
+    
+    def test_session_saved_only_when_enabled(self, mock_env, tmp_path, monkeypatch):
+        """로그인 쿠키는 기본 저장하지 않고, 켜면 소유자만 읽을 수 있게 저장"""
+        monkeypatch.setattr("src.utils.cache.CACHE_DIR", tmp_path)
+        monkeypatch.delenv("SAVE_BROWSER_SESSION", raising=False)
+        
+        with patch('src.publishers.tistory.BrowserManager'):
+            from src.publishers.tistory import TistoryPublisher
+            publisher = TistoryPublisher(headless=True)
+        publisher.driver = type("Driver", (), {"get_cookies": lambda self: [{"name": "TSSESSION", "value": "x"}]})()
+        
+        publisher.save_session()
+        assert publisher.load_session() == []
+        
+        publisher.save_sessions = True
+        publisher.save_session()
+        assert publisher.load_session()[0]["name"] == "TSSESSION"
+        if os.name == "posix":
+            assert (tmp_path / "sessions.json").stat().st_mode & 0o777 == 0o600
+
+    def test_staying_on_newpost_is_failure(self, mock_env):
+        """발행 API 응답 없이 작성 페이지에 머물면 실패"""
+        with patch('src.publishers.tistory.BrowserManager'):
+            from src.publishers.tistory import TistoryPublisher
+            publisher = TistoryPublisher(headless=True)
+        publisher.driver = MagicMock()
+        publisher.driver.find_elements.return_value = []
+        
+        publisher.driver.current_url = "https://testblog.tistory.com/manage/newpost"
+        with patch('time.sleep'):
+            assert publisher._check_publish_result_from_page() == (False, "발행 후 작성 페이지에 머무름")
+        
+        publisher.driver.current_url = "https://testblog.tistory.com/manage/posts"
+        with patch('time.sleep'):
+            assert publisher._check_publish_result_from_page() == (True, None)
 
 
 class TestImageResize:
@@ -0,0 +1,108 @@
+"""
+티스토리 HTTP 발행자 테스트 (로컬 대체 서버)
+pytest tests/test_tistory_http.py -v
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import src.utils.cache as cache_module
+from src.publishers.base import PublishResult
+from src.publishers.tistory_http import TistoryHttpPublisher
+from tests.standin.tistory_server import TistoryStandin
+
+ACCOUNT = {"id": "test@kakao", "password": "pw", "blogs": ["test-blog"]}
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_module, "CACHE_DIR", tmp_path / "cache")
+
+
+def make_image(path: Path, color: str = "red"):
+    from PIL import Image
+    Image.new("RGB", (8, 8), color).save(path)
+    return str(path)
+
+
+def make_publisher(server, cookies, **kwargs):
+    return TistoryHttpPublisher(
+        cookies=cookies, base_url=server.url, account=ACCOUNT, headless=True, **kwargs
+    )
+
+
+def test_publish_over_http(tmp_path):
+    """세션 쿠키로 이미지 업로드 + 글 저장"""
+    images = [make_image(tmp_path / "a.png"), make_image(tmp_path / "b.png")]
+    
+    with TistoryStandin(session="valid") as server:
+        publisher = make_publisher(server, {"TSSESSION": "valid"}, visibility="private")
+        result = publisher.publish(
+            title="제목", content="첫 문단\n\n[IMAGE: a.png]\n\n[IMAGE: b.png]", tags=["a", "b"], images=images
+        )
+        publisher.logout()
+    
+    assert result and result.url == f"{server.url}/101" and result.post_id == "101"
+    assert sorted(server.uploads) == ["a.png", "b.png"]
+    
+    post = server.posts[0]
+    assert post["title"] == "제목"
+    assert post["tag"] == "a,b"
+    assert post["visibility"] == 0
+    assert f"{server.url}/attach/" in post["content"]
+
+
+def test_republish_reuses_uploaded_urls(tmp_path, monkeypatch):
+    """같은 내용의 이미지는 다시 올리지 않고, 확인 시 사라진 URL만 다시 업로드"""
+    content = "[IMAGE: a.png]\n\n[IMAGE: b.png]"
+    images = [make_image(tmp_path / "a.png", "red"), make_image(tmp_path / "b.png", "blue")]
+    
+    with TistoryStandin(session="valid") as server:
+        publisher = make_publisher(server, {"TSSESSION": "valid"})
+        assert publisher.publish(title="첫 발행", content=content, images=images)
+        assert len(server.uploads) == 2
+        
+        # 재발행 (다른 폴더, 같은 내용) - 업로드 없음
+        copies = [make_image(tmp_path / "a_copy.png", "red"), make_image(tmp_path / "b_copy.png", "blue")]
+        result = publisher.publish(title="재발행", content="[IMAGE: a_copy.png]\n\n[IMAGE: b_copy.png]", images=copies)
+        assert result and len(server.uploads) == 2
+        assert "/attach/1/" in server.posts[1]["content"] and "/attach/2/" in server.posts[1]["content"]
+        
+        # URL 확인을 켜면 삭제된 첨부만 다시 업로드
+        monkeypatch.setenv("UPLOAD_URL_CACHE_VERIFY", "true")
+        server.deleted.add(1)
+        assert publisher.publish(title="셋째", content=content, images=images)
+        assert len(server.uploads) == 3
+        
+        # 캐시를 끄면 모두 업로드
+        monkeypatch.setenv("UPLOAD_URL_CACHE_TTL_DAYS", "0")
+        assert publisher.publish(title="넷째", content=content, images=images)
+        assert len(server.uploads) == 5
+
+
+def test_rejected_session_falls_back(tmp_path, monkeypatch):
+    """세션이 거부되면 브라우저 발행으로 대체"""
+    calls = []
+    
+    def fake_browser_publish(self, title, content, category, tags, images):
+        calls.append(title)
+        return PublishResult(True, platform="tistory", url="https://test-blog.tistory.com/1")
+    
+    monkeypatch.setattr(TistoryHttpPublisher, "_publish_with_browser", fake_browser_publish)
+    
+    with TistoryStandin(session="valid") as server:
+        publisher = make_publisher(server, {"TSSESSION": "expired"})
+        result = publisher.publish(title="제목", content="본문")
+        
+        assert result.url == "https://test-blog.tistory.com/1"
+        assert calls == ["제목"]
+        assert server.posts == []
+        
+        # 대체하지 않으면 실패 결과
+        publisher = make_publisher(server, {"TSSESSION": "expired"}, fallback=False)
+        result = publisher.publish(title="제목", content="본문")
+        assert not result and "세션" in result.error
@@ -0,0 +1,102 @@
+"""
+발행 전 검증 테스트
+pytest tests/test_validator.py -v
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PIL import Image
+
+from src.editor.validator import PostValidator, resolve_image_marker
+
+
+def make_post(tmp_path, content: str, title: str = "강남역 카페 후기", keywords=None, category: str = "카페") -> Path:
+    """post.md와 media 폴더(1.외관.jpg, 2.메뉴.png) 생성"""
+    media = tmp_path / "media"
+    media.mkdir()
+    Image.new("RGB", (40, 30), "red").save(media / "1.외관.jpg")
+    Image.new("RGB", (40, 30), "blue").save(media / "2.메뉴.png")
+
+    keywords = keywords if keywords is not None else ["카페", "강남"]
+    post_file = tmp_path / "post.md"
+    post_file.write_text(
+        "---\n"
+        f'title: "{title}"\n'
+        f"keywords: [{', '.join(keywords)}]\n"
+        f'category: "{category}"\n'
+        "---\n"
+        f"{content}\n",
+        encoding="utf-8",
+    )
+    return post_file
+
+
+def test_resolve_image_marker_follows_publisher_rules():
+    files = {"1.외관.jpg": "a", "2.메뉴.png": "b", "cover.webp": "c"}
+
+    assert resolve_image_marker("1.외관.jpg", files) == "1.외관.jpg"
+    assert resolve_image_marker("2.메뉴판 사진", files) == "2.메뉴.png"  # 앞 번호
+    assert resolve_image_marker("cover", files) == "cover.webp"         # 부분 문자열
+    assert resolve_image_marker("3.디저트.jpg", files) is None
+
+
+def test_valid_post_passes(tmp_path):
+    post_file = make_post(tmp_path, "소개\n\n[IMAGE: 1.외관.jpg]\n\n메뉴\n\n[IMAGE: 2.메뉴.png]")
+
+    report = PostValidator(categories={}).validate_file(post_file)
+
+    assert report.ok
+    assert report.issues == []
+
+
+def test_unresolved_marker_and_broken_image_are_errors(tmp_path):
+    post_file = make_post(tmp_path, "[IMAGE: 1.외관.jpg]\n\n[IMAGE: 3.디저트.jpg]")
+    (tmp_path / "media" / "4.깨진파일.jpg").write_bytes(b"not an image")
+    (tmp_path / "media" / "5.아이폰.heic").write_bytes(b"heic")
+
+    report = PostValidator(categories={}).validate_file(post_file)
+    messages = " / ".join(issue.message for issue in report.errors)
+
+    assert not report.ok
+    assert "3.디저트.jpg" in messages
+    assert "4.깨진파일.jpg" in messages
+    assert "5.아이폰.heic" in messages
+
+
+def test_image_size_limit_only_without_preprocessing(tmp_path, monkeypatch):
+    """전처리가 켜져 있으면 재압축된 사본을 올리므로 원본 크기 한도를 적용하지 않음"""
+    post_file = make_post(tmp_path, "[IMAGE: 1.외관.jpg]\n\n[IMAGE: 2.메뉴.png]")
+    monkeypatch.setitem(PostValidator.PLATFORM_RULES["naver"], "max_image_mb", 0.0001)
+
+    assert PostValidator(["naver"], categories={}, preprocess=True).validate_file(post_file).ok
+
+    report = PostValidator(["naver"], categories={}, preprocess=False).validate_file(post_file)
+    assert report.errors and all(issue.platform == "naver" and "MB 초과" in issue.message for issue in report.errors)
+
+
+def test_platform_rules_for_title_and_tags(tmp_path):
+    post_file = make_post(
+        tmp_path, "[IMAGE: 1.외관.jpg]\n\n[IMAGE: 2.메뉴.png]",
+        title="강남역 카페 후기 ☕🍰", keywords=[f"태그{i}" for i in range(12)],
+    )
+
+    report = PostValidator(categories={}).validate_file(post_file)
+
+    # 네이버는 제목을 키 입력하므로 이모지가 오류, 티스토리는 제거 후 발행하므로 경고
+    assert [issue.platform for issue in report.errors] == ["naver"]
+    assert report.errors_for("tistory") == []
+    assert any(issue.platform == "tistory" and "10개" in issue.message for issue in report.warnings)
+    assert not any(issue.platform == "naver" and "태그" in issue.message for issue in report.warnings)
+
+
+def test_unknown_category_warns_only_when_categories_cached(tmp_path):
+    post_file = make_post(tmp_path, "본문", category="디저트")
+
+    assert PostValidator(["tistory"], categories={}).validate_file(post_file).issues == []
+
+    report = PostValidator(["tistory"], categories={"tistory": ["일상", "- 카페"]}).validate_file(post_file)
+    assert report.ok
+    assert any("디저트" in issue.message for issue in report.warnings)
@@ -0,0 +1,116 @@
+"""
+발행자 사전 준비(PublisherWarmer) 테스트
+pytest tests/test_warmup.py -v
+"""
+import sys
+import threading
+import time
+import pytest
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.publishers import PublisherWarmer, create_publisher
+
+
+class FakePublisher:
+    """로그인에 시간이 걸리는 발행자"""
+    
+    def __init__(self, platform, login_ok=True):
+        self.platform = platform
+        self.login_ok = login_ok
+        self.interactive = True
+        self.logins = 0
+        self.logged_out = False
+    
+    def login(self):
+        self.logins += 1
+        time.sleep(0.2)
+        # 추가 인증이 필요한 계정은 터미널 입력이 가능할 때만 성공
+        return self.login_ok is True or (self.login_ok == "interactive" and self.interactive)
+    
+    def logout(self):
+        self.logged_out = True
+
+
+def make_factory(created):
+    def factory(platform, headless, lean):
+        publisher = FakePublisher(platform, login_ok=platform != "broken")
+        created[platform] = publisher
+        return publisher
+    return factory
+
+
+def test_login_overlaps_other_work():
+    """다른 작업(AI 생성) 동안 로그인이 끝나 있으면 get()은 기다리지 않음"""
+    created = {}
+    warmer = PublisherWarmer(["naver", "tistory"], factory=make_factory(created)).start()
+    time.sleep(0.3)  # AI 초안 생성
+    
+    start = time.perf_counter()
+    assert warmer.get("naver") is created["naver"]
+    assert warmer.get("tistory") is created["tistory"]
+    assert time.perf_counter() - start < 0.1
+    
+    hidden = warmer.hidden_seconds()
+    assert hidden["naver"] >= 0.15 and hidden["tistory"] >= 0.15
+    
+    warmer.close()
+    assert created["naver"].logged_out and created["tistory"].logged_out
+
+
+def test_publisher_reused_and_failed_login():
+    """같은 발행자를 재사용하고, 로그인 실패는 None"""
+    created = {}
+    with PublisherWarmer(["naver", "broken"], factory=make_factory(created)) as warmer:
+        first = warmer.get("naver")
+        assert warmer.get("naver") is first
+        assert first.logins == 1
+        assert warmer.get("broken") is None
+        assert warmer.get("tistory") is None  # 준비 대상 아님
+    assert created["broken"].logged_out
+
+
+def test_login_needing_input_retried_on_main_thread():
+    """백그라운드 로그인은 입력을 기다리지 않고, get()에서 다시 로그인"""
+    created = []
+    
+    def factory(platform, headless, lean):
+        created.append(FakePublisher(platform, login_ok="interactive"))
+        return created[-1]
+    
+    with PublisherWarmer(["naver"], factory=factory) as warmer:
+        publisher = warmer.get("naver")
+        assert publisher is created[1] and publisher.interactive
+        assert created[0].interactive is False and created[0].logged_out
+    assert publisher.logged_out
+
+
+def test_close_does_not_wait_for_stuck_login():
+    """close()는 끝나지 않는 로그인을 제한 시간만 기다리고 브라우저를 종료"""
+    release = threading.Event()
+    created = {}
+    
+    class StuckPublisher(FakePublisher):
+        def login(self):
+            release.wait(5)
+            return not self.logged_out
+    
+    def factory(platform, headless, lean):
+        created[platform] = StuckPublisher(platform)
+        return created[platform]
+    
+    warmer = PublisherWarmer(["naver"], factory=factory).start()
+    time.sleep(0.1)
+    start = time.perf_counter()
+    warmer.close(timeout=0.2)
+    assert time.perf_counter() - start < 1
+    assert created["naver"].logged_out
+    release.set()
+
+
+def test_create_publisher_unknown_platform():
+    """등록되지 않은 플랫폼은 ValueError"""
+    with pytest.raises(ValueError):
+        create_publisher("medium")
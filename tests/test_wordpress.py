@@ -0,0 +1,86 @@
+"""
+워드프레스 발행자 테스트 (로컬 대체 서버)
+pytest tests/test_wordpress.py -v
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import src.utils.cache as cache_module
+from src.publishers.wordpress import WordPressPublisher
+from src.utils.cache import JsonCache
+from tests.standin.wordpress_server import WordPressStandin
+
+ACCOUNT = {"id": "editor", "password": "app pass"}
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_module, "CACHE_DIR", tmp_path / "cache")
+
+
+def make_image(path: Path):
+    from PIL import Image
+    Image.new("RGB", (8, 8), "red").save(path)
+    return str(path)
+
+
+def test_publish_uploads_media_and_resolves_terms(tmp_path):
+    """본문 이미지만 업로드, 카테고리/태그 id 조회(없으면 생성), 글 작성 한 번"""
+    images = [make_image(tmp_path / "1.외관.png"), make_image(tmp_path / "2.메뉴.png"), make_image(tmp_path / "3.png")]
+    content = "## 소개\n\n첫 **문단**\n\n[IMAGE: 1.외관.png]\n\n- 하나\n- 둘\n\n```python\nprint('<hi>')\n```\n\n[IMAGE: 2.메뉴.png]"
+
+    with WordPressStandin(tags=["카페"]) as server:
+        publisher = WordPressPublisher(site_url=server.url, account=ACCOUNT, status="draft")
+        result = publisher.publish(title="제목", content=content, category="맛집", tags=["카페", "강남"], images=images)
+        publisher.logout()
+
+    assert result and result.url == f"{server.url}/?p=501" and result.post_id == "501"
+    assert sorted(server.uploads) == ["1.외관.png", "2.메뉴.png"]
+
+    post = server.posts[0]
+    assert post["status"] == "draft"
+    assert post["categories"] == [server.terms["categories"]["맛집"]]
+    assert post["tags"] == [server.terms["tags"]["카페"], server.terms["tags"]["강남"]]
+    assert post["featured_media"]
+    assert "<h2>소개</h2>" in post["content"]
+    assert "<strong>문단</strong>" in post["content"]
+    assert "<ul><li>하나</li><li>둘</li></ul>" in post["content"]
+    assert "print(&#x27;&lt;hi&gt;&#x27;)" in post["content"]
+    assert post["content"].count('<figure class="wp-block-image') == 2
+
+    # 카테고리/태그 id는 사이트별로 저장
+    terms = JsonCache(WordPressPublisher.TERM_CACHE_NAME).get(server.url)
+    assert terms["tags"]["강남"] == server.terms["tags"]["강남"]
+
+
+def test_cached_terms_skip_lookup_and_recover_when_stale(tmp_path):
+    with WordPressStandin() as server:
+        publisher = WordPressPublisher(site_url=server.url, account=ACCOUNT)
+        assert publisher.publish(title="첫 글", content="본문", category="일상", tags=["새태그"])
+
+        # 두 번째 발행은 카테고리/태그 조회 없이 글 작성만
+        server.requests.clear()
+        assert publisher.publish(title="둘째 글", content="본문", category="일상", tags=["새태그"])
+        assert server.requests == [("POST", "/wp-json/wp/v2/posts")]
+
+        # 사이트에서 태그가 삭제되면 캐시를 비우고 다시 조회
+        del server.terms["tags"]["새태그"]
+        result = publisher.publish(title="셋째 글", content="본문", category="일상", tags=["새태그"])
+
+    assert result and len(server.posts) == 3
+    assert server.posts[-1]["tags"] == [server.terms["tags"]["새태그"]]
+
+
+def test_wrong_app_password_fails_login():
+    with WordPressStandin() as server:
+        publisher = WordPressPublisher(site_url=server.url, account={"id": "editor", "password": "wrong"})
+        assert not publisher.login()
+        result = publisher.publish(title="제목", content="본문")
+
+    assert not result and result.error == "인증 실패"
+    assert server.posts == []